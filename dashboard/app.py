@@ -19,6 +19,7 @@ Usage:
 import os
 import sys
 import json
+import shutil
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -37,6 +38,10 @@ from skills.vault_skills import (
     update_dashboard
 )
 from log_manager import setup_logging
+from scripts.approval_store import ApprovalState, get_approval_store, set_frontmatter_fields
+from scripts.execution_notifier import get_execution_notifier
+from scripts.resilience import read_breaker_states
+from scripts.social_metrics_store import SOURCE_VAULT, get_social_metrics_store
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -51,6 +56,7 @@ logger = setup_logging(
 # Configuration
 VAULT_PATH = Path(__file__).parent.parent / "AI_Employee_Vault"
 LOGS_PATH = Path(__file__).parent.parent / "logs"
+APPROVAL_FOLDERS = ["Pending_Approval", "Needs_Approval"]
 
 # Ensure directories exist
 VAULT_PATH.mkdir(parents=True, exist_ok=True)
@@ -267,21 +273,18 @@ def api_approvals_list():
     try:
         approvals = []
         
-        # Check Pending_Approval folder
-        pending_path = VAULT_PATH / "Pending_Approval"
-        if pending_path.exists():
-            for file in pending_path.glob("*.md"):
+        # Check Pending_Approval and Needs_Approval (including category subfolders)
+        for folder in APPROVAL_FOLDERS:
+            folder_path = VAULT_PATH / folder
+            if not folder_path.exists():
+                continue
+            for file in folder_path.rglob("*.md"):
+                relative = file.relative_to(folder_path)
                 content = file.read_text()
-                approval_data = parse_approval_file(content, file.name)
-                approvals.append(approval_data)
-        
-        # Check Needs_Approval folder
-        needs_approval_path = VAULT_PATH / "Needs_Approval"
-        if needs_approval_path.exists():
-            for file in needs_approval_path.glob("*.md"):
-                content = file.read_text()
-                approval_data = parse_approval_file(content, file.name)
-                approval_data['location'] = 'needs_approval'
+                approval_data = parse_approval_file(content, relative.as_posix())
+                approval_data['location'] = folder.lower()
+                approval_data['category'] = relative.parts[0] if len(relative.parts) > 1 else ''
+                approval_data['modified'] = datetime.fromtimestamp(file.stat().st_mtime).isoformat()
                 approvals.append(approval_data)
         
         return jsonify({
@@ -342,39 +345,168 @@ def parse_approval_file(content: str, filename: str) -> dict:
     return approval_data
 
 
+def find_approval_file(approval_name: str):
+    """
+    Locate an approval file in Pending_Approval or Needs_Approval.
+    
+    Names that resolve outside the approval folder (``../``, absolute
+    paths, symlinks out of the vault) are not found.
+    """
+    for folder in APPROVAL_FOLDERS:
+        file_path = VAULT_PATH / folder / approval_name
+        if file_path.resolve().is_relative_to((VAULT_PATH / folder).resolve()) and file_path.is_file():
+            return file_path
+    return None
+
+
+def select_approvals(filters: dict) -> list:
+    """
+    Select pending approval files matching a bulk filter.
+    
+    Args:
+        filters: Optional keys ``category`` (subfolder, e.g. "social_posts"),
+            ``type`` (frontmatter type) and ``older_than_hours``
+    
+    Returns:
+        List of approval names (paths relative to their approval folder)
+    """
+    store = get_approval_store()
+    category = filters.get('category')
+    approval_type = filters.get('type')
+    older_than_hours = filters.get('older_than_hours')
+    cutoff = None
+    if older_than_hours is not None:
+        cutoff = datetime.now().timestamp() - float(older_than_hours) * 3600
+    
+    selected = []
+    for folder in APPROVAL_FOLDERS:
+        folder_path = VAULT_PATH / folder
+        if not folder_path.exists():
+            continue
+        for file in folder_path.rglob("*.md"):
+            relative = file.relative_to(folder_path)
+            if category and (len(relative.parts) < 2 or relative.parts[0] != category):
+                continue
+            if cutoff is not None and file.stat().st_mtime > cutoff:
+                continue
+            record = store.sync_file(file)
+            if record is None or record.state != ApprovalState.PENDING:
+                continue
+            if approval_type and record.action_type != approval_type:
+                continue
+            selected.append(relative.as_posix())
+    return selected
+
+
+def decide_approvals(approval_names: list, decision: ApprovalState, reason: str = "") -> dict:
+    """
+    Approve or reject a batch of approvals.
+    
+    The files' frontmatter is rewritten (rejected files are moved to
+    Rejected), all state transitions are applied in one approval-store
+    transaction, and the executor is notified once for the whole batch.
+    
+    Args:
+        approval_names: Approval file names (relative to their approval folder)
+        decision: ApprovalState.APPROVED or ApprovalState.REJECTED
+        reason: Optional approval/rejection reason
+    
+    Returns:
+        Dict with ``updated``, ``skipped`` and ``not_found`` name lists
+    """
+    store = get_approval_store()
+    rejected_path = VAULT_PATH / "Rejected"
+    default_reason = "Approved via dashboard" if decision == ApprovalState.APPROVED else "Rejected via dashboard"
+    reason = reason or default_reason
+    
+    files = {}
+    not_found = []
+    for name in approval_names:
+        file_path = find_approval_file(name)
+        if file_path is None:
+            not_found.append(name)
+        else:
+            files[name] = file_path
+    
+    # Only approvals that are still pending can be decided. Files are
+    # written first so a concurrent reader never sees a decided store
+    # entry next to a pending file.
+    reason_key = 'approval_reason' if decision == ApprovalState.APPROVED else 'rejection_reason'
+    items, updated, skipped = [], [], []
+    action_types = {}
+    for name, file_path in files.items():
+        record = store.sync_file(file_path)
+        if record is None or record.state != ApprovalState.PENDING:
+            skipped.append(name)
+            continue
+        content = file_path.read_text()
+        file_path.write_text(set_frontmatter_fields(content, {'status': decision.value, reason_key: reason}))
+        final_path = file_path
+        if decision == ApprovalState.REJECTED:
+            final_path = rejected_path / name
+            final_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(file_path), str(final_path))
+        items.append((record.approval_id, decision, reason, final_path))
+        action_types[record.approval_id] = record.action_type
+        updated.append(name)
+    
+    # One transaction for the whole batch
+    store.bulk_transition(items)
+    
+    if decision == ApprovalState.APPROVED and items:
+        notify_executor([(approval_id, path, action_types[approval_id]) for approval_id, _, _, path in items])
+    
+    logger.info(
+        f"Bulk {decision.value}: {len(updated)} updated, {len(skipped)} skipped, "
+        f"{len(not_found)} not found"
+    )
+    return {'updated': updated, 'skipped': skipped, 'not_found': not_found}
+
+
+def notify_executor(approvals: list):
+    """
+    Push approved actions to the executor (one wake-up per batch).
+    
+    Args:
+        approvals: (approval_id, file_path, action_type) tuples
+    """
+    try:
+        queued = get_execution_notifier().notify(approvals)
+        logger.info(f"Approvals queued for execution: {queued}")
+    except Exception as e:
+        # The executor's folder poll still picks the approvals up
+        logger.warning(f"Could not notify executor, falling back to polling: {e}")
+
+
+def _single_decision_response(approval_name: str, decision: ApprovalState):
+    """Shared response for the single approve/reject endpoints"""
+    data = request.get_json(silent=True) or {}
+    result = decide_approvals([approval_name], decision, data.get('reason', ''))
+    
+    if result['not_found']:
+        return jsonify({
+            'success': False,
+            'error': 'Approval file not found'
+        }), 404
+    if result['skipped']:
+        return jsonify({
+            'success': False,
+            'error': f'Approval {approval_name} is no longer pending'
+        }), 409
+    
+    verb = 'granted' if decision == ApprovalState.APPROVED else 'rejected'
+    logger.info(f"Approval {verb}: {approval_name}")
+    return jsonify({
+        'success': True,
+        'message': f'Approval {verb} for {approval_name}'
+    })
+
+
 @app.route('/api/approvals/<path:approval_name>/approve', methods=['POST'])
 def api_approval_approve(approval_name):
     """Approve a pending action"""
     try:
-        # Determine file path
-        file_path = VAULT_PATH / "Pending_Approval" / f"{approval_name}"
-        if not file_path.exists():
-            file_path = VAULT_PATH / "Needs_Approval" / f"{approval_name}"
-        
-        if not file_path.exists():
-            return jsonify({
-                'success': False,
-                'error': 'Approval file not found'
-            }), 404
-        
-        # Update status to approved
-        content = file_path.read_text()
-        
-        # Update YAML frontmatter
-        if "status: pending" in content:
-            content = content.replace("status: pending", "status: approved")
-        if "approved: false" in content:
-            content = content.replace("approved: false", "approved: true")
-        
-        file_path.write_text(content)
-        
-        logger.info(f"Approval granted: {approval_name}")
-        
-        return jsonify({
-            'success': True,
-            'message': f'Approval granted for {approval_name}'
-        })
-        
+        return _single_decision_response(approval_name, ApprovalState.APPROVED)
     except Exception as e:
         logger.error(f"Error approving action: {e}")
         return jsonify({
@@ -387,43 +519,69 @@ def api_approval_approve(approval_name):
 def api_approval_reject(approval_name):
     """Reject a pending action"""
     try:
-        # Determine file path
-        file_path = VAULT_PATH / "Pending_Approval" / f"{approval_name}"
-        if not file_path.exists():
-            file_path = VAULT_PATH / "Needs_Approval" / f"{approval_name}"
-        
-        if not file_path.exists():
+        return _single_decision_response(approval_name, ApprovalState.REJECTED)
+    except Exception as e:
+        logger.error(f"Error rejecting action: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/api/approvals/latency')
+def api_approvals_latency():
+    """Get approve-to-execute latency of recently executed approvals"""
+    try:
+        return jsonify({
+            'success': True,
+            'data': get_execution_notifier().latency_stats()
+        })
+    except Exception as e:
+        logger.error(f"Error getting approval latency: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/api/approvals/bulk', methods=['POST'])
+def api_approvals_bulk():
+    """
+    Approve or reject many actions at once.
+    
+    JSON body: ``action`` ("approve" or "reject"), optional ``reason``, and
+    either ``ids`` (approval file names) or ``filter`` (``category``,
+    ``type``, ``older_than_hours``).
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        action = data.get('action')
+        if action not in ('approve', 'reject'):
             return jsonify({
                 'success': False,
-                'error': 'Approval file not found'
-            }), 404
-        
-        # Update status to rejected
-        content = file_path.read_text()
-        
-        if "status: pending" in content:
-            content = content.replace("status: pending", "status: rejected")
-        if "approved: false" in content:
-            content = content.replace("approved: false", "approved: false  # Rejected")
-        
-        file_path.write_text(content)
-        
-        # Move to Rejected folder
-        rejected_path = VAULT_PATH / "Rejected"
-        rejected_path.mkdir(parents=True, exist_ok=True)
+                'error': "action must be 'approve' or 'reject'"
+            }), 400
         
-        import shutil
-        shutil.move(str(file_path), str(rejected_path / approval_name))
+        if data.get('ids'):
+            approval_names = list(data['ids'])
+        elif data.get('filter'):
+            approval_names = select_approvals(data['filter'])
+        else:
+            return jsonify({
+                'success': False,
+                'error': 'Provide ids or filter'
+            }), 400
         
-        logger.info(f"Approval rejected: {approval_name}")
+        decision = ApprovalState.APPROVED if action == 'approve' else ApprovalState.REJECTED
+        result = decide_approvals(approval_names, decision, data.get('reason', ''))
         
         return jsonify({
             'success': True,
-            'message': f'Approval rejected for {approval_name}'
+            'data': result
         })
         
     except Exception as e:
-        logger.error(f"Error rejecting action: {e}")
+        logger.error(f"Error in bulk approval: {e}")
         return jsonify({
             'success': False,
             'error': str(e)
@@ -556,6 +714,35 @@ def api_social_list():
         }), 500
 
 
+@app.route('/api/social/metrics')
+def api_social_metrics():
+    """Get cached social metrics per platform (never scrapes)"""
+    try:
+        days = int(request.args.get('days', 7))
+        store = get_social_metrics_store()
+        store.index_vault_folder(VAULT_PATH / "Social_Media")
+        platforms = {}
+        for platform in ('linkedin', 'facebook', 'instagram', 'twitter'):
+            platforms[platform] = {
+                'live': store.summary(platform, days),
+                'vault_posts': store.summary(platform, days, source=SOURCE_VAULT)['posts']
+            }
+        return jsonify({
+            'success': True,
+            'data': {
+                'days': days,
+                'platforms': platforms,
+                'cache': store.status()
+            }
+        })
+    except Exception as e:
+        logger.error(f"Error getting social metrics: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 def parse_social_file(content: str, filename: str) -> dict:
     """Parse social media file"""
     post_data = {
@@ -743,6 +930,8 @@ def api_health_status():
                         disk_str = parts[2].strip().replace('%', '').replace('✅', '').replace('⚠️', '')
                         status_data['disk'] = float(disk_str) if disk_str else 0
         
+        status_data['circuit_breakers'] = read_breaker_states()
+        
         return jsonify({
             'success': True,
             'data': status_data
@@ -756,6 +945,26 @@ def api_health_status():
         }), 500
 
 
+@app.route('/api/health/breakers')
+def api_health_breakers():
+    """Get circuit breaker state of each external endpoint"""
+    try:
+        breakers = read_breaker_states()
+        return jsonify({
+            'success': True,
+            'data': {
+                'breakers': breakers,
+                'open': sorted(name for name, state in breakers.items() if state.get('state') != 'closed')
+            }
+        })
+    except Exception as e:
+        logger.error(f"Error getting circuit breakers: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @app.route('/api/health/logs')
 def api_health_logs():
     """Get recent log entries"""
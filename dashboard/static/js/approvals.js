@@ -3,7 +3,9 @@
  */
 
 let allApprovals = [];
+let visibleApprovals = [];
 let currentApproval = null;
+const selectedApprovals = new Set();
 
 document.addEventListener('DOMContentLoaded', function() {
     loadApprovals();
@@ -16,7 +18,11 @@ async function loadApprovals() {
         
         if (result.success) {
             allApprovals = result.data.approvals || [];
-            renderApprovals(allApprovals);
+            // Drop selections for approvals that are gone
+            const names = new Set(allApprovals.map(a => a.filename));
+            [...selectedApprovals].forEach(name => { if (!names.has(name)) selectedApprovals.delete(name); });
+            populateFilters(allApprovals);
+            filterApprovals();
             updateStats(allApprovals);
         }
     } catch (error) {
@@ -24,8 +30,98 @@ async function loadApprovals() {
     }
 }
 
+function populateFilters(approvals) {
+    fillSelect('filter-approval-type', 'All Types', approvals.map(a => a.type));
+    fillSelect('filter-approval-category', 'All Categories', approvals.map(a => a.category).filter(Boolean));
+}
+
+function fillSelect(id, allLabel, values) {
+    const select = document.getElementById(id);
+    const current = select.value;
+    const options = [...new Set(values)].sort();
+    select.innerHTML = `<option value="all">${allLabel}</option>` +
+        options.map(v => `<option value="${escapeHtml(v)}">${escapeHtml(v)}</option>`).join('');
+    if (current === 'all' || options.includes(current)) select.value = current;
+}
+
+function filterApprovals() {
+    const type = document.getElementById('filter-approval-type').value;
+    const category = document.getElementById('filter-approval-category').value;
+    const olderThan = parseFloat(document.getElementById('filter-approval-age').value);
+    const cutoff = isNaN(olderThan) ? null : Date.now() - olderThan * 3600 * 1000;
+    
+    visibleApprovals = allApprovals.filter(a =>
+        (type === 'all' || a.type === type) &&
+        (category === 'all' || a.category === category) &&
+        (cutoff === null || (a.modified && new Date(a.modified).getTime() <= cutoff))
+    );
+    renderApprovals(visibleApprovals);
+}
+
+function toggleSelection(filename, checked) {
+    if (checked) {
+        selectedApprovals.add(filename);
+    } else {
+        selectedApprovals.delete(filename);
+    }
+    updateSelectedCount();
+}
+
+function toggleSelectAll(checked) {
+    visibleApprovals.forEach(a => toggleSelection(a.filename, checked));
+    renderApprovals(visibleApprovals);
+}
+
+function updateSelectedCount() {
+    document.getElementById('selected-count').textContent = `${selectedApprovals.size} selected`;
+    document.getElementById('select-all-approvals').checked =
+        visibleApprovals.length > 0 && visibleApprovals.every(a => selectedApprovals.has(a.filename));
+}
+
+async function bulkDecide(action) {
+    const ids = [...selectedApprovals];
+    if (ids.length === 0) {
+        alert('Select at least one approval');
+        return;
+    }
+    
+    let reason = '';
+    if (action === 'reject') {
+        reason = prompt(`Reject ${ids.length} approval(s)? Enter rejection reason (optional):`);
+        if (reason === null) return;
+    } else if (!confirm(`Approve ${ids.length} action(s)?`)) {
+        return;
+    }
+    
+    try {
+        const response = await fetch('/api/approvals/bulk', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ action, ids, reason })
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            const { updated, skipped, not_found } = result.data;
+            let message = `${updated.length} ${action === 'approve' ? 'approved' : 'rejected'}`;
+            if (skipped.length) message += `, ${skipped.length} no longer pending`;
+            if (not_found.length) message += `, ${not_found.length} not found`;
+            alert(message);
+            selectedApprovals.clear();
+            loadApprovals();
+        } else {
+            alert('Error: ' + result.error);
+        }
+    } catch (error) {
+        console.error('Error in bulk action:', error);
+        alert('Error applying bulk action');
+    }
+}
+
 function renderApprovals(approvals) {
     const container = document.getElementById('approvals-list');
+    updateSelectedCount();
     
     if (approvals.length === 0) {
         container.innerHTML = '<div class="loading">No pending approvals</div>';
@@ -36,6 +132,8 @@ function renderApprovals(approvals) {
         <div class="approval-card">
             <div class="approval-card-header">
                 <div>
+                    <input type="checkbox" ${selectedApprovals.has(approval.filename) ? 'checked' : ''}
+                        onchange="toggleSelection('${escapeHtml(approval.filename)}', this.checked)">
                     <h4>${escapeHtml(approval.filename)}</h4>
                     <span class="text-muted">${escapeHtml(approval.type)}</span>
                 </div>
@@ -131,7 +229,9 @@ async function rejectApproval() {
     
     try {
         const response = await fetch(`/api/approvals/${encodeURIComponent(currentApproval.filename)}/reject`, {
-            method: 'POST'
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ reason })
         });
         
         const result = await response.json();
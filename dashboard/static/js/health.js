@@ -4,6 +4,7 @@
 
 document.addEventListener('DOMContentLoaded', function() {
     loadHealthStatus();
+    loadBreakers();
     loadLogs();
 });
 
@@ -76,6 +77,42 @@ function updateResource(type, value) {
     }
 }
 
+async function loadBreakers() {
+    try {
+        const response = await fetch('/api/health/breakers');
+        const result = await response.json();
+        
+        if (result.success) {
+            const container = document.getElementById('breakers-container');
+            const breakers = Object.values(result.data.breakers || {});
+            
+            if (breakers.length === 0) {
+                container.innerHTML = '<div class="loading">No external calls recorded</div>';
+                return;
+            }
+            
+            container.innerHTML = breakers.map(breaker => {
+                let levelClass = 'log-level-info';
+                if (breaker.state === 'open') levelClass = 'log-level-error';
+                else if (breaker.state === 'half_open') levelClass = 'log-level-warning';
+                
+                const detail = breaker.state === 'closed'
+                    ? `${breaker.calls || 0} calls, ${breaker.failures || 0} failures`
+                    : `${breaker.consecutive_failures} consecutive failures - ${breaker.last_error || ''}`;
+                
+                return `
+                    <div class="log-entry">
+                        <span class="log-time">[${escapeHtml(breaker.name)}]</span>
+                        <span class="${levelClass}">${escapeHtml(breaker.state)}: ${escapeHtml(detail)}</span>
+                    </div>
+                `;
+            }).join('');
+        }
+    } catch (error) {
+        console.error('Error loading circuit breakers:', error);
+    }
+}
+
 async function loadLogs() {
     try {
         const response = await fetch('/api/health/logs');
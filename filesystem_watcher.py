@@ -4,7 +4,7 @@ FileSystem Watcher for AI Employee - Silver Tier
 This module monitors the Inbox folder (AI_Employee_Vault/Inbox) for new .md files.
 When a new file appears, it:
 1. Moves the file to Needs_Action using vault_skills.move_to_needs_action()
-2. Triggers the task-planner skill using the T class from Claude SDK 0.1.39
+2. Triggers the task-planner skill (single-flight, fast-path rules then the T class)
 3. Writes the plan to Plan_*.md in Needs_Action using vault_skills.write_plan()
 """
 
@@ -17,8 +17,8 @@ import asyncio
 import argparse
 
 from log_manager import setup_logging
-from skills.vault_skills import get_vault, write_plan
-from claude_sdk_wrapper import T
+from skills.vault_skills import get_vault
+from skills.task_planner_skill import plan_task_once
 
 # Setup logger for filesystem_watcher (Silver Tier log path)
 logger = setup_logging(log_file="logs/ai_employee.log", logger_name="filesystem_watcher")
@@ -76,38 +76,14 @@ class InboxHandler(FileSystemEventHandler):
             file_name: Name of the file in Needs_Action to process.
         """
         try:
-            # Create the task-planner prompt
-            plan_prompt = f"""Process the task file '{file_name}' located in AI_Employee_Vault/Needs_Action.
-
-Your responsibilities:
-1. Read and analyze the content of the task file
-2. Generate a detailed, step-by-step implementation plan
-3. Return the plan in markdown format with clear sections and checkboxes for action items.
-
-File to process: {file_name}
-"""
-            # Use T class to spawn the task-planner subagent (run in foreground to wait for result)
-            task = T(
+            # Single-flight planning: fast-path rules first, then the task-planner
+            # subagent; duplicate triggers for the same file content are joined
+            plan_result = plan_task_once(
+                file_name,
                 description=f"Process new task file {file_name} with task-planner skill",
-                prompt=plan_prompt,
-                subagent_type='task-planner',
-                model='opus',
-                run_in_background=False,  # Run in foreground to get the plan content
-                allowed_tools=["Read", "Write", "Glob", "Edit", "Bash", "Skill"],
-                system_prompt="""You are a task-planner specialist for the AI Employee system.
-Your role is to analyze task files in Needs_Action and generate detailed implementation plans."""
+                vault=self.vault
             )
-
-            # Get the plan output from the task
-            plan_content = task.output
-            logger.info(f"Task-planner completed for {file_name}. Task ID: {task.task_id}")
-
-            # Write the plan to a file using vault_skills
-            if plan_content:
-                plan_result = write_plan(file_name, plan_content)
-                logger.info(f"Plan file created: {plan_result}")
-            else:
-                logger.warning(f"No plan content generated for {file_name}")
+            logger.info(f"Plan file created: {plan_result}")
 
         except Exception as e:
             logger.error(f"Error triggering task-planner skill for {file_name}: {e}")
@@ -23,6 +23,7 @@ Usage:
 import json
 import logging
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -48,6 +49,12 @@ PERSONAL_PATH.mkdir(parents=True, exist_ok=True)
 # Gold Tier log file
 GOLD_TIER_LOG = LOGS_PATH / 'gold_tier.log'
 
+# Platforms the social fan-out can post to
+SOCIAL_PLATFORMS = ("facebook", "instagram", "twitter")
+
+# Fan-out posts log from several threads at once
+_log_lock = threading.Lock()
+
 
 def log_gold_tier_action(action: str, data: Dict[str, Any]):
     """Log Gold Tier action to gold_tier.log."""
@@ -57,7 +64,7 @@ def log_gold_tier_action(action: str, data: Dict[str, Any]):
         "data": data
     }
     
-    with open(GOLD_TIER_LOG, 'a', encoding='utf-8') as f:
+    with _log_lock, open(GOLD_TIER_LOG, 'a', encoding='utf-8') as f:
         f.write(json.dumps(log_entry) + '\n')
     
     logger.info(f"{action}: {json.dumps(data, indent=2)}")
@@ -177,20 +184,81 @@ class GoldTierIntegration:
         
         # Save invoice record to Reports
         if result.get('status') == 'success':
-            invoice_record = {
-                "invoice_id": result['invoice_id'],
-                "invoice_name": result['invoice_name'],
-                "customer": customer_name,
-                "amount": result['amount_total'],
-                "state": result['state'],
-                "due_date": result['due_date'],
-                "plan_file": plan_file,
-                "created_at": datetime.now().isoformat()
-            }
+            self._save_invoice_record(result, customer_name, plan_file)
+        
+        return result
+    
+    def _save_invoice_record(self, result: Dict[str, Any], customer_name: str, plan_file: str):
+        """Save a created invoice's record to Reports (details Odoo did not confirm are null)."""
+        invoice_record = {
+            "invoice_id": result['invoice_id'],
+            "invoice_name": result.get('invoice_name'),
+            "customer": customer_name,
+            "amount": result.get('amount_total'),
+            "state": result.get('state'),
+            "due_date": result.get('due_date'),
+            "plan_file": plan_file,
+            "created_at": datetime.now().isoformat()
+        }
+        if result.get('message'):
+            invoice_record["note"] = result['message']
+        
+        invoice_file = REPORTS_PATH / f"invoice_{result['invoice_id']}.json"
+        with open(invoice_file, 'w', encoding='utf-8') as f:
+            json.dump(invoice_record, f, indent=2)
+    
+    def create_invoices_from_plan(
+        self,
+        plan_file: str,
+        invoices: List[Dict[str, Any]],
+        auto_validate: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Create a batch of invoices (e.g. month-end billing) from plan data.
+        
+        Uses OdooMCPServer.create_invoices_bulk, so the whole batch costs a
+        few round trips instead of several per invoice.
+        
+        Args:
+            plan_file: Path to plan file in Needs_Action
+            invoices: [{"customer_name": str, "items": [...], "description": str, ...}]
+            auto_validate: Whether to validate immediately
             
-            invoice_file = REPORTS_PATH / f"invoice_{result['invoice_id']}.json"
-            with open(invoice_file, 'w', encoding='utf-8') as f:
-                json.dump(invoice_record, f, indent=2)
+        Returns:
+            Bulk result with one entry per invoice
+        """
+        if not self.odoo:
+            self._init_odoo()
+        
+        if not self.odoo:
+            return {"status": "error", "message": "Odoo not available"}
+        
+        logger.info(f"Creating {len(invoices)} invoices from plan: {plan_file}")
+        
+        batch = [
+            dict(invoice, description=invoice.get("description") or f"Generated from plan: {plan_file}")
+            for invoice in invoices
+        ]
+        result = self.odoo.create_invoices_bulk(batch, auto_validate=auto_validate)
+        
+        log_gold_tier_action("invoices_created_bulk", {
+            "plan_file": plan_file,
+            "total": result.get("total", 0),
+            "succeeded": result.get("succeeded", 0),
+            "partial": result.get("partial", 0),
+            "failed": result.get("failed", 0),
+            "amount_total": result.get("amount_total", 0),
+            "rpc_calls": result.get("rpc_calls", 0),
+            "failures": [
+                {"customer": item.get("customer"), "message": item.get("message")}
+                for item in result.get("results", []) if item.get("status") != "success"
+            ]
+        })
+        
+        for item in result.get("results", []):
+            # Partial items (posting or read-back unconfirmed) exist in Odoo too
+            if item.get("invoice_id"):
+                self._save_invoice_record(item, item["customer"], plan_file)
         
         return result
     
@@ -261,6 +329,39 @@ class GoldTierIntegration:
         
         return result
     
+    def record_payments_from_plan(self, payments: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Record a batch of invoice payments.
+        
+        Args:
+            payments: [{"invoice_id": int, "amount": float, "payment_date": str, "reference": str}]
+            
+        Returns:
+            Bulk result with one entry per payment
+        """
+        if not self.odoo:
+            self._init_odoo()
+        
+        if not self.odoo:
+            return {"status": "error", "message": "Odoo not available"}
+        
+        result = self.odoo.record_payments_bulk(payments)
+        
+        log_gold_tier_action("payments_recorded_bulk", {
+            "total": result.get("total", 0),
+            "succeeded": result.get("succeeded", 0),
+            "partial": result.get("partial", 0),
+            "failed": result.get("failed", 0),
+            "amount_total": result.get("amount_total", 0),
+            "rpc_calls": result.get("rpc_calls", 0),
+            "failures": [
+                {"invoice_id": item.get("invoice_id"), "message": item.get("message")}
+                for item in result.get("results", []) if item.get("status") != "success"
+            ]
+        })
+        
+        return result
+    
     # ==================== TWITTER INTEGRATION ====================
     
     def post_tweet_from_plan(
@@ -420,6 +521,82 @@ class GoldTierIntegration:
         
         return result
     
+    def fan_out_from_plan(
+        self,
+        plan_file: str,
+        content: str,
+        platforms: List[str] = None,
+        image_path: str = None,
+        facebook_link: str = None,
+        retries: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Post the same content to several platforms concurrently.
+
+        Each platform posts on its own worker thread, so a cross-post takes
+        as long as the slowest platform instead of the sum of all of them.
+        Failed platforms are not retried unless the caller asks for
+        ``retries`` rounds (a failed post may still have been published);
+        platforms that already posted are never posted again. To retry
+        later, pass the returned ``failed`` list back as ``platforms``.
+
+        Args:
+            plan_file: Path to plan file
+            content: Post content
+            platforms: Any of 'facebook', 'instagram', 'twitter'
+                (default: facebook and instagram)
+            image_path: Path to image (required for Instagram)
+            facebook_link: URL for Facebook
+            retries: Retry rounds for failed platforms (default: none)
+
+        Returns:
+            Fan-out result with per-platform results, ``failed`` platforms,
+            ``wall_ms`` and ``sum_ms``
+        """
+        from scripts.social_fanout import fan_out, retry_failed
+
+        platforms = list(platforms or ["facebook", "instagram"])
+        unknown = [p for p in platforms if p not in SOCIAL_PLATFORMS]
+        if unknown:
+            return {"status": "error", "message": f"Unknown platform(s): {', '.join(unknown)}"}
+
+        # Load clients up front; lazy init from several threads would race
+        if "twitter" in platforms and not self.twitter:
+            self._init_twitter()
+        if {"facebook", "instagram"} & set(platforms) and not self.social:
+            self._init_social()
+
+        posts = {
+            "facebook": lambda: self.post_facebook_from_plan(
+                plan_file=plan_file, content=content, image_path=image_path, link=facebook_link
+            ),
+            "instagram": lambda: self.post_instagram_from_plan(
+                plan_file=plan_file, content=content, image_path=image_path
+            ) if image_path else {"status": "error", "message": "Instagram requires an image"},
+            "twitter": lambda: self.post_tweet_from_plan(plan_file=plan_file, content=content),
+        }
+        posts = {platform: posts[platform] for platform in platforms}
+
+        logger.info(f"Fanning out post to {', '.join(platforms)} from plan: {plan_file}")
+        outcome = fan_out(posts)
+        for _ in range(max(0, retries)):
+            if not outcome.failed:
+                break
+            outcome = retry_failed(outcome, posts)
+
+        result = outcome.to_dict()
+        log_gold_tier_action("social_fanout", {
+            "plan_file": plan_file,
+            "content": content[:50] + "..." if len(content) > 50 else content,
+            "status": result["status"],
+            "succeeded": result["succeeded"],
+            "failed": result["failed"],
+            "wall_ms": result["wall_ms"],
+            "sum_ms": result["sum_ms"]
+        })
+
+        return result
+
     def post_to_both_from_plan(
         self,
         plan_file: str,
@@ -428,7 +605,7 @@ class GoldTierIntegration:
         facebook_link: str = None
     ) -> Dict[str, Any]:
         """
-        Post to both Facebook and Instagram based on plan data.
+        Post to both Facebook and Instagram (concurrently) based on plan data.
         
         Args:
             plan_file: Path to plan file
@@ -437,29 +614,15 @@ class GoldTierIntegration:
             facebook_link: URL for Facebook
             
         Returns:
-            Combined posting result
+            Fan-out result (see fan_out_from_plan)
         """
-        if not self.social:
-            self._init_social()
-        
-        if not self.social:
-            return {"status": "error", "message": "Social Media not available"}
-        
-        logger.info(f"Posting to both platforms from plan: {plan_file}")
-        
-        result = self.social.post_to_both(
+        return self.fan_out_from_plan(
+            plan_file=plan_file,
             content=content,
+            platforms=["facebook", "instagram"],
             image_path=image_path,
             facebook_link=facebook_link
         )
-        
-        log_gold_tier_action("cross_posted", {
-            "plan_file": plan_file,
-            "content": content[:50] + "..." if len(content) > 50 else content,
-            "result": result
-        })
-        
-        return result
     
     # ==================== PERSONAL TASK INTEGRATION ====================
     
@@ -590,14 +753,25 @@ class GoldTierIntegration:
         Args:
             plan_file: Path to plan file
             content: Post content
-            platform: 'facebook', 'instagram', or 'both'
+            platform: 'facebook', 'instagram', 'twitter', 'both'
+                (Facebook + Instagram) or 'all'
             image_path: Path to image
             facebook_link: URL for Facebook
 
         Returns:
             Posting result
         """
-        if platform == "facebook":
+        if platform == "all":
+            return self.fan_out_from_plan(
+                plan_file=plan_file,
+                content=content,
+                platforms=list(SOCIAL_PLATFORMS),
+                image_path=image_path,
+                facebook_link=facebook_link
+            )
+        elif platform == "twitter":
+            return self.post_tweet_from_plan(plan_file=plan_file, content=content)
+        elif platform == "facebook":
             return self.post_facebook_from_plan(
                 plan_file=plan_file,
                 content=content,
@@ -661,6 +835,26 @@ def create_invoice_from_plan(
     )
 
 
+def create_invoices_from_plan(
+    plan_file: str,
+    invoices: List[Dict[str, Any]],
+    auto_validate: bool = False
+) -> Dict[str, Any]:
+    """Create a batch of invoices from plan data."""
+    integration = GoldTierIntegration()
+    return integration.create_invoices_from_plan(
+        plan_file=plan_file,
+        invoices=invoices,
+        auto_validate=auto_validate
+    )
+
+
+def record_payments_from_plan(payments: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Record a batch of invoice payments."""
+    integration = GoldTierIntegration()
+    return integration.record_payments_from_plan(payments)
+
+
 def post_tweet_from_plan(
     plan_file: str,
     content: str,
@@ -688,34 +882,18 @@ def post_social_from_plan(
     Args:
         plan_file: Path to plan file
         content: Post content
-        platform: 'facebook', 'instagram', or 'both'
+        platform: 'facebook', 'instagram', 'twitter', 'both' or 'all'
         image_path: Path to image
         facebook_link: URL for Facebook
     """
     integration = GoldTierIntegration()
-    
-    if platform == "facebook":
-        return integration.post_facebook_from_plan(
-            plan_file=plan_file,
-            content=content,
-            image_path=image_path,
-            link=facebook_link
-        )
-    elif platform == "instagram":
-        if not image_path:
-            return {"status": "error", "message": "Instagram requires an image"}
-        return integration.post_instagram_from_plan(
-            plan_file=plan_file,
-            content=content,
-            image_path=image_path
-        )
-    else:  # both
-        return integration.post_to_both_from_plan(
-            plan_file=plan_file,
-            content=content,
-            image_path=image_path,
-            facebook_link=facebook_link
-        )
+    return integration.post_social_from_plan(
+        plan_file=plan_file,
+        content=content,
+        platform=platform,
+        image_path=image_path,
+        facebook_link=facebook_link
+    )
 
 
 def sync_personal_tasks(
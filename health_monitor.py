@@ -27,6 +27,7 @@ from datetime import datetime
 from typing import List, Dict, Any
 
 from log_manager import setup_logging
+from scripts.resilience import read_breaker_states
 
 # Setup logging
 logger = setup_logging(
@@ -96,6 +97,10 @@ class HealthMonitor:
         self.restart_count = {}
         self.max_restarts_before_alert = 3
         
+        # Circuit breakers already alerted on (name -> opened_at)
+        self.alerted_breakers = {}
+        self.breaker_states = {}
+        
         # Statistics
         self.stats = {
             'checks_performed': 0,
@@ -356,6 +361,31 @@ class HealthMonitor:
             logger.error(f"Error checking CPU: {e}")
             return False
 
+    def check_circuit_breakers(self) -> List[str]:
+        """
+        Check the MCP clients' circuit breakers.
+        
+        Alerts once each time an endpoint's circuit opens.
+        
+        Returns:
+            List of endpoints whose circuit is not closed
+        """
+        self.breaker_states = read_breaker_states()
+        degraded = []
+        for name, state in self.breaker_states.items():
+            if state.get('state') == 'closed':
+                self.alerted_breakers.pop(name, None)
+                continue
+            degraded.append(name)
+            logger.warning(f"Circuit for {name} is {state.get('state')}: {state.get('last_error', '')}")
+            if state.get('state') == 'open' and self.alerted_breakers.get(name) != state.get('opened_at'):
+                self.alerted_breakers[name] = state.get('opened_at')
+                self.alert_human(
+                    f"Circuit breaker open for {name} after {state.get('consecutive_failures', 0)} "
+                    f"consecutive failures: {state.get('last_error', 'unknown error')}"
+                )
+        return degraded
+
     def alert_human(self, message: str, severity: str = "high"):
         """
         Send alert to human via vault file and console.
@@ -455,6 +485,17 @@ agent_type: {self.agent_type}
             else:
                 health_content += "- No restarts\n"
             
+            health_content += "\n## Circuit Breakers\n"
+            if self.breaker_states:
+                health_content += "| Endpoint | State | Failures | Last Error |\n|----------|-------|----------|------------|\n"
+                for name, state in sorted(self.breaker_states.items()):
+                    health_content += (
+                        f"| {name} | {state.get('state')} | {state.get('consecutive_failures', 0)} "
+                        f"| {(state.get('last_error') or '-').replace('|', '/')[:80]} |\n"
+                    )
+            else:
+                health_content += "- No external calls recorded\n"
+            
             health_file.write_text(health_content)
             logger.debug("Health status written")
             
@@ -497,6 +538,9 @@ agent_type: {self.agent_type}
                 self.check_memory()
                 self.check_cpu()
                 
+                # Check external endpoints (MCP circuit breakers)
+                self.check_circuit_breakers()
+                
                 # Write health status
                 self.write_health_status()
                 
@@ -28,6 +28,10 @@ Environment Variables:
     ODOO_DB: Database name (default: odoo_db)
     ODOO_USERNAME: Odoo username (default: admin)
     ODOO_PASSWORD: Odoo password (default: admin)
+    ODOO_PROTOCOL: 'xmlrpc' or 'jsonrpc' (default: xmlrpc)
+    ODOO_POOL_SIZE: Keep-alive connections per Odoo URL (default: 4)
+    ODOO_CACHE_ENABLED: Cache Odoo reads, invalidated by writes (default: true)
+    ODOO_CACHE_TTL: Cache TTL in seconds for models without their own (default: 60)
     LOG_LEVEL: Logging level (default: INFO)
 """
 
@@ -41,6 +45,16 @@ from typing import Any, Dict, List, Optional
 
 import xmlrpc.client
 
+# Project root on sys.path for the shared resilience layer
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts import odoo_bulk
+from scripts.odoo_cache import get_odoo_cache
+from scripts.odoo_transport import cached_login, get_rpc_client
+from scripts.resilience import get_circuit_breaker, retry_call
+
 # Configure logging
 log_level = os.getenv('LOG_LEVEL', 'INFO')
 logging.basicConfig(
@@ -56,6 +70,10 @@ ODOO_DB = os.getenv('ODOO_DB', 'odoo_db')
 ODOO_USERNAME = os.getenv('ODOO_USERNAME', 'admin')
 ODOO_PASSWORD = os.getenv('ODOO_PASSWORD', 'admin')
 
+# Read-only methods that are safe to retry on transport errors
+RETRYABLE_METHODS = {"search", "read", "search_read", "search_count", "read_group", "fields_get", "name_search"}
+ODOO_TRANSIENT_ERRORS = (OSError, xmlrpc.client.ProtocolError)
+
 
 class OdooMCPServer:
     """
@@ -70,7 +88,8 @@ class OdooMCPServer:
         url: str = None,
         db: str = None,
         username: str = None,
-        password: str = None
+        password: str = None,
+        protocol: str = None
     ):
         """
         Initialize Odoo MCP connection.
@@ -80,6 +99,7 @@ class OdooMCPServer:
             db: Database name
             username: Odoo username (email)
             password: Odoo password
+            protocol: 'xmlrpc' or 'jsonrpc' (default: ODOO_PROTOCOL env, else xmlrpc)
         """
         self.url = url or ODOO_URL
         self.db = db or ODOO_DB
@@ -87,40 +107,47 @@ class OdooMCPServer:
         self.password = password or ODOO_PASSWORD
 
         self.uid = None
-        self.common = None
-        self.models = None
+        # Shared keep-alive connection pool for this Odoo URL
+        self.rpc = get_rpc_client(self.url, protocol)
+        # Process-wide read-through cache, invalidated by writes
+        self.cache = get_odoo_cache()
 
         logger.info(f"Initializing Odoo MCP connection to {self.url}")
-        self._authenticate()
+        self._authenticate(use_cached=True)
+
+    def _authenticate(self, use_cached: bool = False):
+        """
+        Authenticate with Odoo and establish session.
 
-    def _authenticate(self):
-        """Authenticate with Odoo and establish session."""
+        Args:
+            use_cached: Reuse the session uid this process already holds for
+                these credentials instead of logging in again
+        """
         try:
-            # Common endpoint for authentication
-            common_url = f"{self.url}/xmlrpc/2/common"
-            self.common = xmlrpc.client.ServerProxy(common_url)
-
-            # Authenticate and get user ID
-            self.uid = self.common.authenticate(
-                self.db,
-                self.username,
-                self.password,
-                {}
-            )
+            self.uid = cached_login(self.rpc, self.db, self.username, self.password, refresh=not use_cached)
 
             if not self.uid:
                 raise Exception("Authentication failed. Check credentials.")
 
-            # Models endpoint for operations
-            models_url = f"{self.url}/xmlrpc/2/object"
-            self.models = xmlrpc.client.ServerProxy(models_url)
-
-            logger.info(f"Successfully authenticated as user ID: {self.uid}")
+            logger.info(f"Successfully authenticated as user ID: {self.uid} ({self.rpc.protocol})")
 
         except Exception as e:
             logger.error(f"Failed to authenticate with Odoo: {e}")
             raise
 
+    @property
+    def _cache_namespace(self):
+        """Cached reads belong to one database and user."""
+        return (self.rpc.url, self.db, self.uid)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Read cache hit/miss statistics."""
+        return self.cache.stats()
+
+    def clear_cache(self):
+        """Drop all cached Odoo reads (e.g. after changes made in the Odoo UI)."""
+        self.cache.clear(self._cache_namespace)
+
     def _execute(self, model: str, method: str, *args, **kwargs):
         """
         Execute a method on an Odoo model.
@@ -133,20 +160,40 @@ class OdooMCPServer:
 
         Returns:
             Method result
+
+        Raises:
+            CircuitOpenError: If Odoo has been failing and its circuit is open
         """
         if not self.uid:
             raise Exception("Not authenticated. Call _authenticate() first.")
 
+        def call():
+            # Faults are Odoo answering with an error: the endpoint is up
+            with get_circuit_breaker("odoo").guard(ignore=(xmlrpc.client.Fault,)):
+                return self.rpc.execute_kw(
+                    self.db,
+                    self.uid,
+                    self.password,
+                    model,
+                    method,
+                    args,
+                    kwargs
+                )
+
         try:
-            result = self.models.execute_kw(
-                self.db,
-                self.uid,
-                self.password,
-                model,
-                method,
-                args,
-                kwargs
-            )
+            if method in RETRYABLE_METHODS:
+                result = self.cache.get_or_call(
+                    self._cache_namespace, model, method, args, kwargs,
+                    lambda: retry_call(call, endpoint="odoo", max_attempts=3, base_delay=0.5,
+                                       retry_on=ODOO_TRANSIENT_ERRORS)
+                )
+            else:
+                # Writes are not retried: a lost response may hide a committed write
+                try:
+                    result = call()
+                finally:
+                    # Even a failed write may have committed: drop affected reads
+                    self.cache.invalidate(self._cache_namespace, model)
             logger.debug(f"Executed {method} on {model}: {result}")
             return result
         except Exception as e:
@@ -275,7 +322,8 @@ class OdooMCPServer:
                 "account.move",
                 "search",
                 domain,
-                {"limit": limit, "order": "invoice_date desc"}
+                limit=limit,
+                order="invoice_date desc"
             )
 
             # Read invoice details
@@ -379,6 +427,47 @@ class OdooMCPServer:
             logger.error(f"Failed to record payment: {e}")
             return {"status": "error", "message": str(e)}
 
+    def create_invoices_bulk(
+        self,
+        invoices: List[Dict[str, Any]],
+        auto_validate: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Create many customer invoices in a few round trips.
+
+        Customers are resolved with one search_read, invoices created with one
+        multi-record create and posted with one action_post (per chunk of
+        ODOO_BULK_CHUNK records). Records Odoo rejects are isolated and
+        reported without failing the rest.
+
+        Args:
+            invoices: [{"customer_name": str, "items": [...], "description": str,
+                        "invoice_date": str, "due_date": str, "reference": str}]
+            auto_validate: If True, post the invoices after creating them
+
+        Returns:
+            Dictionary with status ('success', 'partial', 'error'), counts and
+            one result per invoice, in input order
+        """
+        return odoo_bulk.create_invoices_bulk(self, invoices, auto_validate=auto_validate)
+
+    def record_payments_bulk(self, payments: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Record many invoice payments in a few round trips.
+
+        Invoices are read with one call and drafts posted with one
+        action_post; invoices paid in full share one payment wizard per
+        payment date, partial payments get their own.
+
+        Args:
+            payments: [{"invoice_id": int, "amount": float, "payment_date": str, "reference": str}]
+
+        Returns:
+            Dictionary with status ('success', 'partial', 'error'), counts and
+            one result per payment, in input order
+        """
+        return odoo_bulk.record_payments_bulk(self, payments)
+
     # ==================== PARTNER MANAGEMENT ====================
 
     def _find_partner(self, name: str) -> Optional[int]:
@@ -388,7 +477,7 @@ class OdooMCPServer:
                 "res.partner",
                 "search",
                 [("name", "=ilike", name)],
-                {"limit": 1}
+                limit=1
             )
             return partner_ids[0] if partner_ids else None
         except Exception as e:
@@ -443,7 +532,7 @@ class OdooMCPServer:
     def test_connection(self) -> Dict[str, Any]:
         """Test Odoo connection and return server info."""
         try:
-            version = self.common.version()
+            version = self.rpc.version()
             return {
                 "status": "success",
                 "connected": True,
@@ -451,7 +540,9 @@ class OdooMCPServer:
                 "database": self.db,
                 "user_id": self.uid,
                 "odoo_version": version.get("server_version", "unknown"),
-                "server_info": version
+                "server_info": version,
+                "transport": self.rpc.stats(),
+                "cache": self.cache.stats()
             }
         except Exception as e:
             return {
@@ -16,12 +16,26 @@ Usage:
 """
 
 import logging
+import os
+import time
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import json
 from datetime import datetime
 
 from log_manager import setup_logging
+from scripts.approval_store import ApprovalState, approval_id_for, get_approval_store
+from scripts.execution_ledger import get_execution_ledger
+from scripts.execution_notifier import get_execution_notifier
+from scripts.mcp_client_registry import MCPClientRegistry
+from scripts.execution_scheduler import (
+    ActionSchedule,
+    ExecutionScheduler,
+    action_schedule,
+    channel_for,
+    get_execution_scheduler,
+)
 
 # Setup logging
 logger = setup_logging(
@@ -40,6 +54,48 @@ for path in [PENDING_APPROVAL_PATH, APPROVED_PATH, REJECTED_PATH]:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def _email_client():
+    from scripts import send_email
+    return send_email
+
+
+def _reset_gmail_session(send_email_module):
+    # Drop this thread's cached Gmail service; the next send re-authenticates
+    send_email_module._service_cache.__dict__.clear()
+
+
+def _facebook_client():
+    from scripts.facebook_mcp_server import FacebookMCPServer
+    return FacebookMCPServer()
+
+
+def _twitter_client():
+    from scripts.twitter_mcp_server import TwitterMCPServer
+    return TwitterMCPServer()
+
+
+def _odoo_client():
+    from scripts.odoo_mcp_server import OdooMCPServer
+    # Load with full credentials (Local only)
+    return OdooMCPServer(
+        url=os.getenv('ODOO_URL', 'http://localhost:8069'),
+        db=os.getenv('ODOO_DB', 'odoo_db'),
+        username=os.getenv('ODOO_USERNAME', 'admin'),
+        password=os.getenv('ODOO_PASSWORD', '')
+    )
+
+
+def create_client_registry() -> MCPClientRegistry:
+    """MCP clients used by the executor; none is constructed until first use."""
+    idle_ttl = float(os.getenv('MCP_CLIENT_IDLE_TTL', '900'))
+    clients = MCPClientRegistry()
+    clients.register('email', _email_client, idle_ttl=idle_ttl, reauth=_reset_gmail_session)
+    clients.register('facebook', _facebook_client, idle_ttl=idle_ttl)
+    clients.register('twitter', _twitter_client, idle_ttl=idle_ttl)
+    clients.register('odoo', _odoo_client, idle_ttl=idle_ttl, reauth=lambda odoo: odoo._authenticate())
+    return clients
+
+
 class MCPExecutor:
     """
     Platinum Tier MCP Executor
@@ -48,55 +104,71 @@ class MCPExecutor:
     Only runs on Local machine with full credentials access.
     """
 
-    def __init__(self):
-        """Initialize MCP Executor"""
+    def __init__(self, scheduler: ExecutionScheduler = None, clients: MCPClientRegistry = None):
+        """
+        Initialize MCP Executor
+        
+        Args:
+            scheduler: Per-channel execution scheduler (default: shared scheduler)
+            clients: MCP client registry (default: email, Facebook, Twitter and
+                Odoo clients, each constructed on first use)
+        """
         self.executed_actions = []
         self.failed_actions = []
+        self.scheduler = scheduler or get_execution_scheduler()
+        self.ledger = get_execution_ledger()
         
-        # Initialize MCP clients (lazy loading)
-        self.email_mcp = None
-        self.facebook_mcp = None
-        self.twitter_mcp = None
-        self.odoo_mcp = None
+        # MCP clients are built lazily by the action type that needs them
+        self.clients = clients or create_client_registry()
         
         logger.info("MCP Executor initialized (Local only)")
 
-    def _load_mcp_servers(self):
-        """Load MCP server modules"""
-        try:
-            from mcp.business_mcp.server import EmailMCPClient
-            self.email_mcp = EmailMCPClient()
-            logger.info("Email MCP client loaded")
-        except Exception as e:
-            logger.warning(f"Could not load Email MCP: {e}")
+    def submit_from_file(self, approval_file: Path) -> Future:
+        """
+        Queue an approval file on its channel's lane.
         
-        try:
-            from scripts.facebook_mcp_server import FacebookMCPServer
-            self.facebook_mcp = FacebookMCPServer()
-            logger.info("Facebook MCP client loaded")
-        except Exception as e:
-            logger.warning(f"Could not load Facebook MCP: {e}")
+        Actions on different channels run concurrently; each channel has
+        its own concurrency limit and token-bucket rate limit. Within a
+        channel, actions run by priority and deadline (see schedule_from_file()).
         
-        try:
-            from scripts.twitter_mcp_server import TwitterMCPServer
-            self.twitter_mcp = TwitterMCPServer()
-            logger.info("Twitter MCP client loaded")
-        except Exception as e:
-            logger.warning(f"Could not load Twitter MCP: {e}")
+        Args:
+            approval_file: Path to approval file
         
+        Returns:
+            Future resolving to the execute_from_file() result
+        """
+        return self.schedule_from_file(approval_file)[0]
+
+    def schedule_from_file(self, approval_file: Path) -> Tuple[Future, ActionSchedule]:
+        """
+        Queue an approval file by its frontmatter ``priority``/``severity``,
+        ``deadline`` and ``scheduled_for`` fields.
+        
+        Actions scheduled for later wait in the scheduler's timer wheel.
+        
+        Args:
+            approval_file: Path to approval file
+        
+        Returns:
+            (Future resolving to the execute_from_file() result, schedule)
+        """
         try:
-            from scripts.odoo_mcp_server import OdooMCPServer
-            # Load with full credentials (Local only)
-            import os
-            self.odoo_mcp = OdooMCPServer(
-                url=os.getenv('ODOO_URL', 'http://localhost:8069'),
-                db=os.getenv('ODOO_DB', 'odoo_db'),
-                username=os.getenv('ODOO_USERNAME', 'admin'),
-                password=os.getenv('ODOO_PASSWORD', '')
-            )
-            logger.info("Odoo MCP client loaded")
-        except Exception as e:
-            logger.warning(f"Could not load Odoo MCP: {e}")
+            metadata = self._parse_frontmatter(approval_file.read_text())
+        except Exception:
+            metadata = {}
+        channel = channel_for(metadata.get('type', 'unknown'), metadata.get('platform'))
+        schedule = action_schedule(metadata)
+        try:
+            # Age counts from the approval (the file's last write)
+            approved_at = approval_file.stat().st_mtime
+        except OSError:
+            approved_at = None
+        future = self.scheduler.schedule(
+            channel, self.execute_from_file, args=(approval_file,),
+            priority=schedule.priority, deadline=schedule.deadline, not_before=schedule.not_before,
+            ready_since=approved_at
+        )
+        return future, schedule
 
     def execute_from_file(self, approval_file: Path) -> Dict[str, Any]:
         """
@@ -116,24 +188,39 @@ class MCPExecutor:
             
             action_type = metadata.get('type', 'unknown')
             
-            logger.info(f"Executing action type: {action_type} from {approval_file.name}")
-            
-            # Route to appropriate executor
-            if action_type in ['email_triage', 'email_draft']:
-                return self._execute_email_send(content, metadata, approval_file)
+            # Claim the action in the execution ledger: a completed action is
+            # never repeated, even after a restart or a retried approval
+            approval_id = approval_id_for(approval_file)
+            entry = self.ledger.begin(approval_id, action_type, self._action_content(content, metadata))
+            if entry.decision == 'duplicate':
+                logger.info(f"Skipping {approval_file.name}: already executed (idempotent replay)")
+                return {
+                    'success': True,
+                    'action': action_type,
+                    'result': entry.result,
+                    'duplicate': True
+                }
+            if not entry.proceed:
+                logger.warning(f"Not executing {approval_file.name}: {entry.decision} {entry.error}".rstrip())
+                return {
+                    'success': False,
+                    'error': entry.error or f'Action is already {entry.decision}',
+                    'ledger': entry.decision
+                }
             
-            elif action_type in ['social_post_draft', 'facebook_post_approval', 'twitter_post_approval']:
-                return self._execute_social_post(content, metadata, approval_file)
+            logger.info(f"Executing action type: {action_type} from {approval_file.name} (attempt {entry.attempts})")
+            get_execution_notifier().mark_started(approval_id)
             
-            elif action_type == 'payment_approval':
-                return self._execute_payment(content, metadata, approval_file)
+            try:
+                result = self._dispatch(action_type, content, metadata, approval_file)
+            except Exception as e:
+                result = {'success': False, 'error': str(e)}
             
+            if result.get('success'):
+                self.ledger.succeed(entry.key, result)
             else:
-                logger.warning(f"Unknown action type: {action_type}")
-                return {
-                    'success': False,
-                    'error': f'Unknown action type: {action_type}'
-                }
+                self.ledger.fail(entry.key, str(result.get('error') or result.get('message', 'Execution failed')))
+            return result
                 
         except Exception as e:
             logger.error(f"Error executing action from {approval_file}: {e}")
@@ -142,12 +229,46 @@ class MCPExecutor:
                 'error': str(e)
             }
 
+    DISPATCH_ACTION_TYPES = (
+        'email_triage', 'email_draft',
+        'social_post_draft', 'facebook_post_approval', 'twitter_post_approval',
+        'payment_approval',
+    )
+
+    def _dispatch(self, action_type: str, content: str, metadata: Dict[str, Any], approval_file: Path) -> Dict[str, Any]:
+        """Route an action to its executor"""
+        if action_type in ['email_triage', 'email_draft']:
+            return self._execute_email_send(content, metadata, approval_file)
+        
+        elif action_type in ['social_post_draft', 'facebook_post_approval', 'twitter_post_approval']:
+            return self._execute_social_post(content, metadata, approval_file)
+        
+        elif action_type == 'payment_approval':
+            return self._execute_payment(content, metadata, approval_file)
+        
+        else:
+            logger.warning(f"Unknown action type: {action_type}")
+            return {
+                'success': False,
+                'error': f'Unknown action type: {action_type}'
+            }
+
+    @staticmethod
+    def _action_content(content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Content that identifies an action (ignores approval bookkeeping fields)"""
+        bookkeeping = {'status', 'approved', 'approval_reason', 'rejection_reason', 'timeout', 'timeout_extended'}
+        body = content.split('\n---', 2)[-1] if content.startswith('---') else content
+        return {
+            'metadata': {k: v for k, v in metadata.items() if k not in bookkeeping},
+            'body': body.strip()
+        }
+
     def _parse_frontmatter(self, content: str) -> Dict[str, Any]:
         """Parse YAML frontmatter from markdown content"""
         import re
         
         # Extract frontmatter between --- markers
-        match = re.search(r'^---\s*\n(.*?)\n---\s*$', content, re.DOTALL)
+        match = re.search(r'\A---\s*\n(.*?)\n---\s*$', content, re.DOTALL | re.MULTILINE)
         if not match:
             return {}
         
@@ -178,15 +299,6 @@ class MCPExecutor:
         """Execute email send action"""
         logger.info("Executing email send...")
         
-        if not self.email_mcp:
-            self._load_mcp_servers()
-        
-        if not self.email_mcp:
-            return {
-                'success': False,
-                'error': 'Email MCP not available'
-            }
-        
         try:
             # Extract email details from content
             to_email = metadata.get('to', metadata.get('from', ''))
@@ -198,7 +310,8 @@ class MCPExecutor:
             body = draft_match.group(1).strip() if draft_match else "Please see attached."
             
             # Send email
-            result = self.email_mcp.send_email(
+            result = self.clients.call(
+                'email', 'send_gmail_email',
                 to=to_email,
                 subject=subject,
                 body=body
@@ -245,9 +358,6 @@ class MCPExecutor:
         platform = metadata.get('platform', 'unknown')
         logger.info(f"Executing {platform} post...")
         
-        if not self.facebook_mcp and not self.twitter_mcp:
-            self._load_mcp_servers()
-        
         try:
             # Extract post content
             import re
@@ -260,25 +370,18 @@ class MCPExecutor:
             post_content = content_match.group(1).strip() if content_match else "No content"
             
             if platform == 'facebook':
-                if not self.facebook_mcp:
-                    return {'success': False, 'error': 'Facebook MCP not available'}
-                
-                result = self.facebook_mcp.post_to_facebook(
+                result = self.clients.call(
+                    'facebook', 'post_to_facebook',
                     content=post_content,
                     page_name=metadata.get('page_name')
                 )
                 
             elif platform == 'twitter':
-                if not self.twitter_mcp:
-                    return {'success': False, 'error': 'Twitter MCP not available'}
-                
-                result = self.twitter_mcp.post_tweet(content=post_content)
+                result = self.clients.call('twitter', 'post_tweet', content=post_content)
                 
             elif platform == 'instagram':
-                if not self.facebook_mcp:
-                    return {'success': False, 'error': 'Facebook MCP not available'}
-                
-                result = self.facebook_mcp.post_to_instagram(
+                result = self.clients.call(
+                    'facebook', 'post_to_instagram',
                     content=post_content,
                     caption=metadata.get('caption', post_content)
                 )
@@ -329,22 +432,14 @@ class MCPExecutor:
         """Execute payment action via Odoo"""
         logger.info("Executing payment...")
         
-        if not self.odoo_mcp:
-            self._load_mcp_servers()
-        
-        if not self.odoo_mcp:
-            return {
-                'success': False,
-                'error': 'Odoo MCP not available'
-            }
-        
         try:
             amount = float(metadata.get('amount', 0))
             recipient = metadata.get('recipient', 'Unknown')
             reference = metadata.get('reference', '')
             
             # Record payment in Odoo
-            result = self.odoo_mcp.record_payment(
+            result = self.clients.call(
+                'odoo', 'record_payment',
                 amount=amount,
                 partner_name=recipient,
                 reference=reference
@@ -393,89 +488,130 @@ class MCPExecutor:
             'total_failed': len(self.failed_actions),
             'success_rate': len(self.executed_actions) / (len(self.executed_actions) + len(self.failed_actions)) * 100 if (self.executed_actions or self.failed_actions) else 0,
             'executed_actions': self.executed_actions,
-            'failed_actions': self.failed_actions
+            'failed_actions': self.failed_actions,
+            'lanes': self.scheduler.stats(),
+            'delayed': self.scheduler.delayed(),
+            'clients': self.clients.stats()
         }
 
 
+# Approval types run() executes, mapped to the action they trigger. Other
+# approved types (DISPATCH_ACTION_TYPES) are executed by the local orchestrator.
+RUN_ACTION_TYPES = {
+    "email_send_approval": "gmail_send",
+    "linkedin_post_approval": "linkedin_post",
+}
+
+
 def run():
     """
     Run MCP Executor in continuous mode.
-    Monitors Pending_Approval folder and executes approved actions.
+    Executes approved actions as soon as the dashboard pushes them, and
+    polls the Pending_Approval folder as a fallback.
     This is the main entry point for PM2.
     """
     logger.info("=== MCP Executor starting in continuous mode ===")
     logger.info(f"Monitoring folder: {PENDING_APPROVAL_PATH}")
 
-    processed_files = set()
-    check_interval = 10  # Check every 10 seconds
+    executor = MCPExecutor()
+    store = get_approval_store()
+    notifier = get_execution_notifier()
+    if notifier.listen("mcp-executor"):
+        logger.info("Listening for approval notifications")
+    else:
+        logger.warning("Unix sockets unavailable; checking the notification queue by polling")
+    # Finished actions are tracked durably (approval store + execution ledger),
+    # so a restart neither re-sends nor forgets them
+    in_flight = {}  # file stem -> Future; actions run concurrently on per-channel lanes
+    not_handled = set()  # approvals for other consumers, logged once
+    check_interval = 10  # Fallback folder scan every 10 seconds
+    compact_interval = 3600  # Prune old ledger entries hourly
+    last_compact = 0.0
+    last_scan = 0.0
+
+    def on_done(file_id: str, approval_id: str, action_type: str, future: Future):
+        in_flight.pop(file_id, None)
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        logger.info(f"Execution result for {approval_id}: {'success' if result.get('success') else 'failed'}")
+        if result.get('success'):
+            store.transition(approval_id, ApprovalState.EXECUTED, f"Executed {action_type}")
+        else:
+            store.transition(approval_id, ApprovalState.FAILED,
+                             str(result.get('error') or result.get('message', 'Execution failed')))
+        notifier.mark_finished(approval_id, bool(result.get('success')))
+
+    def process(approval_file: Path):
+        approval_id = approval_file.stem
+
+        # Skip running files (finished ones are no longer APPROVED in the store)
+        if approval_id in in_flight:
+            return
+
+        claimed = False
+        try:
+            # Check if approved (frontmatter only; re-parsed only when the file changed)
+            record = store.sync_file(approval_file)
+            if record is None or record.state != ApprovalState.APPROVED:
+                return  # Not yet approved (or already executed), skip
+
+            action_type = RUN_ACTION_TYPES.get(record.action_type)
+            if action_type is None:
+                # Another consumer (e.g. the local orchestrator) executes it; leave its state alone
+                if approval_id not in not_handled:
+                    logger.info(f"{approval_id} ({record.action_type}) is not handled by mcp-executor, skipping")
+                    not_handled.add(approval_id)
+                return
+
+            claimed = True
+            logger.info(f"Found approved action: {action_type} (ID: {approval_id})")
+
+            future = executor.submit_from_file(approval_file)
+            in_flight[approval_id] = future
+            future.add_done_callback(
+                lambda f, fid=approval_id, aid=record.approval_id, at=action_type: on_done(fid, aid, at, f)
+            )
+
+        except Exception as e:
+            logger.error(f"Error processing {approval_id}: {e}")
+            # Only fail approvals this executor took on; others are retried on the next scan
+            if claimed:
+                store.transition(approval_id_for(approval_file), ApprovalState.FAILED, str(e))
 
     while True:
         try:
-            # Scan for approval files
-            if PENDING_APPROVAL_PATH.exists():
-                for approval_file in PENDING_APPROVAL_PATH.glob("*.md"):
-                    approval_id = approval_file.stem
-
-                    # Skip already processed files
-                    if approval_id in processed_files:
-                        continue
-
-                    try:
-                        content = approval_file.read_text(encoding="utf-8")
-
-                        # Check if approved
-                        if "approved: true" not in content.lower() and "status: approved" not in content.lower():
-                            continue  # Not yet approved, skip
-
-                        # Determine action type and extract data
-                        action_type = None
-                        action_data = {}
-
-                        if "type: email_send_approval" in content.lower():
-                            action_type = "gmail_send"
-                            # Extract recipient email
-                            for line in content.splitlines():
-                                if "recipient_email:" in line.lower():
-                                    action_data["to"] = line.split(":", 1)[1].strip().strip('"')
-                                elif "subject:" in line.lower():
-                                    action_data["subject"] = line.split(":", 1)[1].strip()
-
-                            # Get full email content
-                            if "full_email_content:" in content.lower():
-                                idx = content.find("full_email_content:")
-                                if idx != -1:
-                                    block = content[idx:]
-                                    if "|" in block:
-                                        action_data["body"] = block.split("|", 1)[1].strip()
-
-                        elif "type: linkedin_post_approval" in content.lower():
-                            action_type = "linkedin_post"
-                            # Get final post content
-                            if "final_post_content:" in content.lower():
-                                idx = content.find("final_post_content:")
-                                if idx != -1:
-                                    block = content[idx:]
-                                    if "|" in block:
-                                        action_data["content"] = block.split("|", 1)[1].strip()
-
-                        if action_type:
-                            logger.info(f"Found approved action: {action_type} (ID: {approval_id})")
-
-                            result = executor.execute_from_file(approval_file)
-
-                            logger.info(f"Execution result: {'success' if result.get('success') else 'failed'}")
-                            processed_files.add(approval_id)
-                        else:
-                            logger.warning(f"Unknown action type in {approval_id}, skipping")
-
-                    except Exception as e:
-                        logger.error(f"Error processing {approval_id}: {e}")
-                        processed_files.add(approval_id)  # Skip on error
-
-            time.sleep(check_interval)  # Poll every 10 seconds
+            # Pushed approvals first: they start within milliseconds of the click
+            for notification in notifier.drain("mcp-executor", action_types=RUN_ACTION_TYPES):
+                approval_file = Path(notification['file_path'])
+                if approval_file.exists():
+                    process(approval_file)
+
+            # Fallback scan for approvals made outside the dashboard
+            if time.time() - last_scan >= check_interval:
+                if PENDING_APPROVAL_PATH.exists():
+                    for approval_file in PENDING_APPROVAL_PATH.glob("*.md"):
+                        process(approval_file)
+                last_scan = time.time()
+
+                # Close MCP clients (browser sessions, Odoo logins) nobody has used for a while
+                executor.clients.evict_idle()
+
+            if time.time() - last_compact >= compact_interval:
+                removed = executor.ledger.compact()
+                if removed:
+                    logger.info(f"Compacted execution ledger: removed {removed} old entries")
+                notifier.compact()
+                last_compact = time.time()
+
+            if in_flight:
+                logger.debug(f"Lane stats: {executor.scheduler.stats()}")
+            notifier.wait(max(0.0, check_interval - (time.time() - last_scan)), action_types=RUN_ACTION_TYPES)
 
         except KeyboardInterrupt:
             logger.info("MCP Executor shutting down (user interrupt)")
+            notifier.close()
             break
         except Exception as e:
             logger.error(f"Error in main loop: {e}")
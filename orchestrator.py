@@ -17,20 +17,22 @@ Components:
     - Human Approval Skill: Blocks execution until human approves/rejects (Silver Tier)
 """
 
-import json
 import time
 import threading
 from datetime import datetime
 from pathlib import Path
-from subprocess import run, PIPE
 
 from log_manager import setup_logging
 from skills.vault_skills import get_vault
 from claude_sdk_wrapper import T
+from skills.task_planner_skill import plan_task_once, resume_interrupted_plans
 from gmail_watcher import GmailWatcher
 from linkedin_watcher import LinkedInWatcher
 from filesystem_watcher import FileSystemWatcher
-from scripts.request_approval import request_approval, ApprovalStatus
+from scripts.request_approval import ApprovalStatus
+from scripts.approval_manager import get_approval_manager, ApprovalResult
+from scripts.approval_store import ApprovalState, get_approval_store, parse_frontmatter
+from scripts.action_worker_pool import get_action_worker_pool
 
 # Setup logger for orchestrator (using Silver Tier log path)
 logger = setup_logging(log_file="logs/ai_employee.log", logger_name="orchestrator")
@@ -57,54 +59,41 @@ def run_watcher_thread(watcher_instance):
 
 def trigger_task_planner(file_name: str, description: str = None) -> str:
     """
-    Trigger the task-planner skill using T class.
-    
+    Trigger the task-planner skill in the background.
+
+    Planning goes through the single-flight layer, so a file already planned
+    (or being planned) by the Inbox watcher or scheduler is not re-planned.
+
     Args:
         file_name: Name of the file in Needs_Action to process.
         description: Optional description override.
-        
+
     Returns:
-        Task ID or error message.
+        Status message or error message.
     """
     try:
         desc = description or f"Process new task file {file_name} with task-planner skill"
-        
-        plan_prompt = f"""Process the file '{file_name}' located in AI_Employee_Vault/Needs_Action.
+        result = plan_task_once(file_name, description=desc, vault=vault, wait=False)
+        if result:
+            # Already planned, in flight elsewhere, or unreadable
+            logger.info(f"Task-planner not started for {file_name}: {result}")
+            return result
 
-Your responsibilities:
-1. Read and analyze the task file content
-2. Generate a detailed, step-by-step implementation plan
-3. Save the plan as 'Plan_{Path(file_name).stem}.md' in the Needs_Action folder
+        logger.info(f"Triggered task-planner skill for {file_name}")
+        return f"Planning started for {file_name}"
 
-The plan should be actionable with clear steps and checkboxes.
-"""
-        
-        # Use T class to spawn the task-planner subagent
-        task = T(
-            description=desc,
-            prompt=plan_prompt,
-            subagent_type='task-planner',
-            model='opus',
-            run_in_background=True,
-            allowed_tools=["Read", "Write", "Glob", "Edit", "Bash", "Skill"],
-            system_prompt="""You are a task-planner specialist for the AI Employee system.
-Your role is to analyze task files and generate detailed implementation plans.
-Always save plans as Plan_*.md files in the Needs_Action folder."""
-        )
-        
-        logger.info(f"Triggered task-planner skill for {file_name}. Task ID: {task.task_id}")
-        return task.task_id
-        
     except Exception as e:
         logger.error(f"Error triggering task-planner for {file_name}: {e}")
         return f"Error: {e}"
 
 
-
-
 def trigger_mcp_executor(action_type: str, data: dict, approval_id: str) -> str:
     """
-    Trigger the mcp-executor skill by running the script directly.
+    Trigger the mcp-executor skill on the shared in-process worker pool.
+
+    The pool's workers stay warm between actions (modules imported and
+    clients authenticated once), so there is no per-action interpreter
+    start.
 
     Args:
         action_type: The type of action (gmail_send, linkedin_post).
@@ -115,43 +104,18 @@ def trigger_mcp_executor(action_type: str, data: dict, approval_id: str) -> str:
         Result message or error message.
     """
     try:
-        # Create a temporary data file
-        temp_dir = Path("temp")
-        temp_dir.mkdir(exist_ok=True)
-        data_file = temp_dir / f"mcp_data_{approval_id}_{datetime.now().strftime('%Y%m%d%H%M%S')}.json"
-        
-        with open(data_file, 'w') as f:
-            json.dump(data, f, indent=2)
-        
-        # Run mcp_executor.py as a subprocess
-        cmd = [
-            "python",
-            "scripts/mcp_executor.py",
-            "--action", action_type,
-            "--data", str(data_file),
-            "--approval_id", approval_id
-        ]
-        
-        logger.info(f"Executing mcp-executor: {' '.join(cmd)}")
-        
-        result = run(cmd, capture_output=True, text=True, timeout=120)
-        
-        # Clean up temp file
-        data_file.unlink(missing_ok=True)
-        
-        # Parse and log result
-        if result.returncode == 0:
-            try:
-                output = json.loads(result.stdout)
-                logger.info(f"mcp-executor result for {approval_id}: {output.get('status')}")
-                return f"Success: {output.get('message', 'Action completed')}"
-            except json.JSONDecodeError:
-                logger.info(f"mcp-executor completed for {approval_id}")
-                return "Action completed"
-        else:
-            logger.error(f"mcp-executor error: {result.stderr}")
-            return f"Error: {result.stderr or result.stdout}"
-            
+        logger.info(f"Executing mcp-executor: {action_type} (approval: {approval_id})")
+        output = get_action_worker_pool().execute(action_type, data, approval_id)
+        logger.info(
+            f"mcp-executor result for {approval_id}: {output.get('status')} "
+            f"in {output.get('duration_ms', 0)} ms"
+        )
+
+        if output.get("status") == "success":
+            return f"Success: {output.get('message') or 'Action completed'}"
+        logger.error(f"mcp-executor error: {output.get('message')}")
+        return f"Error: {output.get('message')}"
+
     except Exception as e:
         logger.error(f"Error triggering mcp-executor for {action_type} (approval: {approval_id}): {e}")
         return f"Error: {e}"
@@ -285,7 +249,8 @@ def process_pending_approvals():
     
     This function:
     1. Moves approval files from Pending_Approval to Needs_Approval
-    2. Uses blocking human-approval skill to wait for human response
+    2. Registers Needs_Approval with the event-driven approval manager
+       (non-blocking; all pending approvals are tracked at once)
     3. Triggers mcp-executor only after approval is granted
     4. Handles timeouts and rejections gracefully
     
@@ -294,11 +259,12 @@ def process_pending_approvals():
     logger.info("\n--- Checking Pending_Approval for actions requiring human approval ---")
     
     # First, move any new files from Pending_Approval to Needs_Approval
+    store = get_approval_store()
     for approval_file_path in PENDING_APPROVAL_PATH.glob('*.md'):
         try:
-            content = approval_file_path.read_text()
-            # Skip files that are already approved (they'll be processed from Needs_Approval)
-            if "status: approved" in content.lower() or "status: rejected" in content.lower():
+            # Skip files that already have an answer (frontmatter status, via the approval store)
+            record = store.sync_file(approval_file_path)
+            if record is not None and record.state != ApprovalState.PENDING:
                 continue
             
             # Move to Needs_Approval for human-approval processing
@@ -310,73 +276,81 @@ def process_pending_approvals():
         except Exception as e:
             logger.error(f"Error moving approval file {approval_file_path.name}: {e}")
     
-    # Process files in Needs_Approval with blocking human-approval
-    logger.info("\n--- Processing Needs_Approval with human-approval skill (BLOCKING) ---")
-    
-    for approval_file_path in NEEDS_APPROVAL_PATH.glob('*.md'):
-        try:
-            approval_id = approval_file_path.stem
-            logger.info(f"Processing approval request: {approval_file_path.name}")
+    # Track every file in Needs_Approval with the event-driven approval manager.
+    # This returns immediately; handle_approval_result runs as each approval resolves.
+    logger.info("\n--- Watching Needs_Approval with human-approval skill (event-driven) ---")
+    manager = get_approval_manager()
+    manager.watch_directory(callback=handle_approval_result)
+    logger.info(f"Approvals awaiting a human response: {len(manager.pending())}")
+
+
+def handle_approval_result(result: ApprovalResult):
+    """
+    Act on a resolved approval (callback for the approval manager).
+
+    Triggers mcp-executor only after approval is granted; rejections and
+    timeouts are logged.
+
+    Args:
+        result: The resolved approval.
+    """
+    approval_id = result.approval_id
+    status, reason = result.status, result.reason
+    try:
+        if status == ApprovalStatus.APPROVED:
+            logger.info(f"Approval GRANTED for {approval_id}: {reason}")
             
-            # Use human-approval skill - THIS BLOCKS until human responds or timeout
-            status, reason = request_approval(
-                file_path=str(approval_file_path),
-                timeout_seconds=3600,  # Default 1 hour timeout
-                poll_interval=10       # Check every 10 seconds
-            )
+            # Extract action type and data for mcp-executor
+            # The file has already been moved to Approved; use the content captured at resolution
+            content = result.content
+            approval_type = parse_frontmatter(content).get("type", "")
+            action_type = ""
+            data_for_executor = {}
             
-            if status == ApprovalStatus.APPROVED:
-                logger.info(f"Approval GRANTED for {approval_id}: {reason}")
+            if approval_type == "email_send_approval":
+                action_type = "gmail_send"
+                recipient_email_line = next((line for line in content.splitlines() if "recipient_email:" in line), None)
+                full_email_content_block = content.split("full_email_content: |")
                 
-                # Extract action type and data for mcp-executor
-                content = approval_file_path.read_text() if approval_file_path.exists() else ""
-                action_type = ""
-                data_for_executor = {}
+                recipient_email = recipient_email_line.split(":")[-1].strip().strip('"') if recipient_email_line else ""
+                full_email_content = full_email_content_block[1].strip() if len(full_email_content_block) > 1 else ""
                 
-                if "type: email_send_approval" in content:
-                    action_type = "gmail_send"
-                    recipient_email_line = next((line for line in content.splitlines() if "recipient_email:" in line), None)
-                    full_email_content_block = content.split("full_email_content: |")
-                    
-                    recipient_email = recipient_email_line.split(":")[-1].strip().strip('"') if recipient_email_line else ""
-                    full_email_content = full_email_content_block[1].strip() if len(full_email_content_block) > 1 else ""
-                    
-                    data_for_executor = {
-                        "to": recipient_email,
-                        "subject": next((line.split(":")[-1].strip() for line in content.splitlines() if "subject:" in line), "No Subject"),
-                        "body": full_email_content
-                    }
-                    
-                elif "type: linkedin_post_approval" in content:
-                    action_type = "linkedin_post"
-                    final_post_content_block = content.split("final_post_content: |")
-                    final_post_content = final_post_content_block[1].strip() if len(final_post_content_block) > 1 else ""
-                    
-                    data_for_executor = {
-                        "content": final_post_content
-                    }
+                data_for_executor = {
+                    "to": recipient_email,
+                    "subject": next((line.split(":")[-1].strip() for line in content.splitlines() if "subject:" in line), "No Subject"),
+                    "body": full_email_content
+                }
                 
-                if action_type:
-                    # Trigger mcp-executor only after approval
-                    result = trigger_mcp_executor(action_type, data_for_executor, approval_id)
-                    
-                    if "Error" not in result:
-                        logger.info(f"mcp-executor completed successfully for {approval_id}")
-                    else:
-                        logger.error(f"mcp-executor failed for {approval_id}: {result}")
-                else:
-                    logger.warning(f"Could not determine action type for {approval_id}")
-                    
-            elif status == ApprovalStatus.REJECTED:
-                logger.warning(f"Approval REJECTED for {approval_id}: {reason}")
+            elif approval_type == "linkedin_post_approval":
+                action_type = "linkedin_post"
+                final_post_content_block = content.split("final_post_content: |")
+                final_post_content = final_post_content_block[1].strip() if len(final_post_content_block) > 1 else ""
                 
-            elif status == ApprovalStatus.TIMEOUT:
-                logger.warning(f"Approval TIMEOUT for {approval_id}: {reason}")
+                data_for_executor = {
+                    "content": final_post_content
+                }
+            
+            if action_type:
+                # Trigger mcp-executor only after approval
+                exec_result = trigger_mcp_executor(action_type, data_for_executor, approval_id)
                 
-        except Exception as e:
-            logger.error(f"Error processing approval file {approval_file_path.name}: {e}")
+                if "Error" not in exec_result:
+                    logger.info(f"mcp-executor completed successfully for {approval_id}")
+                    get_approval_store().transition(approval_id, ApprovalState.EXECUTED, f"Executed {action_type}")
+                else:
+                    logger.error(f"mcp-executor failed for {approval_id}: {exec_result}")
+                    get_approval_store().transition(approval_id, ApprovalState.FAILED, exec_result)
+            else:
+                logger.warning(f"Could not determine action type for {approval_id}")
 
+        elif status == ApprovalStatus.REJECTED:
+            logger.warning(f"Approval REJECTED for {approval_id}: {reason}")
 
+        elif status == ApprovalStatus.TIMEOUT:
+            logger.warning(f"Approval TIMEOUT for {approval_id}: {reason}")
+
+    except Exception as e:
+        logger.error(f"Error processing approval result {approval_id}: {e}")
 
 
 def orchestrate():
@@ -390,6 +364,11 @@ def orchestrate():
 
     watcher_threads = []
 
+    # --- Resume plans interrupted by a previous run ---
+    resumed = resume_interrupted_plans(vault)
+    if resumed:
+        logger.info(f"Resumed interrupted planning for: {', '.join(resumed)}")
+
     # --- Start FileSystemWatcher for Inbox ---
     logger.info("\n--- Starting FileSystemWatcher for Inbox ---")
     fs_watcher = FileSystemWatcher(vault_path=VAULT_PATH)
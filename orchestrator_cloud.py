@@ -23,7 +23,7 @@ Usage:
 import time
 import logging
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Dict, Any
 import os
 
@@ -60,6 +60,7 @@ except ImportError:
 
 try:
     from scripts.odoo_mcp_server import OdooMCPServer
+    from scripts.odoo_sync import OdooSyncEngine, get_odoo_ledger_store
     ODOO_AVAILABLE = True
 except ImportError:
     ODOO_AVAILABLE = False
@@ -304,6 +305,20 @@ AI Employee
         else:
             return "Review content and determine appropriate response."
 
+    def _next_best_post_time(self, hours: tuple = (13, 19)) -> datetime:
+        """
+        Next weekday engagement slot (1 PM or 7 PM) for a social post.
+        
+        The executor holds an approved post until this time; editing
+        ``scheduled_for`` before approving changes it.
+        """
+        candidate = datetime.now().replace(minute=0, second=0, microsecond=0)
+        for _ in range(7 * 24):
+            candidate += timedelta(hours=1)
+            if candidate.weekday() < 5 and candidate.hour in hours:
+                return candidate
+        return candidate
+
     def generate_social_drafts(self) -> int:
         """
         Monitor social media, generate post drafts in /Updates/social_drafts/
@@ -325,6 +340,8 @@ AI Employee
 type: social_post_draft
 platform: facebook
 draft_created: {datetime.now().isoformat()}
+scheduled_for: {self._next_best_post_time().isoformat()}
+priority: low
 status: draft_ready
 ---
 
@@ -368,6 +385,8 @@ Based on engagement patterns: Weekdays 1-3 PM or 7-8 PM
 type: social_post_draft
 platform: twitter
 draft_created: {datetime.now().isoformat()}
+scheduled_for: {self._next_best_post_time().isoformat()}
+priority: low
 status: draft_ready
 ---
 
@@ -408,6 +427,10 @@ Productivity is up 85% this week. #AI #Automation #Productivity
         """
         Generate Odoo financial reports in /Updates/odoo_reports/
         
+        Invoices and payments are synced incrementally (write_date cursors);
+        the P&L is only fetched when invoices changed, and a report is only
+        written when its content differs from the last one.
+        
         Returns:
             Number of reports generated
         """
@@ -418,50 +441,58 @@ Productivity is up 85% this week. #AI #Automation #Productivity
             return 0
         
         try:
-            # Get financial data (read-only)
             report_file = self.updates_dir / "odoo_reports" / f"financial_{datetime.now().strftime('%Y%m%d')}.md"
+            store = get_odoo_ledger_store()
             
-            # Try to get financial report
             try:
+                sync = OdooSyncEngine(self.odoo_client, store=store).sync()
+                if sync["errors"]:
+                    raise Exception("; ".join(f"{m}: {e}" for m, e in sync["errors"].items()))
+                if not sync["changed"] and self._last_report_exists(store):
+                    logger.info("Odoo unchanged since last report, skipping")
+                    return 0
+                
                 financial_report = self.odoo_client.get_financial_report(report_type='profit_loss')
-                report_content = f"""---
-type: odoo_financial_report
-report_date: {datetime.now().isoformat()}
-period: current_month
-status: ready
----
-
-# Financial Report
+                if financial_report.get('status') != 'success':
+                    raise Exception(financial_report.get('message', 'report failed'))
+                status = "ready"
+                body = f"""# Financial Report
 
 ## Profit & Loss Summary
 
-{financial_report.get('summary', 'No data available')}
+Period: {financial_report.get('period', 'year to date')}
 
 ## Key Metrics
-- Revenue: ${financial_report.get('revenue', 0):,.2f}
+- Revenue: ${financial_report.get('income', 0):,.2f}
 - Expenses: ${financial_report.get('expenses', 0):,.2f}
 - Net Profit: ${financial_report.get('net_profit', 0):,.2f}
+- Invoices synced: {len(store.records('account.move'))} ({sync['changed']} changed this cycle)
 
 ## Alerts
 {self._analyze_financials(financial_report)}
 """
             except Exception as e:
                 logger.warning(f"Could not fetch Odoo report: {e}")
-                report_content = f"""---
+                status = "error"
+                body = """# Financial Report
+
+**Status:** Could not connect to Odoo ERP
+
+Please check Odoo service status and credentials.
+"""
+            
+            header = f"""---
 type: odoo_financial_report
 report_date: {datetime.now().isoformat()}
 period: current_month
-status: error
+status: {status}
 ---
 
-# Financial Report
-
-**Status:** Could not connect to Odoo ERP
-
-Please check Odoo service status and credentials.
 """
+            if not store.write_if_changed("cloud_financial_report", report_file, header, body):
+                logger.info("Odoo financial report unchanged, not rewritten")
+                return 0
             
-            report_file.write_text(report_content)
             self.stats['reports_generated'] += 1
             logger.info(f"Created Odoo financial report: {report_file.name}")
             
@@ -472,11 +503,17 @@ Please check Odoo service status and credentials.
             self.stats['errors'] += 1
             return 0
 
+    @staticmethod
+    def _last_report_exists(store) -> bool:
+        """Whether the last written financial report is still on disk."""
+        path = store.summary_path("cloud_financial_report")
+        return bool(path and path.exists())
+
     def _analyze_financials(self, report: Dict[str, Any]) -> str:
         """Analyze financial report for alerts"""
         alerts = []
         
-        revenue = report.get('revenue', 0)
+        revenue = report.get('income', report.get('revenue', 0))
         expenses = report.get('expenses', 0)
         net_profit = report.get('net_profit', 0)
         
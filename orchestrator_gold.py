@@ -24,24 +24,27 @@ Gold Tier Components:
     - RalphWiggumLoop: Autonomous multi-step task completion
 """
 
-import json
 import time
 import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from subprocess import run, PIPE
 from typing import Tuple
 
 from log_manager import setup_logging
 from skills.vault_skills import get_vault
 from claude_sdk_wrapper import T
+from skills.task_planner_skill import plan_task_once, resume_interrupted_plans
 from gmail_watcher import GmailWatcher
 from linkedin_watcher import LinkedInWatcher
 from filesystem_watcher import FileSystemWatcher
 from facebook_watcher import FacebookWatcher
 from twitter_watcher import TwitterWatcher
-from scripts.request_approval import request_approval, ApprovalStatus
-from scripts.odoo_mcp_server import OdooMCPServer
+from scripts.request_approval import ApprovalStatus
+from scripts.approval_manager import get_approval_manager, ApprovalResult
+from scripts.approval_store import ApprovalState, get_approval_store, parse_frontmatter
+from scripts.action_worker_pool import get_action_worker_pool
+from scripts.odoo_mcp_server import get_odoo_client
+from scripts.odoo_sync import sync_odoo_to_vault
 from scripts.facebook_mcp_server import FacebookMCPServer
 from scripts.twitter_mcp_server import TwitterMCPServer
 from scripts.ceo_briefing_generator import CEOBriefingGenerator
@@ -76,43 +79,28 @@ def run_watcher_thread(watcher_instance):
 
 def trigger_task_planner(file_name: str, description: str = None) -> str:
     """
-    Trigger the task-planner skill using T class.
+    Trigger the task-planner skill in the background.
+
+    Planning goes through the single-flight layer, so a file already planned
+    (or being planned) by the Inbox watcher or scheduler is not re-planned.
 
     Args:
         file_name: Name of the file in Needs_Action to process.
         description: Optional description override.
 
     Returns:
-        Task ID or error message.
+        Status message or error message.
     """
     try:
         desc = description or f"Process new task file {file_name} with task-planner skill"
+        result = plan_task_once(file_name, description=desc, vault=vault, wait=False)
+        if result:
+            # Already planned, in flight elsewhere, or unreadable
+            logger.info(f"Task-planner not started for {file_name}: {result}")
+            return result
 
-        plan_prompt = f"""Process the file '{file_name}' located in AI_Employee_Vault/Needs_Action.
-
-Your responsibilities:
-1. Read and analyze the task file content
-2. Generate a detailed, step-by-step implementation plan
-3. Save the plan as 'Plan_{Path(file_name).stem}.md' in the Needs_Action folder
-
-The plan should be actionable with clear steps and checkboxes.
-"""
-
-        # Use T class to spawn the task-planner subagent
-        task = T(
-            description=desc,
-            prompt=plan_prompt,
-            subagent_type='task-planner',
-            model='opus',
-            run_in_background=True,
-            allowed_tools=["Read", "Write", "Glob", "Edit", "Bash", "Skill"],
-            system_prompt="""You are a task-planner specialist for the AI Employee system.
-Your role is to analyze task files and generate detailed implementation plans.
-Always save plans as Plan_*.md files in the Needs_Action folder."""
-        )
-
-        logger.info(f"Triggered task-planner skill for {file_name}. Task ID: {task.task_id}")
-        return task.task_id
+        logger.info(f"Triggered task-planner skill for {file_name}")
+        return f"Planning started for {file_name}"
 
     except Exception as e:
         logger.error(f"Error triggering task-planner for {file_name}: {e}")
@@ -121,7 +109,11 @@ Always save plans as Plan_*.md files in the Needs_Action folder."""
 
 def trigger_mcp_executor(action_type: str, data: dict, approval_id: str) -> str:
     """
-    Trigger the mcp-executor skill by running the script directly.
+    Trigger the mcp-executor skill on the shared in-process worker pool.
+
+    The pool's workers stay warm between actions (modules imported and
+    clients authenticated once), so there is no per-action interpreter
+    start.
 
     Args:
         action_type: The type of action (gmail_send, linkedin_post, facebook_post, twitter_post, odoo_invoice).
@@ -132,42 +124,17 @@ def trigger_mcp_executor(action_type: str, data: dict, approval_id: str) -> str:
         Result message or error message.
     """
     try:
-        # Create a temporary data file
-        temp_dir = Path("temp")
-        temp_dir.mkdir(exist_ok=True)
-        data_file = temp_dir / f"mcp_data_{approval_id}_{datetime.now().strftime('%Y%m%d%H%M%S')}.json"
-
-        with open(data_file, 'w') as f:
-            json.dump(data, f, indent=2)
-
-        # Run mcp_executor.py as a subprocess
-        cmd = [
-            "python",
-            "scripts/mcp_executor.py",
-            "--action", action_type,
-            "--data", str(data_file),
-            "--approval_id", approval_id
-        ]
-
-        logger.info(f"Executing mcp-executor: {' '.join(cmd)}")
-
-        result = run(cmd, capture_output=True, text=True, timeout=120)
-
-        # Clean up temp file
-        data_file.unlink(missing_ok=True)
-
-        # Parse and log result
-        if result.returncode == 0:
-            try:
-                output = json.loads(result.stdout)
-                logger.info(f"mcp-executor result for {approval_id}: {output.get('status')}")
-                return f"Success: {output.get('message', 'Action completed')}"
-            except json.JSONDecodeError:
-                logger.info(f"mcp-executor completed for {approval_id}")
-                return "Action completed"
-        else:
-            logger.error(f"mcp-executor error: {result.stderr}")
-            return f"Error: {result.stderr or result.stdout}"
+        logger.info(f"Executing mcp-executor: {action_type} (approval: {approval_id})")
+        output = get_action_worker_pool().execute(action_type, data, approval_id)
+        logger.info(
+            f"mcp-executor result for {approval_id}: {output.get('status')} "
+            f"in {output.get('duration_ms', 0)} ms"
+        )
+
+        if output.get("status") == "success":
+            return f"Success: {output.get('message') or 'Action completed'}"
+        logger.error(f"mcp-executor error: {output.get('message')}")
+        return f"Error: {output.get('message')}"
 
     except Exception as e:
         logger.error(f"Error triggering mcp-executor for {action_type} (approval: {approval_id}): {e}")
@@ -365,54 +332,27 @@ def process_twitter_activity(twitter_watcher: TwitterWatcher):
         logger.error(f"Error processing Twitter activity: {e}")
 
 
-def sync_odoo_accounting():
-    """Sync accounting data from Odoo and create financial reports."""
-    logger.info("Syncing Odoo accounting data...")
-    try:
-        odoo = OdooMCPServer()
-        
-        # Test connection
-        conn_result = odoo.test_connection()
-        if conn_result.get("connected"):
-            logger.info(f"Odoo connected: {conn_result.get('odoo_version', 'unknown')}")
-            
-            # Get invoices
-            invoices_result = odoo.get_invoices(status="all", limit=50)
-            if invoices_result.get("status") == "success":
-                # Save to Accounting folder
-                invoices_file = ACCOUNTING_PATH / f"Invoices_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-                content = f"""---
-type: odoo_invoices_export
-generated: {datetime.now().isoformat()}
-count: {invoices_result.get('count', 0)}
----
-
-# Odoo Invoices Export
-
-{json.dumps(invoices_result, indent=2)}
-"""
-                invoices_file.write_text(content)
-                logger.info(f"Exported {invoices_result.get('count', 0)} invoices to {invoices_file.name}")
-            
-            # Get financial report
-            report_result = odoo.get_financial_report(report_type="profit_loss")
-            if report_result.get("status") == "success":
-                report_file = ACCOUNTING_PATH / f"Financial_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-                content = f"""---
-type: odoo_financial_report
-generated: {datetime.now().isoformat()}
-report_type: profit_loss
----
+def sync_odoo_accounting(full: bool = False):
+    """
+    Sync accounting data from Odoo and refresh the financial summaries.
 
-# Odoo Financial Report
+    Only invoices and payments changed since the last sync are fetched
+    (write_date cursors); summaries in Accounting/ are rewritten only when
+    their content changed.
 
-{json.dumps(report_result, indent=2)}
-"""
-                report_file.write_text(content)
-                logger.info(f"Exported financial report to {report_file.name}")
-        else:
-            logger.warning(f"Odoo not connected: {conn_result.get('message')}")
-            
+    Args:
+        full: Resync everything from scratch (e.g. after deleting records in Odoo)
+    """
+    logger.info(f"Syncing Odoo accounting data{' (full resync)' if full else ''}...")
+    try:
+        odoo = get_odoo_client()
+        result = sync_odoo_to_vault(odoo, ACCOUNTING_PATH, full=full)
+        for model, error in result["errors"].items():
+            logger.warning(f"Odoo sync of {model} failed: {error}")
+        logger.info(
+            f"Odoo sync {result['status']}: {result['changed']} records changed, "
+            f"summaries written: {', '.join(result['written']) or 'none'}"
+        )
     except Exception as e:
         logger.error(f"Error syncing Odoo accounting: {e}")
 
@@ -439,7 +379,8 @@ def process_pending_approvals():
 
     This function:
     1. Moves approval files from Pending_Approval to Needs_Approval
-    2. Uses blocking human-approval skill to wait for human response
+    2. Registers Needs_Approval with the event-driven approval manager
+       (non-blocking; all pending approvals are tracked at once)
     3. Triggers mcp-executor only after approval is granted
     4. Handles timeouts and rejections gracefully
 
@@ -458,11 +399,12 @@ def process_pending_approvals():
 
     # First, move any new files from Pending_Approval to Needs_Approval
     files_moved = 0
+    store = get_approval_store()
     for approval_file_path in PENDING_APPROVAL_PATH.glob('*.md'):
         try:
-            content = approval_file_path.read_text()
-            # Skip files that are already approved (they'll be processed from Needs_Approval)
-            if "status: approved" in content.lower() or "status: rejected" in content.lower():
+            # Skip files that already have an answer (frontmatter status, via the approval store)
+            record = store.sync_file(approval_file_path)
+            if record is not None and record.state != ApprovalState.PENDING:
                 continue
 
             # Move to Needs_Approval for human-approval processing
@@ -478,81 +420,89 @@ def process_pending_approvals():
     if files_moved > 0:
         logger.info(f"Moved {files_moved} file(s) from Pending_Approval to Needs_Approval")
 
-    # Process files in Needs_Approval with blocking human-approval
-    logger.info("\n--- Processing Needs_Approval with human-approval skill (BLOCKING) ---")
+    # Track every file in Needs_Approval with the event-driven approval manager.
+    # This returns immediately; handle_approval_result runs as each approval resolves.
+    logger.info("\n--- Watching Needs_Approval with human-approval skill (event-driven) ---")
+    manager = get_approval_manager()
+    manager.watch_directory(callback=handle_approval_result)
+    logger.info(f"Approvals awaiting a human response: {len(manager.pending())}")
 
-    for approval_file_path in NEEDS_APPROVAL_PATH.glob('*.md'):
-        try:
-            approval_id = approval_file_path.stem
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Waiting for approval: {approval_file_path.name}")
-            logger.info(f"{'='*60}")
-
-            # Use human-approval skill - THIS BLOCKS until human responds or timeout
-            status, reason = request_approval(
-                file_path=str(approval_file_path),
-                timeout_seconds=3600,  # Default 1 hour timeout
-                poll_interval=10       # Check every 10 seconds
-            )
+    logger.info("\n" + "=" * 60)
+    logger.info("=== HITL APPROVAL WORKFLOW COMPLETE ===")
+    logger.info("=" * 60)
+
+
+def handle_approval_result(result: ApprovalResult):
+    """
+    Act on a resolved approval (callback for the approval manager).
 
-            if status == ApprovalStatus.APPROVED:
-                logger.info(f"\n{'✓'} APPROVED → Executing: {approval_id}")
-                logger.info(f"Approval reason: {reason}")
-
-                # Extract action type and data for mcp-executor
-                content = approval_file_path.read_text() if approval_file_path.exists() else ""
-                action_type = ""
-                data_for_executor = {}
-
-                if "type: email_send_approval" in content:
-                    action_type = "gmail_send"
-                    recipient_email_line = next((line for line in content.splitlines() if "recipient_email:" in line), None)
-                    full_email_content_block = content.split("full_email_content: |")
-
-                    recipient_email = recipient_email_line.split(":")[-1].strip().strip('"') if recipient_email_line else ""
-                    full_email_content = full_email_content_block[1].strip() if len(full_email_content_block) > 1 else ""
-
-                    data_for_executor = {
-                        "to": recipient_email,
-                        "subject": next((line.split(":")[-1].strip() for line in content.splitlines() if "subject:" in line), "No Subject"),
-                        "body": full_email_content
-                    }
-
-                elif "type: linkedin_post_approval" in content:
-                    action_type = "linkedin_post"
-                    final_post_content_block = content.split("final_post_content: |")
-                    final_post_content = final_post_content_block[1].strip() if len(final_post_content_block) > 1 else ""
-
-                    data_for_executor = {
-                        "content": final_post_content
-                    }
-
-                if action_type:
-                    # Trigger mcp-executor only after approval
-                    logger.info(f"Triggering mcp-executor for action: {action_type}")
-                    result = trigger_mcp_executor(action_type, data_for_executor, approval_id)
-
-                    if "Error" not in result:
-                        logger.info(f"✓ EXECUTION COMPLETE: {approval_id} - Success")
-                    else:
-                        logger.error(f"✗ EXECUTION FAILED: {approval_id} - {result}")
+    Triggers mcp-executor only after approval is granted; rejections and
+    timeouts are logged.
+
+    Args:
+        result: The resolved approval.
+    """
+    approval_id = result.approval_id
+    status, reason = result.status, result.reason
+    try:
+        if status == ApprovalStatus.APPROVED:
+            logger.info(f"\n{'✓'} APPROVED → Executing: {approval_id}")
+            logger.info(f"Approval reason: {reason}")
+
+            # Extract action type and data for mcp-executor
+            # The file has already been moved to Approved; use the content captured at resolution
+            content = result.content
+            approval_type = parse_frontmatter(content).get("type", "")
+            action_type = ""
+            data_for_executor = {}
+
+            if approval_type == "email_send_approval":
+                action_type = "gmail_send"
+                recipient_email_line = next((line for line in content.splitlines() if "recipient_email:" in line), None)
+                full_email_content_block = content.split("full_email_content: |")
+
+                recipient_email = recipient_email_line.split(":")[-1].strip().strip('"') if recipient_email_line else ""
+                full_email_content = full_email_content_block[1].strip() if len(full_email_content_block) > 1 else ""
+
+                data_for_executor = {
+                    "to": recipient_email,
+                    "subject": next((line.split(":")[-1].strip() for line in content.splitlines() if "subject:" in line), "No Subject"),
+                    "body": full_email_content
+                }
+
+            elif approval_type == "linkedin_post_approval":
+                action_type = "linkedin_post"
+                final_post_content_block = content.split("final_post_content: |")
+                final_post_content = final_post_content_block[1].strip() if len(final_post_content_block) > 1 else ""
+
+                data_for_executor = {
+                    "content": final_post_content
+                }
+
+            if action_type:
+                # Trigger mcp-executor only after approval
+                logger.info(f"Triggering mcp-executor for action: {action_type}")
+                exec_result = trigger_mcp_executor(action_type, data_for_executor, approval_id)
+
+                if "Error" not in exec_result:
+                    logger.info(f"✓ EXECUTION COMPLETE: {approval_id} - Success")
+                    get_approval_store().transition(approval_id, ApprovalState.EXECUTED, f"Executed {action_type}")
                 else:
-                    logger.warning(f"Could not determine action type for {approval_id}")
+                    logger.error(f"✗ EXECUTION FAILED: {approval_id} - {exec_result}")
+                    get_approval_store().transition(approval_id, ApprovalState.FAILED, exec_result)
+            else:
+                logger.warning(f"Could not determine action type for {approval_id}")
 
-            elif status == ApprovalStatus.REJECTED:
-                logger.info(f"\n{'✗'} REJECTED → Skipping: {approval_id}")
-                logger.info(f"Rejection reason: {reason}")
+        elif status == ApprovalStatus.REJECTED:
+            logger.info(f"\n{'✗'} REJECTED → Skipping: {approval_id}")
+            logger.info(f"Rejection reason: {reason}")
 
-            elif status == ApprovalStatus.TIMEOUT:
-                logger.info(f"\n{'⏱'} TIMEOUT → Skipping: {approval_id}")
-                logger.info(f"Timeout reason: {reason}")
+        elif status == ApprovalStatus.TIMEOUT:
+            logger.info(f"\n{'⏱'} TIMEOUT → Skipping: {approval_id}")
+            logger.info(f"Timeout reason: {reason}")
 
-        except Exception as e:
-            logger.error(f"Error processing approval file {approval_file_path.name}: {e}")
-    
-    logger.info("\n" + "=" * 60)
-    logger.info("=== HITL APPROVAL WORKFLOW COMPLETE ===")
-    logger.info("=" * 60)
+    except Exception as e:
+        logger.error(f"Error processing approval result {approval_id}: {e}")
 
 
 def orchestrate():
@@ -566,6 +516,11 @@ def orchestrate():
 
     watcher_threads = []
 
+    # --- Resume plans interrupted by a previous run ---
+    resumed = resume_interrupted_plans(vault)
+    if resumed:
+        logger.info(f"Resumed interrupted planning for: {', '.join(resumed)}")
+
     # --- Start FileSystemWatcher for Inbox ---
     logger.info("\n--- Starting FileSystemWatcher for Inbox ---")
     fs_watcher = FileSystemWatcher(vault_path=VAULT_PATH)
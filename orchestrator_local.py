@@ -27,6 +27,8 @@ from typing import List, Dict, Any
 
 from log_manager import setup_logging
 from skills.vault_skills import get_vault
+from scripts.approval_store import ApprovalState, get_approval_store
+from scripts.execution_notifier import get_execution_notifier
 
 # Setup logging
 logger = setup_logging(
@@ -98,6 +100,9 @@ class LocalOrchestrator:
         self.file_watcher = None
         self.mcp_executor = None
         
+        # Approved actions scheduled for later: approval_id -> (file, record, future)
+        self.scheduled_actions = {}
+        
         self._initialize_components()
         
         # Statistics
@@ -383,65 +388,65 @@ Check `/Pending_Approval/` for items requiring your review.
         
         return metadata
 
-    def process_pending_approvals(self) -> int:
+    def process_pending_approvals(self, approval_files: List[Path] = None) -> int:
         """
         Process items in /Pending_Approval/
         
         Checks for approved/rejected items and executes actions.
         
+        Args:
+            approval_files: Only these files (e.g. pushed by the dashboard);
+                default scans the whole folder
+        
         Returns:
             Number of approvals processed
         """
         logger.info("Processing pending approvals...")
         
         approvals_processed = 0
-        approval_files = list(self.pending_approval_dir.glob("**/*.md"))
+        if approval_files is None:
+            approval_files = list(self.pending_approval_dir.glob("**/*.md"))
+        store = get_approval_store()
+        submitted = []
+        
+        # Scheduled actions that came due since the last cycle
+        for approval_id, (approval_file, record, future) in list(self.scheduled_actions.items()):
+            if future.done():
+                del self.scheduled_actions[approval_id]
+                submitted.append((approval_file, record, future))
         
         for approval_file in approval_files:
             try:
-                content = approval_file.read_text()
-                metadata = self._parse_frontmatter(content)
-                
-                # Check if approved
-                is_approved = (
-                    metadata.get('approved') == True or
-                    metadata.get('status', '').lower() == 'approved' or
-                    'approved: true' in content.lower()
-                )
-                
-                is_rejected = (
-                    metadata.get('approved') == False or
-                    metadata.get('status', '').lower() == 'rejected' or
-                    'rejected: true' in content.lower()
-                )
-                
-                if is_approved:
+                # Frontmatter-only status; the file is re-parsed only when it changed
+                record = store.sync_file(approval_file)
+                if record is None:
+                    continue
+                
+                if record.state == ApprovalState.APPROVED:
+                    if record.approval_id in self.scheduled_actions:
+                        continue  # Waiting in the scheduler's timer wheel
                     logger.info(f"Executing approved action: {approval_file.name}")
                     
-                    # Execute via MCP
+                    # Queue on the action's channel lane by priority/deadline;
+                    # lanes run concurrently
                     if self.mcp_executor:
-                        result = self.mcp_executor.execute_from_file(approval_file)
-                        
-                        if result.get('success'):
-                            # Move to Approved/
-                            approved_dir = self.vault_path / "Approved"
-                            approved_dir.mkdir(parents=True, exist_ok=True)
-                            approval_file.rename(approved_dir / approval_file.name)
-                            logger.info(f"Action executed successfully: {approval_file.name}")
-                            self.stats['approvals_approved'] += 1
-                            self.stats['actions_executed'] += 1
+                        future, schedule = self.mcp_executor.schedule_from_file(approval_file)
+                        if schedule.not_before and schedule.not_before > time.time():
+                            # Don't hold the cycle for it; collected once it has run
+                            self.scheduled_actions[record.approval_id] = (approval_file, record, future)
                         else:
-                            logger.error(f"Action failed: {result.get('error')}")
-                            self.stats['errors'] += 1
+                            submitted.append((approval_file, record, future))
                     else:
                         logger.error("MCP Executor not available")
                         self.stats['errors'] += 1
                 
-                elif is_rejected:
+                elif record.state == ApprovalState.REJECTED:
                     # Move to Rejected/
                     rejected_dir = self.vault_path / "Rejected"
                     rejected_dir.mkdir(parents=True, exist_ok=True)
                     approval_file.rename(rejected_dir / approval_file.name)
+                    store.transition(record.approval_id, ApprovalState.REJECTED, record.reason,
+                                     file_path=rejected_dir / approval_file.name)
                     logger.info(f"Action rejected: {approval_file.name}")
                     self.stats['approvals_rejected'] += 1
                 
@@ -451,6 +456,33 @@ Check `/Pending_Approval/` for items requiring your review.
                 logger.error(f"Failed to process approval {approval_file}: {e}")
                 self.stats['errors'] += 1
         
+        notifier = get_execution_notifier()
+        for approval_file, record, future in submitted:
+            try:
+                result = future.result()
+                notifier.mark_finished(record.approval_id, bool(result.get('success')))
+                
+                if result.get('success'):
+                    # Move to Approved/
+                    approved_dir = self.vault_path / "Approved"
+                    approved_dir.mkdir(parents=True, exist_ok=True)
+                    approval_file.rename(approved_dir / approval_file.name)
+                    store.transition(record.approval_id, ApprovalState.EXECUTED,
+                                     f"Executed via {result.get('action', 'MCP')}",
+                                     file_path=approved_dir / approval_file.name)
+                    logger.info(f"Action executed successfully: {approval_file.name}")
+                    self.stats['approvals_approved'] += 1
+                    self.stats['actions_executed'] += 1
+                else:
+                    store.transition(record.approval_id, ApprovalState.FAILED,
+                                     str(result.get('error') or result.get('message', 'Execution failed')))
+                    logger.error(f"Action failed: {result.get('error')}")
+                    self.stats['errors'] += 1
+                    
+            except Exception as e:
+                logger.error(f"Failed to execute approval {approval_file}: {e}")
+                self.stats['errors'] += 1
+        
         self.stats['approvals_processed'] += approvals_processed
         return approvals_processed
 
@@ -578,6 +610,28 @@ uptime_hours: {uptime_hours:.2f}
         except Exception as e:
             logger.error(f"Failed to write health status: {e}")
 
+    def wait_for_approvals(self, seconds: float):
+        """
+        Sleep until the next cycle, handling pushed approvals immediately.
+        
+        Args:
+            seconds: Time until the next cycle
+        """
+        notifier = get_execution_notifier()
+        # Only the approval types this orchestrator executes; the rest are the MCP executor's
+        handled = MCPExecutor.DISPATCH_ACTION_TYPES if self.mcp_executor else ()
+        deadline = time.monotonic() + seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if notifier.wait(remaining, action_types=handled):
+                pushed = [Path(n['file_path']) for n in notifier.drain("local-orchestrator", action_types=handled)]
+                pushed = [path for path in pushed if path.exists()]
+                if pushed:
+                    logger.info(f"Executing {len(pushed)} pushed approvals")
+                    self.process_pending_approvals(pushed)
+
     def run(self):
         """Main Local Agent loop"""
         logger.info("Local Orchestrator started (Approval + Execution Mode)")
@@ -585,6 +639,7 @@ uptime_hours: {uptime_hours:.2f}
         logger.info("Security: Full credentials access (Local only)")
         
         cycle_count = 0
+        get_execution_notifier().listen("local-orchestrator")
         
         while True:
             cycle_count += 1
@@ -612,9 +667,10 @@ uptime_hours: {uptime_hours:.2f}
                 if cycle_count % 5 == 0:
                     self.write_health_status()
                 
-                # Wait before next cycle (15 seconds)
-                logger.info(f"Cycle {cycle_count} complete. Sleeping for 15 seconds...")
-                time.sleep(15)
+                # Wait before next cycle (15 seconds), executing approvals
+                # pushed by the dashboard as soon as they arrive
+                logger.info(f"Cycle {cycle_count} complete. Waiting up to 15 seconds...")
+                self.wait_for_approvals(15)
                 
             except KeyboardInterrupt:
                 logger.info("Local Orchestrator shutting down (user interrupt)")
@@ -0,0 +1,606 @@
+"""
+Accounting Ledger Store - Append-Only Transaction Storage
+
+Backing store for ``AccountingManager``. Transactions are appended to a
+SQLite table that refuses updates and deletes, and running totals per
+(period, type, category) are updated in the same database transaction as
+the insert, so logging a transaction costs one insert and one upsert no
+matter how long the ledger is. Amounts are kept in integer cents so the
+running totals never drift.
+
+Each row also carries a dedupe key (date, signed amount, normalized
+description) so bulk imports can skip transactions already in the
+ledger; see ``append_deduplicated()``.
+
+Filtered reads go through ``query()``/``iter_query()``: (date, seq),
+(type, date, seq) and (category, date, seq) indexes answer a date range
+with or without a type/category filter as one index range scan, and
+pages continue from the last row seen (keyset pagination) instead of
+skipping an OFFSET.
+
+Months are partitions of the ledger. ``seal_through()`` closes every
+month up to a given one: each gets an immutable aggregate record (totals
+and counts by type and category) in the ``partitions`` table, and inserts
+dated in a sealed month are refused from then on, so the record stays
+exact and reports over closed months never need the raw rows.
+
+``Current_Month.md`` is no longer the source of truth; AccountingManager
+renders it from this store as a read-only view.
+
+Usage:
+    from scripts.accounting_ledger import get_accounting_ledger_store
+
+    store = get_accounting_ledger_store()
+    store.append([{"transaction_id": "TXN-20260314-A1B", "date": "2026-03-14",
+                   "type": "income", "amount": 5000.0, "description": "Client payment"}])
+    totals = store.totals()
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+LEDGER_DB_PATH = PROJECT_ROOT / "logs" / "accounting_ledger.db"
+
+TRANSACTION_TYPES = ("income", "expense")
+
+_TABLES = """
+CREATE TABLE IF NOT EXISTS transactions (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    transaction_id TEXT NOT NULL UNIQUE,
+    date TEXT NOT NULL,
+    period TEXT NOT NULL,
+    type TEXT NOT NULL,
+    amount_cents INTEGER NOT NULL,
+    description TEXT,
+    category TEXT NOT NULL,
+    reference TEXT,
+    logged_at TEXT NOT NULL,
+    dedupe_key TEXT
+);
+CREATE TABLE IF NOT EXISTS running_totals (
+    period TEXT NOT NULL,
+    type TEXT NOT NULL,
+    category TEXT NOT NULL,
+    total_cents INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (period, type, category)
+);
+CREATE TABLE IF NOT EXISTS partitions (
+    period TEXT PRIMARY KEY,
+    sealed_at TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    aggregate TEXT NOT NULL
+);
+"""
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_transactions_dedupe ON transactions(dedupe_key);
+CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(date, seq);
+CREATE INDEX IF NOT EXISTS idx_transactions_type_date ON transactions(type, date, seq);
+CREATE INDEX IF NOT EXISTS idx_transactions_category_date ON transactions(category, date, seq);
+CREATE INDEX IF NOT EXISTS idx_transactions_reference ON transactions(reference, date, seq);
+CREATE TRIGGER IF NOT EXISTS transactions_no_update BEFORE UPDATE ON transactions
+BEGIN SELECT RAISE(ABORT, 'accounting ledger is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS transactions_no_delete BEFORE DELETE ON transactions
+BEGIN SELECT RAISE(ABORT, 'accounting ledger is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS transactions_sealed_period BEFORE INSERT ON transactions
+WHEN NEW.period <= (SELECT MAX(period) FROM partitions)
+BEGIN SELECT RAISE(ABORT, 'accounting period is sealed'); END;
+CREATE TRIGGER IF NOT EXISTS partitions_no_update BEFORE UPDATE ON partitions
+BEGIN SELECT RAISE(ABORT, 'sealed partitions are immutable'); END;
+CREATE TRIGGER IF NOT EXISTS partitions_no_delete BEFORE DELETE ON partitions
+BEGIN SELECT RAISE(ABORT, 'sealed partitions are immutable'); END;
+"""
+
+_COLUMNS = "seq, transaction_id, date, type, amount_cents, description, category, reference, logged_at"
+
+# Keys per "IN (...)" lookup, under SQLite's bound-parameter limit
+_LOOKUP_BATCH = 500
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+class SealedPeriodError(ValueError):
+    """Raised when a transaction is dated in a sealed month."""
+
+
+def to_cents(amount: float) -> int:
+    """Convert a dollar amount to integer cents."""
+    return int(round(float(amount) * 100))
+
+
+def normalize_description(description: Optional[str]) -> str:
+    """Casefold a description and collapse punctuation/whitespace runs."""
+    return _NON_ALNUM.sub(" ", (description or "").casefold()).strip()
+
+
+def dedupe_key(date: str, type: str, amount_cents: int, description: Optional[str]) -> str:
+    """Duplicate-detection key: date, signed amount and normalized description."""
+    signed = -amount_cents if type == "expense" else amount_cents
+    return f"{date}|{signed}|{normalize_description(description)}"
+
+
+def next_period(period: str) -> str:
+    """The YYYY-MM period after ``period``."""
+    year, month = int(period[:4]), int(period[5:7])
+    return f"{year + month // 12}-{month % 12 + 1:02d}"
+
+
+def _empty_totals() -> Dict[str, Dict[str, Any]]:
+    return {t: {"total": 0.0, "count": 0, "by_category": {}, "category_counts": {}} for t in TRANSACTION_TYPES}
+
+
+def _row_to_transaction(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "transaction_id": row["transaction_id"],
+        "date": row["date"],
+        "type": row["type"],
+        "amount": row["amount_cents"] / 100,
+        "description": row["description"],
+        "category": row["category"],
+        "reference": row["reference"],
+        "logged_at": row["logged_at"],
+    }
+
+
+class AccountingLedgerStore:
+    """SQLite-backed append-only ledger with incrementally maintained totals."""
+
+    def __init__(self, db_path: Path = LEDGER_DB_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_TABLES)
+            self._migrate()
+            self._conn.executescript(_INDEXES)
+            self._conn.commit()
+
+    def _migrate(self):
+        """Add and backfill the dedupe_key column on ledgers created without it."""
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(transactions)")}
+        if "dedupe_key" in columns:
+            return
+        self._conn.create_function("dedupe_key", 4, dedupe_key, deterministic=True)
+        with self._conn:
+            self._conn.execute("ALTER TABLE transactions ADD COLUMN dedupe_key TEXT")
+            # The append-only trigger is recreated by _INDEXES right after the backfill
+            self._conn.execute("DROP TRIGGER IF EXISTS transactions_no_update")
+            self._conn.execute("UPDATE transactions SET dedupe_key = dedupe_key(date, type, amount_cents, description)")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _row(t: Dict[str, Any], now: str) -> list:
+        cents = to_cents(t["amount"])
+        return [
+            t.get("transaction_id"), t["date"], t["date"][:7], t["type"], cents, t.get("description"),
+            t.get("category") or "uncategorized", t.get("reference"), t.get("logged_at") or now,
+            dedupe_key(t["date"], t["type"], cents, t.get("description")),
+        ]
+
+    def _insert(self, rows: List[list], deltas: Dict[tuple, List[int]]):
+        """Insert prepared rows and upsert their running totals (caller holds the lock and transaction)."""
+        chunk_deltas = defaultdict(lambda: [0, 0])
+        for row in rows:
+            delta = chunk_deltas[(row[2], row[3], row[6])]
+            delta[0] += row[4]
+            delta[1] += 1
+        self._conn.executemany(
+            "INSERT INTO transactions (transaction_id, date, period, type, amount_cents, description, "
+            "category, reference, logged_at, dedupe_key) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._conn.executemany(
+            "INSERT INTO running_totals (period, type, category, total_cents, count) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (period, type, category) DO UPDATE SET "
+            "total_cents = total_cents + excluded.total_cents, count = count + excluded.count",
+            [(period, type_, category, cents, count) for (period, type_, category), (cents, count) in chunk_deltas.items()],
+        )
+        for key, (cents, count) in chunk_deltas.items():
+            deltas[key][0] += cents
+            deltas[key][1] += count
+
+    def append(self, transactions: Iterable[Dict[str, Any]]) -> int:
+        """
+        Append transactions and fold them into the running totals.
+
+        All rows are written in one database transaction: either every row
+        is stored or none is.
+
+        Args:
+            transactions: Dicts with transaction_id, date (YYYY-MM-DD), type,
+                amount and optional description, category, reference, logged_at
+
+        Returns:
+            Sequence number of the last appended row
+
+        Raises:
+            sqlite3.IntegrityError: A transaction_id already exists
+            SealedPeriodError: A transaction is dated in a sealed month
+        """
+        now = datetime.now().isoformat()
+        rows = [self._row(t, now) for t in transactions]
+        with self._lock, self._conn:
+            sealed_through = self._sealed_through()
+            for row in rows:
+                if sealed_through and row[2] <= sealed_through:
+                    raise SealedPeriodError(f"Accounting period {row[2]} is sealed")
+            self._insert(rows, defaultdict(lambda: [0, 0]))
+            return self._last_seq()
+
+    def append_deduplicated(self, chunks: Iterable[List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Append chunks of transactions in one database transaction, skipping
+        rows that are already in the ledger.
+
+        Rows match on ``dedupe_key()`` and are counted per occurrence: a
+        statement listing the same purchase twice on one day imports both
+        rows the first time and neither on re-import. Only one chunk is in
+        memory at a time (occurrence counts live in a temp table), so
+        ``chunks`` can be a generator over an arbitrarily large file.
+        New rows dated in a sealed month are skipped and counted as sealed.
+
+        Args:
+            chunks: Iterable of lists of transaction dicts (as for append());
+                rows without a transaction_id get a deterministic one
+
+        Returns:
+            Dictionary with imported, duplicates, sealed, last_seq and totals
+            ({type: {"total", "count", "by_category"}} of imported rows)
+        """
+        now = datetime.now().isoformat()
+        imported = duplicates = sealed = 0
+        deltas = defaultdict(lambda: [0, 0])
+
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            start_seq = self._last_seq()
+            sealed_through = self._sealed_through()
+            self._conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS import_seen (dedupe_key TEXT PRIMARY KEY, seen INTEGER NOT NULL)"
+            )
+            self._conn.execute("DELETE FROM import_seen")
+
+            for chunk in chunks:
+                rows = [self._row(t, now) for t in chunk]
+                keys = list({row[9] for row in rows})
+                existing, seen = {}, {}
+                for i in range(0, len(keys), _LOOKUP_BATCH):
+                    batch = keys[i:i + _LOOKUP_BATCH]
+                    marks = ",".join("?" * len(batch))
+                    existing.update(self._conn.execute(
+                        f"SELECT dedupe_key, COUNT(*) FROM transactions WHERE seq <= ? AND dedupe_key IN ({marks}) "
+                        "GROUP BY dedupe_key", [start_seq, *batch]).fetchall())
+                    seen.update(self._conn.execute(
+                        f"SELECT dedupe_key, seen FROM import_seen WHERE dedupe_key IN ({marks})", batch).fetchall())
+
+                fresh = []
+                for row in rows:
+                    key = row[9]
+                    seen[key] = occurrence = seen.get(key, 0) + 1
+                    if occurrence <= existing.get(key, 0):
+                        duplicates += 1
+                        continue
+                    if sealed_through and row[2] <= sealed_through:
+                        sealed += 1
+                        continue
+                    if not row[0]:
+                        digest = hashlib.sha1(f"{key}#{occurrence}".encode("utf-8")).hexdigest()[:10].upper()
+                        row[0] = f"TXN-{row[1].replace('-', '')}-{digest}"
+                    fresh.append(row)
+
+                self._conn.executemany(
+                    "INSERT INTO import_seen (dedupe_key, seen) VALUES (?, ?) "
+                    "ON CONFLICT (dedupe_key) DO UPDATE SET seen = excluded.seen",
+                    list(seen.items()),
+                )
+                self._insert(fresh, deltas)
+                imported += len(fresh)
+
+            self._conn.execute("DELETE FROM import_seen")
+            last_seq = self._last_seq()
+
+        totals = {t: {"total": 0.0, "count": 0, "by_category": {}} for t in TRANSACTION_TYPES}
+        for (_, type_, category), (cents, count) in deltas.items():
+            entry = totals[type_]
+            entry["total"] = round(entry["total"] + cents / 100, 2)
+            entry["count"] += count
+            entry["by_category"][category] = round(entry["by_category"].get(category, 0.0) + cents / 100, 2)
+        return {"imported": imported, "duplicates": duplicates, "sealed": sealed,
+                "last_seq": last_seq, "totals": totals}
+
+    def _last_seq(self) -> int:
+        row = self._conn.execute("SELECT MAX(seq) FROM transactions").fetchone()
+        return row[0] or 0
+
+    def last_seq(self) -> int:
+        """Sequence number of the newest transaction (0 when empty)."""
+        with self._lock:
+            return self._last_seq()
+
+    def count(self) -> int:
+        """Number of stored transactions."""
+        with self._lock:
+            return self._conn.execute("SELECT SUM(count) FROM running_totals").fetchone()[0] or 0
+
+    def exists(self, transaction_id: str) -> bool:
+        """Whether a transaction ID is already taken."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM transactions WHERE transaction_id = ?", (transaction_id,)
+            ).fetchone()
+        return row is not None
+
+    def totals(self, periods: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Running totals by type, read from the aggregate table.
+
+        Args:
+            periods: Optional list of YYYY-MM periods to include (default: all)
+
+        Returns:
+            {"income": {"total", "count", "by_category"}, "expense": {...}}
+        """
+        query = "SELECT type, category, SUM(total_cents) AS cents, SUM(count) AS n FROM running_totals"
+        params: List[Any] = []
+        if periods is not None:
+            query += f" WHERE period IN ({','.join('?' * len(periods))})"
+            params = list(periods)
+        query += " GROUP BY type, category"
+
+        result = {t: {"total": 0.0, "count": 0, "by_category": {}} for t in TRANSACTION_TYPES}
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        for row in rows:
+            entry = result.setdefault(row["type"], {"total": 0.0, "count": 0, "by_category": {}})
+            entry["total"] = round(entry["total"] + row["cents"] / 100, 2)
+            entry["count"] += row["n"]
+            entry["by_category"][row["category"]] = row["cents"] / 100
+        return result
+
+    def transactions(self, start_date: str = None) -> List[Dict[str, Any]]:
+        """All stored transactions in logging order, optionally from ``start_date`` on."""
+        query, params = f"SELECT {_COLUMNS} FROM transactions", []
+        if start_date:
+            query += " WHERE date >= ?"
+            params.append(start_date)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY seq", params).fetchall()
+        return [_row_to_transaction(row) for row in rows]
+
+    def query(
+        self,
+        type: str = None,
+        start_date: str = None,
+        end_date: str = None,
+        category: str = None,
+        reference: str = None,
+        limit: int = None,
+        after_id: str = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Transactions matching the filters, in (date, seq) order.
+
+        Each combination of filters is served by an index range scan, so
+        the cost is O(log n + k) for k matching rows.
+
+        Args:
+            type: Filter by type ("income" or "expense")
+            start_date: Earliest date (YYYY-MM-DD, inclusive)
+            end_date: Latest date (YYYY-MM-DD, inclusive)
+            category: Filter by category
+            reference: Filter by reference (e.g. a bank FITID)
+            limit: Maximum number of rows to return
+            after_id: Return rows after this transaction (the last one of
+                the previous page)
+
+        Returns:
+            List of transaction dicts
+
+        Raises:
+            ValueError: If ``after_id`` is not in the ledger
+        """
+        cursor = None
+        if after_id:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT date, seq FROM transactions WHERE transaction_id = ?", (after_id,)
+                ).fetchone()
+            if row is None:
+                raise ValueError(f"Unknown transaction: {after_id}")
+            cursor = (row["date"], row["seq"])
+        return self._page(self._filters(type, start_date, end_date, category, reference), cursor, limit)
+
+    def iter_query(
+        self,
+        type: str = None,
+        start_date: str = None,
+        end_date: str = None,
+        category: str = None,
+        reference: str = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream transactions matching the filters, in (date, seq) order.
+
+        Rows are fetched ``batch_size`` at a time, each batch continuing
+        from the last (date, seq) seen, so the lock is never held for the
+        whole result and memory stays bounded by the batch size.
+        """
+        filters = self._filters(type, start_date, end_date, category, reference)
+        cursor = None
+        while True:
+            page = self._page(filters, cursor, batch_size, with_cursor=True)
+            if not page:
+                return
+            for transaction, _ in page:
+                yield transaction
+            cursor = page[-1][1]
+
+    @staticmethod
+    def _filters(type, start_date, end_date, category, reference) -> Tuple[List[str], List[Any]]:
+        clauses, params = [], []
+        for clause, value in (("type = ?", type), ("date >= ?", start_date), ("date <= ?", end_date),
+                              ("category = ?", category), ("reference = ?", reference)):
+            if value:
+                clauses.append(clause)
+                params.append(value)
+        return clauses, params
+
+    def _page(self, filters: Tuple[List[str], List[Any]], cursor: Optional[Tuple[str, int]],
+              limit: Optional[int], with_cursor: bool = False) -> list:
+        clauses, params = list(filters[0]), list(filters[1])
+        if cursor:
+            clauses.append("(date, seq) > (?, ?)")
+            params.extend(cursor)
+        query = f"SELECT {_COLUMNS} FROM transactions"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY date, seq"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        if with_cursor:
+            return [(_row_to_transaction(row), (row["date"], row["seq"])) for row in rows]
+        return [_row_to_transaction(row) for row in rows]
+
+    def scan(self, since_seq: int = 0, batch_size: int = 10000) -> Iterator[Tuple[int, str, str, int, str]]:
+        """
+        Stream (seq, date, type, amount_cents, category) for rows after ``since_seq``.
+
+        Rows are read in seq order, ``batch_size`` at a time, so the lock is
+        never held for a whole-table read.
+        """
+        last = since_seq
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT seq, date, type, amount_cents, category FROM transactions "
+                    "WHERE seq > ? ORDER BY seq LIMIT ?", (last, batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield tuple(row)
+            last = rows[-1][0]
+
+    def periods(self) -> List[str]:
+        """YYYY-MM periods that have transactions, oldest first."""
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT period FROM running_totals ORDER BY period").fetchall()
+        return [row[0] for row in rows]
+
+    def _sealed_through(self) -> Optional[str]:
+        return self._conn.execute("SELECT MAX(period) FROM partitions").fetchone()[0]
+
+    def sealed_through(self) -> Optional[str]:
+        """Newest sealed period (every month up to it is sealed), or None."""
+        with self._lock:
+            return self._sealed_through()
+
+    def seal_through(self, period: str) -> List[str]:
+        """
+        Seal every month up to and including ``period``.
+
+        Each month from the oldest unsealed one (empty months included)
+        gets an aggregate record built from the running totals; afterwards
+        no transaction dated in those months can be appended.
+
+        Args:
+            period: Last month to seal (YYYY-MM)
+
+        Returns:
+            Newly sealed periods, oldest first
+        """
+        now = datetime.now().isoformat()
+        sealed = []
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            current = self._sealed_through()
+            if current:
+                month = next_period(current)
+            else:
+                month = self._conn.execute("SELECT MIN(period) FROM running_totals").fetchone()[0]
+            while month and month <= period:
+                totals = self._period_totals(month)
+                self._conn.execute(
+                    "INSERT INTO partitions (period, sealed_at, row_count, aggregate) VALUES (?, ?, ?, ?)",
+                    (month, now, sum(t["count"] for t in totals.values()), json.dumps(totals, sort_keys=True)),
+                )
+                sealed.append(month)
+                month = next_period(month)
+        return sealed
+
+    def _period_totals(self, period: str) -> Dict[str, Dict[str, Any]]:
+        totals = _empty_totals()
+        for row in self._conn.execute(
+            "SELECT type, category, total_cents, count FROM running_totals WHERE period = ? ORDER BY category",
+            (period,),
+        ):
+            entry = totals[row["type"]]
+            entry["total"] = round(entry["total"] + row["total_cents"] / 100, 2)
+            entry["count"] += row["count"]
+            entry["by_category"][row["category"]] = row["total_cents"] / 100
+            entry["category_counts"][row["category"]] = row["count"]
+        return totals
+
+    def partitions(self, start_period: str = None, end_period: str = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregate records of sealed months, without touching transaction rows.
+
+        Args:
+            start_period: First period (YYYY-MM, inclusive)
+            end_period: Last period (YYYY-MM, inclusive)
+
+        Returns:
+            {period: {"sealed_at", "row_count", "income": {"total", "count",
+            "by_category", "category_counts"}, "expense": {...}}}
+        """
+        query, params = "SELECT period, sealed_at, row_count, aggregate FROM partitions WHERE 1 = 1", []
+        if start_period:
+            query += " AND period >= ?"
+            params.append(start_period)
+        if end_period:
+            query += " AND period <= ?"
+            params.append(end_period)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY period", params).fetchall()
+        return {
+            row["period"]: {"sealed_at": row["sealed_at"], "row_count": row["row_count"], **json.loads(row["aggregate"])}
+            for row in rows
+        }
+
+    def first_logged_at(self) -> Optional[str]:
+        """Timestamp of the oldest stored transaction."""
+        with self._lock:
+            row = self._conn.execute("SELECT logged_at FROM transactions ORDER BY seq LIMIT 1").fetchone()
+        return row["logged_at"] if row else None
+
+
+_accounting_ledger_store = None
+_accounting_ledger_store_lock = threading.Lock()
+
+
+def get_accounting_ledger_store() -> AccountingLedgerStore:
+    """Get singleton accounting ledger store."""
+    global _accounting_ledger_store
+    with _accounting_ledger_store_lock:
+        if _accounting_ledger_store is None:
+            _accounting_ledger_store = AccountingLedgerStore()
+        return _accounting_ledger_store
@@ -6,17 +6,27 @@ Lightweight accounting system for tracking income and expenses.
 Perfect for hackathon Gold Tier requirements without Odoo complexity.
 
 Capabilities:
-- Log income/expense transactions
-- Maintain Current_Month.md ledger
+- Log income/expense transactions to an append-only ledger store
+  (logs/accounting_ledger.db) with running totals
+- Render Current_Month.md as a read-only view of the open month(s)
+- Roll months over automatically: months that ended more than
+  ACCOUNTING_CLOSE_AFTER_DAYS ago are sealed with precomputed aggregate
+  records (late entries and statements for recent months still post)
+- Query transactions by date range, type, category or reference
+  (indexed, with pagination and a streaming iterator)
 - Generate weekly summaries
 - Generate monthly reports
+- Generate multi-month trend reports (columnar analytics, see ledger_analytics.py)
 - Calculate totals and balances
 
 Usage:
     python scripts/accounting_manager.py log --type income --amount 5000 --description "Client payment"
+    python scripts/accounting_manager.py import --file statement.csv
     python scripts/accounting_manager.py totals
     python scripts/accounting_manager.py weekly-summary
     python scripts/accounting_manager.py monthly-report --month 3 --year 2026
+    python scripts/accounting_manager.py trend-report --months 36
+    python scripts/accounting_manager.py rollover [--through 2026-09]
 
 Author: AI Employee Project
 Version: 1.0.0
@@ -24,15 +34,26 @@ License: MIT
 """
 
 import argparse
+import atexit
 import json
 import logging
 import os
+import sqlite3
 import sys
-from datetime import datetime, timedelta
+import threading
+from datetime import date as Date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 import hashlib
 
+# Add project root to sys.path so the CLI can import scripts.* modules
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.accounting_ledger import AccountingLedgerStore, get_accounting_ledger_store, next_period
+from scripts.ledger_analytics import compare_totals, get_ledger_analytics, monthly_trend
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -47,32 +68,75 @@ CURRENT_MONTH_FILE = ACCOUNTING_PATH / 'Current_Month.md'
 WEEKLY_SUMMARIES_PATH = ACCOUNTING_PATH / 'Weekly_Summaries'
 MONTHLY_REPORTS_PATH = ACCOUNTING_PATH / 'Monthly_Reports'
 
+# Current_Month.md is re-rendered at most once per debounce window
+VIEW_DEBOUNCE_SECONDS = float(os.getenv('ACCOUNTING_VIEW_DEBOUNCE', '2.0'))
+
+# A month is sealed automatically once it ended this many days ago, leaving
+# time for late receipts and the month's bank statement
+CLOSE_AFTER_DAYS = int(os.getenv('ACCOUNTING_CLOSE_AFTER_DAYS', '15'))
+
+
+def _month_before(period: str) -> str:
+    """The month before a YYYY-MM period."""
+    year, month = int(period[:4]), int(period[5:7])
+    return f"{year - (month == 1)}-{(month - 2) % 12 + 1:02d}"
+
 
 class AccountingManager:
     """
     Vault-based Accounting Manager.
     
     Simple, lightweight accounting system for hackathon Gold Tier.
+    Transactions live in an append-only ledger store; Current_Month.md is
+    rendered from it on a debounce instead of being rewritten per entry.
+    Months past the close window are sealed into partitions whose
+    aggregate records serve monthly and trend reports.
     """
 
-    def __init__(self, vault_path: str = None):
+    def __init__(
+        self,
+        vault_path: str = None,
+        store: Optional[AccountingLedgerStore] = None,
+        view_debounce: float = None,
+        close_after_days: int = None
+    ):
         """
         Initialize Accounting Manager.
         
         Args:
             vault_path: Path to AI Employee vault
+            store: Ledger store (default: shared store in logs/accounting_ledger.db)
+            view_debounce: Seconds to coalesce Current_Month.md renders
+                (default: ACCOUNTING_VIEW_DEBOUNCE; 0 renders after every log)
+            close_after_days: Days after a month ends before it is sealed
+                automatically (default: ACCOUNTING_CLOSE_AFTER_DAYS)
         """
         self.vault_path = Path(vault_path) if vault_path else VAULT_PATH
         self.accounting_path = self.vault_path / 'Accounting'
         self.current_month_file = self.accounting_path / 'Current_Month.md'
         self.weekly_summaries_path = self.accounting_path / 'Weekly_Summaries'
         self.monthly_reports_path = self.accounting_path / 'Monthly_Reports'
+        self.store = store or get_accounting_ledger_store()
+        self.analytics = get_ledger_analytics(self.store)
+        self.view_debounce = VIEW_DEBOUNCE_SECONDS if view_debounce is None else view_debounce
+        self.close_after_days = CLOSE_AFTER_DAYS if close_after_days is None else close_after_days
+        
+        self._view_lock = threading.Lock()
+        self._view_timer: Optional[threading.Timer] = None
+        self._view_seq: Optional[int] = None
+        self._rolled_period: Optional[str] = None
         
         # Ensure directories exist
         self._ensure_directories()
         
-        # Initialize current month file if needed
-        self._initialize_current_month()
+        # Bring a ledger written before the store existed into it, seal
+        # finished months, then render the view
+        self._import_markdown_ledger()
+        if not self.rollover() and not self.current_month_file.exists():
+            self.render_view(force=True)
+        
+        # Don't lose a pending render when the process exits
+        atexit.register(self._flush_pending_view)
         
         logger.info(f'AccountingManager initialized. Vault: {self.vault_path}')
 
@@ -82,35 +146,23 @@ class AccountingManager:
         self.weekly_summaries_path.mkdir(parents=True, exist_ok=True)
         self.monthly_reports_path.mkdir(parents=True, exist_ok=True)
 
-    def _initialize_current_month(self):
-        """Initialize current month ledger file if it doesn't exist."""
-        if not self.current_month_file.exists():
-            current_month = datetime.now().strftime('%B %Y')
-            content = f"""---
-month: {current_month}
-created: {datetime.now().strftime('%Y-%m-%d')}
-last_updated: {datetime.now().isoformat()}
-total_income: 0.00
-total_expense: 0.00
-balance: 0.00
----
-
-# Accounting Ledger - {current_month}
-
-## Transactions
-
-<!-- Transactions will be logged below -->
-
-## Summary
-
-| Type | Total | Count |
-|------|-------|-------|
-| Income | $0.00 | 0 |
-| Expense | $0.00 | 0 |
-| **Balance** | **$0.00** | **0** |
-"""
-            self.current_month_file.write_text(content)
-            logger.info(f'Initialized current month file: {self.current_month_file}')
+    def _import_markdown_ledger(self):
+        """Import transactions from a Markdown-only Current_Month.md into an empty store."""
+        if self.store.count() or not self.current_month_file.exists():
+            return
+        
+        transactions, seen = [], set()
+        for t in self._parse_transactions():
+            if t['transaction_id'] in seen or t['type'] not in ('income', 'expense') or t['amount'] <= 0:
+                logger.warning(f"Skipping unimportable ledger entry {t['transaction_id']}")
+                continue
+            seen.add(t['transaction_id'])
+            t['reference'] = None if t['reference'] == 'N/A' else t['reference']
+            transactions.append(t)
+        
+        if transactions:
+            self.store.append(transactions)
+            logger.info(f'Imported {len(transactions)} transactions from {self.current_month_file}')
 
     def _generate_transaction_id(self, date: str, amount: float, description: str) -> str:
         """
@@ -132,7 +184,9 @@ balance: 0.00
 
     def _parse_transactions(self) -> List[Dict[str, Any]]:
         """
-        Parse transactions from current month file.
+        Parse transactions from the Markdown ledger in Current_Month.md.
+        
+        Only used to import a ledger written before the store existed.
         
         Returns:
             List of transaction dictionaries
@@ -189,46 +243,60 @@ balance: 0.00
         
         return transactions
 
-    def _update_summary(self):
-        """Update summary section in current month file."""
-        transactions = self._parse_transactions()
-        
-        total_income = sum(t['amount'] for t in transactions if t['type'] == 'income')
-        total_expense = sum(t['amount'] for t in transactions if t['type'] == 'expense')
+    def _render_view_content(self) -> str:
+        """Render Current_Month.md from the open (unsealed) months of the ledger store."""
+        sealed_through = self.store.sealed_through()
+        open_periods = [p for p in self.store.periods() if not sealed_through or p > sealed_through]
+        transactions = self.store.transactions(
+            start_date=f"{next_period(sealed_through)}-01" if sealed_through else None
+        )
+        totals = self.store.totals(open_periods)
+        total_income = totals['income']['total']
+        total_expense = totals['expense']['total']
         balance = total_income - total_expense
+        income_count = totals['income']['count']
+        expense_count = totals['expense']['count']
         
-        income_count = len([t for t in transactions if t['type'] == 'income'])
-        expense_count = len([t for t in transactions if t['type'] == 'expense'])
-        
-        content = self.current_month_file.read_text()
-        
-        # Update frontmatter
-        import re
+        month = datetime.strptime(open_periods[-1], '%Y-%m') if open_periods else datetime.now()
+        current_month = month.strftime('%B %Y')
+        first_logged = self.store.first_logged_at()
+        created = first_logged[:10] if first_logged else datetime.now().strftime('%Y-%m-%d')
+        sealed_note = (f"\n> Months through {sealed_through} are sealed; use `accounting_manager.py monthly-report` for them.\n"
+                       if sealed_through else '')
         
-        # Update totals in frontmatter
-        content = re.sub(
-            r'total_income: [\d.]+',
-            f'total_income: {total_income:.2f}',
-            content
-        )
-        content = re.sub(
-            r'total_expense: [\d.]+',
-            f'total_expense: {total_expense:.2f}',
-            content
-        )
-        content = re.sub(
-            r'balance: [\d.]+',
-            f'balance: {balance:.2f}',
-            content
-        )
-        content = re.sub(
-            r'last_updated: [^\n]+',
-            f'last_updated: {datetime.now().isoformat()}',
-            content
-        )
-        
-        # Update summary table
-        summary_table = f"""
+        parts = [f"""---
+month: {current_month}
+created: {created}
+last_updated: {datetime.now().isoformat()}
+sealed_through: {sealed_through or 'none'}
+total_income: {total_income:.2f}
+total_expense: {total_expense:.2f}
+balance: {balance:.2f}
+---
+
+# Accounting Ledger - {current_month}
+
+> Generated from the accounting ledger store. Log transactions with
+> `accounting_manager.py log`; edits to this file are overwritten.
+{sealed_note}
+## Transactions
+
+<!-- Transactions will be logged below -->
+"""]
+        for t in transactions:
+            parts.append(f"""
+### {t['transaction_id']}
+- **Date:** {t['date']}
+- **Type:** {t['type']}
+- **Amount:** ${t['amount']:,.2f}
+- **Description:** {t['description']}
+- **Category:** {t['category'] or 'uncategorized'}
+- **Reference:** {t['reference'] or 'N/A'}
+- **Logged at:** {t['logged_at']}
+
+---
+""")
+        parts.append(f"""
 ## Summary
 
 | Type | Total | Count |
@@ -236,18 +304,110 @@ balance: 0.00
 | Income | ${total_income:,.2f} | {income_count} |
 | Expense | ${total_expense:,.2f} | {expense_count} |
 | **Balance** | **${balance:,.2f}** | **{income_count + expense_count}** |
-"""
+""")
+        return ''.join(parts)
+
+    def render_view(self, force: bool = False) -> bool:
+        """
+        Render Current_Month.md from the ledger store.
         
-        # Replace summary table
-        content = re.sub(
-            r'## Summary\n\n.*?\| \*\*Balance\*\* \|\s*\*\*[\$,\d.]+\*\*\s*\| \*\*\d+\*\*\s*\|',
-            summary_table.strip(),
-            content,
-            flags=re.DOTALL
-        )
+        Args:
+            force: Render even if no transaction was logged since the last render
+            
+        Returns:
+            True if the file was written
+        """
+        seq = self.store.last_seq()
+        if not force and seq == self._view_seq and self.current_month_file.exists():
+            return False
+        
+        content = self._render_view_content()
+        tmp_file = self.current_month_file.with_suffix('.md.tmp')
+        tmp_file.write_text(content)
+        os.replace(tmp_file, self.current_month_file)
+        self._view_seq = seq
+        logger.info(f'Rendered ledger view: {self.current_month_file}')
+        return True
+
+    def _schedule_view_render(self):
+        """Render the view now, or once at the end of the debounce window."""
+        if self.view_debounce <= 0:
+            self.render_view()
+            return
+        
+        with self._view_lock:
+            if self._view_timer is None:
+                self._view_timer = threading.Timer(self.view_debounce, self.flush_view)
+                self._view_timer.daemon = True
+                self._view_timer.start()
+
+    def flush_view(self) -> bool:
+        """
+        Render any pending Current_Month.md update immediately.
+        
+        Returns:
+            True if the file was written
+        """
+        with self._view_lock:
+            timer, self._view_timer = self._view_timer, None
+        if timer is not None:
+            timer.cancel()
+        
+        try:
+            return self.render_view()
+        except OSError as e:
+            logger.error(f'Error rendering ledger view: {e}')
+            return False
+
+    def _flush_pending_view(self):
+        """atexit hook: flush a render that is still waiting on its timer."""
+        if self._view_timer is not None:
+            self.flush_view()
+
+    def closable_period(self, today: Optional[Date] = None) -> str:
+        """
+        Newest month past the close window (YYYY-MM).
+        
+        A month can be sealed once it ended more than ``close_after_days``
+        days before ``today``.
+        """
+        cutoff = (today or Date.today()) - timedelta(days=self.close_after_days)
+        return _month_before(cutoff.strftime('%Y-%m'))
+
+    def rollover(self, through: Optional[str] = None) -> List[str]:
+        """
+        Seal finished months into immutable partitions.
+        
+        Every month up to ``through`` is sealed with an aggregate record
+        (see AccountingLedgerStore.seal_through); transactions dated in a
+        sealed month are refused afterwards. Without ``through``, only
+        months past the close window are sealed; this runs automatically
+        on start-up and whenever another month passes the window.
+        
+        Args:
+            through: Close the books up to this month (YYYY-MM) early;
+                the current calendar month is never sealed
+        
+        Returns:
+            Newly sealed periods (YYYY-MM), oldest first
+        """
+        self._rolled_period = self.closable_period()
+        target = self._rolled_period
+        if through:
+            target = min(through, _month_before(datetime.now().strftime('%Y-%m')))
+        if not self.store.periods():
+            return []
         
-        self.current_month_file.write_text(content)
-        logger.info('Updated summary in current month file')
+        sealed = self.store.seal_through(target)
+        if sealed:
+            logger.info(f'Sealed accounting periods {sealed[0]} to {sealed[-1]}')
+            self.render_view(force=True)
+        return sealed
+
+    def close(self):
+        """Flush the pending view render and stop watching for exit."""
+        self._flush_pending_view()
+        atexit.unregister(self._flush_pending_view)
 
     def log_transaction(
         self,
@@ -261,6 +421,11 @@ balance: 0.00
         """
         Log a new transaction.
         
+        Appends to the ledger store (constant time regardless of ledger size)
+        and schedules a debounced re-render of Current_Month.md. Late entries
+        post until their month passes the close window; once another month
+        passes it, the next transaction rolls it over.
+        
         Args:
             date: Transaction date (YYYY-MM-DD)
             type: "income" or "expense"
@@ -271,6 +436,10 @@ balance: 0.00
             
         Returns:
             Dictionary with status and transaction details
+            
+        Raises:
+            ValueError: Invalid input, or the date is in a sealed month
+                (SealedPeriodError)
         """
         # Validation
         if type not in ['income', 'expense']:
@@ -279,40 +448,34 @@ balance: 0.00
         if not isinstance(amount, (int, float)) or amount <= 0:
             raise ValueError(f"Invalid amount: {amount}. Must be positive number")
         
-        # Generate transaction ID
-        transaction_id = self._generate_transaction_id(date, amount, description)
-        
-        # Create transaction content
-        transaction_content = f"""
-### {transaction_id}
-- **Date:** {date}
-- **Type:** {type}
-- **Amount:** ${amount:,.2f}
-- **Description:** {description}
-- **Category:** {category or 'uncategorized'}
-- **Reference:** {reference or 'N/A'}
-- **Logged at:** {datetime.now().isoformat()}
-
----
-"""
-        
-        # Read current file
-        content = self.current_month_file.read_text()
-        
-        # Find position to insert (before "## Summary")
-        summary_pos = content.find('## Summary')
-        if summary_pos == -1:
-            # Append to end
-            content += transaction_content
-        else:
-            # Insert before summary
-            content = content[:summary_pos] + transaction_content + content[summary_pos:]
+        try:
+            datetime.strptime(date, '%Y-%m-%d')
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid date: {date}. Must be YYYY-MM-DD")
+        
+        transaction = {
+            'date': date,
+            'type': type,
+            'amount': amount,
+            'description': description,
+            'category': category,
+            'reference': reference,
+            'logged_at': datetime.now().isoformat()
+        }
         
-        # Write updated content
-        self.current_month_file.write_text(content)
+        # Short IDs can collide; regenerate on a clash
+        for attempt in range(5):
+            transaction_id = self._generate_transaction_id(date, amount, f"{description}{attempt}")
+            try:
+                self.store.append([{**transaction, 'transaction_id': transaction_id}])
+                break
+            except sqlite3.IntegrityError:
+                if attempt == 4:
+                    raise
         
-        # Update summary
-        self._update_summary()
+        self._schedule_view_render()
+        if self.closable_period() != self._rolled_period:
+            self.rollover()
         
         logger.info(f'Logged transaction {transaction_id}: {type} ${amount:.2f} - {description}')
         
@@ -331,62 +494,116 @@ balance: 0.00
             }
         }
 
+    def import_bank_statement(self, path: str, **kwargs) -> Dict[str, Any]:
+        """
+        Import a CSV or OFX bank statement in one batch.
+        
+        Rows are categorized with the bank_import rule set and rows already
+        in the ledger are skipped; see scripts/bank_import.py. Rows dated in
+        a sealed month (older than the close window) are not imported
+        (counted as "sealed").
+        
+        Args:
+            path: Statement file
+            **kwargs: Passed to bank_import.import_bank_statement
+                (rules, chunk_size, file_format, date_format)
+            
+        Returns:
+            Import result with counts and totals
+        """
+        from scripts.bank_import import import_bank_statement
+        
+        result = import_bank_statement(path, store=self.store, **kwargs)
+        if result['imported']:
+            self._schedule_view_render()
+            if self.closable_period() != self._rolled_period:
+                self.rollover()
+        result['file'] = str(self.current_month_file)
+        result['statement'] = str(path)
+        return result
+
     def get_transactions(
         self,
         type: str = None,
         start_date: str = None,
         end_date: str = None,
-        category: str = None
+        category: str = None,
+        reference: str = None,
+        limit: int = None,
+        after_id: str = None
     ) -> List[Dict[str, Any]]:
         """
-        Retrieve transactions with optional filters.
+        Retrieve transactions with optional filters, in date order.
+        
+        Answered from the ledger store's indexes, so a date range costs
+        the same whichever months it spans.
         
         Args:
             type: Filter by type ("income" or "expense")
             start_date: Filter by start date (YYYY-MM-DD)
             end_date: Filter by end date (YYYY-MM-DD)
             category: Filter by category
+            reference: Filter by reference
+            limit: Page size (default: all matching transactions)
+            after_id: transaction_id of the last row of the previous page
             
         Returns:
             List of matching transactions
         """
-        transactions = self._parse_transactions()
-        
-        # Apply filters
-        if type:
-            transactions = [t for t in transactions if t['type'] == type]
-        
-        if start_date:
-            transactions = [t for t in transactions if t['date'] and t['date'] >= start_date]
-        
-        if end_date:
-            transactions = [t for t in transactions if t['date'] and t['date'] <= end_date]
-        
-        if category:
-            transactions = [t for t in transactions if t['category'] == category]
+        return self.store.query(
+            type=type,
+            start_date=start_date,
+            end_date=end_date,
+            category=category,
+            reference=reference,
+            limit=limit,
+            after_id=after_id
+        )
+
+    def iter_transactions(
+        self,
+        type: str = None,
+        start_date: str = None,
+        end_date: str = None,
+        category: str = None,
+        reference: str = None,
+        batch_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream transactions with optional filters, in date order.
         
-        return transactions
+        Same filters as get_transactions(), fetched batch_size rows at a
+        time so large ranges never sit in memory at once.
+        """
+        return self.store.iter_query(
+            type=type,
+            start_date=start_date,
+            end_date=end_date,
+            category=category,
+            reference=reference,
+            batch_size=batch_size
+        )
 
     def get_totals(self) -> Dict[str, Any]:
         """
         Get total income, expense, and balance.
         
+        Read from the store's running totals, not by scanning transactions.
+        
         Returns:
             Dictionary with totals
         """
-        transactions = self._parse_transactions()
-        
-        total_income = sum(t['amount'] for t in transactions if t['type'] == 'income')
-        total_expense = sum(t['amount'] for t in transactions if t['type'] == 'expense')
-        balance = total_income - total_expense
+        totals = self.store.totals()
+        total_income = totals['income']['total']
+        total_expense = totals['expense']['total']
         
         return {
             'total_income': total_income,
             'total_expense': total_expense,
-            'balance': balance,
-            'transaction_count': len(transactions),
-            'income_count': len([t for t in transactions if t['type'] == 'income']),
-            'expense_count': len([t for t in transactions if t['type'] == 'expense']),
+            'balance': round(total_income - total_expense, 2),
+            'transaction_count': totals['income']['count'] + totals['expense']['count'],
+            'income_count': totals['income']['count'],
+            'expense_count': totals['expense']['count'],
             'period': datetime.now().strftime('%Y-%m')
         }
 
@@ -423,30 +640,20 @@ balance: 0.00
             week_start = last_monday.strftime('%Y-%m-%d')
             week_end = (last_monday + timedelta(days=6)).strftime('%Y-%m-%d')
         
-        # Get transactions for the week
+        # Totals and categories come from the columnar snapshot; rows only for the listing
+        totals = self.analytics.totals(week_start, week_end)
+        categories = self.analytics.by_category(week_start, week_end)
+        comparison = self.analytics.compare(week_start, week_end)
         transactions = self.get_transactions(
             start_date=week_start,
             end_date=week_end
         )
         
-        # Calculate totals
-        income_transactions = [t for t in transactions if t['type'] == 'income']
-        expense_transactions = [t for t in transactions if t['type'] == 'expense']
-        
-        total_income = sum(t['amount'] for t in income_transactions)
-        total_expense = sum(t['amount'] for t in expense_transactions)
-        net_profit = total_income - total_expense
-        
-        # Group by category
-        categories = {}
-        for t in transactions:
-            cat = t['category'] or 'uncategorized'
-            if cat not in categories:
-                categories[cat] = 0.0
-            categories[cat] += t['amount']
+        total_income = totals['total_income']
+        total_expense = totals['total_expense']
+        net_profit = totals['net_profit']
         
         # Create summary file
-        summary_date = datetime.now().strftime('%Y%m%d')
         summary_file = self.weekly_summaries_path / f"Weekly_Summary_{week_start}_to_{week_end}.md"
         
         content = f"""---
@@ -461,19 +668,22 @@ generated: {datetime.now().isoformat()}
 
 ## Income
 - **Total:** ${total_income:,.2f}
-- **Transactions:** {len(income_transactions)}
+- **Transactions:** {totals['income_count']}
 
 ## Expenses
 - **Total:** ${total_expense:,.2f}
-- **Transactions:** {len(expense_transactions)}
+- **Transactions:** {totals['expense_count']}
 
 ## Net Profit
 - **${net_profit:,.2f}**
 
+## Compared to Previous Week
+{self._format_comparison(comparison)}
+
 ## Categories
 """
         
-        for cat, amount in sorted(categories.items(), key=lambda x: x[1], reverse=True):
+        for cat, amount in categories.items():
             content += f"- {cat.capitalize()}: ${amount:,.2f}\n"
         
         content += f"\n## Transactions\n\n"
@@ -498,10 +708,11 @@ generated: {datetime.now().isoformat()}
                 'net_profit': net_profit
             },
             'counts': {
-                'income_transactions': len(income_transactions),
-                'expense_transactions': len(expense_transactions)
+                'income_transactions': totals['income_count'],
+                'expense_transactions': totals['expense_count']
             },
-            'categories': categories
+            'categories': categories,
+            'comparison': comparison
         }
 
     def generate_monthly_report(self, year: int, month: int) -> Dict[str, Any]:
@@ -522,29 +733,31 @@ generated: {datetime.now().isoformat()}
         start_date = f"{year}-{month:02d}-01"
         end_date = f"{year}-{month:02d}-{last_day:02d}"
         
-        # Get transactions
-        transactions = self.get_transactions(
-            start_date=start_date,
-            end_date=end_date
+        # Previous calendar month for the comparison
+        prev_year, prev_month = (year, month - 1) if month > 1 else (year - 1, 12)
+        _, prev_last_day = monthrange(prev_year, prev_month)
+        
+        # Totals and categories come from the month's aggregate record; rows only for the breakdown tables
+        period = f"{year}-{month:02d}"
+        prev_period = f"{prev_year}-{prev_month:02d}"
+        records = self.store.partitions(prev_period, period)
+        record = self._month_record(period, records)
+        totals = self._record_totals(record)
+        expense_categories = dict(sorted(record['expense']['by_category'].items(), key=lambda x: x[1], reverse=True))
+        comparison = compare_totals(
+            {'start': start_date, 'end': end_date, **totals},
+            {'start': f"{prev_period}-01", 'end': f"{prev_period}-{prev_last_day:02d}",
+             **self._record_totals(self._month_record(prev_period, records))}
         )
+        sealed_at = records[period]['sealed_at'] if period in records else None
+        income_transactions = self.get_transactions(type='income', start_date=start_date, end_date=end_date)
+        expense_transactions = self.get_transactions(type='expense', start_date=start_date, end_date=end_date)
         
-        # Calculate totals
-        income_transactions = [t for t in transactions if t['type'] == 'income']
-        expense_transactions = [t for t in transactions if t['type'] == 'expense']
-        
-        total_income = sum(t['amount'] for t in income_transactions)
-        total_expense = sum(t['amount'] for t in expense_transactions)
-        net_profit = total_income - total_expense
+        total_income = totals['total_income']
+        total_expense = totals['total_expense']
+        net_profit = totals['net_profit']
         profit_margin = (net_profit / total_income * 100) if total_income > 0 else 0
         
-        # Group expenses by category
-        expense_categories = {}
-        for t in expense_transactions:
-            cat = t['category'] or 'uncategorized'
-            if cat not in expense_categories:
-                expense_categories[cat] = 0.0
-            expense_categories[cat] += t['amount']
-        
         # Create report file
         month_name = datetime(year, month, 1).strftime('%B %Y')
         report_file = self.monthly_reports_path / f"Monthly_Report_{year}_{month:02d}.md"
@@ -553,11 +766,13 @@ generated: {datetime.now().isoformat()}
 type: monthly_report
 year: {year}
 month: {month}
+sealed: {'true' if sealed_at else 'false'}
 generated: {datetime.now().isoformat()}
 ---
 
 # Monthly Accounting Report
 **Month:** {month_name}
+**Status:** {f'Sealed {sealed_at[:10]}' if sealed_at else 'Open'}
 
 ## Summary
 - **Total Income:** ${total_income:,.2f}
@@ -565,6 +780,9 @@ generated: {datetime.now().isoformat()}
 - **Net Profit:** ${net_profit:,.2f}
 - **Profit Margin:** {profit_margin:.1f}%
 
+## Compared to Previous Month
+{self._format_comparison(comparison)}
+
 ## Income Breakdown
 
 | Date | Description | Amount |
@@ -597,7 +815,7 @@ generated: {datetime.now().isoformat()}
 |----------|--------|------------|
 """
         
-        for cat, amount in sorted(expense_categories.items(), key=lambda x: x[1], reverse=True):
+        for cat, amount in expense_categories.items():
             percentage = (amount / total_expense * 100) if total_expense > 0 else 0
             content += f"| {cat.capitalize()} | ${amount:,.2f} | {percentage:.1f}% |\n"
         
@@ -620,12 +838,144 @@ generated: {datetime.now().isoformat()}
                 'profit_margin': profit_margin
             },
             'counts': {
-                'income_transactions': len(income_transactions),
-                'expense_transactions': len(expense_transactions)
+                'income_transactions': totals['income_count'],
+                'expense_transactions': totals['expense_count']
+            },
+            'expense_categories': expense_categories,
+            'comparison': comparison,
+            'sealed': bool(sealed_at)
+        }
+
+    def generate_trend_report(self, months: int = 24, end_date: str = None) -> Dict[str, Any]:
+        """
+        Generate a multi-month trend report.
+        
+        Monthly income, expense and net with a 3-month rolling average and
+        year-over-year change. Whole months come from their aggregate
+        records; only a partial last month reads the columnar snapshot.
+        
+        Args:
+            months: Number of months to cover, ending with end_date's month
+            end_date: Last date (YYYY-MM-DD), defaults to today
+            
+        Returns:
+            Dictionary with the monthly trend rows and file path
+        """
+        end = datetime.strptime(end_date, '%Y-%m-%d') if end_date else datetime.now()
+        first_month = end.year * 12 + end.month - months
+        start_date = f"{first_month // 12}-{first_month % 12 + 1:02d}-01"
+        end_date = end.strftime('%Y-%m-%d')
+        
+        # One extra year of history for the year-over-year column
+        history_start = f"{first_month // 12 - 1}-{first_month % 12 + 1:02d}-01"
+        trend = monthly_trend(self._month_buckets(history_start, end_date), start_date)
+        income = round(sum(m['total_income'] for m in trend), 2)
+        expense = round(sum(m['total_expense'] for m in trend), 2)
+        totals = {
+            'total_income': income,
+            'total_expense': expense,
+            'net_profit': round(income - expense, 2),
+            'income_count': sum(m['income_count'] for m in trend),
+            'expense_count': sum(m['expense_count'] for m in trend)
+        }
+        
+        report_file = self.monthly_reports_path / f"Trend_Report_{trend[0]['period']}_to_{trend[-1]['period']}.md"
+        
+        content = f"""---
+type: trend_report
+period_start: {start_date}
+period_end: {end_date}
+generated: {datetime.now().isoformat()}
+---
+
+# Accounting Trend Report
+**Period:** {trend[0]['period']} to {trend[-1]['period']} ({len(trend)} months)
+
+## Totals
+- **Total Income:** ${totals['total_income']:,.2f}
+- **Total Expenses:** ${totals['total_expense']:,.2f}
+- **Net Profit:** ${totals['net_profit']:,.2f}
+
+## Monthly Trend
+
+| Month | Income | Expenses | Net | Net (3-mo avg) | Income YoY | Net YoY |
+|-------|--------|----------|-----|----------------|------------|---------|
+"""
+        
+        for m in trend:
+            income_yoy = f"{m['income_yoy']:+.1f}%" if m['income_yoy'] is not None else '-'
+            net_yoy = f"{m['net_yoy']:+.1f}%" if m['net_yoy'] is not None else '-'
+            content += (f"| {m['period']} | ${m['total_income']:,.2f} | ${m['total_expense']:,.2f} | "
+                        f"${m['net_profit']:,.2f} | ${m['net_3m_avg']:,.2f} | {income_yoy} | {net_yoy} |\n")
+        
+        report_file.write_text(content)
+        
+        logger.info(f'Generated trend report: {report_file}')
+        
+        return {
+            'status': 'success',
+            'report_file': str(report_file),
+            'period': {
+                'start': start_date,
+                'end': end_date
             },
-            'expense_categories': expense_categories
+            'totals': totals,
+            'trend': trend
         }
 
+    def _month_record(self, period: str, records: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """A month's totals by type and category: its sealed aggregate record, or the running totals if open."""
+        return records.get(period) or self.store.totals([period])
+
+    @staticmethod
+    def _record_totals(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten an aggregate record into report totals."""
+        income = record['income']['total']
+        expense = record['expense']['total']
+        return {
+            'total_income': income,
+            'total_expense': expense,
+            'net_profit': round(income - expense, 2),
+            'income_count': record['income']['count'],
+            'expense_count': record['expense']['count']
+        }
+
+    def _month_buckets(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+        """
+        Totals per calendar month between two dates.
+        
+        Whole months are read from aggregate records (sealed partitions or
+        running totals); only months cut by start_date/end_date are summed
+        from the columnar snapshot.
+        """
+        from calendar import monthrange
+        
+        records = self.store.partitions(start_date[:7], end_date[:7])
+        buckets = []
+        period = start_date[:7]
+        while period <= end_date[:7]:
+            _, last_day = monthrange(int(period[:4]), int(period[5:7]))
+            month_start, month_end = f"{period}-01", f"{period}-{last_day:02d}"
+            start, end = max(start_date, month_start), min(end_date, month_end)
+            if (start, end) == (month_start, month_end):
+                totals = self._record_totals(self._month_record(period, records))
+            else:
+                totals = self.analytics.totals(start, end)
+            buckets.append({'period': period, 'start': start, 'end': end, **totals})
+            period = next_period(period)
+        return buckets
+
+    @staticmethod
+    def _format_comparison(comparison: Dict[str, Any]) -> str:
+        """Format a period comparison as Markdown bullets."""
+        previous = comparison['previous']
+        lines = [f"*vs {previous['start']} to {previous['end']}*"]
+        for key, label in (('total_income', 'Income'), ('total_expense', 'Expenses'), ('net_profit', 'Net Profit')):
+            change = comparison['change'][key]
+            change_text = f"{change:+.1f}%" if change is not None else 'n/a'
+            lines.append(f"- **{label}:** ${previous[key]:,.2f} → ${comparison['current'][key]:,.2f} ({change_text})")
+        return '\n'.join(lines)
+
     def export_to_csv(self, filename: str) -> str:
         """
         Export transactions to CSV.
@@ -636,16 +986,17 @@ generated: {datetime.now().isoformat()}
         Returns:
             Path to CSV file
         """
-        transactions = self._parse_transactions()
-        
         csv_path = Path(filename)
+        count = 0
         
         with open(csv_path, 'w') as f:
             f.write("Date,Type,Amount,Description,Category,Reference,Transaction_ID\n")
-            for t in sorted(transactions, key=lambda x: x['date']):
-                f.write(f"{t['date']},{t['type']},{t['amount']},\"{t['description']}\",{t['category']},{t['reference']},{t['transaction_id']}\n")
+            # Streamed in date order straight from the date index
+            for t in self.iter_transactions():
+                f.write(f"{t['date']},{t['type']},{t['amount']},\"{t['description']}\",{t['category']},{t['reference'] or ''},{t['transaction_id']}\n")
+                count += 1
         
-        logger.info(f'Exported {len(transactions)} transactions to {csv_path}')
+        logger.info(f'Exported {count} transactions to {csv_path}')
         return str(csv_path)
 
     def export_to_json(self, filename: str) -> str:
@@ -658,7 +1009,7 @@ generated: {datetime.now().isoformat()}
         Returns:
             Path to JSON file
         """
-        transactions = self._parse_transactions()
+        transactions = self.store.transactions()
         totals = self.get_totals()
         
         data = {
@@ -689,6 +1040,12 @@ def main():
     log_parser.add_argument('--reference', help='Reference number')
     log_parser.add_argument('--date', help='Transaction date (YYYY-MM-DD, default: today)')
     
+    # Bank statement import command
+    import_parser = subparsers.add_parser('import', help='Import a CSV/OFX bank statement')
+    import_parser.add_argument('--file', required=True, help='Statement file (.csv or .ofx)')
+    import_parser.add_argument('--format', choices=['csv', 'ofx'], help='Statement format (default: from extension)')
+    import_parser.add_argument('--date-format', help='strptime format for CSV dates (default: %%Y-%%m-%%d)')
+    
     # Totals command
     subparsers.add_parser('totals', help='Get total income, expense, and balance')
     
@@ -705,6 +1062,16 @@ def main():
     monthly_parser.add_argument('--month', type=int, required=True, help='Month (1-12)')
     monthly_parser.add_argument('--year', type=int, required=True, help='Year')
     
+    # Trend report command
+    trend_parser = subparsers.add_parser('trend-report', help='Generate multi-month trend report')
+    trend_parser.add_argument('--months', type=int, default=24, help='Number of months (default: 24)')
+    trend_parser.add_argument('--end', help='Last date (YYYY-MM-DD, default: today)')
+    
+    # Rollover command
+    rollover_parser = subparsers.add_parser('rollover', help='Seal finished months into immutable partitions')
+    rollover_parser.add_argument('--through', help='Close the books up to this month (YYYY-MM), '
+                                                   'default: months past ACCOUNTING_CLOSE_AFTER_DAYS')
+    
     # Export commands
     export_csv_parser = subparsers.add_parser('export-csv', help='Export to CSV')
     export_csv_parser.add_argument('--filename', required=True, help='Output CSV filename')
@@ -730,6 +1097,14 @@ def main():
             )
             print(json.dumps(result, indent=2))
             
+        elif args.command == 'import':
+            result = accounting.import_bank_statement(
+                args.file,
+                file_format=args.format,
+                date_format=args.date_format
+            )
+            print(json.dumps(result, indent=2))
+            
         elif args.command == 'totals':
             totals = accounting.get_totals()
             print("\n=== Accounting Totals ===")
@@ -766,6 +1141,19 @@ def main():
             print(f"Net Profit:     ${result['totals']['net_profit']:,.2f}")
             print(f"Profit Margin:  {result['totals']['profit_margin']:.1f}%\n")
             
+        elif args.command == 'trend-report':
+            result = accounting.generate_trend_report(months=args.months, end_date=args.end)
+            print(f"\nTrend report generated: {result['report_file']}\n")
+            print(f"Period: {result['period']['start']} to {result['period']['end']}")
+            print(f"Total Income:   ${result['totals']['total_income']:,.2f}")
+            print(f"Total Expense:  ${result['totals']['total_expense']:,.2f}")
+            print(f"Net Profit:     ${result['totals']['net_profit']:,.2f}\n")
+            
+        elif args.command == 'rollover':
+            sealed = accounting.rollover(through=args.through)
+            print(f"\nSealed: {', '.join(sealed) if sealed else 'nothing new'}")
+            print(f"Sealed through: {accounting.store.sealed_through() or 'none'}\n")
+            
         elif args.command == 'export-csv':
             csv_path = accounting.export_to_csv(args.filename)
             print(f"\nExported to CSV: {csv_path}\n")
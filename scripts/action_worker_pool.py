@@ -0,0 +1,278 @@
+"""
+Action Worker Pool - Long-Lived In-Process MCP Executor
+
+Runs approved external actions (gmail_send, linkedin_post) on a pool of
+long-lived workers instead of spawning ``python scripts/mcp_executor.py``
+per action. Workers import the executor once and keep their clients warm
+(e.g. each worker thread reuses its authenticated Gmail service), so the
+per-action cost is the API call itself rather than an interpreter start,
+module imports and re-authentication.
+
+Threads are used by default since the clients are I/O-bound. Worker
+processes can be used instead for isolation (a crash in browser
+automation cannot take the orchestrator down); each process is warmed
+once when it starts.
+
+Usage:
+    from scripts.action_worker_pool import get_action_worker_pool
+
+    pool = get_action_worker_pool()
+
+    # Blocking, with a structured result
+    result = pool.execute("gmail_send", {"to": ..., "subject": ..., "body": ...}, approval_id)
+
+    # Non-blocking
+    future = pool.submit("linkedin_post", {"content": ...}, approval_id)
+
+Timeouts: ``execute()`` cancels an action that is still queued when its
+timeout expires. An action that already started cannot be interrupted
+and may still complete (the email may still be sent). It stays tracked
+under its approval ID, and submitting the same approval ID again joins
+the running action instead of executing it a second time.
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+# Add project root to sys.path to enable imports from root-level modules
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from log_manager import setup_logging
+
+logger = setup_logging(log_file="logs/ai_employee.log", logger_name="action-worker-pool")
+
+DEFAULT_WORKERS = int(os.getenv("MCP_EXECUTOR_WORKERS", "4"))
+DEFAULT_ACTION_TIMEOUT = 120
+
+
+def _warm_worker():
+    """Import the executor (and its client modules) once per worker process."""
+    try:
+        import scripts.mcp_executor  # noqa: F401
+    except ImportError as e:
+        # Actions will report the missing dependency when they run
+        logger.warning(f"Could not preload mcp executor: {e}")
+
+
+def _run_action(
+    action_type: str,
+    data: Dict[str, Any],
+    approval_id: str,
+    deadline_at: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Execute one action inside a worker and time it."""
+    from scripts.mcp_executor import execute_action
+    from scripts.execution_scheduler import channel_for, get_execution_scheduler
+
+    # Time spent queued counts against the caller's deadline (wall clock, so
+    # it also works across worker processes)
+    timeout = None if deadline_at is None else max(0.0, deadline_at - time.time())
+
+    # Share the channel's rate limit with the executor lanes
+    if not get_execution_scheduler().lane(channel_for(action_type)).bucket.acquire(timeout=timeout):
+        return {
+            "status": "error",
+            "message": "Deadline exceeded waiting for the channel rate limit",
+            "action_type": action_type,
+            "approval_id": approval_id,
+        }
+    if deadline_at is not None:
+        timeout = max(0.0, deadline_at - time.time())
+    started = time.perf_counter()
+    result = execute_action(action_type=action_type, data=data, approval_id=approval_id, timeout=timeout)
+    result = dict(result)
+    result.setdefault("action_type", action_type)
+    result.setdefault("approval_id", approval_id)
+    result["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    result["worker"] = f"{os.getpid()}:{threading.current_thread().name}"
+    return result
+
+
+class ActionWorkerPool:
+    """
+    Pool of warm workers executing approved MCP actions.
+
+    Actions are queued in memory (the executor's work queue) and each
+    returns a Future resolving to the structured result dict from
+    ``execute_action`` plus ``duration_ms`` and ``worker``. At most one
+    action per approval ID is queued or running at a time.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_WORKERS,
+        use_processes: bool = False,
+        runner: Callable[..., Dict[str, Any]] = _run_action,
+    ):
+        """
+        Args:
+            max_workers: Number of worker threads/processes
+            use_processes: Run actions in worker processes instead of threads
+            runner: Module-level function executing one action as
+                ``runner(action_type, data, approval_id, deadline_at)``
+        """
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self._runner = runner
+        if use_processes:
+            self._executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_warm_worker)
+        else:
+            _warm_worker()
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mcp-worker")
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self._stats = {"submitted": 0, "joined": 0, "succeeded": 0, "failed": 0, "cancelled": 0, "total_ms": 0.0}
+        mode = "processes" if use_processes else "threads"
+        logger.info(f"Action worker pool started ({max_workers} {mode})")
+
+    def submit(
+        self,
+        action_type: str,
+        data: Dict[str, Any],
+        approval_id: str,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """
+        Queue an action for execution.
+
+        If an action for the same approval ID is still queued or running
+        (e.g. after an ``execute()`` timeout), its Future is returned
+        instead of running the action twice.
+
+        Args:
+            action_type: Type of action ('gmail_send' or 'linkedin_post')
+            data: Action data dictionary
+            approval_id: Approval document ID
+            timeout: Deadline in seconds from now, propagated to the
+                executor's retries (None for no deadline)
+
+        Returns:
+            Future resolving to the result dictionary
+        """
+        deadline_at = None if timeout is None else time.time() + timeout
+        with self._lock:
+            running = self._in_flight.get(approval_id)
+            if running is not None and not running.done():
+                self._stats["joined"] += 1
+                logger.info(f"Action for {approval_id} is still in flight; joining it")
+                return running
+            self._stats["submitted"] += 1
+            future = self._executor.submit(self._runner, action_type, data, approval_id, deadline_at)
+            self._in_flight[approval_id] = future
+        future.add_done_callback(lambda done: self._finished(approval_id, done))
+        return future
+
+    def execute(
+        self,
+        action_type: str,
+        data: Dict[str, Any],
+        approval_id: str,
+        timeout: Optional[float] = DEFAULT_ACTION_TIMEOUT,
+    ) -> Dict[str, Any]:
+        """
+        Execute an action and wait for its result.
+
+        Args:
+            action_type: Type of action ('gmail_send' or 'linkedin_post')
+            data: Action data dictionary
+            approval_id: Approval document ID
+            timeout: Seconds to wait for the result (None waits forever)
+
+        Returns:
+            Result dictionary with status and message. On timeout a queued
+            action is cancelled (``cancelled: True``); one that already
+            started keeps running (``still_running: True``) and may still
+            complete, so it must not be re-run by other means.
+        """
+        future = self.submit(action_type, data, approval_id, timeout=timeout)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            if future.cancel():
+                logger.error(f"Action {action_type} for {approval_id} cancelled: still queued after {timeout}s")
+                return {
+                    "status": "error",
+                    "message": f"Action timed out after {timeout} seconds before it started; cancelled",
+                    "action_type": action_type,
+                    "approval_id": approval_id,
+                    "cancelled": True,
+                }
+            logger.error(f"Action {action_type} for {approval_id} still running after {timeout}s")
+            return {
+                "status": "error",
+                "message": (f"Action timed out after {timeout} seconds but is still running and may "
+                            "complete; resubmitting this approval joins it"),
+                "action_type": action_type,
+                "approval_id": approval_id,
+                "still_running": True,
+            }
+        except Exception as e:
+            logger.error(f"Action {action_type} for {approval_id} crashed in worker: {e}")
+            return {
+                "status": "error",
+                "message": f"Worker error: {e}",
+                "action_type": action_type,
+                "approval_id": approval_id,
+            }
+
+    def _finished(self, approval_id: str, future: Future):
+        if future.cancelled():
+            result = None
+        else:
+            try:
+                result = future.result()
+            except Exception:
+                result = None
+        with self._lock:
+            if self._in_flight.get(approval_id) is future:
+                del self._in_flight[approval_id]
+            if future.cancelled():
+                self._stats["cancelled"] += 1
+            elif result is not None and result.get("status") == "success":
+                self._stats["succeeded"] += 1
+            else:
+                self._stats["failed"] += 1
+            if result is not None:
+                self._stats["total_ms"] += result.get("duration_ms", 0.0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Submitted/joined/succeeded/failed/cancelled counts, in-flight actions and average latency."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["in_flight"] = len(self._in_flight)
+        finished = stats["succeeded"] + stats["failed"]
+        stats["avg_ms"] = round(stats.pop("total_ms") / finished, 1) if finished else 0.0
+        stats["workers"] = self.max_workers
+        stats["mode"] = "processes" if self.use_processes else "threads"
+        return stats
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting actions and shut the workers down."""
+        self._executor.shutdown(wait=wait)
+
+
+_action_worker_pool = None
+_action_worker_pool_lock = threading.Lock()
+
+
+def get_action_worker_pool() -> ActionWorkerPool:
+    """
+    Get singleton action worker pool.
+
+    Worker count comes from ``MCP_EXECUTOR_WORKERS`` (default 4); set
+    ``MCP_EXECUTOR_PROCESSES=true`` to run actions in worker processes.
+    """
+    global _action_worker_pool
+    with _action_worker_pool_lock:
+        if _action_worker_pool is None:
+            use_processes = os.getenv("MCP_EXECUTOR_PROCESSES", "false").lower() == "true"
+            _action_worker_pool = ActionWorkerPool(use_processes=use_processes)
+        return _action_worker_pool
@@ -0,0 +1,533 @@
+"""
+Approval Manager - Event-Driven Human Approval Waiter
+
+Tracks every pending approval file in Needs_Approval at once instead of
+blocking one thread per file. File modifications are picked up through
+watchdog (inotify on Linux); all approval deadlines are driven by a single
+timer heap on one dispatcher thread. When an approval resolves, its future
+is completed and any per-approval callbacks run on a small worker pool.
+
+Usage:
+    from scripts.approval_manager import get_approval_manager
+
+    manager = get_approval_manager()
+
+    # Non-blocking: callback runs when the human approves/rejects or on timeout
+    manager.watch("AI_Employee_Vault/Needs_Approval/EMAIL_123.md", callback=on_resolved)
+
+    # Track everything in Needs_Approval, including files created later
+    manager.watch_directory(callback=on_resolved)
+
+    # Blocking (what request_approval() does)
+    result = manager.watch(path, timeout_seconds=3600).result()
+"""
+
+import heapq
+import itertools
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+# Add project root to sys.path to enable imports from root-level modules
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+from log_manager import setup_logging
+from scripts.approval_store import ApprovalState, ApprovalStore, get_approval_store
+from scripts.request_approval import (
+    ApprovalStatus,
+    NEEDS_APPROVAL_PATH,
+    approval_destination,
+    check_approval_status,
+    log_approval_action,
+    parse_timeout_extended,
+    parse_timeout_from_file,
+    read_file,
+)
+
+logger = setup_logging(log_file="logs/ai_employee.log", logger_name="approval-manager")
+
+DEFAULT_TIMEOUT_SECONDS = 3600
+DEFAULT_POLL_INTERVAL = 10
+
+
+@dataclass
+class ApprovalResult:
+    """Outcome of a tracked approval."""
+    approval_id: str
+    file_path: Path
+    status: ApprovalStatus
+    reason: str
+    final_path: Optional[Path] = None
+    content: str = ""
+
+
+@dataclass
+class _TrackedApproval:
+    file_path: Path
+    timeout_seconds: int
+    started: float
+    deadline: float
+    future: Future = field(default_factory=Future)
+    callbacks: List[Callable[[ApprovalResult], None]] = field(default_factory=list)
+    generation: int = 0
+    mtime: Optional[float] = None
+
+
+class _NeedsApprovalEventHandler(FileSystemEventHandler):
+    """Forwards file system events in Needs_Approval to the manager."""
+
+    def __init__(self, manager: "ApprovalManager"):
+        super().__init__()
+        self.manager = manager
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.manager.notify_changed(Path(event.src_path), created=True)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.manager.notify_changed(Path(event.src_path))
+
+    def on_moved(self, event):
+        # Editors often save via write-to-temp + rename
+        if not event.is_directory:
+            self.manager.notify_changed(Path(event.dest_path), created=True)
+
+
+class ApprovalManager:
+    """
+    Event-driven waiter for human approvals.
+
+    Every tracked approval has one entry in a deadline heap; the dispatcher
+    thread sleeps until the earliest deadline or until a file change wakes
+    it. The Markdown file is only re-read when it has changed. Without
+    watchdog the dispatcher falls back to stat-ing the tracked files every
+    ``poll_interval`` seconds - still one thread for all approvals.
+    Decisions, timeouts and file moves are recorded in the approval store.
+    """
+
+    def __init__(
+        self,
+        needs_approval_path: Path = NEEDS_APPROVAL_PATH,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        default_timeout: int = DEFAULT_TIMEOUT_SECONDS,
+        callback_workers: int = 4,
+        use_watchdog: bool = True,
+        store: Optional[ApprovalStore] = None,
+    ):
+        self.needs_approval_path = Path(needs_approval_path)
+        self.poll_interval = poll_interval
+        self.default_timeout = default_timeout
+        self.use_watchdog = use_watchdog and WATCHDOG_AVAILABLE
+        self.store = store or get_approval_store()
+
+        self._cond = threading.Condition()
+        self._approvals: Dict[str, _TrackedApproval] = {}
+        self._deadlines: list = []
+        self._seq = itertools.count()
+        self._dirty: Set[str] = set()
+        self._directory_callbacks: List[Callable[[ApprovalResult], None]] = []
+        self._callback_pool = ThreadPoolExecutor(
+            max_workers=callback_workers, thread_name_prefix="approval-callback"
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._observer = None
+        self._running = False
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Start the dispatcher thread (and the file observer, if available)."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+
+        self.needs_approval_path.mkdir(parents=True, exist_ok=True)
+        if self.use_watchdog:
+            self._observer = Observer()
+            self._observer.schedule(
+                _NeedsApprovalEventHandler(self), str(self.needs_approval_path), recursive=False
+            )
+            self._observer.start()
+
+        self._thread = threading.Thread(target=self._dispatch_loop, name="approval-manager", daemon=True)
+        self._thread.start()
+        mode = "file system events" if self.use_watchdog else f"polling every {self.poll_interval}s"
+        logger.info(f"ApprovalManager started ({mode}) for {self.needs_approval_path}")
+
+    def stop(self):
+        """Stop the dispatcher. Pending futures are left unresolved."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(file_path: Path) -> str:
+        return str(Path(file_path).resolve())
+
+    def watch(
+        self,
+        file_path,
+        timeout_seconds: Optional[int] = None,
+        callback: Optional[Callable[[ApprovalResult], None]] = None,
+    ) -> Future:
+        """
+        Track an approval file until it is approved, rejected or times out.
+
+        Watching a file that is already tracked returns the existing future
+        (the callback is added once).
+
+        Args:
+            file_path: Path to the approval request file in Needs_Approval.
+            timeout_seconds: Timeout in seconds (default: manager default). A
+                ``timeout:``/``timeout_extended:`` field in the file overrides it.
+            callback: Optional callable invoked with the ApprovalResult.
+
+        Returns:
+            Future resolving to an ApprovalResult.
+        """
+        file_path = Path(file_path)
+        key = self._key(file_path)
+
+        with self._cond:
+            tracked = self._approvals.get(key)
+            if tracked is not None:
+                if callback is not None and callback not in tracked.callbacks:
+                    tracked.callbacks.append(callback)
+                return tracked.future
+
+        if not file_path.exists():
+            error_msg = f"Approval file not found: {file_path}"
+            log_approval_action(error_msg, level="ERROR")
+            future = Future()
+            result = ApprovalResult(file_path.stem, file_path, ApprovalStatus.REJECTED, error_msg)
+            future.set_result(result)
+            if callback is not None:
+                self._run_callback(callback, result)
+            return future
+
+        timeout_seconds = timeout_seconds or self.default_timeout
+        now = time.time()
+        tracked = _TrackedApproval(
+            file_path=file_path,
+            timeout_seconds=timeout_seconds,
+            started=now,
+            deadline=now + timeout_seconds,
+        )
+        if callback is not None:
+            tracked.callbacks.append(callback)
+
+        file_deadline = self._deadline_from_file(file_path)
+        if file_deadline is not None:
+            tracked.deadline = file_deadline
+
+        with self._cond:
+            existing = self._approvals.get(key)
+            if existing is not None:
+                # Lost a registration race; join the existing approval
+                if callback is not None and callback not in existing.callbacks:
+                    existing.callbacks.append(callback)
+                return existing.future
+            self._approvals[key] = tracked
+            heapq.heappush(self._deadlines, (tracked.deadline, next(self._seq), key, tracked.generation))
+            # Check once right away: the file may already be approved
+            self._dirty.add(key)
+            self._cond.notify_all()
+
+        log_approval_action(f"Approval request received: {file_path.name}")
+        log_approval_action(
+            f"Timeout set to: {datetime.fromtimestamp(tracked.deadline).isoformat()} "
+            f"(in {tracked.deadline - now:.0f} seconds)"
+        )
+        self.start()
+        return tracked.future
+
+    def watch_directory(self, callback: Optional[Callable[[ApprovalResult], None]] = None) -> List[Future]:
+        """
+        Track every approval file in Needs_Approval, now and as new files arrive.
+
+        Safe to call repeatedly (e.g. once per orchestrator cycle); files and
+        callbacks are only registered once.
+
+        Args:
+            callback: Optional callable invoked with each ApprovalResult.
+
+        Returns:
+            Futures for the approvals currently in the folder.
+        """
+        with self._cond:
+            if callback is not None and callback not in self._directory_callbacks:
+                self._directory_callbacks.append(callback)
+
+        self.needs_approval_path.mkdir(parents=True, exist_ok=True)
+        futures = [
+            self.watch(file_path, callback=callback)
+            for file_path in sorted(self.needs_approval_path.glob("*.md"))
+        ]
+        self.start()
+        return futures
+
+    def notify_changed(self, file_path: Path, created: bool = False):
+        """Mark a file as changed (called from file system events)."""
+        if file_path.suffix != ".md":
+            return
+        key = self._key(file_path)
+        with self._cond:
+            tracked = key in self._approvals
+            directory_callbacks = list(self._directory_callbacks)
+            if tracked:
+                self._dirty.add(key)
+                self._cond.notify_all()
+        if not tracked and created and file_path.parent.resolve() == self.needs_approval_path.resolve():
+            for callback in directory_callbacks or [None]:
+                self.watch(file_path, callback=callback)
+
+    def pending(self) -> List[str]:
+        """Names of the approval files currently being tracked."""
+        with self._cond:
+            return sorted(tracked.file_path.name for tracked in self._approvals.values())
+
+    # ------------------------------------------------------------------
+    # Dispatcher
+    # ------------------------------------------------------------------
+
+    def _dispatch_loop(self):
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                wait_for = self._seconds_until_next_deadline()
+                if not self.use_watchdog:
+                    wait_for = min(wait_for, self.poll_interval)
+                if not self._dirty and wait_for > 0:
+                    self._cond.wait(wait_for)
+                if not self._running:
+                    return
+                dirty = self._dirty
+                self._dirty = set()
+                expired = self._pop_expired()
+
+            if not self.use_watchdog:
+                dirty |= self._poll_changes()
+
+            for key in dirty:
+                self._check(key)
+            for key in expired:
+                self._expire(key)
+
+    def _seconds_until_next_deadline(self) -> float:
+        """Seconds until the earliest live deadline (caller holds the lock)."""
+        while self._deadlines:
+            deadline, _, key, generation = self._deadlines[0]
+            tracked = self._approvals.get(key)
+            if tracked is None or tracked.generation != generation:
+                heapq.heappop(self._deadlines)  # Stale entry
+                continue
+            return max(0.0, deadline - time.time())
+        return 3600.0
+
+    def _pop_expired(self) -> List[str]:
+        """Pop all live heap entries whose deadline has passed (caller holds the lock)."""
+        expired = []
+        now = time.time()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, key, generation = heapq.heappop(self._deadlines)
+            tracked = self._approvals.get(key)
+            if tracked is not None and tracked.generation == generation:
+                expired.append(key)
+        return expired
+
+    def _poll_changes(self) -> Set[str]:
+        """Fallback change detection: stat tracked files and scan for new ones."""
+        with self._cond:
+            tracked = dict(self._approvals)
+            scan_directory = bool(self._directory_callbacks)
+
+        changed = set()
+        for key, approval in tracked.items():
+            try:
+                mtime = approval.file_path.stat().st_mtime
+            except OSError:
+                mtime = None
+            if mtime != approval.mtime:
+                changed.add(key)
+
+        if scan_directory and self.needs_approval_path.exists():
+            for file_path in self.needs_approval_path.glob("*.md"):
+                if self._key(file_path) not in tracked:
+                    self.notify_changed(file_path, created=True)
+        return changed
+
+    def _deadline_from_file(self, file_path: Path) -> Optional[float]:
+        try:
+            content = read_file(file_path)
+        except Exception as e:
+            log_approval_action(f"Error reading initial timeout from file: {e}", level="WARNING")
+            return None
+
+        file_timeout = parse_timeout_from_file(content)
+        extended_timeout = parse_timeout_extended(content)
+        if extended_timeout and (file_timeout is None or extended_timeout > file_timeout):
+            return extended_timeout.timestamp()
+        if file_timeout:
+            return file_timeout.timestamp()
+        return None
+
+    def _check(self, key: str):
+        """Re-read a changed approval file and resolve it if a human responded."""
+        with self._cond:
+            tracked = self._approvals.get(key)
+        if tracked is None:
+            return
+
+        try:
+            mtime = tracked.file_path.stat().st_mtime
+        except OSError:
+            mtime = None
+        if mtime is not None and mtime == tracked.mtime:
+            return  # Unchanged since the last parse
+        tracked.mtime = mtime
+
+        try:
+            status, reason = check_approval_status(tracked.file_path, store=self.store)
+        except Exception as e:
+            log_approval_action(f"Error checking approval status: {e}", level="ERROR")
+            return
+
+        if status in (ApprovalStatus.APPROVED, ApprovalStatus.REJECTED):
+            level = "INFO" if status == ApprovalStatus.APPROVED else "WARNING"
+            log_approval_action(f"STATUS_CHANGE: {status.value.upper()} detected - {reason}", level=level)
+            self._resolve(key, status, reason)
+            return
+
+        # Still pending: a timeout extension may have been written
+        file_deadline = self._deadline_from_file(tracked.file_path)
+        with self._cond:
+            if file_deadline is not None and file_deadline > tracked.deadline and key in self._approvals:
+                tracked.deadline = file_deadline
+                tracked.generation += 1
+                heapq.heappush(self._deadlines, (tracked.deadline, next(self._seq), key, tracked.generation))
+                log_approval_action(
+                    f"Timeout extended for {tracked.file_path.name} to "
+                    f"{datetime.fromtimestamp(file_deadline).isoformat()}"
+                )
+
+    def _expire(self, key: str):
+        with self._cond:
+            tracked = self._approvals.get(key)
+        if tracked is None:
+            return
+
+        # A last look in case the final edit raced the deadline
+        tracked.mtime = None
+        self._check(key)
+        with self._cond:
+            if key not in self._approvals:
+                return
+
+        log_approval_action(
+            f"TIMEOUT: No human response after {tracked.timeout_seconds} seconds", level="WARNING"
+        )
+        self._resolve(key, ApprovalStatus.TIMEOUT, f"Timeout after {tracked.timeout_seconds} seconds")
+
+    def _resolve(self, key: str, status: ApprovalStatus, reason: str):
+        with self._cond:
+            tracked = self._approvals.pop(key, None)
+        if tracked is None:
+            return
+
+        file_path = tracked.file_path
+        try:
+            content = read_file(file_path)
+        except Exception:
+            content = ""
+
+        final_path = approval_destination(file_path, status)
+        if final_path is not None:
+            try:
+                final_path.parent.mkdir(parents=True, exist_ok=True)
+                file_path.replace(final_path)
+                log_approval_action(f"File renamed and moved to: {final_path.parent}")
+            except OSError as e:
+                log_approval_action(f"Error moving file from {file_path} to {final_path}: {e}", level="ERROR")
+                final_path = None
+
+        approval_id = file_path.stem
+        # Approved/rejected were recorded when the file was parsed; this
+        # records the timeout and the file's new location
+        self.store.transition(approval_id, ApprovalState(status.value), reason, file_path=final_path)
+        if status == ApprovalStatus.APPROVED:
+            log_approval_action(f"APPROVAL_COMPLETE: {approval_id} approved by human")
+        elif status == ApprovalStatus.REJECTED:
+            log_approval_action(f"APPROVAL_REJECTED: {approval_id} rejected by human - {reason}")
+
+        result = ApprovalResult(
+            approval_id=approval_id,
+            file_path=file_path,
+            status=status,
+            reason=reason,
+            final_path=final_path,
+            content=content,
+        )
+        tracked.future.set_result(result)
+        for callback in tracked.callbacks:
+            self._run_callback(callback, result)
+
+    def _run_callback(self, callback: Callable[[ApprovalResult], None], result: ApprovalResult):
+        def _invoke():
+            try:
+                callback(result)
+            except Exception as e:
+                logger.error(f"Approval callback failed for {result.approval_id}: {e}")
+
+        self._callback_pool.submit(_invoke)
+
+
+_approval_manager = None
+_approval_manager_lock = threading.Lock()
+
+
+def get_approval_manager(poll_interval: float = DEFAULT_POLL_INTERVAL) -> ApprovalManager:
+    """
+    Get singleton approval manager.
+
+    Args:
+        poll_interval: Fallback polling interval; the shortest interval any
+            caller has asked for is used.
+    """
+    global _approval_manager
+    with _approval_manager_lock:
+        if _approval_manager is None:
+            _approval_manager = ApprovalManager(poll_interval=poll_interval)
+        elif poll_interval < _approval_manager.poll_interval:
+            _approval_manager.poll_interval = poll_interval
+        return _approval_manager
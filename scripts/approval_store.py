@@ -0,0 +1,456 @@
+"""
+Approval Store - Structured Approval State Machine
+
+Keeps the status of every approval request in an indexed SQLite table so
+readers (orchestrators, executors, dashboard) look it up by primary key
+instead of re-reading and substring-searching Markdown files.
+
+State machine:
+    pending -> approved | rejected | timeout
+    approved -> executed | failed
+
+Every transition is recorded with a timestamp and reason. The Markdown file
+stays the human interface: only its YAML frontmatter is parsed (a body that
+quotes "status: approved" has no effect), and only when the file's
+mtime/size fingerprint has changed since the last parse.
+
+Usage:
+    from scripts.approval_store import get_approval_store, ApprovalState
+
+    store = get_approval_store()
+    record = store.sync_file(Path("AI_Employee_Vault/Pending_Approval/EMAIL_123.md"))
+    if record and record.state == ApprovalState.APPROVED:
+        ...
+        store.transition(record.approval_id, ApprovalState.EXECUTED, "Email sent")
+"""
+
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+APPROVAL_DB_PATH = PROJECT_ROOT / "logs" / "approvals.db"
+
+
+class ApprovalState(Enum):
+    """Lifecycle states of an approval request."""
+    PENDING = "pending"
+    APPROVED = "approved"
+    REJECTED = "rejected"
+    TIMEOUT = "timeout"
+    EXECUTED = "executed"
+    FAILED = "failed"
+
+
+TRANSITIONS = {
+    ApprovalState.PENDING: {ApprovalState.APPROVED, ApprovalState.REJECTED, ApprovalState.TIMEOUT},
+    ApprovalState.APPROVED: {ApprovalState.EXECUTED, ApprovalState.FAILED},
+    ApprovalState.REJECTED: set(),
+    ApprovalState.TIMEOUT: set(),
+    ApprovalState.EXECUTED: set(),
+    ApprovalState.FAILED: set(),
+}
+
+# Suffix added by approval_destination() when a resolved file is moved
+_RESOLVED_SUFFIX = re.compile(r"\.(approved|rejected|timeout)(_\d{8}_\d{6})?$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS approvals (
+    approval_id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    reason TEXT,
+    action_type TEXT,
+    file_path TEXT,
+    fingerprint TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_approvals_state ON approvals(state);
+CREATE TABLE IF NOT EXISTS approval_transitions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    approval_id TEXT NOT NULL,
+    from_state TEXT,
+    to_state TEXT NOT NULL,
+    reason TEXT,
+    at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_transitions_approval ON approval_transitions(approval_id);
+"""
+
+
+@dataclass
+class ApprovalRecord:
+    """Current state of one approval request."""
+    approval_id: str
+    state: ApprovalState
+    reason: str
+    action_type: str
+    file_path: str
+    fingerprint: str
+    created_at: str
+    updated_at: str
+
+
+def approval_id_for(file_path) -> str:
+    """
+    Approval ID for a file: its name without ``.md`` or the
+    ``.approved_<timestamp>``-style suffix added when it was resolved.
+    """
+    return _RESOLVED_SUFFIX.sub("", Path(file_path).stem)
+
+
+def parse_frontmatter(content: str) -> Dict[str, str]:
+    """
+    Parse the YAML frontmatter block at the very top of a Markdown file.
+
+    Only the leading ``---`` ... ``---`` block is read; everything after it
+    is ignored. Keys are lower-cased and inline ``# comments`` are dropped.
+
+    Args:
+        content: Markdown file content
+
+    Returns:
+        Dict of frontmatter key/value strings (empty if there is none)
+    """
+    lines = content.lstrip("\ufeff").splitlines()
+    if not lines or lines[0].strip() != "---":
+        return {}
+
+    metadata = {}
+    for line in lines[1:]:
+        if line.strip() == "---":
+            return metadata
+        if ":" not in line or line.startswith((" ", "\t")):
+            continue
+        key, value = line.split(":", 1)
+        value = value.split(" #", 1)[0].strip().strip('"').strip("'")
+        metadata[key.strip().lower()] = value
+    # No closing marker: not frontmatter
+    return {}
+
+
+def frontmatter_decision(metadata: Dict[str, str]) -> Tuple[ApprovalState, str]:
+    """
+    Decide the human's answer from parsed frontmatter.
+
+    ``status: approved`` / ``approved: true`` approve; ``status: rejected``
+    (or ``reject``) / ``rejected: true`` reject. Anything else is pending.
+
+    Args:
+        metadata: Output of parse_frontmatter()
+
+    Returns:
+        Tuple of (ApprovalState, reason)
+    """
+    status = metadata.get("status", "").lower()
+
+    if status == "approved" or metadata.get("approved", "").lower() == "true":
+        reason = metadata.get("approval_reason") or metadata.get("approved_reason") or "Approved by human reviewer"
+        return (ApprovalState.APPROVED, reason)
+
+    if status in ("rejected", "reject") or metadata.get("rejected", "").lower() == "true":
+        reason = metadata.get("rejection_reason") or metadata.get("rejected_reason") or "Rejected by human reviewer"
+        return (ApprovalState.REJECTED, reason)
+
+    return (ApprovalState.PENDING, "Waiting for human response")
+
+
+_NEWLINES = re.compile(r"[\r\n\u2028\u2029\x0b\x0c\x85]+")
+
+
+def set_frontmatter_fields(content: str, fields: Dict[str, str]) -> str:
+    """
+    Set keys in the frontmatter, leaving the body untouched.
+
+    Existing keys are replaced in place; new keys are appended to the block.
+    Line breaks in values are collapsed to spaces so a value (e.g. a
+    user-supplied reason) cannot inject extra frontmatter keys.
+
+    Args:
+        content: Markdown file content
+        fields: Keys and values to set
+
+    Returns:
+        Updated content (a frontmatter block is added if there is none)
+    """
+    fields = {key: _NEWLINES.sub(" ", str(value)).strip() for key, value in fields.items()}
+    lines = content.splitlines(keepends=True)
+    if lines and lines[0].strip() == "---":
+        remaining = dict(fields)
+        for index in range(1, len(lines)):
+            if lines[index].strip() == "---":
+                new_lines = [f"{key}: {value}\n" for key, value in remaining.items()]
+                lines[index:index] = new_lines
+                return "".join(lines)
+            for key in list(remaining):
+                if re.match(rf"{re.escape(key)}\s*:", lines[index]):
+                    lines[index] = f"{key}: {remaining.pop(key)}\n"
+                    break
+    block = "".join(f"{key}: {value}\n" for key, value in fields.items())
+    return f"---\n{block}---\n\n{content}"
+
+
+def set_frontmatter_status(content: str, status: str) -> str:
+    """
+    Set ``status:`` in the frontmatter, leaving the body untouched.
+
+    Args:
+        content: Markdown file content
+        status: New status value (e.g. "approved")
+
+    Returns:
+        Updated content (a frontmatter block is added if there is none)
+    """
+    return set_frontmatter_fields(content, {"status": status})
+
+
+class ApprovalStore:
+    """
+    SQLite-backed approval state machine.
+
+    Lookups are primary-key reads. The database is shared by every process
+    that touches approvals (orchestrators, mcp executor, dashboard), so
+    SQLite's own locking is used across processes and a lock serialises
+    the shared connection inside one process.
+    """
+
+    def __init__(self, db_path: Path = APPROVAL_DB_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _record(row) -> ApprovalRecord:
+        return ApprovalRecord(
+            approval_id=row["approval_id"],
+            state=ApprovalState(row["state"]),
+            reason=row["reason"] or "",
+            action_type=row["action_type"] or "",
+            file_path=row["file_path"] or "",
+            fingerprint=row["fingerprint"] or "",
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
+    def get(self, approval_id: str) -> Optional[ApprovalRecord]:
+        """Current record for an approval, or None if unknown."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM approvals WHERE approval_id = ?", (approval_id,)
+            ).fetchone()
+        return self._record(row) if row else None
+
+    def state(self, approval_id: str) -> Optional[ApprovalState]:
+        """Current state of an approval, or None if unknown."""
+        record = self.get(approval_id)
+        return record.state if record else None
+
+    def list_by_state(self, state: ApprovalState) -> List[ApprovalRecord]:
+        """All approvals currently in ``state`` (uses the state index)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM approvals WHERE state = ? ORDER BY updated_at", (state.value,)
+            ).fetchall()
+        return [self._record(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """Number of approvals per state."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT state, COUNT(*) AS n FROM approvals GROUP BY state"
+            ).fetchall()
+        return {row["state"]: row["n"] for row in rows}
+
+    def history(self, approval_id: str) -> List[Dict[str, str]]:
+        """Transitions of an approval, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT from_state, to_state, reason, at FROM approval_transitions "
+                "WHERE approval_id = ? ORDER BY id",
+                (approval_id,),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _write(self, approval_id: str, row, to_state: ApprovalState, reason: str, **fields):
+        """Insert/update the approval row and log the transition (caller holds the lock)."""
+        now = datetime.now().isoformat()
+        from_state = row["state"] if row else None
+        if row is None:
+            self._conn.execute(
+                "INSERT INTO approvals (approval_id, state, reason, action_type, file_path, fingerprint, "
+                "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (approval_id, to_state.value, reason, fields.get("action_type"),
+                 fields.get("file_path"), fields.get("fingerprint"), now, now),
+            )
+        else:
+            updates = {"state": to_state.value, "reason": reason, "updated_at": now}
+            updates.update({key: value for key, value in fields.items() if value is not None})
+            assignments = ", ".join(f"{key} = ?" for key in updates)
+            self._conn.execute(
+                f"UPDATE approvals SET {assignments} WHERE approval_id = ?",
+                (*updates.values(), approval_id),
+            )
+        if from_state != to_state.value:
+            self._conn.execute(
+                "INSERT INTO approval_transitions (approval_id, from_state, to_state, reason, at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (approval_id, from_state, to_state.value, reason, now),
+            )
+
+    def transition(
+        self,
+        approval_id: str,
+        to_state: ApprovalState,
+        reason: str = "",
+        file_path: Optional[Path] = None,
+    ) -> bool:
+        """
+        Move an approval to a new state.
+
+        Setting the state it is already in only updates reason/file path.
+
+        Args:
+            approval_id: Approval ID
+            to_state: Target state
+            reason: Why the transition happened
+            file_path: Current location of the approval file, if it moved
+
+        Returns:
+            True if applied, False if the transition is not allowed
+        """
+        return self.bulk_transition([(approval_id, to_state, reason, file_path)])[approval_id]
+
+    def bulk_transition(
+        self,
+        items: List[Tuple[str, ApprovalState, str, Optional[Path]]],
+    ) -> Dict[str, bool]:
+        """
+        Apply many transitions in a single transaction.
+
+        Args:
+            items: (approval_id, to_state, reason, file_path) tuples;
+                file_path may be None
+
+        Returns:
+            Dict of approval_id -> whether the transition was applied
+        """
+        applied = {}
+        with self._lock, self._conn:
+            for approval_id, to_state, reason, file_path in items:
+                row = self._conn.execute(
+                    "SELECT * FROM approvals WHERE approval_id = ?", (approval_id,)
+                ).fetchone()
+                current = ApprovalState(row["state"]) if row else ApprovalState.PENDING
+                if to_state != current and to_state not in TRANSITIONS[current]:
+                    applied[approval_id] = False
+                    continue
+                self._write(
+                    approval_id, row, to_state, reason or (row["reason"] if row else ""),
+                    file_path=str(file_path) if file_path else None,
+                )
+                applied[approval_id] = True
+        return applied
+
+    def sync_file(self, file_path) -> Optional[ApprovalRecord]:
+        """
+        Bring the store up to date with an approval file and return its record.
+
+        The file is only read when its mtime/size fingerprint differs from
+        the one recorded at the last parse; otherwise this is a single
+        indexed lookup. The frontmatter answer is applied only if it is a
+        legal transition (a late approval after a timeout is ignored). A
+        pending file for an approval that already finished is treated as a
+        resubmission and starts over at pending.
+
+        Args:
+            file_path: Path to the approval Markdown file
+
+        Returns:
+            The approval record, or None if the file does not exist and the
+            approval is unknown
+        """
+        file_path = Path(file_path)
+        approval_id = approval_id_for(file_path)
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return self.get(approval_id)
+        fingerprint = f"{stat.st_mtime_ns}:{stat.st_size}"
+
+        record = self.get(approval_id)
+        if record is not None and record.fingerprint == fingerprint and record.file_path == str(file_path):
+            return record
+
+        try:
+            content = file_path.read_text(encoding="utf-8")
+        except OSError:
+            return record
+        metadata = parse_frontmatter(content)
+        decided, reason = frontmatter_decision(metadata)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM approvals WHERE approval_id = ?", (approval_id,)
+            ).fetchone()
+            current = ApprovalState(row["state"]) if row else None
+            fields = {
+                "action_type": metadata.get("type"),
+                "file_path": str(file_path),
+                "fingerprint": fingerprint,
+            }
+            with self._conn:
+                if row is None:
+                    self._write(approval_id, None, ApprovalState.PENDING, "Approval requested", **fields)
+                    row = self._conn.execute(
+                        "SELECT * FROM approvals WHERE approval_id = ?", (approval_id,)
+                    ).fetchone()
+                    current = ApprovalState.PENDING
+                if decided == current:
+                    self._write(approval_id, row, current, row["reason"], **fields)
+                elif decided in TRANSITIONS[current]:
+                    self._write(approval_id, row, decided, reason, **fields)
+                elif decided == ApprovalState.PENDING:
+                    self._write(approval_id, row, ApprovalState.PENDING, "Resubmitted", **fields)
+                else:
+                    # Answer no longer applies (e.g. approved after timeout)
+                    self._write(approval_id, row, current, row["reason"], **fields)
+            row = self._conn.execute(
+                "SELECT * FROM approvals WHERE approval_id = ?", (approval_id,)
+            ).fetchone()
+        return self._record(row)
+
+
+_approval_store = None
+_approval_store_lock = threading.Lock()
+
+
+def get_approval_store() -> ApprovalStore:
+    """Get singleton approval store."""
+    global _approval_store
+    with _approval_store_lock:
+        if _approval_store is None:
+            _approval_store = ApprovalStore()
+        return _approval_store
@@ -0,0 +1,287 @@
+"""
+Bank Statement Import - Streaming CSV/OFX Import into the Accounting Ledger
+
+Reads bank statements in chunks, categorizes descriptions with a compiled
+rule set, and appends everything to the accounting ledger store in a
+single database transaction, skipping transactions that are already in
+the ledger (same date, signed amount and normalized description).
+
+Memory stays bounded by the chunk size: rows are parsed lazily, each
+distinct description is categorized once (cached), and duplicate
+detection runs in SQLite rather than over an in-memory copy of the
+ledger.
+
+Supported formats:
+    CSV - header with date, description and amount; a negative amount or
+          a debit in the optional type column is an expense
+    OFX - <STMTTRN> blocks (SGML or XML); FITID becomes the reference
+
+Usage:
+    python scripts/bank_import.py statement.csv
+    python scripts/accounting_manager.py import --file statement.ofx
+
+    from scripts.bank_import import import_bank_statement
+    result = import_bank_statement("statement.csv")
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import re
+import sys
+import time
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Add project root to sys.path so the CLI can import scripts.* modules
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.accounting_ledger import AccountingLedgerStore, get_accounting_ledger_store
+
+logger = logging.getLogger('bank_import')
+
+# Rows parsed and written per chunk
+IMPORT_CHUNK = int(os.getenv('BANK_IMPORT_CHUNK', '5000'))
+
+# Parse errors kept in the result (the rest are only counted)
+MAX_REPORTED_ERRORS = 20
+
+# CSV type values that mark an unsigned amount as money out
+DEBIT_TYPES = {'debit', 'dr', 'withdrawal', 'expense'}
+
+# (category, keywords) in priority order; keywords are regular expressions
+DEFAULT_CATEGORY_RULES: List[Tuple[str, Sequence[str]]] = [
+    ('salary', [r'salary', r'payroll', r'wages?']),
+    ('revenue', [r'invoice', r'client payment', r'stripe payout', r'paypal transfer from']),
+    ('rent', [r'\brent\b', r'lease', r'landlord']),
+    ('utilities', [r'electric', r'water bill', r'\bgas bill', r'internet', r'broadband', r'utility', r'phone bill']),
+    ('food', [r'\bkfc\b', r'mcdonald', r'restaurant', r'\bcafe', r'coffee', r'food', r'pizza', r'grocer']),
+    ('software', [r'adobe', r'github', r'google workspace', r'microsoft', r'aws', r'subscription', r'saas']),
+    ('travel', [r'uber', r'careem', r'airline', r'hotel', r'fuel', r'petrol']),
+    ('fees', [r'bank fee', r'service charge', r'\bfee\b', r'commission']),
+    ('transfer', [r'transfer', r'\batm\b', r'withdrawal']),
+]
+
+
+class CategoryRules:
+    """Rule set compiled into one regex; first matching rule wins."""
+
+    def __init__(self, rules: Sequence[Tuple[str, Sequence[str]]] = None, default: str = 'uncategorized'):
+        self.default = default
+        self.categories: List[str] = []
+        alternatives = []
+        for index, (category, keywords) in enumerate(rules or DEFAULT_CATEGORY_RULES):
+            self.categories.append(category)
+            # Anchored alternatives are tried in rule order, so priority is kept in a single match
+            alternatives.append(f"(?P<r{index}>.*?(?:{'|'.join(keywords)}))")
+        self._pattern = re.compile('|'.join(alternatives), re.IGNORECASE | re.DOTALL) if alternatives else None
+        self.categorize = lru_cache(maxsize=65536)(self._categorize)
+
+    def _categorize(self, description: str) -> str:
+        match = self._pattern.match(description) if self._pattern else None
+        return self.categories[int(match.lastgroup[1:])] if match else self.default
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str, date_format: Optional[str]) -> str:
+    # Statements repeat the same few hundred dates; parse each once
+    value = value.strip()
+    if date_format:
+        return datetime.strptime(value, date_format).strftime('%Y-%m-%d')
+    return datetime.strptime(value[:10], '%Y-%m-%d').strftime('%Y-%m-%d')
+
+
+def _parse_amount(value: str) -> float:
+    value = value.strip().replace(',', '').replace('$', '')
+    if value.startswith('(') and value.endswith(')'):
+        value = '-' + value[1:-1]
+    return float(value)
+
+
+def _transaction(date: str, description: str, amount: float, kind: Optional[str], reference: Optional[str]) -> Dict[str, Any]:
+    if amount == 0:
+        raise ValueError('zero amount')
+    # A negative amount is always money out; the type column only matters for unsigned amounts
+    debit = amount < 0 or (kind or '').strip().lower() in DEBIT_TYPES
+    return {
+        'date': date,
+        'type': 'expense' if debit else 'income',
+        'amount': abs(amount),
+        'description': description.strip(),
+        'reference': reference or None,
+    }
+
+
+def iter_csv(path: Path, date_format: str = None) -> Iterator[Tuple[int, Any]]:
+    """
+    Stream transactions from a CSV statement.
+
+    Yields:
+        (line number, transaction dict or ValueError)
+    """
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = [h.strip().lower() for h in next(reader, [])]
+        columns = {name: header.index(name) for name in ('date', 'description', 'amount', 'type', 'reference')
+                   if name in header}
+        missing = {'date', 'description', 'amount'} - columns.keys()
+        if missing:
+            raise ValueError(f"CSV header missing column(s): {', '.join(sorted(missing))}")
+
+        for line_no, row in enumerate(reader, start=2):
+            if not row:
+                continue
+            try:
+                yield line_no, _transaction(
+                    _parse_date(row[columns['date']], date_format),
+                    row[columns['description']],
+                    _parse_amount(row[columns['amount']]),
+                    row[columns['type']] if 'type' in columns else None,
+                    row[columns['reference']] if 'reference' in columns else None,
+                )
+            except (ValueError, IndexError) as e:
+                yield line_no, ValueError(str(e) or type(e).__name__)
+
+
+_OFX_TAG = re.compile(r'<(/?)([A-Za-z0-9.]+)>([^<\r\n]*)')
+
+
+def iter_ofx(path: Path) -> Iterator[Tuple[int, Any]]:
+    """
+    Stream transactions from an OFX statement (SGML or XML flavour).
+
+    Yields:
+        (line number, transaction dict or ValueError)
+    """
+    current: Optional[Dict[str, str]] = None
+    start_line = 0
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for line_no, line in enumerate(f, start=1):
+            for closing, tag, value in _OFX_TAG.findall(line):
+                tag = tag.upper()
+                if tag == 'STMTTRN':
+                    if not closing:
+                        current, start_line = {}, line_no
+                        continue
+                    if current is None:
+                        continue
+                    try:
+                        posted = current.get('DTPOSTED', '')[:8]
+                        yield start_line, _transaction(
+                            datetime.strptime(posted, '%Y%m%d').strftime('%Y-%m-%d'),
+                            current.get('NAME') or current.get('MEMO') or '',
+                            _parse_amount(current.get('TRNAMT', '')),
+                            None,  # TRNAMT is signed; TRNTYPE (POS, XFER, ...) can't override it
+                            current.get('FITID'),
+                        )
+                    except ValueError as e:
+                        yield start_line, ValueError(str(e))
+                    current = None
+                elif current is not None and not closing and value.strip():
+                    current[tag] = value.strip()
+
+
+def import_bank_statement(
+    path: str,
+    store: Optional[AccountingLedgerStore] = None,
+    rules: CategoryRules = None,
+    chunk_size: int = None,
+    file_format: str = None,
+    date_format: str = None
+) -> Dict[str, Any]:
+    """
+    Import a CSV or OFX bank statement into the accounting ledger.
+
+    The whole statement is committed in one transaction: if the import
+    fails midway nothing is written. Rows that cannot be parsed are
+    skipped and reported; rows already in the ledger are counted as
+    duplicates, and new rows dated in a sealed month as sealed.
+
+    Args:
+        path: Statement file
+        store: Ledger store (default: shared accounting ledger store)
+        rules: Category rules (default: DEFAULT_CATEGORY_RULES)
+        chunk_size: Rows per chunk (default: BANK_IMPORT_CHUNK)
+        file_format: "csv" or "ofx" (default: from the file extension)
+        date_format: strptime format for CSV dates (default: YYYY-MM-DD)
+
+    Returns:
+        Dictionary with status, counts, imported totals and parse errors
+    """
+    path = Path(path)
+    store = store or get_accounting_ledger_store()
+    rules = rules or CategoryRules()
+    chunk_size = chunk_size or IMPORT_CHUNK
+    file_format = (file_format or path.suffix.lstrip('.') or 'csv').lower()
+    if file_format in ('ofx', 'qfx'):
+        rows = iter_ofx(path)
+    elif file_format == 'csv':
+        rows = iter_csv(path, date_format)
+    else:
+        raise ValueError(f"Unsupported statement format: {file_format}")
+
+    stats = {'rows': 0, 'invalid': 0}
+    errors: List[str] = []
+
+    def chunks() -> Iterator[List[Dict[str, Any]]]:
+        chunk = []
+        for line_no, item in rows:
+            stats['rows'] += 1
+            if isinstance(item, ValueError):
+                stats['invalid'] += 1
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append(f"line {line_no}: {item}")
+                continue
+            item['category'] = rules.categorize(item['description'])
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    started = time.perf_counter()
+    result = store.append_deduplicated(chunks())
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+
+    logger.info(f"Imported {result['imported']} of {stats['rows']} rows from {path} "
+                f"({result['duplicates']} duplicates, {result['sealed']} in sealed months, "
+                f"{stats['invalid']} invalid) in {elapsed_ms} ms")
+
+    rejected = stats['invalid'] + result['sealed']
+    return {
+        'status': 'success' if not rejected else ('partial' if result['imported'] else 'error'),
+        'file': str(path),
+        'format': file_format,
+        'rows': stats['rows'],
+        'imported': result['imported'],
+        'duplicates': result['duplicates'],
+        'sealed': result['sealed'],
+        'invalid': stats['invalid'],
+        'errors': errors,
+        'totals': result['totals'],
+        'elapsed_ms': elapsed_ms,
+    }
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description='Import a CSV/OFX bank statement into the accounting ledger')
+    parser.add_argument('file', help='Statement file (.csv or .ofx)')
+    parser.add_argument('--format', choices=['csv', 'ofx'], help='Statement format (default: from extension)')
+    parser.add_argument('--date-format', help='strptime format for CSV dates (default: %%Y-%%m-%%d)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    result = import_bank_statement(args.file, file_format=args.format, date_format=args.date_format)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == '__main__':
+    main()
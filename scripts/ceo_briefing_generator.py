@@ -2,7 +2,7 @@
 Weekly Business Audit & CEO Briefing Generator - Gold Tier
 
 Generates comprehensive weekly business reports including:
-- Financial performance (from Odoo)
+- Financial performance (from Odoo, or the vault accounting ledger)
 - Completed tasks analysis
 - Social media metrics
 - Bottlenecks identification
@@ -135,7 +135,10 @@ class CEOBriefingGenerator:
         week_end: datetime
     ) -> Dict[str, Any]:
         """
-        Gather financial data from Odoo.
+        Gather financial data from Odoo and the vault accounting ledger.
+        
+        Odoo figures are used when Odoo is reachable; otherwise revenue,
+        expenses and profit come from the ledger.
         
         Args:
             week_start: Start of week
@@ -151,13 +154,16 @@ class CEOBriefingGenerator:
             "outstanding_invoices": 0,
             "paid_invoices": 0,
             "currency": "USD",
-            "trend": "stable"
+            "trend": "stable",
+            "source": "none",
+            "ledger": self._gather_ledger_financials(week_start, week_end)
         }
         
         try:
-            from scripts.odoo_mcp_server import OdooMCPServer
+            from scripts.odoo_mcp_server import get_odoo_client
             
-            odoo = OdooMCPServer()
+            # Shared client: no fresh login or connection per briefing
+            odoo = get_odoo_client()
             
             # Test connection
             conn_result = odoo.test_connection()
@@ -194,12 +200,7 @@ class CEOBriefingGenerator:
                         financial_data["expenses"] = pl_report.get("expenses", financial_data["expenses"])
                         financial_data["profit"] = pl_report.get("net_profit", financial_data["profit"])
                     
-                    # Determine trend
-                    if financial_data["profit"] > 0:
-                        financial_data["trend"] = "positive"
-                    elif financial_data["profit"] < 0:
-                        financial_data["trend"] = "negative"
-                    
+                    financial_data["source"] = "odoo"
                     logger.info(f"Gathered financial data: Revenue=${financial_data['revenue']}, Profit=${financial_data['profit']}")
                 else:
                     logger.warning(f"Could not get invoices: {invoices_result.get('message')}")
@@ -211,8 +212,59 @@ class CEOBriefingGenerator:
         except Exception as e:
             logger.error(f"Error gathering financial data: {e}")
         
+        ledger = financial_data["ledger"]
+        if financial_data["source"] != "odoo" and ledger.get("income_count", 0) + ledger.get("expense_count", 0):
+            financial_data["revenue"] = ledger["total_income"]
+            financial_data["expenses"] = ledger["total_expense"]
+            financial_data["profit"] = ledger["net_profit"]
+            financial_data["source"] = "ledger"
+        
+        # Determine trend
+        if financial_data["profit"] > 0:
+            financial_data["trend"] = "positive"
+        elif financial_data["profit"] < 0:
+            financial_data["trend"] = "negative"
+        
         return financial_data
     
+    def _gather_ledger_financials(
+        self,
+        week_start: datetime,
+        week_end: datetime
+    ) -> Dict[str, Any]:
+        """
+        Summarize the vault accounting ledger for the week.
+        
+        Uses the columnar ledger analytics, so the week-over-week comparison,
+        last four weeks and top expense categories cost a few bisects rather
+        than a pass over every transaction.
+        
+        Args:
+            week_start: Start of week
+            week_end: End of week
+            
+        Returns:
+            Ledger totals for the week with change vs the previous week
+        """
+        try:
+            from scripts.accounting_ledger import get_accounting_ledger_store
+            from scripts.ledger_analytics import get_ledger_analytics
+            
+            analytics = get_ledger_analytics(get_accounting_ledger_store())
+            start, end = week_start.strftime("%Y-%m-%d"), week_end.strftime("%Y-%m-%d")
+            comparison = analytics.compare(start, end)
+            top_expenses = analytics.by_category(start, end, type="expense")
+            return {
+                **comparison["current"],
+                "previous": comparison["previous"],
+                "change": comparison["change"],
+                "last_4_weeks": analytics.rolling(end, window_days=7, periods=4),
+                "top_expense_categories": dict(list(top_expenses.items())[:5])
+            }
+        except Exception as e:
+            logger.error(f"Error reading accounting ledger: {e}")
+            return {}
+    
     def _gather_completed_tasks(
         self,
         week_start: datetime,
@@ -361,22 +413,20 @@ class CEOBriefingGenerator:
                 logger.warning("Social_Media folder not found")
                 return metrics
             
-            # Count posts by platform
-            for file in self.social_media_path.glob("*.md"):
-                try:
-                    content = file.read_text()
-                    
-                    if "platform: linkedin" in content.lower():
-                        metrics["linkedin"]["posts"] += 1
-                    elif "platform: facebook" in content.lower():
-                        metrics["facebook"]["posts"] += 1
-                    elif "platform: instagram" in content.lower():
-                        metrics["instagram"]["posts"] += 1
-                    elif "platform: twitter" in content.lower():
-                        metrics["twitter"]["tweets"] += 1
-                    
-                except Exception as e:
-                    logger.debug(f"Error reading social media file {file}: {e}")
+            from scripts.social_metrics_store import SOURCE_VAULT, get_social_metrics_store
+            
+            # Only files changed since the last briefing are re-read
+            store = get_social_metrics_store()
+            store.index_vault_folder(self.social_media_path)
+            
+            for platform, entry in metrics.items():
+                count_key = "tweets" if platform == "twitter" else "posts"
+                entry[count_key] = store.summary(platform, days=None, source=SOURCE_VAULT)["posts"]
+                
+                # Engagement already scraped for the week (never scrapes here)
+                live = store.summary(platform, source="live", start=week_start, end=week_end)
+                if live["posts"]:
+                    entry["engagement"] = live["engagement"]
             
             logger.info(f"Gathered social media metrics: {metrics}")
             
@@ -571,6 +621,29 @@ class CEOBriefingGenerator:
         
         return metadata
     
+    def _format_ledger_section(self, ledger: Dict[str, Any]) -> str:
+        """Format the vault ledger week-over-week table (empty if no ledger data)."""
+        if not ledger or not ledger.get("income_count", 0) + ledger.get("expense_count", 0) + \
+                ledger.get("previous", {}).get("income_count", 0) + ledger.get("previous", {}).get("expense_count", 0):
+            return ""
+        
+        previous, change = ledger["previous"], ledger["change"]
+        rows = []
+        for key, label in (("total_income", "Income"), ("total_expense", "Expenses"), ("net_profit", "Net")):
+            pct = f"{change[key]:+.1f}%" if change.get(key) is not None else "n/a"
+            rows.append(f"| {label} | ${ledger[key]:,.2f} | ${previous[key]:,.2f} | {pct} |")
+        weeks = " → ".join(f"${w['net_profit']:,.2f}" for w in ledger.get("last_4_weeks", []))
+        categories = ", ".join(f"{c} (${a:,.2f})" for c, a in ledger.get("top_expense_categories", {}).items())
+        
+        return (
+            "\n### Vault Ledger\n\n"
+            "| Metric | This Week | Previous Week | Change |\n"
+            "|--------|-----------|---------------|--------|\n"
+            + "\n".join(rows) + "\n\n"
+            + f"**Net, last 4 weeks:** {weeks}\n\n"
+            + f"**Top expense categories:** {categories or 'none'}\n"
+        )
+    
     def _create_briefing_document(
         self,
         briefing_data: Dict[str, Any],
@@ -603,6 +676,7 @@ class CEOBriefingGenerator:
             block = f"### {s['category'].title()} (Priority: {s['priority']})\n{s['suggestion']}\n\n**Action:** {s['action']}\n"
             suggestion_blocks.append(block)
         suggestions_text = chr(10).join(suggestion_blocks) if suggestions else '*No suggestions at this time.*'
+        ledger_text = self._format_ledger_section(financials.get("ledger") or {})
 
         content = f"""---
 type: ceo_briefing
@@ -633,7 +707,7 @@ generated: {briefing_data['period']['generated_at']}
 | Profit | ${financials.get('profit', 0):,.2f} | |
 | Outstanding Invoices | ${financials.get('outstanding_invoices', 0):,.2f} | |
 | Paid Invoices | ${financials.get('paid_invoices', 0):,.2f} | |
-
+{ledger_text}
 ---
 
 ## Completed Tasks
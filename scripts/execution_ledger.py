@@ -0,0 +1,244 @@
+"""
+Execution Ledger - Durable, Idempotent Action Execution
+
+Records every external side effect (email send, social post, payment)
+in a SQLite ledger keyed by approval ID and a hash of the action content.
+Executors call ``begin()`` before acting and ``succeed()``/``fail()``
+afterwards, so retries and restarts are exactly-once from the business's
+point of view:
+
+    - an action that already succeeded is never repeated (the stored
+      result is returned instead)
+    - an action another worker is running is not started twice
+    - an attempt that was in flight when the process died is flagged as
+      uncertain and held for a human instead of being blindly re-sent
+
+Lookups are primary-key reads; ``compact()`` drops finished entries past
+their retention period.
+
+Usage:
+    from scripts.execution_ledger import get_execution_ledger
+
+    ledger = get_execution_ledger()
+    entry = ledger.begin(approval_id, "gmail_send", data)
+    if entry.proceed:
+        result = send(...)
+        ledger.succeed(entry.key, result) if ok else ledger.fail(entry.key, error)
+    elif entry.decision == "duplicate":
+        result = entry.result
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+LEDGER_DB_PATH = PROJECT_ROOT / "logs" / "execution_ledger.db"
+
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_RETENTION_DAYS = 30
+
+STATUS_IN_PROGRESS = "in_progress"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS executions (
+    key TEXT PRIMARY KEY,
+    approval_id TEXT NOT NULL,
+    action_type TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    lease_expires TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_executions_approval ON executions(approval_id);
+CREATE INDEX IF NOT EXISTS idx_executions_status_updated ON executions(status, updated_at);
+"""
+
+
+@dataclass
+class LedgerEntry:
+    """Outcome of ``begin()``."""
+    key: str
+    decision: str  # "proceed", "duplicate", "in_progress" or "uncertain"
+    attempts: int = 0
+    result: Optional[Dict[str, Any]] = None
+    error: str = ""
+
+    @property
+    def proceed(self) -> bool:
+        return self.decision == "proceed"
+
+
+def content_hash(action_type: str, data: Any) -> str:
+    """Stable hash of an action's type and content."""
+    payload = json.dumps({"type": action_type, "data": data}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ExecutionLedger:
+    """SQLite-backed exactly-once execution ledger."""
+
+    def __init__(self, db_path: Path = LEDGER_DB_PATH, lease_seconds: int = DEFAULT_LEASE_SECONDS):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def key_for(approval_id: str, action_type: str, data: Any) -> str:
+        """Ledger key: approval ID plus the action content hash."""
+        return f"{approval_id}:{content_hash(action_type, data)[:32]}"
+
+    def begin(self, approval_id: str, action_type: str, data: Any) -> LedgerEntry:
+        """
+        Claim an action before executing it.
+
+        Args:
+            approval_id: Approval document ID
+            action_type: Action type (e.g. "gmail_send")
+            data: Action content (hashed into the key)
+
+        Returns:
+            LedgerEntry; only execute the action if ``entry.proceed``
+        """
+        key = self.key_for(approval_id, action_type, data)
+        now = datetime.now()
+        lease_expires = (now + timedelta(seconds=self.lease_seconds)).isoformat()
+
+        with self._lock, self._conn:
+            # Take the write lock up front so two processes cannot both claim the action
+            self._conn.execute("BEGIN IMMEDIATE")
+            row = self._conn.execute("SELECT * FROM executions WHERE key = ?", (key,)).fetchone()
+
+            if row is not None:
+                if row["status"] == STATUS_SUCCEEDED:
+                    return LedgerEntry(key, "duplicate", row["attempts"], _loads(row["result"]))
+                if row["status"] == STATUS_IN_PROGRESS:
+                    if row["lease_expires"] and row["lease_expires"] > now.isoformat():
+                        return LedgerEntry(key, "in_progress", row["attempts"])
+                    # The worker died mid-attempt: the side effect may or may not have happened
+                    return LedgerEntry(
+                        key, "uncertain", row["attempts"],
+                        error="Previous attempt was interrupted; outcome unknown",
+                    )
+
+                self._conn.execute(
+                    "UPDATE executions SET status = ?, attempts = attempts + 1, lease_expires = ?, "
+                    "updated_at = ? WHERE key = ?",
+                    (STATUS_IN_PROGRESS, lease_expires, now.isoformat(), key),
+                )
+                return LedgerEntry(key, "proceed", row["attempts"] + 1)
+
+            self._conn.execute(
+                "INSERT INTO executions (key, approval_id, action_type, content_hash, status, attempts, "
+                "lease_expires, created_at, updated_at) VALUES (?, ?, ?, ?, ?, 1, ?, ?, ?)",
+                (key, approval_id, action_type, content_hash(action_type, data), STATUS_IN_PROGRESS,
+                 lease_expires, now.isoformat(), now.isoformat()),
+            )
+            return LedgerEntry(key, "proceed", 1)
+
+    def _finish(self, key: str, status: str, result: Optional[Dict[str, Any]], error: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE executions SET status = ?, result = ?, error = ?, lease_expires = NULL, "
+                "updated_at = ? WHERE key = ?",
+                (status, json.dumps(result, default=str) if result is not None else None,
+                 error, datetime.now().isoformat(), key),
+            )
+
+    def succeed(self, key: str, result: Optional[Dict[str, Any]] = None):
+        """Record that the action's side effect happened."""
+        self._finish(key, STATUS_SUCCEEDED, result, "")
+
+    def fail(self, key: str, error: str):
+        """Record a failed attempt (the action may be retried)."""
+        self._finish(key, STATUS_FAILED, None, error)
+
+    def resolve(self, key: str, succeeded: bool, note: str = "Resolved manually"):
+        """Settle an uncertain attempt after a human has checked the outcome."""
+        if succeeded:
+            self.succeed(key, {"status": "success", "message": note})
+        else:
+            self.fail(key, note)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Ledger entry by key, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM executions WHERE key = ?", (key,)).fetchone()
+        return _row_dict(row) if row else None
+
+    def for_approval(self, approval_id: str) -> List[Dict[str, Any]]:
+        """All ledger entries for an approval."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM executions WHERE approval_id = ? ORDER BY created_at", (approval_id,)
+            ).fetchall()
+        return [_row_dict(row) for row in rows]
+
+    def compact(self, retain_days: int = DEFAULT_RETENTION_DAYS) -> int:
+        """
+        Delete finished entries older than the retention period.
+
+        In-progress entries are always kept.
+
+        Args:
+            retain_days: Days to keep succeeded/failed entries
+
+        Returns:
+            Number of entries removed
+        """
+        cutoff = (datetime.now() - timedelta(days=retain_days)).isoformat()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM executions WHERE status IN (?, ?) AND updated_at < ?",
+                (STATUS_SUCCEEDED, STATUS_FAILED, cutoff),
+            )
+            removed = cursor.rowcount
+        if removed:
+            with self._lock:
+                self._conn.execute("VACUUM")
+        return removed
+
+
+def _loads(value: Optional[str]) -> Optional[Dict[str, Any]]:
+    return json.loads(value) if value else None
+
+
+def _row_dict(row) -> Dict[str, Any]:
+    entry = dict(row)
+    entry["result"] = _loads(entry["result"])
+    return entry
+
+
+_execution_ledger = None
+_execution_ledger_lock = threading.Lock()
+
+
+def get_execution_ledger() -> ExecutionLedger:
+    """Get singleton execution ledger."""
+    global _execution_ledger
+    with _execution_ledger_lock:
+        if _execution_ledger is None:
+            _execution_ledger = ExecutionLedger()
+        return _execution_ledger
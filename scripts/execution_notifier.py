@@ -0,0 +1,318 @@
+"""
+Execution Notifier - Push Approved Actions to the Executor
+
+When a human approves an action in the dashboard, the approval is queued in
+a small SQLite table and every waiting executor is woken through a Unix
+domain datagram socket, so execution starts within milliseconds instead of
+on the next folder poll. The queue is durable (a wake-up that nobody hears
+is picked up on the next wait) and each notification is claimed by exactly
+one consumer. Notifications carry the approval's action type, and each
+consumer only claims the types it executes, so the MCP executor and the
+local orchestrator never take each other's approvals. Folder polling stays
+as the fallback.
+
+Every notification records when it was approved, claimed, started and
+finished, so approve-to-execute latency can be measured end to end.
+
+Usage:
+    # Producer (dashboard)
+    get_execution_notifier().notify([(approval_id, file_path, action_type)])
+
+    # Consumer (executor loop)
+    notifier = get_execution_notifier()
+    notifier.listen("mcp-executor")
+    while True:
+        if notifier.wait(timeout=10, action_types=RUN_ACTION_TYPES):
+            for item in notifier.drain("mcp-executor", action_types=RUN_ACTION_TYPES):
+                submit(item["file_path"])
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Collection, Dict, Iterable, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+QUEUE_DB_PATH = PROJECT_ROOT / "logs" / "execution_queue.db"
+WAKE_DIR = PROJECT_ROOT / "logs" / "executor_wake"
+
+# Without Unix sockets, wait() re-checks the queue at this interval
+FALLBACK_POLL_SECONDS = 0.5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notifications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    approval_id TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    action_type TEXT,
+    approved_at REAL NOT NULL,
+    claimed_at REAL,
+    claimed_by TEXT,
+    started_at REAL,
+    finished_at REAL,
+    success INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_notifications_unclaimed ON notifications(claimed_at, id);
+CREATE INDEX IF NOT EXISTS idx_notifications_approval ON notifications(approval_id, id);
+"""
+
+
+def _type_filter(action_types: Optional[Collection[str]]) -> Tuple[str, tuple]:
+    """SQL condition limiting notifications to a consumer's action types.
+
+    Notifications queued without an action type can be claimed by anyone.
+    """
+    if action_types is None:
+        return "", ()
+    types = tuple(action_types)
+    placeholders = ", ".join("?" * len(types))
+    return f" AND (action_type IS NULL OR action_type IN ({placeholders}))", types
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+class ExecutionNotifier:
+    """SQLite notification queue with Unix-socket wake-ups."""
+
+    def __init__(self, db_path: Path = QUEUE_DB_PATH, wake_dir: Path = WAKE_DIR):
+        self.db_path = Path(db_path)
+        self.wake_dir = Path(wake_dir)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            self._migrate()
+            self._conn.commit()
+        self._sock: Optional[socket.socket] = None
+        self._sock_path: Optional[Path] = None
+
+    def _migrate(self):
+        """Add columns introduced after a queue database was created."""
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(notifications)")}
+        if "action_type" not in columns:
+            self._conn.execute("ALTER TABLE notifications ADD COLUMN action_type TEXT")
+
+    # ==================== PRODUCER ====================
+
+    def notify(self, items: Iterable[Tuple[Any, ...]]) -> int:
+        """
+        Queue approved actions and wake the executors.
+
+        Args:
+            items: (approval_id, file_path, action_type) tuples; without an
+                action type any consumer may claim the notification
+
+        Returns:
+            Number of notifications queued
+        """
+        now = time.time()
+        rows = []
+        for approval_id, file_path, *rest in items:
+            rows.append((approval_id, str(file_path), rest[0] if rest else None, now))
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO notifications (approval_id, file_path, action_type, approved_at) "
+                "VALUES (?, ?, ?, ?)", rows
+            )
+        self.wake()
+        return len(rows)
+
+    def wake(self):
+        """Send a wake-up datagram to every listening executor."""
+        if not hasattr(socket, "AF_UNIX") or not self.wake_dir.exists():
+            return
+        sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sender.setblocking(False)
+            for path in self.wake_dir.glob("*.sock"):
+                try:
+                    sender.sendto(b"1", str(path))
+                except (ConnectionRefusedError, FileNotFoundError):
+                    # Listener exited without cleaning up
+                    path.unlink(missing_ok=True)
+                except (BlockingIOError, OSError):
+                    # Its buffer is full of wake-ups already
+                    pass
+        finally:
+            sender.close()
+
+    # ==================== CONSUMER ====================
+
+    def listen(self, name: str) -> bool:
+        """
+        Start receiving wake-ups.
+
+        Returns:
+            True if a wake-up socket is bound, False if wait() falls back
+            to polling the queue
+        """
+        if self._sock is not None:
+            return True
+        if not hasattr(socket, "AF_UNIX"):
+            return False
+        path = self.wake_dir / f"{name}-{os.getpid()}.sock"
+        try:
+            self.wake_dir.mkdir(parents=True, exist_ok=True)
+            path.unlink(missing_ok=True)
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            sock.bind(str(path))
+        except OSError:
+            # e.g. path longer than the platform's socket path limit
+            return False
+        self._sock, self._sock_path = sock, path
+        return True
+
+    def pending(self, action_types: Optional[Collection[str]] = None) -> int:
+        """Number of unclaimed notifications (of ``action_types`` if given)."""
+        condition, params = _type_filter(action_types)
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT COUNT(*) FROM notifications WHERE claimed_at IS NULL{condition}", params
+            ).fetchone()[0]
+
+    def wait(self, timeout: float, action_types: Optional[Collection[str]] = None) -> bool:
+        """
+        Block until a notification is queued or ``timeout`` passes.
+
+        Args:
+            timeout: Seconds to wait at most
+            action_types: Only wake for notifications of these action types
+
+        Returns:
+            True if there are notifications to drain
+        """
+        if self.pending(action_types):
+            return True
+        deadline = time.monotonic() + timeout
+        if self._sock is None:
+            while time.monotonic() < deadline:
+                time.sleep(min(FALLBACK_POLL_SECONDS, max(0.0, deadline - time.monotonic())))
+                if self.pending(action_types):
+                    return True
+            return False
+
+        self._sock.settimeout(max(0.001, timeout))
+        try:
+            self._sock.recv(16)
+        except socket.timeout:
+            return self.pending(action_types) > 0
+        # Swallow wake-ups that arrived for the same batch
+        self._sock.setblocking(False)
+        try:
+            while True:
+                self._sock.recv(16)
+        except (BlockingIOError, OSError):
+            pass
+        return self.pending(action_types) > 0
+
+    def drain(self, consumer: str, limit: int = 100,
+              action_types: Optional[Collection[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Claim queued notifications (each is handed to one consumer only).
+
+        Args:
+            consumer: Name recorded as the claimer
+            limit: Maximum notifications to claim
+            action_types: Only claim notifications of these action types,
+                leaving the rest for the consumers that execute them
+
+        Returns:
+            Dicts with ``approval_id``, ``file_path``, ``action_type`` and ``approved_at``
+        """
+        now = time.time()
+        condition, params = _type_filter(action_types)
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            rows = self._conn.execute(
+                "SELECT id, approval_id, file_path, action_type, approved_at FROM notifications "
+                f"WHERE claimed_at IS NULL{condition} ORDER BY id LIMIT ?", (*params, limit)
+            ).fetchall()
+            if rows:
+                self._conn.executemany(
+                    "UPDATE notifications SET claimed_at = ?, claimed_by = ? WHERE id = ?",
+                    [(now, consumer, row["id"]) for row in rows],
+                )
+        return [dict(row) for row in rows]
+
+    # ==================== LATENCY ====================
+
+    def _mark(self, approval_id: str, column: str, extra: str = "", params: tuple = ()):
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"UPDATE notifications SET {column} = ?{extra} WHERE id = ("
+                "SELECT id FROM notifications WHERE approval_id = ? ORDER BY id DESC LIMIT 1)",
+                (time.time(), *params, approval_id),
+            )
+
+    def mark_started(self, approval_id: str):
+        """Record that the approved action started executing."""
+        self._mark(approval_id, "started_at")
+
+    def mark_finished(self, approval_id: str, success: bool):
+        """Record that the approved action finished."""
+        self._mark(approval_id, "finished_at", ", success = ?", (1 if success else 0,))
+
+    def latency_stats(self, window: int = 200) -> Dict[str, Any]:
+        """
+        Approve-to-pickup, approve-to-start and approve-to-finish latency
+        over the most recent finished notifications (milliseconds).
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT approved_at, claimed_at, started_at, finished_at FROM notifications "
+                "WHERE finished_at IS NOT NULL ORDER BY id DESC LIMIT ?", (window,)
+            ).fetchall()
+        stats: Dict[str, Any] = {"samples": len(rows)}
+        for label, column in (("pickup", "claimed_at"), ("start", "started_at"), ("finish", "finished_at")):
+            values = [(row[column] - row["approved_at"]) * 1000 for row in rows if row[column] is not None]
+            stats[f"{label}_ms"] = {
+                "avg": round(sum(values) / len(values), 1) if values else 0.0,
+                "p50": round(_percentile(values, 50), 1),
+                "p95": round(_percentile(values, 95), 1),
+            }
+        stats["pending"] = self.pending()
+        return stats
+
+    def compact(self, retain_days: int = 7) -> int:
+        """Delete handled notifications older than the retention period."""
+        cutoff = time.time() - retain_days * 86400
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM notifications WHERE claimed_at IS NOT NULL AND approved_at < ?", (cutoff,)
+            )
+        return cursor.rowcount
+
+    def close(self):
+        if self._sock is not None:
+            self._sock.close()
+            if self._sock_path is not None:
+                self._sock_path.unlink(missing_ok=True)
+            self._sock = self._sock_path = None
+        with self._lock:
+            self._conn.close()
+
+
+_execution_notifier = None
+_execution_notifier_lock = threading.Lock()
+
+
+def get_execution_notifier() -> ExecutionNotifier:
+    """Get singleton execution notifier."""
+    global _execution_notifier
+    with _execution_notifier_lock:
+        if _execution_notifier is None:
+            _execution_notifier = ExecutionNotifier()
+        return _execution_notifier
@@ -0,0 +1,584 @@
+"""
+Execution Scheduler - Per-Channel Lanes with Token-Bucket Rate Limits
+
+Approved actions are dispatched to a separate lane per channel (gmail,
+linkedin, twitter, facebook, instagram, odoo). Each lane has its own
+worker threads (so fifty emails never queue behind one slow Playwright
+post) and its own token bucket, so fanning out cannot trip a provider's
+rate limit. Every lane reports queue depth, in-flight count and wait/run
+times.
+
+Within a lane, actions run in priority order (``priority``/``severity``
+frontmatter), with deadlines pulled forward and older actions aging up so
+low-priority work is never starved. Actions scheduled for later
+(``scheduled_for``) wait in a timer wheel and enter their lane when due.
+
+Lane settings can be overridden with the ``EXECUTION_LANES`` environment
+variable (JSON), e.g.::
+
+    EXECUTION_LANES='{"gmail": {"concurrency": 2, "rate": 0.5, "burst": 5}}'
+
+Usage:
+    from scripts.execution_scheduler import get_execution_scheduler
+
+    scheduler = get_execution_scheduler()
+    future = scheduler.submit("gmail", send_fn, to, subject, body)
+    future = scheduler.schedule("twitter", post_fn, args=(text,), priority="low",
+                                not_before=time.time() + 3600)
+    print(scheduler.stats()["gmail"])
+"""
+
+import heapq
+import itertools
+import json
+import math
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add project root to sys.path to enable imports from root-level modules
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from log_manager import setup_logging
+
+logger = setup_logging(log_file="logs/ai_employee.log", logger_name="execution-scheduler")
+
+
+@dataclass
+class LaneConfig:
+    """Concurrency and rate limit of one channel lane."""
+    concurrency: int = 1
+    rate: float = 1.0   # Tokens (actions) added per second
+    burst: int = 1      # Bucket capacity
+
+
+DEFAULT_LANES = {
+    "gmail": LaneConfig(concurrency=4, rate=1.0, burst=10),
+    "linkedin": LaneConfig(concurrency=1, rate=1 / 60, burst=1),
+    "twitter": LaneConfig(concurrency=2, rate=1 / 36, burst=5),
+    "facebook": LaneConfig(concurrency=2, rate=1 / 18, burst=5),
+    "instagram": LaneConfig(concurrency=1, rate=1 / 36, burst=3),
+    "odoo": LaneConfig(concurrency=4, rate=5.0, burst=10),
+}
+DEFAULT_LANE = "default"
+
+# Approval/action types -> channel lane
+_CHANNEL_BY_TYPE = {
+    "gmail_send": "gmail",
+    "email_send_approval": "gmail",
+    "email_triage": "gmail",
+    "email_draft": "gmail",
+    "linkedin_post": "linkedin",
+    "linkedin_post_approval": "linkedin",
+    "facebook_post_approval": "facebook",
+    "twitter_post_approval": "twitter",
+    "payment_approval": "odoo",
+    "odoo_invoice": "odoo",
+}
+
+
+# Priority ranks (lower runs first)
+PRIORITY_RANKS = {
+    "critical": 0,
+    "urgent": 0,
+    "high": 1,
+    "normal": 2,
+    "medium": 2,
+    "low": 3,
+}
+DEFAULT_PRIORITY = "normal"
+
+# A queued action gains one priority rank per AGING_SECONDS of waiting
+AGING_SECONDS = float(os.getenv("EXECUTION_AGING_SECONDS", "300"))
+
+# A deadline pulls an action forward this long before it is due
+DEADLINE_LEAD_SECONDS = 60
+
+
+@dataclass
+class ActionSchedule:
+    """When and how urgently an approved action should run."""
+    priority: str = DEFAULT_PRIORITY
+    deadline: Optional[float] = None    # Epoch seconds the action should be done by
+    not_before: Optional[float] = None  # Epoch seconds before which it must not run
+
+
+def priority_rank(priority: Optional[str]) -> int:
+    """Rank of a priority name (unknown names rank as normal)."""
+    return PRIORITY_RANKS.get(str(priority or DEFAULT_PRIORITY).strip().lower(), PRIORITY_RANKS[DEFAULT_PRIORITY])
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    if value in (None, ""):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(str(value).strip().strip('"\'')).timestamp()
+    except ValueError:
+        return None
+
+
+def action_schedule(metadata: Dict[str, Any]) -> ActionSchedule:
+    """
+    Schedule of an action from its approval frontmatter.
+
+    ``priority`` (or ``severity``) sets the rank; ``scheduled_for`` delays
+    the action and also becomes its deadline; ``deadline``/``due_date``
+    set an explicit deadline.
+    """
+    not_before = _timestamp(metadata.get("scheduled_for"))
+    deadline = _timestamp(metadata.get("deadline") or metadata.get("due_date")) or not_before
+    return ActionSchedule(
+        priority=str(metadata.get("priority") or metadata.get("severity") or DEFAULT_PRIORITY).lower(),
+        deadline=deadline,
+        not_before=not_before,
+    )
+
+
+def channel_for(action_type: str, platform: Optional[str] = None) -> str:
+    """
+    Lane name for an action.
+
+    Args:
+        action_type: Approval ``type`` or executor action type
+        platform: Optional ``platform`` field (used for generic social drafts)
+
+    Returns:
+        Channel name (``default`` if unknown)
+    """
+    if platform and platform.lower() in DEFAULT_LANES:
+        return platform.lower()
+    return _CHANNEL_BY_TYPE.get(action_type, DEFAULT_LANE)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Holds up to ``burst`` tokens and refills at ``rate`` tokens per second.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """
+        Take a token if one is available.
+
+        Returns:
+            0.0 if a token was taken, otherwise seconds until one is available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate if self.rate > 0 else 60.0
+
+    def refund(self):
+        """Return an unused token."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1)
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a token is available.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if a token was taken, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire()
+            if wait == 0.0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+@dataclass(order=True)
+class _Job:
+    """Queued action; ordered by its aged, deadline-adjusted sort key."""
+    sort_key: float
+    seq: int
+    future: Future = field(compare=False)
+    fn: Callable[..., Any] = field(compare=False)
+    args: tuple = field(compare=False)
+    kwargs: dict = field(compare=False)
+    enqueued: float = field(compare=False)
+
+
+def _sort_key(priority: str, deadline: Optional[float], enqueued: float, aging: float) -> float:
+    """
+    Virtual start time of a job (smaller runs first).
+
+    Each rank below the top delays a job by ``aging`` seconds, so a job
+    overtakes every higher-priority job queued more than ``aging`` seconds
+    per rank after it. A deadline pulls the key forward to shortly before
+    it is due. The key does not change while the job waits, so a heap
+    keeps the order.
+    """
+    key = enqueued + priority_rank(priority) * aging
+    if deadline is not None:
+        key = min(key, deadline - DEADLINE_LEAD_SECONDS)
+    return key
+
+
+class Lane:
+    """One channel: bounded workers serving a priority queue behind a token bucket."""
+
+    def __init__(self, name: str, config: LaneConfig, aging: float = AGING_SECONDS):
+        self.name = name
+        self.config = config
+        self.aging = aging
+        self.bucket = TokenBucket(config.rate, config.burst)
+        self._heap: List[_Job] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._shutdown = False
+        self._lock = threading.Lock()
+        self._metrics = {
+            "queued": 0,
+            "in_flight": 0,
+            "completed": 0,
+            "failed": 0,
+            "wait_total": 0.0,
+            "wait_max": 0.0,
+            "run_total": 0.0,
+        }
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        return self.enqueue(fn, args, kwargs)
+
+    def enqueue(
+        self,
+        fn: Callable[..., Any],
+        args: tuple = (),
+        kwargs: Optional[dict] = None,
+        priority: str = DEFAULT_PRIORITY,
+        deadline: Optional[float] = None,
+        future: Optional[Future] = None,
+        ready_since: Optional[float] = None,
+    ) -> Future:
+        """
+        Queue a job by priority/deadline/age; returns its Future.
+
+        ``ready_since`` (epoch seconds, default now) is when the action
+        became ready, e.g. when it was approved; its age counts from then.
+        """
+        future = future or Future()
+        ready_since = min(ready_since or time.time(), time.time())
+        job = _Job(_sort_key(priority, deadline, ready_since, self.aging), next(self._seq),
+                   future, fn, tuple(args), dict(kwargs or {}), time.monotonic())
+        with self._lock:
+            self._metrics["queued"] += 1
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError(f"Lane '{self.name}' is shut down")
+            heapq.heappush(self._heap, job)
+            self._start_workers()
+            self._cond.notify()
+        return future
+
+    def _start_workers(self):
+        while len(self._workers) < max(1, self.config.concurrency):
+            worker = threading.Thread(
+                target=self._worker, name=f"lane-{self.name}_{len(self._workers)}", daemon=True
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._heap and not self._shutdown:
+                    self._cond.wait()
+                if not self._heap:
+                    return
+            # Rate limit inside the lane, so only this channel waits; the
+            # job is picked after the token so the most urgent one runs
+            self.bucket.acquire()
+            with self._cond:
+                if not self._heap:
+                    self.bucket.refund()
+                    continue
+                job = heapq.heappop(self._heap)
+            if job.future.set_running_or_notify_cancel():
+                self._run(job)
+            else:
+                with self._lock:
+                    self._metrics["queued"] -= 1
+
+    def _run(self, job: _Job):
+        started = time.monotonic()
+        waited = started - job.enqueued
+        with self._lock:
+            self._metrics["queued"] -= 1
+            self._metrics["in_flight"] += 1
+            self._metrics["wait_total"] += waited
+            self._metrics["wait_max"] = max(self._metrics["wait_max"], waited)
+
+        succeeded = False
+        try:
+            result = job.fn(*job.args, **job.kwargs)
+            succeeded = not (
+                isinstance(result, dict)
+                and (result.get("success") is False or result.get("status") == "error")
+            )
+            job.future.set_result(result)
+        except BaseException as e:
+            job.future.set_exception(e)
+        finally:
+            with self._lock:
+                self._metrics["in_flight"] -= 1
+                self._metrics["run_total"] += time.monotonic() - started
+                self._metrics["completed" if succeeded else "failed"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            metrics = dict(self._metrics)
+        finished = metrics["completed"] + metrics["failed"]
+        started = finished + metrics["in_flight"]
+        return {
+            "concurrency": self.config.concurrency,
+            "rate_per_sec": self.config.rate,
+            "burst": self.config.burst,
+            "queue_depth": metrics["queued"],
+            "in_flight": metrics["in_flight"],
+            "completed": metrics["completed"],
+            "failed": metrics["failed"],
+            "avg_wait_sec": round(metrics["wait_total"] / started, 3) if started else 0.0,
+            "max_wait_sec": round(metrics["wait_max"], 3),
+            "avg_run_sec": round(metrics["run_total"] / finished, 3) if finished else 0.0,
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting jobs; queued jobs still run."""
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+        if wait:
+            for worker in list(self._workers):
+                worker.join()
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel for delayed actions.
+
+    Timers land in one of ``slots`` buckets ``tick`` seconds apart; a single
+    thread advances one bucket per tick and fires the timers whose rounds
+    have run out. Adding and firing a timer is O(1) however many are
+    waiting, and nothing is re-polled while it waits.
+    """
+
+    def __init__(self, tick: float = 1.0, slots: int = 3600):
+        self.tick = tick
+        self.slots = slots
+        self._wheel: List[List[list]] = [[] for _ in range(slots)]
+        self._cursor = 0
+        self._count = 0
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def add(self, delay: float, callback: Callable[[], None]):
+        """Run ``callback`` after ``delay`` seconds (rounded up to a tick)."""
+        ticks = max(1, math.ceil(delay / self.tick))
+        with self._cond:
+            slot = (self._cursor + ticks) % self.slots
+            self._wheel[slot].append([(ticks - 1) // self.slots, callback])
+            self._count += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="timer-wheel", daemon=True)
+                self._thread.start()
+
+    def pending(self) -> int:
+        with self._cond:
+            return self._count
+
+    def _run(self):
+        next_tick = time.monotonic() + self.tick
+        while True:
+            with self._cond:
+                while not self._stopped and time.monotonic() < next_tick:
+                    self._cond.wait(max(0.0, next_tick - time.monotonic()))
+                if self._stopped:
+                    return
+                self._cursor = (self._cursor + 1) % self.slots
+                bucket = self._wheel[self._cursor]
+                due = [entry[1] for entry in bucket if entry[0] == 0]
+                remaining = [entry for entry in bucket if entry[0] > 0]
+                for entry in remaining:
+                    entry[0] -= 1
+                self._wheel[self._cursor] = remaining
+                self._count -= len(due)
+            next_tick += self.tick
+            for callback in due:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error(f"Timer callback failed: {e}")
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+
+class ExecutionScheduler:
+    """
+    Dispatches actions to per-channel lanes.
+
+    Lanes are created on first use; unknown channels share the ``default``
+    lane.
+    """
+
+    def __init__(self, lane_config: Optional[Dict[str, LaneConfig]] = None):
+        self.lane_config = dict(DEFAULT_LANES)
+        self.lane_config.update(_lane_config_from_env())
+        if lane_config:
+            self.lane_config.update(lane_config)
+        self._lanes: Dict[str, Lane] = {}
+        self._lock = threading.Lock()
+        self.timers = TimerWheel()
+
+    def lane(self, channel: str) -> Lane:
+        """Get (or create) the lane for a channel."""
+        with self._lock:
+            lane = self._lanes.get(channel)
+            if lane is None:
+                config = self.lane_config.get(channel) or self.lane_config.get(DEFAULT_LANE) or LaneConfig()
+                lane = Lane(channel, config)
+                self._lanes[channel] = lane
+                logger.info(
+                    f"Lane '{channel}' started (concurrency={config.concurrency}, "
+                    f"rate={config.rate:.3f}/s, burst={config.burst})"
+                )
+            return lane
+
+    def submit(self, channel: str, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Queue ``fn(*args, **kwargs)`` on a channel's lane.
+
+        Args:
+            channel: Channel name (see channel_for())
+            fn: Callable performing the action
+
+        Returns:
+            Future resolving to the callable's return value
+        """
+        return self.lane(channel).submit(fn, *args, **kwargs)
+
+    def schedule(
+        self,
+        channel: str,
+        fn: Callable[..., Any],
+        args: tuple = (),
+        kwargs: Optional[dict] = None,
+        priority: str = DEFAULT_PRIORITY,
+        deadline: Optional[float] = None,
+        not_before: Optional[float] = None,
+        ready_since: Optional[float] = None,
+    ) -> Future:
+        """
+        Queue ``fn(*args, **kwargs)`` by priority and deadline.
+
+        Args:
+            channel: Channel name (see channel_for())
+            fn: Callable performing the action
+            priority: Priority name (see PRIORITY_RANKS)
+            deadline: Epoch seconds the action should be done by
+            not_before: Epoch seconds before which it must not start; the
+                action waits in the timer wheel until then
+            ready_since: Epoch seconds the action became ready (for aging)
+
+        Returns:
+            Future resolving to the callable's return value
+        """
+        lane = self.lane(channel)
+        delay = (not_before - time.time()) if not_before else 0
+        if delay <= 0:
+            return lane.enqueue(fn, args, kwargs, priority, deadline, ready_since=ready_since)
+
+        future = Future()
+
+        def release():
+            if future.cancelled():
+                return
+            try:
+                # Its age counts from when it came due
+                lane.enqueue(fn, args, kwargs, priority, deadline, future=future)
+            except RuntimeError as e:
+                future.set_exception(e)
+
+        self.timers.add(delay, release)
+        logger.info(f"Action on '{channel}' delayed {delay:.0f}s until {datetime.fromtimestamp(not_before).isoformat()}")
+        return future
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-lane queue depth, in-flight count and wait/run times."""
+        with self._lock:
+            lanes = dict(self._lanes)
+        return {name: lane.stats() for name, lane in lanes.items()}
+
+    def delayed(self) -> int:
+        """Actions waiting in the timer wheel."""
+        return self.timers.pending()
+
+    def shutdown(self, wait: bool = True):
+        self.timers.stop()
+        with self._lock:
+            lanes = list(self._lanes.values())
+        for lane in lanes:
+            lane.shutdown(wait=wait)
+
+
+def _lane_config_from_env() -> Dict[str, LaneConfig]:
+    raw = os.getenv("EXECUTION_LANES")
+    if not raw:
+        return {}
+    try:
+        return {name: LaneConfig(**settings) for name, settings in json.loads(raw).items()}
+    except (ValueError, TypeError) as e:
+        logger.warning(f"Ignoring invalid EXECUTION_LANES: {e}")
+        return {}
+
+
+_execution_scheduler = None
+_execution_scheduler_lock = threading.Lock()
+
+
+def get_execution_scheduler() -> ExecutionScheduler:
+    """Get singleton execution scheduler."""
+    global _execution_scheduler
+    with _execution_scheduler_lock:
+        if _execution_scheduler is None:
+            _execution_scheduler = ExecutionScheduler()
+        return _execution_scheduler
@@ -28,6 +28,8 @@ from datetime import datetime
 from pathlib import Path
 
 from log_manager import setup_logging
+from scripts.resilience import circuit_protected
+from scripts.social_metrics_store import get_social_metrics_store
 
 # Setup logging
 logger = setup_logging(log_file="logs/ai_employee.log", logger_name="facebook_mcp")
@@ -52,6 +54,7 @@ class FacebookMCPServer:
         
         logger.info(f"FacebookMCPServer initialized for {len(self.facebook_pages)} pages")
     
+    @circuit_protected("facebook", error_result=True)
     def post_to_facebook(
         self,
         content: str,
@@ -257,6 +260,7 @@ class FacebookMCPServer:
                 "platform": "facebook"
             }
     
+    @circuit_protected("instagram", error_result=True)
     def post_to_instagram(
         self,
         content: str,
@@ -406,7 +410,7 @@ class FacebookMCPServer:
         days: int = 7
     ) -> Dict[str, Any]:
         """
-        Get Facebook Page insights/metrics.
+        Get Facebook Page insights/metrics (cached for SOCIAL_METRICS_TTL).
         
         Args:
             page_name: Facebook Page name
@@ -423,6 +427,14 @@ class FacebookMCPServer:
                 "message": "No Facebook page specified"
             }
         
+        # Served from the metrics cache; fetched at most once per TTL
+        return get_social_metrics_store().cached(
+            f"facebook:insights:{target_page}:{days}",
+            lambda: self._fetch_page_insights(target_page, days)
+        )
+
+    def _fetch_page_insights(self, target_page: str, days: int) -> Dict[str, Any]:
+        """Fetch page insights from Facebook (uncached)."""
         # This would require Facebook Graph API access token for real insights
         # For now, return a placeholder
         return {
@@ -443,7 +455,7 @@ class FacebookMCPServer:
         platform: str = "facebook"
     ) -> Dict[str, Any]:
         """
-        Get comments for a specific post.
+        Get comments for a specific post (cached for SOCIAL_METRICS_TTL).
         
         Args:
             post_id: Post ID
@@ -452,6 +464,13 @@ class FacebookMCPServer:
         Returns:
             Dictionary with comments
         """
+        return get_social_metrics_store().cached(
+            f"{platform}:comments:{post_id}",
+            lambda: self._fetch_comments(post_id, platform)
+        )
+
+    def _fetch_comments(self, post_id: str, platform: str) -> Dict[str, Any]:
+        """Fetch a post's comments (uncached)."""
         # This would require API access for real comments
         return {
             "status": "success",
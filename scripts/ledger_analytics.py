@@ -0,0 +1,351 @@
+"""
+Ledger Analytics - Columnar Reporting over the Accounting Ledger
+
+Keeps a column-oriented snapshot of the accounting ledger store for
+reports: one typed ``array`` per field (day ordinal, amount in cents,
+type code, dictionary-encoded category), sorted by date, plus running
+prefix sums of income/expense amounts and counts. With those:
+
+    - totals for any date range are two bisects and a subtraction
+    - weekly/monthly series, rolling windows and period-over-period
+      comparisons cost O(buckets * log n), independent of row counts
+    - category group-bys scan only the rows inside the date range
+
+The ledger store is append-only, so refreshing the snapshot only reads
+rows logged since the last refresh. Rows arriving in date order are
+appended; an out-of-order batch (e.g. a back-dated import) is merged in.
+
+Usage:
+    from scripts.ledger_analytics import get_ledger_analytics
+
+    analytics = get_ledger_analytics(store)
+    week = analytics.totals("2026-03-09", "2026-03-15")
+    months = analytics.series("2024-01-01", "2026-12-31", freq="month")
+"""
+
+import threading
+import weakref
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from scripts.accounting_ledger import AccountingLedgerStore
+
+INCOME, EXPENSE = 0, 1
+_TYPE_CODES = {"income": INCOME, "expense": EXPENSE}
+
+
+@lru_cache(maxsize=8192)
+def _ordinal(iso_date: str) -> int:
+    return date.fromisoformat(iso_date[:10]).toordinal()
+
+
+def _pct_change(current: float, previous: float) -> Optional[float]:
+    if not previous:
+        return None
+    return round((current - previous) / abs(previous) * 100, 1)
+
+
+def previous_period(start: str, end: str) -> Tuple[str, str]:
+    """The same number of days immediately before an inclusive date range."""
+    first, last = date.fromisoformat(start), date.fromisoformat(end)
+    return ((first - timedelta(days=(last - first).days + 1)).isoformat(),
+            (first - timedelta(days=1)).isoformat())
+
+
+def compare_totals(current: Dict[str, Any], previous: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Period-over-period comparison of two totals dicts.
+
+    Args:
+        current: Totals with start/end plus total_income, total_expense, net_profit
+        previous: Same for the comparison period
+
+    Returns:
+        Dictionary with current, previous and change (percent, None if
+        the previous value was zero)
+    """
+    return {
+        "current": current,
+        "previous": previous,
+        "change": {
+            key: _pct_change(current[key], previous[key])
+            for key in ("total_income", "total_expense", "net_profit")
+        },
+    }
+
+
+def monthly_trend(months: List[Dict[str, Any]], start: str) -> List[Dict[str, Any]]:
+    """
+    Add 3-month rolling averages and year-over-year change to monthly buckets.
+
+    Args:
+        months: Consecutive monthly buckets ({"period", "end", totals...}),
+            starting up to a year before ``start`` for the YoY column
+        start: First date (YYYY-MM-DD) to include in the result
+
+    Returns:
+        Buckets ending on or after ``start``, with net_3m_avg and
+        income_yoy/net_yoy (percent)
+    """
+    by_period = {m["period"]: m for m in months}
+    trend = []
+    for i, month in enumerate(months):
+        if month["end"] < start:
+            continue
+        window = months[max(0, i - 2):i + 1]
+        year, mon = month["period"].split("-")
+        last_year = by_period.get(f"{int(year) - 1}-{mon}")
+        trend.append({
+            **month,
+            "net_3m_avg": round(sum(m["net_profit"] for m in window) / len(window), 2),
+            "income_yoy": _pct_change(month["total_income"], last_year["total_income"]) if last_year else None,
+            "net_yoy": _pct_change(month["net_profit"], last_year["net_profit"]) if last_year else None,
+        })
+    return trend
+
+
+class LedgerColumns:
+    """Date-sorted column arrays with prefix sums over amounts and counts."""
+
+    def __init__(self):
+        self.category_names: List[str] = []
+        self._category_codes: Dict[str, int] = {}
+        self.seq = 0
+        self._clear_rows()
+
+    def _clear_rows(self):
+        self.days = array("l")
+        self.amounts = array("q")
+        self.types = array("b")
+        self.categories = array("l")
+        # prefix[i] = sum over rows [0, i)
+        self.income_cum = array("q", [0])
+        self.expense_cum = array("q", [0])
+        self.income_n = array("l", [0])
+        self.expense_n = array("l", [0])
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def category_code(self, name: str) -> int:
+        code = self._category_codes.get(name)
+        if code is None:
+            code = self._category_codes[name] = len(self.category_names)
+            self.category_names.append(name)
+        return code
+
+    def _append(self, day: int, type_code: int, cents: int, category_code: int):
+        self.days.append(day)
+        self.amounts.append(cents)
+        self.types.append(type_code)
+        self.categories.append(category_code)
+        income = cents if type_code == INCOME else 0
+        self.income_cum.append(self.income_cum[-1] + income)
+        self.expense_cum.append(self.expense_cum[-1] + cents - income)
+        self.income_n.append(self.income_n[-1] + (type_code == INCOME))
+        self.expense_n.append(self.expense_n[-1] + (type_code == EXPENSE))
+
+    def extend(self, rows: List[Tuple[int, int, int, int]]):
+        """
+        Add (day, type_code, cents, category_code) rows.
+
+        Rows dated on or after the current last day are appended; anything
+        older triggers a single merge rebuild.
+        """
+        rows.sort(key=lambda r: r[0])
+        if not rows:
+            return
+        if self.days and rows[0][0] < self.days[-1]:
+            existing = list(zip(self.days, self.types, self.amounts, self.categories))
+            rows = sorted(existing + rows, key=lambda r: r[0])
+            self._clear_rows()
+        for row in rows:
+            self._append(*row)
+
+    def span(self, start: Optional[str], end: Optional[str]) -> Tuple[int, int]:
+        """Row index range [lo, hi) for an inclusive date range."""
+        lo = bisect_left(self.days, _ordinal(start)) if start else 0
+        hi = bisect_right(self.days, _ordinal(end)) if end else len(self.days)
+        return lo, max(lo, hi)
+
+
+class LedgerAnalytics:
+    """Columnar analytics over an AccountingLedgerStore."""
+
+    def __init__(self, store: AccountingLedgerStore):
+        self.store = store
+        self._columns = LedgerColumns()
+        self._lock = threading.Lock()
+
+    def refresh(self) -> LedgerColumns:
+        """Load rows logged since the last refresh and return the columns."""
+        with self._lock:
+            columns = self._columns
+            if self.store.last_seq() == columns.seq:
+                return columns
+            rows, last = [], columns.seq
+            for seq, iso_date, type_, cents, category in self.store.scan(columns.seq):
+                rows.append((_ordinal(iso_date), _TYPE_CODES[type_], cents, columns.category_code(category)))
+                last = seq
+            columns.extend(rows)
+            columns.seq = last
+            return columns
+
+    def totals(self, start: str = None, end: str = None) -> Dict[str, Any]:
+        """
+        Income, expense and net for an inclusive date range, from prefix sums.
+
+        Args:
+            start: First date (YYYY-MM-DD), default: beginning of the ledger
+            end: Last date (YYYY-MM-DD), default: end of the ledger
+
+        Returns:
+            Dictionary with total_income, total_expense, net_profit,
+            income_count and expense_count
+        """
+        c = self.refresh()
+        lo, hi = c.span(start, end)
+        return self._totals(c, lo, hi)
+
+    @staticmethod
+    def _totals(c: LedgerColumns, lo: int, hi: int) -> Dict[str, Any]:
+        income = (c.income_cum[hi] - c.income_cum[lo]) / 100
+        expense = (c.expense_cum[hi] - c.expense_cum[lo]) / 100
+        return {
+            "total_income": income,
+            "total_expense": expense,
+            "net_profit": round(income - expense, 2),
+            "income_count": c.income_n[hi] - c.income_n[lo],
+            "expense_count": c.expense_n[hi] - c.expense_n[lo],
+        }
+
+    def by_category(self, start: str = None, end: str = None, type: str = None) -> Dict[str, float]:
+        """
+        Amount per category within a date range.
+
+        Args:
+            start: First date (YYYY-MM-DD)
+            end: Last date (YYYY-MM-DD)
+            type: Only "income" or "expense" rows (default: both)
+
+        Returns:
+            {category: amount}, largest first
+        """
+        c = self.refresh()
+        lo, hi = c.span(start, end)
+        sums = [0] * len(c.category_names)
+        wanted = _TYPE_CODES.get(type) if type else None
+        for code, cents, type_code in zip(c.categories[lo:hi], c.amounts[lo:hi], c.types[lo:hi]):
+            if wanted is None or type_code == wanted:
+                sums[code] += cents
+        pairs = [(c.category_names[code], cents / 100) for code, cents in enumerate(sums) if cents]
+        return dict(sorted(pairs, key=lambda x: x[1], reverse=True))
+
+    def series(self, start: str, end: str, freq: str = "month") -> List[Dict[str, Any]]:
+        """
+        Totals per day, week (Monday start) or calendar month.
+
+        Args:
+            start: First date (YYYY-MM-DD)
+            end: Last date (YYYY-MM-DD)
+            freq: "day", "week" or "month"
+
+        Returns:
+            List of {"period", "start", "end", totals...} in date order
+        """
+        c = self.refresh()
+        first, last = date.fromisoformat(start), date.fromisoformat(end)
+        buckets = []
+        cursor = first
+        while cursor <= last:
+            if freq == "day":
+                bucket_end, label = cursor, cursor.isoformat()
+            elif freq == "week":
+                bucket_end = cursor + timedelta(days=6 - cursor.weekday())
+                label = f"{cursor.isocalendar()[0]}-W{cursor.isocalendar()[1]:02d}"
+            elif freq == "month":
+                next_month = date(cursor.year + cursor.month // 12, cursor.month % 12 + 1, 1)
+                bucket_end, label = next_month - timedelta(days=1), cursor.strftime("%Y-%m")
+            else:
+                raise ValueError(f"Unknown frequency: {freq}")
+            bucket_end = min(bucket_end, last)
+            lo, hi = c.span(cursor.isoformat(), bucket_end.isoformat())
+            buckets.append({"period": label, "start": cursor.isoformat(), "end": bucket_end.isoformat(),
+                            **self._totals(c, lo, hi)})
+            cursor = bucket_end + timedelta(days=1)
+        return buckets
+
+    def rolling(self, end: str, window_days: int, periods: int) -> List[Dict[str, Any]]:
+        """
+        Consecutive trailing windows ending at ``end``, oldest first.
+
+        Args:
+            end: Last date of the newest window (YYYY-MM-DD)
+            window_days: Window length in days
+            periods: Number of windows
+
+        Returns:
+            List of {"start", "end", totals...}
+        """
+        c = self.refresh()
+        last = date.fromisoformat(end)
+        windows = []
+        for i in reversed(range(periods)):
+            window_end = last - timedelta(days=i * window_days)
+            window_start = window_end - timedelta(days=window_days - 1)
+            lo, hi = c.span(window_start.isoformat(), window_end.isoformat())
+            windows.append({"start": window_start.isoformat(), "end": window_end.isoformat(), **self._totals(c, lo, hi)})
+        return windows
+
+    def compare(self, start: str, end: str, previous_start: str = None, previous_end: str = None) -> Dict[str, Any]:
+        """
+        Compare a period with the previous one.
+
+        Args:
+            start: First date of the period (YYYY-MM-DD)
+            end: Last date of the period (YYYY-MM-DD)
+            previous_start: First date of the comparison period
+                (default: the same number of days immediately before)
+            previous_end: Last date of the comparison period
+
+        Returns:
+            Dictionary with current, previous and change (see compare_totals)
+        """
+        if not previous_start or not previous_end:
+            previous_start, previous_end = previous_period(start, end)
+        return compare_totals(
+            {"start": start, "end": end, **self.totals(start, end)},
+            {"start": previous_start, "end": previous_end, **self.totals(previous_start, previous_end)},
+        )
+
+    def trend(self, start: str, end: str) -> List[Dict[str, Any]]:
+        """
+        Monthly series with 3-month rolling averages and year-over-year change.
+
+        Args:
+            start: First date (YYYY-MM-DD)
+            end: Last date (YYYY-MM-DD)
+
+        Returns:
+            Monthly buckets with net_3m_avg and income_yoy/net_yoy (percent)
+        """
+        first = date.fromisoformat(start)
+        # One extra year of history for the year-over-year column
+        history_start = date(first.year - 1, first.month, 1).isoformat()
+        return monthly_trend(self.series(history_start, end, freq="month"), start)
+
+
+_ledger_analytics = weakref.WeakKeyDictionary()
+_ledger_analytics_lock = threading.Lock()
+
+
+def get_ledger_analytics(store: AccountingLedgerStore) -> LedgerAnalytics:
+    """Get the shared analytics snapshot for a ledger store."""
+    with _ledger_analytics_lock:
+        analytics = _ledger_analytics.get(store)
+        if analytics is None:
+            analytics = _ledger_analytics[store] = LedgerAnalytics(store)
+        return analytics
@@ -0,0 +1,286 @@
+"""
+MCP Client Registry - Lazy, Warm, Self-Healing Client Pool
+
+Constructs each MCP client (email, Facebook, Twitter, Odoo, ...) only when
+an action first needs it, so executor startup does not pay for imports and
+logins of integrations that are not in use. Clients then stay warm until
+they have been idle for their TTL, and a call that fails because the
+session expired re-authenticates (or rebuilds the client). Only methods
+registered as idempotent are then retried; a send, post or payment is
+never repeated, since it may already have taken effect.
+
+Each client reports its init time, number of (re)initialisations, calls
+and re-authentications.
+
+Usage:
+    from scripts.mcp_client_registry import MCPClientRegistry
+
+    clients = MCPClientRegistry()
+    clients.register("odoo", OdooMCPServer, idle_ttl=900,
+                     reauth=lambda odoo: odoo._authenticate(),
+                     idempotent={"get_invoices"})
+
+    result = clients.call("odoo", "record_payment", amount=100, partner_name="Acme")
+    print(clients.stats()["odoo"]["init_ms"])
+"""
+
+import sys
+import threading
+import time
+import xmlrpc.client
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, Optional
+
+# Add project root to sys.path to enable imports from root-level modules
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from log_manager import setup_logging
+from scripts.odoo_transport import ACCESS_DENIED_FAULT
+
+logger = setup_logging(log_file="logs/ai_employee.log", logger_name="mcp-client-registry")
+
+DEFAULT_IDLE_TTL = 900        # Close clients unused for 15 minutes
+DEFAULT_FAILURE_BACKOFF = 60  # Don't retry a failed construction for a minute
+
+# Exception classes that mean the session/credentials need refreshing
+# (matched by name so client libraries need not be importable here)
+AUTH_ERROR_TYPES = frozenset({
+    "AccessDenied",         # odoo.exceptions.AccessDenied
+    "RefreshError",         # google.auth.exceptions.RefreshError
+    "TwitterAuthRequired",  # scripts.twitter_mcp_server
+})
+
+HTTP_UNAUTHORIZED = 401
+
+
+class ClientUnavailable(Exception):
+    """Raised when a client could not be constructed."""
+
+
+def _status_codes(error: BaseException) -> Iterator[Any]:
+    """HTTP status codes carried by common HTTP/RPC exception types."""
+    yield getattr(error, "status_code", None)                           # generic
+    yield getattr(error, "errcode", None)                               # xmlrpc.client.ProtocolError
+    yield getattr(getattr(error, "response", None), "status_code", None)  # requests.HTTPError
+    yield getattr(getattr(error, "resp", None), "status", None)         # googleapiclient HttpError
+    if not isinstance(error, OSError) or hasattr(error, "getcode"):
+        yield getattr(error, "code", None)                              # urllib.error.HTTPError
+
+
+def is_auth_error(error: Any) -> bool:
+    """
+    True if an exception or error result is a structured authentication failure.
+
+    Exceptions count when they are an HTTP 401, an Odoo AccessDenied fault or
+    one of AUTH_ERROR_TYPES. Error results count only when they say so with
+    ``auth_error: True`` or ``status_code: 401``; error text is never matched,
+    since ordinary messages can mention "401" or "access denied".
+    """
+    if isinstance(error, dict):
+        if error.get("status") != "error" and error.get("success") is not False:
+            return False
+        return error.get("auth_error") is True or error.get("status_code") == HTTP_UNAUTHORIZED
+    if not isinstance(error, BaseException):
+        return False
+    if isinstance(error, xmlrpc.client.Fault):
+        return error.faultCode in (ACCESS_DENIED_FAULT, "AccessDenied")
+    if any(cls.__name__ in AUTH_ERROR_TYPES for cls in type(error).__mro__):
+        return True
+    return any(code == HTTP_UNAUTHORIZED for code in _status_codes(error))
+
+
+@dataclass
+class _Slot:
+    """One registered client and its bookkeeping."""
+    name: str
+    factory: Callable[[], Any]
+    idle_ttl: float
+    reauth: Optional[Callable[[Any], None]]
+    idempotent: FrozenSet[str] = frozenset()
+    client: Any = None
+    lock: threading.RLock = field(default_factory=threading.RLock)
+    last_used: float = 0.0
+    init_ms: float = 0.0
+    inits: int = 0
+    calls: int = 0
+    reauths: int = 0
+    failed_at: float = 0.0
+    last_error: str = ""
+
+
+class MCPClientRegistry:
+    """Lazily constructed MCP clients with idle TTL and transparent re-auth."""
+
+    def __init__(self, failure_backoff: float = DEFAULT_FAILURE_BACKOFF):
+        self.failure_backoff = failure_backoff
+        self._slots: Dict[str, _Slot] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        idle_ttl: float = DEFAULT_IDLE_TTL,
+        reauth: Optional[Callable[[Any], None]] = None,
+        idempotent: Iterable[str] = (),
+    ):
+        """
+        Register a client factory (nothing is constructed yet).
+
+        Args:
+            name: Client name (e.g. "odoo")
+            factory: Zero-argument callable building the client
+            idle_ttl: Seconds a client may stay unused before it is closed
+            reauth: Refreshes an existing client's session in place; if not
+                given, an expired session rebuilds the client
+            idempotent: Methods safe to call again after re-authenticating
+                (reads); other methods are never retried
+        """
+        with self._lock:
+            self._slots[name] = _Slot(name, factory, idle_ttl, reauth, frozenset(idempotent))
+
+    def _slot(self, name: str) -> _Slot:
+        with self._lock:
+            slot = self._slots.get(name)
+        if slot is None:
+            raise KeyError(f"No MCP client registered as '{name}'")
+        return slot
+
+    def get(self, name: str) -> Any:
+        """
+        Get a client, constructing it on first use or after its idle TTL.
+
+        Raises:
+            ClientUnavailable: If construction failed (recently)
+        """
+        slot = self._slot(name)
+        with slot.lock:
+            now = time.monotonic()
+            if slot.client is not None and now - slot.last_used > slot.idle_ttl:
+                logger.info(f"MCP client '{name}' idle for {now - slot.last_used:.0f}s, reconnecting")
+                self._close(slot)
+            if slot.client is None:
+                if slot.failed_at and now - slot.failed_at < self.failure_backoff:
+                    raise ClientUnavailable(f"{name} client unavailable: {slot.last_error}")
+                self._build(slot)
+            slot.last_used = time.monotonic()
+            return slot.client
+
+    def _build(self, slot: _Slot):
+        started = time.perf_counter()
+        try:
+            slot.client = slot.factory()
+        except Exception as e:
+            slot.failed_at = time.monotonic()
+            slot.last_error = str(e)
+            logger.warning(f"Could not load {slot.name} MCP client: {e}")
+            raise ClientUnavailable(f"{slot.name} client unavailable: {e}") from e
+        slot.init_ms = round((time.perf_counter() - started) * 1000, 1)
+        slot.inits += 1
+        slot.failed_at = 0.0
+        slot.last_error = ""
+        logger.info(f"{slot.name} MCP client loaded in {slot.init_ms} ms")
+
+    def _refresh(self, slot: _Slot):
+        """Re-authenticate a client whose session expired."""
+        slot.reauths += 1
+        if slot.reauth is not None and slot.client is not None:
+            logger.info(f"Re-authenticating {slot.name} MCP client")
+            slot.reauth(slot.client)
+        else:
+            logger.info(f"Rebuilding {slot.name} MCP client after session expiry")
+            self._close(slot)
+            self._build(slot)
+
+    def call(self, name: str, method: str, *args, **kwargs) -> Any:
+        """
+        Call ``client.method(*args, **kwargs)``.
+
+        If the call fails (by raising or returning an error dict) with an
+        authentication failure (see is_auth_error), the client
+        re-authenticates. The call is retried once only if ``method`` was
+        registered as idempotent; otherwise the failure is returned (or
+        raised) so a send, post or payment is never repeated.
+
+        Raises:
+            ClientUnavailable: If the client could not be constructed
+        """
+        slot = self._slot(name)
+        client = self.get(name)
+        slot.calls += 1
+        error = None
+        try:
+            result = getattr(client, method)(*args, **kwargs)
+            if not is_auth_error(result):
+                return result
+            reason = result
+        except Exception as e:
+            if not is_auth_error(e):
+                raise
+            reason = error = e
+
+        logger.warning(f"{name} session expired ({reason}), re-authenticating")
+        with slot.lock:
+            self._refresh(slot)
+            client = slot.client
+            slot.last_used = time.monotonic()
+        if method not in slot.idempotent:
+            logger.warning(f"Not retrying {name}.{method}: it may already have taken effect")
+            if error is not None:
+                raise error
+            return result
+        return getattr(client, method)(*args, **kwargs)
+
+    def _close(self, slot: _Slot):
+        client, slot.client = slot.client, None
+        close = getattr(client, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                logger.debug(f"Error closing {slot.name} MCP client: {e}")
+
+    def evict_idle(self) -> int:
+        """Close clients past their idle TTL; returns how many were closed."""
+        with self._lock:
+            slots = list(self._slots.values())
+        closed = 0
+        now = time.monotonic()
+        for slot in slots:
+            with slot.lock:
+                if slot.client is not None and now - slot.last_used > slot.idle_ttl:
+                    self._close(slot)
+                    closed += 1
+        return closed
+
+    def is_loaded(self, name: str) -> bool:
+        return self._slot(name).client is not None
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-client load state, init time and call/re-auth counters."""
+        with self._lock:
+            slots = list(self._slots.values())
+        now = time.monotonic()
+        return {
+            slot.name: {
+                "loaded": slot.client is not None,
+                "init_ms": slot.init_ms,
+                "inits": slot.inits,
+                "calls": slot.calls,
+                "reauths": slot.reauths,
+                "idle_sec": round(now - slot.last_used, 1) if slot.client is not None else None,
+                "idle_ttl": slot.idle_ttl,
+                "last_error": slot.last_error,
+            }
+            for slot in slots
+        }
+
+    def close_all(self):
+        with self._lock:
+            slots = list(self._slots.values())
+        for slot in slots:
+            with slot.lock:
+                self._close(slot)
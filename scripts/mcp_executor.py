@@ -24,6 +24,10 @@ from typing import Optional, Dict, Any
 
 from log_manager import setup_logging
 from scripts.post_linkedin import post_linkedin as real_post_linkedin
+from scripts.approval_store import ApprovalState, get_approval_store
+from scripts.execution_ledger import get_execution_ledger
+from scripts.execution_scheduler import channel_for
+from scripts.resilience import deadline, full_jitter_delay, get_retry_budget, time_remaining
 
 # Initialize logger
 logger = setup_logging(log_file="logs/ai_employee.log", logger_name="mcp_executor")
@@ -36,6 +40,9 @@ APPROVED_PATH = VAULT_PATH / "Approved"
 REJECTED_PATH = VAULT_PATH / "Rejected"
 ACTION_LOG_PATH = VAULT_PATH / "Logs" / "actions.log"
 
+# Cap on a single retry backoff (seconds)
+MAX_RETRY_DELAY = 60
+
 # Ensure directories exist
 ACTION_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
 APPROVAL_PATH.mkdir(parents=True, exist_ok=True)
@@ -137,21 +144,30 @@ def check_approval(approval_id: str) -> Optional[bool]:
     """
     Check if an approval request has been approved.
 
+    Reads the approval store; a file still in Pending_Approval is synced
+    first (its frontmatter is only re-parsed if it changed). Approvals
+    resolved through Needs_Approval are found in the store even after the
+    file has been moved.
+
     Args:
         approval_id: The ID of the approval document (filename without .md)
 
     Returns:
         True if approved, False if pending, None if not found
     """
+    store = get_approval_store()
     approval_file = APPROVAL_PATH / f"{approval_id}.md"
 
-    if not approval_file.exists():
+    if approval_file.exists():
+        record = store.sync_file(approval_file)
+    else:
+        record = store.get(approval_id)
+
+    if record is None:
         log_action(f"Approval file not found: {approval_id}.md", level="ERROR")
         return None
 
-    content = approval_file.read_text(encoding="utf-8")
-
-    if "approved: true" in content.lower() or "status: approved" in content.lower():
+    if record.state == ApprovalState.APPROVED:
         log_action(f"Approval confirmed for: {approval_id}")
         return True
     else:
@@ -195,7 +211,8 @@ def execute_action(
     data: Dict[str, Any],
     approval_id: str,
     max_retries: int = 3,
-    retry_delay: int = 5
+    retry_delay: float = 5,
+    timeout: Optional[float] = None
 ) -> Dict[str, Any]:
     """
     Execute an external action after verifying approval.
@@ -205,7 +222,8 @@ def execute_action(
         data: Action data dictionary
         approval_id: Approval document ID
         max_retries: Maximum retry attempts on failure
-        retry_delay: Delay between retries in seconds
+        retry_delay: Base backoff delay in seconds (doubles per retry, full jitter)
+        timeout: Overall deadline in seconds (None for no deadline)
 
     Returns:
         Result dictionary with status, message, and details
@@ -234,57 +252,107 @@ def execute_action(
             "approval_id": approval_id
         }
 
-    # Execute action with retries
+    # Execute action with retries. Every attempt is claimed in the execution
+    # ledger first, so a retry or restart never repeats a completed send.
+    # Retries back off with full jitter, draw on the channel's retry budget
+    # and never sleep past the caller's deadline.
+    ledger = get_execution_ledger()
+    channel = channel_for(action_type)
+    budget = get_retry_budget(channel)
+    budget.deposit()
     retries = 0
 
-    while retries <= max_retries:
-        try:
-            log_action(f"Executing {action_type} (attempt {retries + 1}/{max_retries + 1})")
-
-            if action_type == "gmail_send":
-                result = send_gmail_email(data)
-            elif action_type == "linkedin_post":
-                result = post_linkedin_message(data)
-            else:
-                log_action(f"Unknown action type: {action_type}", level="ERROR")
+    with deadline(timeout):
+        while retries <= max_retries:
+            entry = ledger.begin(approval_id, action_type, data)
+            if entry.decision == "duplicate":
+                log_action(f"ACTION_SKIPPED: {action_type} for {approval_id} already completed (idempotent replay)")
+                previous = entry.result or {}
                 return {
-                    "status": "error",
-                    "message": f"Unknown action type: {action_type}"
+                    "status": "success",
+                    "message": previous.get("message", "Action already completed"),
+                    "action_type": action_type,
+                    "approval_id": approval_id,
+                    "duplicate": True
                 }
-
-            if result.get("status") == "success":
-                log_action(f"ACTION_SUCCESS: {action_type} completed for approval {approval_id}")
-                move_approval_file(approval_id, APPROVED_PATH)
-
+            if not entry.proceed:
+                log_action(f"ACTION_HELD: {action_type} for {approval_id} is {entry.decision} {entry.error}".rstrip(),
+                           level="WARNING")
                 return {
-                    "status": "success",
-                    "message": result.get("message"),
+                    "status": "error",
+                    "message": entry.error or f"Action is already {entry.decision}",
                     "action_type": action_type,
-                    "approval_id": approval_id
+                    "approval_id": approval_id,
+                    "ledger": entry.decision
                 }
-            else:
-                raise Exception(result.get("message", "Unknown error"))
-
-        except Exception as e:
-            log_action(f"Attempt {retries + 1} failed: {e}", level="ERROR")
-            retries += 1
-
-            if retries <= max_retries:
-                log_action(f"Retrying in {retry_delay} seconds...", level="WARNING")
-                # This delay is part of real production retry logic and NOT simulation.
-                # It provides controlled backoff between retry attempts to handle
-                # temporary API/network failures gracefully.
-                # PRODUCTION NOTE: time.sleep() is used strictly for retry backoff
-                # in real production environments to handle transient failures.
-                time.sleep(retry_delay)
+
+            result = {}
+            try:
+                log_action(f"Executing {action_type} (attempt {retries + 1}/{max_retries + 1})")
+
+                if action_type == "gmail_send":
+                    result = send_gmail_email(data)
+                elif action_type == "linkedin_post":
+                    result = post_linkedin_message(data)
+                else:
+                    log_action(f"Unknown action type: {action_type}", level="ERROR")
+                    ledger.fail(entry.key, f"Unknown action type: {action_type}")
+                    return {
+                        "status": "error",
+                        "message": f"Unknown action type: {action_type}"
+                    }
+
+                if result.get("status") == "success":
+                    ledger.succeed(entry.key, result)
+                    log_action(f"ACTION_SUCCESS: {action_type} completed for approval {approval_id}")
+                    move_approval_file(approval_id, APPROVED_PATH)
+
+                    return {
+                        "status": "success",
+                        "message": result.get("message"),
+                        "action_type": action_type,
+                        "approval_id": approval_id
+                    }
+                else:
+                    raise Exception(result.get("message", "Unknown error"))
+
+            except Exception as e:
+                ledger.fail(entry.key, str(e))
+                log_action(f"Attempt {retries + 1} failed: {e}", level="ERROR")
+                retries += 1
+
+                if result.get("circuit_open"):
+                    # The endpoint is down: fail fast and leave the approval for a later run
+                    log_action(f"ACTION_DEFERRED: {channel} circuit is open, not retrying {approval_id}",
+                               level="WARNING")
+                    return {
+                        "status": "error",
+                        "message": result.get("message"),
+                        "action_type": action_type,
+                        "approval_id": approval_id,
+                        "circuit_open": True
+                    }
+
+                if retries > max_retries:
+                    break
+                if not budget.try_spend():
+                    log_action(f"Retry budget for {channel} exhausted, giving up", level="WARNING")
+                    break
+                delay = full_jitter_delay(retries - 1, base=retry_delay, cap=MAX_RETRY_DELAY)
+                remaining = time_remaining()
+                if remaining is not None and delay >= remaining:
+                    log_action(f"Deadline leaves {max(remaining, 0):.1f}s, not retrying", level="WARNING")
+                    break
+                log_action(f"Retrying in {delay:.1f} seconds...", level="WARNING")
+                time.sleep(delay)
 
     # All retries exhausted
-    log_action(f"ACTION_FAILED: {action_type} failed after {max_retries + 1} attempts", level="ERROR")
+    log_action(f"ACTION_FAILED: {action_type} failed after {retries} attempts", level="ERROR")
     move_approval_file(approval_id, REJECTED_PATH)
 
     return {
         "status": "error",
-        "message": f"Action failed after {max_retries + 1} attempts",
+        "message": f"Action failed after {retries} attempts",
         "action_type": action_type,
         "approval_id": approval_id
     }
@@ -0,0 +1,438 @@
+"""
+Odoo Bulk Operations - Batch Invoice and Payment Creation
+
+``OdooMCPServer.create_invoice`` costs a partner lookup, a create, a read
+and (optionally) a post per invoice, so month-end billing for hundreds of
+clients means thousands of sequential round trips. These helpers batch
+each phase into one call per chunk of records:
+
+create_invoices_bulk:
+    1. resolve every customer with one ``search_read`` (case-insensitive)
+    2. create the missing partners with one multi-record ``create``
+    3. create the invoices with one multi-record ``create``
+    4. post them with one ``action_post`` (when auto_validate)
+    5. read names and totals back with one ``read``
+
+record_payments_bulk:
+    1. read every invoice with one ``read``
+    2. post draft invoices with one ``action_post``
+    3. pay invoices settled in full with one payment wizard per payment
+       date (one payment per invoice); partial and referenced payments get
+       a wizard each
+
+Odoo runs a multi-record call in one transaction, so a single bad record
+fails its chunk. When Odoo rejects a chunk (xmlrpc Fault) the chunk is
+retried record by record to isolate the failures; every item gets its own
+result. Transport failures abort the remaining work and are reported per
+item too: invoices created before the failure are "partial" (created, but
+posting or the read-back of their details is unconfirmed).
+
+Used by OdooMCPServer in both scripts/odoo_mcp_server.py and
+mcp/odoo_mcp/server.py.
+"""
+
+import os
+import xmlrpc.client
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from log_manager import setup_logging
+
+logger = setup_logging(log_file="logs/ai_employee.log", logger_name="odoo_bulk")
+
+# Records per multi-record create/post call
+BULK_CHUNK = int(os.getenv("ODOO_BULK_CHUNK", "200"))
+
+# Residual difference below which a payment settles the invoice in full
+_CENT = 0.005
+
+
+class _BulkRun:
+    """Counts round trips of one bulk operation."""
+
+    def __init__(self, odoo):
+        self.odoo = odoo
+        self.calls = 0
+
+    def execute(self, model: str, method: str, *args, **kwargs):
+        self.calls += 1
+        return self.odoo._execute(model, method, *args, **kwargs)
+
+
+def _chunks(items: List[Any], size: int = None):
+    size = size or BULK_CHUNK
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _fault_message(error: Exception) -> str:
+    return error.faultString if isinstance(error, xmlrpc.client.Fault) else str(error)
+
+
+def _create_isolating(run: _BulkRun, model: str,
+                      vals_list: List[Dict[str, Any]]) -> List[Tuple[Optional[int], Optional[str]]]:
+    """
+    Create records in multi-record calls, isolating rejected records.
+
+    Returns:
+        (record_id, None) or (None, error) per input, in order
+    """
+    outcome: List[Tuple[Optional[int], Optional[str]]] = []
+    for chunk in _chunks(vals_list):
+        try:
+            ids = run.execute(model, "create", chunk)
+            outcome.extend((record_id, None) for record_id in ids)
+        except xmlrpc.client.Fault:
+            # The chunk rolled back as a whole: find the bad records
+            for vals in chunk:
+                try:
+                    outcome.append((run.execute(model, "create", vals), None))
+                except xmlrpc.client.Fault as e:
+                    outcome.append((None, _fault_message(e)))
+    return outcome
+
+
+def _call_isolating(run: _BulkRun, model: str, method: str, ids: List[int]) -> Dict[int, str]:
+    """
+    Call ``method`` on records in chunks, isolating rejected records.
+
+    Returns:
+        record_id -> error for the records Odoo rejected
+    """
+    errors: Dict[int, str] = {}
+    for chunk in _chunks(ids):
+        try:
+            run.execute(model, method, chunk)
+        except xmlrpc.client.Fault:
+            for record_id in chunk:
+                try:
+                    run.execute(model, method, [record_id])
+                except xmlrpc.client.Fault as e:
+                    errors[record_id] = _fault_message(e)
+    return errors
+
+
+def _ilike_any(field: str, values: List[str]) -> List[Any]:
+    """Domain matching ``field`` case-insensitively against any of ``values``."""
+    return ["|"] * (len(values) - 1) + [(field, "=ilike", value) for value in values]
+
+
+def resolve_partners(run: _BulkRun, names: List[str]) -> Dict[str, Tuple[Optional[int], Optional[str]]]:
+    """
+    Map customer names to partner ids, creating the missing partners.
+
+    Returns:
+        lowercased name -> (partner_id, None) or (None, error)
+    """
+    wanted = {name.strip().lower(): name.strip() for name in names}
+    resolved: Dict[str, Tuple[Optional[int], Optional[str]]] = {}
+
+    for chunk in _chunks(list(wanted.values())):
+        partners = run.execute("res.partner", "search_read", _ilike_any("name", chunk), ["name"], order="id")
+        for partner in partners:
+            # First (oldest) match wins, like _find_partner
+            resolved.setdefault(partner["name"].strip().lower(), (partner["id"], None))
+
+    missing = [name for key, name in wanted.items() if key not in resolved]
+    if missing:
+        created = _create_isolating(
+            run, "res.partner", [{"name": name, "company_type": "company"} for name in missing]
+        )
+        for name, outcome in zip(missing, created):
+            resolved[name.lower()] = outcome
+        logger.info(f"Created {sum(1 for pid, _ in created if pid)} partners in bulk")
+    return resolved
+
+
+def _invoice_vals(invoice: Dict[str, Any], partner_id: int) -> Tuple[Dict[str, Any], str]:
+    """Invoice values as create_invoice builds them, and the due date."""
+    invoice_date = invoice.get("invoice_date") or datetime.now().strftime("%Y-%m-%d")
+    due_date = invoice.get("due_date") or (
+        datetime.strptime(invoice_date, "%Y-%m-%d") + timedelta(days=30)
+    ).strftime("%Y-%m-%d")
+
+    lines = []
+    for item in invoice["items"]:
+        line_vals = {
+            "name": item.get("name", "Service"),
+            "quantity": item.get("quantity", 1),
+            "price_unit": item.get("price", 0),
+        }
+        if "account_id" in item:
+            line_vals["account_id"] = item["account_id"]
+        lines.append((0, 0, line_vals))
+
+    vals = {
+        "move_type": "out_invoice",
+        "partner_id": partner_id,
+        "invoice_date": invoice_date,
+        "invoice_date_due": due_date,
+        "narration": invoice.get("description", ""),
+        "invoice_line_ids": lines,
+    }
+    if invoice.get("reference"):
+        vals["ref"] = invoice["reference"]
+    return vals, due_date
+
+
+def _summary(results: List[Dict[str, Any]], run: _BulkRun, started: datetime, **extra) -> Dict[str, Any]:
+    succeeded = sum(1 for r in results if r["status"] == "success")
+    partial = sum(1 for r in results if r["status"] == "partial")
+    failed = len(results) - succeeded - partial
+    status = "success" if succeeded == len(results) else ("partial" if succeeded or partial else "error")
+    return {
+        "status": status,
+        "total": len(results),
+        "succeeded": succeeded,
+        "partial": partial,
+        "failed": failed,
+        "rpc_calls": run.calls,
+        "elapsed_ms": round((datetime.now() - started).total_seconds() * 1000, 1),
+        **extra,
+        "results": results,
+    }
+
+
+def create_invoices_bulk(odoo, invoices: List[Dict[str, Any]], auto_validate: bool = False) -> Dict[str, Any]:
+    """
+    Create many customer invoices in a handful of round trips.
+
+    Args:
+        odoo: OdooMCPServer
+        invoices: [{"customer_name": str, "items": [{"name", "quantity", "price", "account_id"}],
+                    "description": str, "invoice_date": str, "due_date": str, "reference": str}]
+        auto_validate: Post the invoices after creating them
+
+    Returns:
+        Summary with status ('success', 'partial' or 'error'), counts, rpc_calls
+        and one result per input invoice, in order. An invoice whose posting
+        or details could not be confirmed is 'partial' and may lack
+        invoice_name, amount_total and state.
+    """
+    started = datetime.now()
+    run = _BulkRun(odoo)
+    posted = not auto_validate
+    results: List[Dict[str, Any]] = [
+        {"index": i, "status": "pending", "customer": (inv.get("customer_name") or "").strip()}
+        for i, inv in enumerate(invoices)
+    ]
+
+    def fail(result, message):
+        result.update(status="error", message=message)
+
+    valid = []
+    for result, invoice in zip(results, invoices):
+        if not result["customer"]:
+            fail(result, "customer_name is required")
+        elif not invoice.get("items"):
+            fail(result, "At least one invoice line is required")
+        else:
+            valid.append((result, invoice))
+
+    try:
+        partners = resolve_partners(run, [result["customer"] for result, _ in valid]) if valid else {}
+
+        pending = []
+        for result, invoice in valid:
+            partner_id, error = partners[result["customer"].lower()]
+            if error:
+                fail(result, f"Customer could not be created: {error}")
+                continue
+            try:
+                vals, due_date = _invoice_vals(invoice, partner_id)
+            except ValueError as e:
+                fail(result, f"Invalid date: {e}")
+                continue
+            result["due_date"] = due_date
+            pending.append((result, vals))
+
+        created = _create_isolating(run, "account.move", [vals for _, vals in pending])
+        invoice_ids = []
+        for (result, _), (invoice_id, error) in zip(pending, created):
+            if error:
+                fail(result, error)
+            else:
+                result["invoice_id"] = invoice_id
+                invoice_ids.append(invoice_id)
+
+        if auto_validate and invoice_ids:
+            post_errors = _call_isolating(run, "account.move", "action_post", invoice_ids)
+            posted = True
+            for result in results:
+                if result.get("invoice_id") in post_errors:
+                    # The draft exists; report it so it can be fixed and posted
+                    result["post_error"] = post_errors[result["invoice_id"]]
+
+        details = {}
+        for chunk in _chunks(invoice_ids):
+            for row in run.execute("account.move", "read", chunk, ["name", "amount_total", "amount_untaxed", "state"]):
+                details[row["id"]] = row
+        for result in results:
+            if "invoice_id" not in result:
+                continue
+            row = details.get(result["invoice_id"], {})
+            result.update(
+                status="error" if result.get("post_error") else "success",
+                invoice_name=row.get("name") or f"INV/{result['invoice_id']}",
+                amount_total=row.get("amount_total", 0),
+                amount_untaxed=row.get("amount_untaxed", 0),
+                state=row.get("state", "draft"),
+            )
+            if result.get("post_error"):
+                result["message"] = f"Created as draft but not posted: {result['post_error']}"
+    except Exception as e:
+        # Transport failure or open circuit: the remaining work did not run
+        logger.error(f"Bulk invoice creation aborted: {e}")
+        for result in results:
+            if result["status"] == "pending":
+                if not result.get("invoice_id"):
+                    fail(result, f"Aborted: {e}")
+                elif not posted:
+                    # action_post may or may not have committed
+                    result.update(status="partial", post_error=str(e),
+                                  message=f"Created; posting not confirmed: {e}")
+                else:
+                    result.update(status="partial", message=f"Created; details unavailable: {e}")
+
+    summary = _summary(results, run, started,
+                       amount_total=round(sum(r.get("amount_total", 0) for r in results), 2))
+    logger.info(f"Bulk invoices: {summary['succeeded']}/{summary['total']} created "
+                f"in {run.calls} calls ({summary['elapsed_ms']} ms)")
+    return summary
+
+
+def record_payments_bulk(odoo, payments: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Register many invoice payments in a handful of round trips.
+
+    Args:
+        odoo: OdooMCPServer
+        payments: [{"invoice_id": int, "amount": float, "payment_date": str, "reference": str}]
+
+    Returns:
+        Summary with status ('success', 'partial' or 'error'), counts, rpc_calls
+        and one result per input payment, in order
+    """
+    started = datetime.now()
+    run = _BulkRun(odoo)
+    today = datetime.now().strftime("%Y-%m-%d")
+    results: List[Dict[str, Any]] = []
+    for i, payment in enumerate(payments):
+        results.append({
+            "index": i,
+            "status": "pending",
+            "invoice_id": payment.get("invoice_id"),
+            "amount": payment.get("amount"),
+            "payment_date": payment.get("payment_date") or today,
+            "reference": payment.get("reference", ""),
+        })
+
+    def fail(result, message):
+        result.update(status="error", message=message)
+
+    for result in results:
+        if not isinstance(result["invoice_id"], int):
+            fail(result, "invoice_id must be an integer")
+        elif not isinstance(result["amount"], (int, float)) or result["amount"] <= 0:
+            fail(result, "amount must be positive")
+
+    try:
+        invoice_ids = sorted({r["invoice_id"] for r in results if r["status"] == "pending"})
+        # Residuals must be current, not a cached read
+        odoo.cache.invalidate(odoo._cache_namespace, "account.move")
+        invoices = {}
+        for chunk in _chunks(invoice_ids):
+            for row in run.execute("account.move", "read", chunk,
+                                   ["name", "state", "amount_residual", "move_type", "partner_id"]):
+                invoices[row["id"]] = row
+
+        to_post = set()
+        for result in results:
+            if result["status"] != "pending":
+                continue
+            invoice = invoices.get(result["invoice_id"])
+            if not invoice:
+                fail(result, f"Invoice {result['invoice_id']} not found")
+            elif invoice["state"] == "cancel":
+                fail(result, f"Invoice {invoice['name']} is cancelled")
+            elif invoice["state"] == "posted" and invoice["amount_residual"] <= _CENT:
+                fail(result, f"Invoice {invoice['name']} is already paid")
+            else:
+                result["invoice_name"] = invoice["name"]
+                if invoice["state"] == "draft":
+                    to_post.add(invoice["id"])
+
+        # Only posted invoices can be paid
+        post_errors = _call_isolating(run, "account.move", "action_post", sorted(to_post)) if to_post else {}
+        if to_post:
+            for row in run.execute("account.move", "read", sorted(to_post), ["name", "amount_residual"]):
+                invoices[row["id"]].update(row)
+
+        full_by_date: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        partial = []
+        for result in results:
+            if result["status"] != "pending":
+                continue
+            if result["invoice_id"] in post_errors:
+                fail(result, f"Invoice could not be posted: {post_errors[result['invoice_id']]}")
+                continue
+            invoice = invoices[result["invoice_id"]]
+            result["invoice_name"] = invoice["name"]
+            # Several payments for one invoice are registered one by one, and
+            # so are referenced ones (the batch wizard has no per-payment memo)
+            duplicate = sum(1 for r in results if r["invoice_id"] == result["invoice_id"]) > 1
+            in_full = abs(result["amount"] - invoice["amount_residual"]) < _CENT
+            if in_full and not duplicate and not result["reference"]:
+                full_by_date[result["payment_date"]].append(result)
+            else:
+                partial.append(result)
+
+        for payment_date, group in full_by_date.items():
+            for chunk in _chunks(group):
+                _pay_in_full(run, payment_date, chunk)
+
+        for result in partial:
+            _pay_single(run, result)
+    except Exception as e:
+        logger.error(f"Bulk payment registration aborted: {e}")
+        for result in results:
+            if result["status"] == "pending":
+                fail(result, f"Aborted: {e}")
+
+    summary = _summary(results, run, started,
+                       amount_total=round(sum(r["amount"] for r in results if r["status"] == "success"), 2))
+    logger.info(f"Bulk payments: {summary['succeeded']}/{summary['total']} registered "
+                f"in {run.calls} calls ({summary['elapsed_ms']} ms)")
+    return summary
+
+
+def _register_payments(run: _BulkRun, invoice_ids: List[int], vals: Dict[str, Any]):
+    context = {"active_model": "account.move", "active_ids": invoice_ids}
+    wizard_id = run.execute("account.payment.register", "create", vals, context=context)
+    run.execute("account.payment.register", "action_create_payments", [wizard_id], context=context)
+
+
+def _pay_in_full(run: _BulkRun, payment_date: str, group: List[Dict[str, Any]]):
+    """One wizard pays every invoice of the group in full, one payment each."""
+    try:
+        _register_payments(run, [r["invoice_id"] for r in group],
+                           {"payment_date": payment_date, "group_payment": False})
+        for result in group:
+            result.update(status="success", mode="batch")
+    except xmlrpc.client.Fault:
+        # One invoice blocked the wizard: pay the group one by one
+        for result in group:
+            _pay_single(run, result)
+
+
+def _pay_single(run: _BulkRun, result: Dict[str, Any]):
+    try:
+        _register_payments(run, [result["invoice_id"]], {
+            "amount": result["amount"],
+            "payment_date": result["payment_date"],
+            "communication": result["reference"] or f"Payment for {result['invoice_name']}",
+        })
+        result.update(status="success", mode="single")
+    except xmlrpc.client.Fault as e:
+        result.update(status="error", message=_fault_message(e))
@@ -0,0 +1,206 @@
+"""
+Odoo Query Cache - Read-Through Cache for OdooMCPServer
+
+The dashboard, CEO briefing, cloud report sync and Gold orchestrator ask
+Odoo for the same partners, invoices and report sums minutes apart. This
+cache sits under ``OdooMCPServer._execute``:
+
+- read methods (search, read, search_read, search_count, read_group, ...)
+  are cached by (database, user, model, method, arguments), so the domain
+  and requested fields are part of the key
+- entries expire after a TTL chosen per model (ODOO_CACHE_TTL sets the
+  default for models not listed in MODEL_TTLS)
+- any other method (create, write, action_post, payment wizards, ...)
+  invalidates the model and the models whose data it changes
+- a read that was in flight when its model was invalidated is not stored
+- hit/miss/invalidation statistics per model
+
+Set ODOO_CACHE_ENABLED=false to disable it.
+
+Usage:
+    from scripts.odoo_cache import get_odoo_cache
+
+    cache = get_odoo_cache()
+    result = cache.get_or_call(namespace, "res.partner", "search_read", args, kwargs, call)
+    cache.invalidate(namespace, "account.move")
+"""
+
+import copy
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+CACHE_ENABLED = os.getenv("ODOO_CACHE_ENABLED", "true").lower() == "true"
+DEFAULT_TTL = float(os.getenv("ODOO_CACHE_TTL", "60"))
+MAX_ENTRIES = 2048
+
+# Read-only ORM methods whose results may be cached
+CACHEABLE_METHODS = {"search", "read", "search_read", "search_count", "read_group", "fields_get", "name_search"}
+
+# Seconds a cached result stays fresh, per model
+MODEL_TTLS = {
+    "account.account": 3600,
+    "account.journal": 3600,
+    "res.partner": 600,
+    "account.move": 60,
+    "account.move.line": 120,
+    "account.payment": 60,
+}
+
+# Writes to a model also change these models' data
+_POSTING_MODELS = ("account.move", "account.move.line", "account.account", "account.payment")
+INVALIDATES = {
+    "account.move": _POSTING_MODELS,
+    "account.move.line": _POSTING_MODELS,
+    "account.payment": _POSTING_MODELS,
+    "account.payment.register": _POSTING_MODELS,
+    "res.partner": ("res.partner", "account.move"),
+}
+
+
+def _freeze(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str, separators=(",", ":"))
+
+
+class OdooQueryCache:
+    """Thread-safe TTL cache of Odoo read results with model invalidation."""
+
+    def __init__(self, enabled: bool = CACHE_ENABLED, default_ttl: float = DEFAULT_TTL,
+                 max_entries: int = MAX_ENTRIES):
+        self.enabled = enabled
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+        # (namespace, model) -> generation, bumped on every invalidation
+        self._generations: Dict[Tuple[Hashable, str], int] = {}
+        # namespace -> epoch, bumped when the whole namespace is cleared
+        self._epochs: Dict[Hashable, int] = {}
+        self._global_epoch = 0
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def ttl_for(self, model: str) -> float:
+        return MODEL_TTLS.get(model, self.default_ttl)
+
+    def _count(self, model: str, event: str, n: int = 1):
+        counters = self._stats.setdefault(model, {"hits": 0, "misses": 0, "invalidations": 0})
+        counters[event] += n
+
+    def get_or_call(
+        self,
+        namespace: Hashable,
+        model: str,
+        method: str,
+        args: tuple,
+        kwargs: Dict[str, Any],
+        call: Callable[[], Any],
+    ) -> Any:
+        """
+        Return the cached result of a read, or run ``call`` and cache it.
+
+        Args:
+            namespace: Connection identity (url, db, uid) the result belongs to
+            model: Odoo model name
+            method: ORM method; only CACHEABLE_METHODS are cached
+            args: Positional arguments (domain, fields, ...)
+            kwargs: Keyword arguments (limit, order, ...)
+            call: Performs the actual RPC
+
+        Returns:
+            The (copied) result
+        """
+        ttl = self.ttl_for(model)
+        if not self.enabled or method not in CACHEABLE_METHODS or ttl <= 0:
+            return call()
+
+        key = (namespace, model, method, _freeze(args), _freeze(kwargs))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self._count(model, "hits")
+                return copy.deepcopy(entry[1])
+            self._count(model, "misses")
+            generation = self._generation(namespace, model)
+
+        result = call()
+
+        with self._lock:
+            # Skip storing if a write invalidated the model meanwhile
+            if self._generation(namespace, model) == generation:
+                if len(self._entries) >= self.max_entries:
+                    self._evict(now)
+                self._entries[key] = (now + ttl, copy.deepcopy(result))
+        return result
+
+    def _generation(self, namespace: Hashable, model: str) -> Tuple[int, int, int]:
+        return self._global_epoch, self._epochs.get(namespace, 0), self._generations.get((namespace, model), 0)
+
+    def _evict(self, now: float):
+        """Drop expired entries, then the ones closest to expiry."""
+        for key in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+            del self._entries[key]
+        overflow = len(self._entries) - self.max_entries + 1
+        if overflow > 0:
+            for key in sorted(self._entries, key=lambda k: self._entries[k][0])[:overflow]:
+                del self._entries[key]
+
+    def invalidate(self, namespace: Hashable, model: str) -> int:
+        """
+        Drop cached reads of ``model`` and the models its writes affect.
+
+        Returns:
+            Number of entries removed
+        """
+        models = set(INVALIDATES.get(model, ())) | {model}
+        return self.invalidate_models(namespace, models)
+
+    def invalidate_models(self, namespace: Hashable, models: Iterable[str]) -> int:
+        models = set(models)
+        with self._lock:
+            for name in models:
+                self._generations[(namespace, name)] = self._generations.get((namespace, name), 0) + 1
+            stale = [k for k in self._entries if k[0] == namespace and k[1] in models]
+            for key in stale:
+                self._count(key[1], "invalidations")
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self, namespace: Hashable = None):
+        """Drop every cached read (of one namespace, or all)."""
+        with self._lock:
+            if namespace is None:
+                self._global_epoch += 1
+                self._entries.clear()
+                return
+            self._epochs[namespace] = self._epochs.get(namespace, 0) + 1
+            self._entries = {k: v for k, v in self._entries.items() if k[0] != namespace}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = sum(c["hits"] for c in self._stats.values())
+            misses = sum(c["misses"] for c in self._stats.values())
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "hits": hits,
+                "misses": misses,
+                "invalidations": sum(c["invalidations"] for c in self._stats.values()),
+                "hit_ratio": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+                "models": {model: dict(counters) for model, counters in self._stats.items()},
+            }
+
+
+_cache: Optional[OdooQueryCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_odoo_cache() -> OdooQueryCache:
+    """Get the process-wide Odoo query cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = OdooQueryCache()
+        return _cache
@@ -25,13 +25,19 @@ Usage:
 
 import json
 import logging
-import requests
-from typing import Dict, List, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from pathlib import Path
 import xmlrpc.client
 
 from log_manager import setup_logging
+from scripts import odoo_bulk
+from scripts.odoo_cache import get_odoo_cache
+from scripts.odoo_transport import cached_login, get_rpc_client
+from scripts.mcp_client_registry import is_auth_error
+from scripts.resilience import deadline, get_circuit_breaker, retry_call, time_remaining
 
 # Setup logging
 logger = setup_logging(log_file="logs/ai_employee.log", logger_name="odoo_mcp")
@@ -61,6 +67,21 @@ ODOO_PASSWORD = Path(".env").exists() and next(
     "admin"
 ) or "admin"
 
+def _error_result(error: Exception) -> Dict[str, Any]:
+    """Error response; ``auth_error`` lets the MCP client registry re-authenticate."""
+    return {"status": "error", "message": str(error), "auth_error": is_auth_error(error)}
+
+
+# Read-only methods that are safe to retry on transport errors
+RETRYABLE_METHODS = {"search", "read", "search_read", "search_count", "read_group", "fields_get", "name_search"}
+ODOO_TRANSIENT_ERRORS = (OSError, xmlrpc.client.ProtocolError)
+
+# account.account internal groups behind the financial reports
+PL_GROUPS = ("income", "expense")
+BS_GROUPS = ("asset", "liability", "equity")
+# Journal item sums returned per read_group row
+LINE_AGGREGATES = ["debit:sum", "credit:sum", "balance:sum"]
+
 
 class OdooMCPServer:
     """
@@ -75,7 +96,8 @@ class OdooMCPServer:
         url: str = None,
         db: str = None,
         username: str = None,
-        password: str = None
+        password: str = None,
+        protocol: str = None
     ):
         """
         Initialize Odoo MCP connection.
@@ -85,6 +107,7 @@ class OdooMCPServer:
             db: Database name
             username: Odoo username (email)
             password: Odoo password
+            protocol: 'xmlrpc' or 'jsonrpc' (default: ODOO_PROTOCOL env, else xmlrpc)
         """
         self.url = url or ODOO_URL
         self.db = db or ODOO_DB
@@ -92,40 +115,47 @@ class OdooMCPServer:
         self.password = password or ODOO_PASSWORD
         
         self.uid = None
-        self.common = None
-        self.models = None
+        # Shared keep-alive connection pool for this Odoo URL
+        self.rpc = get_rpc_client(self.url, protocol)
+        # Process-wide read-through cache, invalidated by writes
+        self.cache = get_odoo_cache()
         
         logger.info(f"Initializing Odoo MCP connection to {self.url}")
-        self._authenticate()
+        self._authenticate(use_cached=True)
     
-    def _authenticate(self):
-        """Authenticate with Odoo and establish session."""
+    def _authenticate(self, use_cached: bool = False):
+        """
+        Authenticate with Odoo and establish session.
+        
+        Args:
+            use_cached: Reuse the session uid this process already holds for
+                these credentials instead of logging in again
+        """
         try:
-            # Common endpoint for authentication
-            common_url = f"{self.url}/xmlrpc/2/common"
-            self.common = xmlrpc.client.ServerProxy(common_url)
-            
-            # Authenticate and get user ID
-            self.uid = self.common.authenticate(
-                self.db,
-                self.username,
-                self.password,
-                {}
-            )
+            self.uid = cached_login(self.rpc, self.db, self.username, self.password, refresh=not use_cached)
             
             if not self.uid:
                 raise Exception("Authentication failed. Check credentials.")
             
-            # Models endpoint for operations
-            models_url = f"{self.url}/xmlrpc/2/object"
-            self.models = xmlrpc.client.ServerProxy(models_url)
-            
-            logger.info(f"Successfully authenticated as user ID: {self.uid}")
+            logger.info(f"Successfully authenticated as user ID: {self.uid} ({self.rpc.protocol})")
             
         except Exception as e:
             logger.error(f"Failed to authenticate with Odoo: {e}")
             raise
     
+    @property
+    def _cache_namespace(self):
+        """Cached reads belong to one database and user."""
+        return (self.rpc.url, self.db, self.uid)
+        
+    def cache_stats(self) -> Dict[str, Any]:
+        """Read cache hit/miss statistics."""
+        return self.cache.stats()
+        
+    def clear_cache(self):
+        """Drop all cached Odoo reads (e.g. after changes made in the Odoo UI)."""
+        self.cache.clear(self._cache_namespace)
+        
     def _execute(self, model: str, method: str, *args, **kwargs):
         """
         Execute a method on an Odoo model.
@@ -138,20 +168,40 @@ class OdooMCPServer:
             
         Returns:
             Method result
+            
+        Raises:
+            CircuitOpenError: If Odoo has been failing and its circuit is open
         """
         if not self.uid:
             raise Exception("Not authenticated. Call _authenticate() first.")
         
+        def call():
+            # Faults are Odoo answering with an error: the endpoint is up
+            with get_circuit_breaker("odoo").guard(ignore=(xmlrpc.client.Fault,)):
+                return self.rpc.execute_kw(
+                    self.db,
+                    self.uid,
+                    self.password,
+                    model,
+                    method,
+                    args,
+                    kwargs
+                )
+        
         try:
-            result = self.models.execute_kw(
-                self.db,
-                self.uid,
-                self.password,
-                model,
-                method,
-                args,
-                kwargs
-            )
+            if method in RETRYABLE_METHODS:
+                result = self.cache.get_or_call(
+                    self._cache_namespace, model, method, args, kwargs,
+                    lambda: retry_call(call, endpoint="odoo", max_attempts=3, base_delay=0.5,
+                                       retry_on=ODOO_TRANSIENT_ERRORS)
+                )
+            else:
+                # Writes are not retried: a lost response may hide a committed write
+                try:
+                    result = call()
+                finally:
+                    # Even a failed write may have committed: drop affected reads
+                    self.cache.invalidate(self._cache_namespace, model)
             logger.debug(f"Executed {method} on {model}: {result}")
             return result
         except Exception as e:
@@ -243,7 +293,7 @@ class OdooMCPServer:
             
         except Exception as e:
             logger.error(f"Failed to create invoice: {e}")
-            return {"status": "error", "message": str(e)}
+            return _error_result(e)
     
     def get_invoices(
         self,
@@ -280,7 +330,8 @@ class OdooMCPServer:
                 "account.move",
                 "search",
                 domain,
-                {"limit": limit, "order": "invoice_date desc"}
+                limit=limit,
+                order="invoice_date desc"
             )
             
             # Read invoice details
@@ -319,7 +370,7 @@ class OdooMCPServer:
             
         except Exception as e:
             logger.error(f"Failed to get invoices: {e}")
-            return {"status": "error", "message": str(e)}
+            return _error_result(e)
     
     def record_payment(
         self,
@@ -390,7 +441,48 @@ class OdooMCPServer:
             
         except Exception as e:
             logger.error(f"Failed to record payment: {e}")
-            return {"status": "error", "message": str(e)}
+            return _error_result(e)
+    
+    def create_invoices_bulk(
+        self,
+        invoices: List[Dict[str, Any]],
+        auto_validate: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Create many customer invoices in a few round trips.
+        
+        Customers are resolved with one search_read, invoices created with one
+        multi-record create and posted with one action_post (per chunk of
+        ODOO_BULK_CHUNK records). Records Odoo rejects are isolated and
+        reported without failing the rest.
+        
+        Args:
+            invoices: [{"customer_name": str, "items": [...], "description": str,
+                        "invoice_date": str, "due_date": str, "reference": str}]
+            auto_validate: If True, post the invoices after creating them
+            
+        Returns:
+            Dictionary with status ('success', 'partial', 'error'), counts and
+            one result per invoice, in input order
+        """
+        return odoo_bulk.create_invoices_bulk(self, invoices, auto_validate=auto_validate)
+    
+    def record_payments_bulk(self, payments: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Record many invoice payments in a few round trips.
+        
+        Invoices are read with one call and drafts posted with one
+        action_post; invoices paid in full share one payment wizard per
+        payment date, partial payments get their own.
+        
+        Args:
+            payments: [{"invoice_id": int, "amount": float, "payment_date": str, "reference": str}]
+            
+        Returns:
+            Dictionary with status ('success', 'partial', 'error'), counts and
+            one result per payment, in input order
+        """
+        return odoo_bulk.record_payments_bulk(self, payments)
     
     # ==================== FINANCIAL REPORTS ====================
     
@@ -404,7 +496,7 @@ class OdooMCPServer:
         Generate financial report.
         
         Args:
-            report_type: Type of report ('profit_loss', 'balance_sheet', 'cash_flow')
+            report_type: Type of report ('profit_loss', 'balance_sheet', 'trial_balance')
             date_from: Start date (YYYY-MM-DD), defaults to start of fiscal year
             date_to: End date (YYYY-MM-DD), defaults to today
             
@@ -429,51 +521,102 @@ class OdooMCPServer:
                 
         except Exception as e:
             logger.error(f"Failed to generate financial report: {e}")
-            return {"status": "error", "message": str(e)}
+            return _error_result(e)
+    
+    def _read_group(self, domain: List, groupby: List[str], fields: List[str] = None) -> List[Dict[str, Any]]:
+        """Aggregate journal items server-side (one row per group)."""
+        return self._execute(
+            "account.move.line",
+            "read_group",
+            domain,
+            fields or LINE_AGGREGATES,
+            groupby,
+            lazy=False
+        )
+    
+    def _accounts(self, groups: tuple) -> Dict[int, Dict[str, Any]]:
+        """Accounts in the given internal groups, keyed by id."""
+        accounts = self._execute(
+            "account.account",
+            "search_read",
+            [("internal_group", "in", list(groups))],
+            ["code", "name", "account_type", "internal_group"]
+        )
+        return {account["id"]: account for account in accounts}
+    
+    def _execute_parallel(self, calls: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """
+        Run independent read queries concurrently on the pooled connections.
+        
+        Args:
+            calls: Name -> zero-argument callable
+            
+        Returns:
+            Name -> result (the first failure is raised)
+        """
+        remaining = time_remaining()
+        
+        def run(call):
+            # Worker threads do not inherit the caller's thread-local deadline
+            with deadline(remaining):
+                return call()
+        
+        workers = min(len(calls), self.rpc.pool.size)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="odoo-report") as pool:
+            futures = {name: pool.submit(run, call) for name, call in calls.items()}
+            return {name: future.result() for name, future in futures.items()}
+    
+    @staticmethod
+    def _group_rows(groups: List[Dict[str, Any]], accounts: Dict[int, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Join read_group rows (grouped by account_id) with account details."""
+        rows = []
+        for group in groups:
+            account_id = group["account_id"][0] if group.get("account_id") else None
+            account = accounts.get(account_id)
+            if not account:
+                continue
+            rows.append({
+                "account_id": account_id,
+                "code": account.get("code", ""),
+                "name": account.get("name", ""),
+                "account_type": account.get("account_type", ""),
+                "internal_group": account.get("internal_group", ""),
+                "debit": group.get("debit", 0.0),
+                "credit": group.get("credit", 0.0),
+                "balance": group.get("balance", 0.0),
+                "lines": group.get("__count", 0),
+            })
+        return sorted(rows, key=lambda row: row["code"])
+    
+    @staticmethod
+    def _totals_by(rows: List[Dict[str, Any]], key: str) -> Dict[str, float]:
+        """Sum balances (debit - credit) by account_type or internal_group."""
+        totals: Dict[str, float] = {}
+        for row in rows:
+            totals[row[key]] = totals.get(row[key], 0.0) + row["balance"]
+        return totals
     
     def _get_profit_loss(self, date_from: str, date_to: str) -> Dict[str, Any]:
-        """Get profit and loss statement."""
+        """Get profit and loss statement (aggregated server-side per account)."""
         try:
-            # Get income and expense accounts
-            income_accounts = self._execute(
-                "account.account",
-                "search",
-                [("user_type_id.type", "=", "income")]
-            )
-            expense_accounts = self._execute(
-                "account.account",
-                "search",
-                [("user_type_id.type", "=", "expense")]
-            )
-            
-            # Calculate income
-            income_lines = self._execute(
-                "account.move.line",
-                "search_read",
-                [
-                    ("account_id", "in", income_accounts),
-                    ("date", ">=", date_from),
-                    ("date", "<=", date_to),
-                    ("parent_state", "=", "posted")
-                ],
-                ["balance", "credit", "debit"]
-            )
-            total_income = sum(line.get("credit", 0) - line.get("debit", 0) for line in income_lines)
-            
-            # Calculate expenses
-            expense_lines = self._execute(
-                "account.move.line",
-                "search_read",
-                [
-                    ("account_id", "in", expense_accounts),
-                    ("date", ">=", date_from),
-                    ("date", "<=", date_to),
-                    ("parent_state", "=", "posted")
-                ],
-                ["balance", "credit", "debit"]
-            )
-            total_expenses = sum(line.get("debit", 0) - line.get("credit", 0) for line in expense_lines)
-            
+            results = self._execute_parallel({
+                "accounts": lambda: self._accounts(PL_GROUPS),
+                "groups": lambda: self._read_group(
+                    [
+                        ("account_id.internal_group", "in", list(PL_GROUPS)),
+                        ("date", ">=", date_from),
+                        ("date", "<=", date_to),
+                        ("parent_state", "=", "posted")
+                    ],
+                    ["account_id"]
+                ),
+            })
+            rows = self._group_rows(results["groups"], results["accounts"])
+            by_group = self._totals_by(rows, "internal_group")
+            
+            # Income is credit-normal, expenses debit-normal
+            total_income = -by_group.get("income", 0.0)
+            total_expenses = by_group.get("expense", 0.0)
             net_profit = total_income - total_expenses
             
             return {
@@ -483,50 +626,50 @@ class OdooMCPServer:
                 "income": total_income,
                 "expenses": total_expenses,
                 "net_profit": net_profit,
+                "by_account_type": {
+                    account_type: (-total if account_type.startswith("income") else total)
+                    for account_type, total in self._totals_by(rows, "account_type").items()
+                },
+                "accounts": rows,
                 "generated_at": datetime.now().isoformat()
             }
             
         except Exception as e:
             logger.error(f"Failed to get profit and loss: {e}")
-            return {"status": "error", "message": str(e)}
+            return _error_result(e)
     
     def _get_balance_sheet(self, date_from: str, date_to: str) -> Dict[str, Any]:
-        """Get balance sheet."""
+        """Get balance sheet as of date_to (aggregated server-side per account)."""
         try:
-            # Get asset and liability accounts
-            asset_accounts = self._execute(
-                "account.account",
-                "search",
-                [("user_type_id.type", "=", "asset")]
-            )
-            liability_accounts = self._execute(
-                "account.account",
-                "search",
-                [("user_type_id.type", "=", "liability")]
-            )
-            equity_accounts = self._execute(
-                "account.account",
-                "search",
-                [("user_type_id.type", "=", "equity")]
-            )
-            
-            # Calculate balances (simplified - would need opening balances for accuracy)
-            def get_balance(accounts):
-                lines = self._execute(
-                    "account.move.line",
-                    "search_read",
+            results = self._execute_parallel({
+                "accounts": lambda: self._accounts(BS_GROUPS),
+                "groups": lambda: self._read_group(
                     [
-                        ("account_id", "in", accounts),
+                        ("account_id.internal_group", "in", list(BS_GROUPS)),
                         ("date", "<=", date_to),
                         ("parent_state", "=", "posted")
                     ],
-                    ["balance", "credit", "debit"]
-                )
-                return sum(line.get("debit", 0) - line.get("credit", 0) for line in lines)
-            
-            total_assets = get_balance(asset_accounts)
-            total_liabilities = get_balance(liability_accounts)
-            total_equity = get_balance(equity_accounts)
+                    ["account_id"]
+                ),
+                # Unclosed income and expense belong to equity as current earnings
+                "earnings": lambda: self._read_group(
+                    [
+                        ("account_id.internal_group", "in", list(PL_GROUPS)),
+                        ("date", "<=", date_to),
+                        ("parent_state", "=", "posted")
+                    ],
+                    []
+                ),
+            })
+            rows = self._group_rows(results["groups"], results["accounts"])
+            by_group = self._totals_by(rows, "internal_group")
+            
+            total_assets = by_group.get("asset", 0.0)
+            # Liabilities and equity are credit-normal
+            total_liabilities = -by_group.get("liability", 0.0)
+            total_equity = -by_group.get("equity", 0.0)
+            earnings = results["earnings"]
+            current_earnings = -(earnings[0].get("balance") or 0.0) if earnings else 0.0
             
             return {
                 "status": "success",
@@ -535,23 +678,72 @@ class OdooMCPServer:
                 "assets": total_assets,
                 "liabilities": total_liabilities,
                 "equity": total_equity,
+                "current_earnings": current_earnings,
+                "balanced": round(total_assets - total_liabilities - total_equity - current_earnings, 2) == 0,
+                "by_account_type": self._totals_by(rows, "account_type"),
+                "accounts": rows,
                 "generated_at": datetime.now().isoformat()
             }
             
         except Exception as e:
             logger.error(f"Failed to get balance sheet: {e}")
-            return {"status": "error", "message": str(e)}
+            return _error_result(e)
     
     def _get_trial_balance(self, date_from: str, date_to: str) -> Dict[str, Any]:
-        """Get trial balance."""
-        # Simplified implementation
-        return {
-            "status": "success",
-            "report_type": "trial_balance",
-            "period": f"{date_from} to {date_to}",
-            "message": "Trial balance report - implementation in progress",
-            "generated_at": datetime.now().isoformat()
-        }
+        """Get trial balance: opening balance, period movements and closing per account."""
+        try:
+            base_domain = [
+                ("account_id.internal_group", "in", list(BS_GROUPS + PL_GROUPS)),
+                ("parent_state", "=", "posted")
+            ]
+            results = self._execute_parallel({
+                "accounts": lambda: self._accounts(BS_GROUPS + PL_GROUPS),
+                "opening": lambda: self._read_group(
+                    base_domain + [("date", "<", date_from)], ["account_id"]
+                ),
+                "period": lambda: self._read_group(
+                    base_domain + [("date", ">=", date_from), ("date", "<=", date_to)], ["account_id"]
+                ),
+            })
+            accounts = results["accounts"]
+            opening = {row["account_id"]: row for row in self._group_rows(results["opening"], accounts)}
+            period = {row["account_id"]: row for row in self._group_rows(results["period"], accounts)}
+            
+            rows = []
+            for account_id in sorted(set(opening) | set(period), key=lambda a: accounts[a].get("code", "")):
+                account = accounts[account_id]
+                opening_balance = opening[account_id]["balance"] if account_id in opening else 0.0
+                moves = period.get(account_id, {})
+                debit = moves.get("debit", 0.0)
+                credit = moves.get("credit", 0.0)
+                rows.append({
+                    "account_id": account_id,
+                    "code": account.get("code", ""),
+                    "name": account.get("name", ""),
+                    "account_type": account.get("account_type", ""),
+                    "opening_balance": opening_balance,
+                    "debit": debit,
+                    "credit": credit,
+                    "closing_balance": opening_balance + debit - credit,
+                })
+            
+            total_debit = sum(row["debit"] for row in rows)
+            total_credit = sum(row["credit"] for row in rows)
+            
+            return {
+                "status": "success",
+                "report_type": "trial_balance",
+                "period": f"{date_from} to {date_to}",
+                "accounts": rows,
+                "total_debit": total_debit,
+                "total_credit": total_credit,
+                "balanced": round(total_debit - total_credit, 2) == 0,
+                "generated_at": datetime.now().isoformat()
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to get trial balance: {e}")
+            return _error_result(e)
     
     # ==================== PARTNER MANAGEMENT ====================
     
@@ -562,7 +754,7 @@ class OdooMCPServer:
                 "res.partner",
                 "search",
                 [("name", "=ilike", name)],
-                {"limit": 1}
+                limit=1
             )
             return partner_ids[0] if partner_ids else None
         except Exception as e:
@@ -610,7 +802,7 @@ class OdooMCPServer:
             }
         except Exception as e:
             logger.error(f"Failed to get partner: {e}")
-            return {"status": "error", "message": str(e)}
+            return _error_result(e)
     
     # ==================== JOURNAL ENTRIES ====================
     
@@ -667,14 +859,14 @@ class OdooMCPServer:
             
         except Exception as e:
             logger.error(f"Failed to create journal entry: {e}")
-            return {"status": "error", "message": str(e)}
+            return _error_result(e)
     
     # ==================== UTILITY METHODS ====================
     
     def test_connection(self) -> Dict[str, Any]:
         """Test Odoo connection and return server info."""
         try:
-            version = self.common.version()
+            version = self.rpc.version()
             return {
                 "status": "success",
                 "connected": True,
@@ -682,7 +874,9 @@ class OdooMCPServer:
                 "database": self.db,
                 "user_id": self.uid,
                 "odoo_version": version.get("server_version", "unknown"),
-                "server_info": version
+                "server_info": version,
+                "transport": self.rpc.stats(),
+                "cache": self.cache.stats()
             }
         except Exception as e:
             return {
@@ -726,7 +920,7 @@ class OdooMCPServer:
             
         except Exception as e:
             logger.error(f"Failed to get account balance: {e}")
-            return {"status": "error", "message": str(e)}
+            return _error_result(e)
 
 
 # Convenience functions for direct usage
@@ -736,6 +930,19 @@ def create_odoo_connection() -> OdooMCPServer:
     return OdooMCPServer()
 
 
+_odoo_client = None
+_odoo_client_lock = threading.Lock()
+
+
+def get_odoo_client() -> OdooMCPServer:
+    """Get singleton Odoo MCP client (shared session and connection pool)."""
+    global _odoo_client
+    with _odoo_client_lock:
+        if _odoo_client is None:
+            _odoo_client = OdooMCPServer()
+        return _odoo_client
+
+
 def test_odoo_connection() -> Dict[str, Any]:
     """Test Odoo connection."""
     try:
@@ -0,0 +1,505 @@
+"""
+Odoo Sync - Incremental Odoo-to-Vault Sync with write_date Cursors
+
+The Gold orchestrator and the cloud agent used to pull invoices and the
+P&L wholesale every cycle (``limit=50``/``100``), so invoices beyond the
+limit were never seen and unchanged ones were downloaded again. This
+module keeps a local ledger of Odoo records instead:
+
+- a (write_date, id) cursor per model is persisted in SQLite; each sync
+  asks Odoo only for records modified after it, in pages ordered by
+  (write_date, id), and advances the cursor after every page, so an
+  interrupted sync resumes where it stopped
+- each incremental sync starts ODOO_SYNC_LOOKBACK seconds before the
+  cursor: Odoo stamps write_date when a transaction starts, so a record
+  committed late can carry a write_date the cursor already passed. The
+  re-read records match their stored digest and cost no writes
+- fetched records are upserted into the local ledger store; a content
+  digest tells changed records from re-saved ones
+- vault summaries are rendered from the local store and written only when
+  their content changed (the P&L is only re-fetched when invoices changed)
+- ``full=True`` resyncs from scratch and drops records deleted in Odoo,
+  which an incremental sync cannot see
+
+Usage:
+    from scripts.odoo_sync import sync_odoo_to_vault
+
+    result = sync_odoo_to_vault(odoo, ACCOUNTING_PATH)
+    result = sync_odoo_to_vault(odoo, ACCOUNTING_PATH, full=True)
+
+    python -m scripts.odoo_sync [--full]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from log_manager import setup_logging
+
+logger = setup_logging(log_file="logs/ai_employee.log", logger_name="odoo_sync")
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+LEDGER_DB_PATH = PROJECT_ROOT / "logs" / "odoo_ledger.db"
+
+PAGE_SIZE = int(os.getenv("ODOO_SYNC_PAGE_SIZE", "200"))
+
+# Seconds before the cursor that every incremental sync re-reads
+LOOKBACK_SECONDS = float(os.getenv("ODOO_SYNC_LOOKBACK", "300"))
+
+ODOO_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+INVOICE_TYPES = ["out_invoice", "out_refund", "in_invoice", "in_refund"]
+
+# Models kept in the local ledger: base domain and fields to fetch
+SYNC_MODELS = {
+    "account.move": {
+        "domain": [("move_type", "in", INVOICE_TYPES)],
+        "fields": ["name", "partner_id", "move_type", "invoice_date", "invoice_date_due",
+                   "amount_total", "amount_residual", "state", "payment_state", "write_date"],
+    },
+    "account.payment": {
+        "domain": [],
+        "fields": ["name", "partner_id", "payment_type", "amount", "date", "state", "write_date"],
+    },
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    model TEXT NOT NULL,
+    record_id INTEGER NOT NULL,
+    write_date TEXT,
+    digest TEXT NOT NULL,
+    data TEXT NOT NULL,
+    sync_token INTEGER NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (model, record_id)
+);
+CREATE TABLE IF NOT EXISTS cursors (
+    model TEXT PRIMARY KEY,
+    write_date TEXT,
+    record_id INTEGER NOT NULL DEFAULT 0,
+    synced_at REAL,
+    full_sync_at REAL,
+    last_error TEXT
+);
+CREATE TABLE IF NOT EXISTS summaries (
+    name TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    path TEXT,
+    written_at REAL NOT NULL
+);
+"""
+
+# Keeps IN (...) lists under SQLite's bound-parameter limit
+_CHUNK = 500
+
+
+def _digest(data: Any) -> str:
+    return hashlib.sha1(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class OdooLedgerStore:
+    """SQLite copy of synced Odoo records, sync cursors and summary digests."""
+
+    def __init__(self, db_path: Path = LEDGER_DB_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+
+    # ==================== CURSORS ====================
+
+    def cursor(self, model: str) -> Dict[str, Any]:
+        """The model's cursor: last synced (write_date, record_id) and timings."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM cursors WHERE model = ?", (model,)).fetchone()
+        if row:
+            return dict(row)
+        return {"model": model, "write_date": None, "record_id": 0, "synced_at": None,
+                "full_sync_at": None, "last_error": None}
+
+    def _set_cursor(self, model: str, write_date: Optional[str], record_id: int, full: bool = False):
+        now = time.time()
+        self._conn.execute(
+            "INSERT INTO cursors (model, write_date, record_id, synced_at, full_sync_at, last_error) "
+            "VALUES (?, ?, ?, ?, ?, NULL) ON CONFLICT(model) DO UPDATE SET write_date = excluded.write_date, "
+            "record_id = excluded.record_id, synced_at = excluded.synced_at, last_error = NULL, "
+            "full_sync_at = COALESCE(excluded.full_sync_at, cursors.full_sync_at)",
+            (model, write_date, record_id, now, now if full else None),
+        )
+
+    def record_error(self, model: str, error: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO cursors (model, last_error) VALUES (?, ?) "
+                "ON CONFLICT(model) DO UPDATE SET last_error = excluded.last_error",
+                (model, error),
+            )
+
+    # ==================== RECORDS ====================
+
+    def upsert_page(self, model: str, records: List[Dict[str, Any]], sync_token: int) -> Dict[str, List[int]]:
+        """
+        Store one page of records and advance the model's cursor past it.
+
+        Both happen in one transaction, so the cursor never runs ahead of
+        the stored data.
+
+        Returns:
+            Record ids by outcome: "inserted", "updated", "unchanged"
+        """
+        outcome = {"inserted": [], "updated": [], "unchanged": []}
+        if not records:
+            return outcome
+        now = time.time()
+        with self._lock, self._conn:
+            ids = [record["id"] for record in records]
+            known = {}
+            for i in range(0, len(ids), _CHUNK):
+                chunk = ids[i:i + _CHUNK]
+                known.update((row["record_id"], row["digest"]) for row in self._conn.execute(
+                    f"SELECT record_id, digest FROM records WHERE model = ? "
+                    f"AND record_id IN ({','.join('?' * len(chunk))})",
+                    (model, *chunk),
+                ))
+            rows = []
+            for record in records:
+                # write_date alone changes on no-op saves: not a content change
+                digest = _digest({k: v for k, v in record.items() if k != "write_date"})
+                previous = known.get(record["id"])
+                key = "inserted" if previous is None else ("unchanged" if previous == digest else "updated")
+                outcome[key].append(record["id"])
+                rows.append((model, record["id"], record.get("write_date"), digest,
+                             json.dumps(record, default=str), sync_token, now))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO records (model, record_id, write_date, digest, data, sync_token, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            last = records[-1]
+            self._set_cursor(model, last.get("write_date"), last["id"])
+        return outcome
+
+    def mark_synced(self, model: str, full: bool = False):
+        """Record a completed sync (and, if ``full``, a completed resync)."""
+        cursor = self.cursor(model)
+        with self._lock, self._conn:
+            self._set_cursor(model, cursor["write_date"], cursor["record_id"], full=full)
+
+    def drop_unseen(self, model: str, sync_token: int) -> int:
+        """Delete records a full resync did not see (deleted in Odoo)."""
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "DELETE FROM records WHERE model = ? AND sync_token != ?", (model, sync_token)
+            ).rowcount
+
+    def records(self, model: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM records WHERE model = ? ORDER BY record_id", (model,)
+            ).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    # ==================== SUMMARIES ====================
+
+    def write_if_changed(self, name: str, path: Path, header: str, body: str, force: bool = False) -> bool:
+        """
+        Write ``header + body`` to ``path`` unless ``body`` is unchanged
+        since the last write of this summary (and that file still exists).
+
+        Returns:
+            True if the file was written
+        """
+        digest = _digest(body)
+        with self._lock:
+            row = self._conn.execute("SELECT digest, path FROM summaries WHERE name = ?", (name,)).fetchone()
+        if not force and row and row["digest"] == digest and Path(row["path"] or "").is_file():
+            return False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(header + body, encoding="utf-8")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summaries (name, digest, path, written_at) VALUES (?, ?, ?, ?)",
+                (name, digest, str(path), time.time()),
+            )
+        return True
+
+    def summary_path(self, name: str) -> Optional[Path]:
+        """Where a summary was last written, if ever."""
+        with self._lock:
+            row = self._conn.execute("SELECT path FROM summaries WHERE name = ?", (name,)).fetchone()
+        return Path(row["path"]) if row and row["path"] else None
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            cursors = [dict(row) for row in self._conn.execute("SELECT * FROM cursors ORDER BY model")]
+            counts = dict(self._conn.execute("SELECT model, COUNT(*) FROM records GROUP BY model").fetchall())
+        return {c["model"]: {**c, "records": counts.get(c["model"], 0)} for c in cursors}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class OdooSyncEngine:
+    """Pulls changed Odoo records into an OdooLedgerStore, page by page."""
+
+    def __init__(self, odoo, store: "OdooLedgerStore" = None, page_size: int = PAGE_SIZE,
+                 models: Dict[str, Dict[str, Any]] = None, lookback: float = None):
+        self.odoo = odoo
+        self.store = store or get_odoo_ledger_store()
+        self.page_size = page_size
+        self.models = models or SYNC_MODELS
+        self.lookback = LOOKBACK_SECONDS if lookback is None else lookback
+
+    @staticmethod
+    def _after_cursor(write_date: Optional[str], record_id: int, lookback: float = 0) -> List[Any]:
+        """
+        Domain for records strictly after (write_date, id), or for every
+        record written up to ``lookback`` seconds before ``write_date``.
+        """
+        if write_date is None:
+            return []
+        if lookback > 0:
+            since = datetime.strptime(write_date[:19], ODOO_DATETIME_FORMAT) - timedelta(seconds=lookback)
+            return [("write_date", ">=", since.strftime(ODOO_DATETIME_FORMAT))]
+        return ["|", ("write_date", ">", write_date),
+                "&", ("write_date", "=", write_date), ("id", ">", record_id)]
+
+    def sync_model(self, model: str, full: bool = False) -> Dict[str, Any]:
+        """
+        Fetch records of ``model`` changed since its cursor (all of them if
+        ``full``) and upsert them.
+
+        Returns:
+            Counts of fetched/inserted/updated/unchanged/removed records, pages,
+            the ids that changed and the new cursor
+        """
+        config = self.models[model]
+        fields = list(dict.fromkeys(config["fields"] + ["write_date"]))
+        sync_token = time.time_ns()
+        if full:
+            write_date, record_id = None, 0
+        else:
+            cursor = self.store.cursor(model)
+            write_date, record_id = cursor["write_date"], cursor["record_id"]
+
+        # Sync reads must see Odoo as it is now, not a cached page; changes
+        # made in Odoo itself also make cached reports of dependent models stale
+        self.odoo.cache.invalidate(self.odoo._cache_namespace, model)
+
+        result = {"model": model, "full": full, "fetched": 0, "inserted": 0, "updated": 0,
+                  "unchanged": 0, "removed": 0, "pages": 0, "changed_ids": []}
+        started = time.perf_counter()
+        # Only the first page looks back; later pages continue from the page before
+        lookback = 0 if full else self.lookback
+        try:
+            while True:
+                page = self.odoo._execute(
+                    model, "search_read",
+                    config["domain"] + self._after_cursor(write_date, record_id, lookback),
+                    fields,
+                    limit=self.page_size,
+                    order="write_date asc, id asc",
+                )
+                result["pages"] += 1
+                if not page:
+                    break
+                outcome = self.store.upsert_page(model, page, sync_token)
+                result["fetched"] += len(page)
+                for key, ids in outcome.items():
+                    result[key] += len(ids)
+                result["changed_ids"].extend(outcome["inserted"] + outcome["updated"])
+                write_date, record_id = page[-1].get("write_date"), page[-1]["id"]
+                lookback = 0
+                if len(page) < self.page_size:
+                    break
+        except Exception as e:
+            # Pages already stored keep their cursor; the next sync resumes there
+            self.store.record_error(model, str(e))
+            logger.error(f"Sync of {model} stopped after {result['pages']} pages: {e}")
+            raise
+
+        if full:
+            result["removed"] = self.store.drop_unseen(model, sync_token)
+        self.store.mark_synced(model, full=full)
+        result["cursor"] = {"write_date": write_date, "record_id": record_id}
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(
+            f"Synced {model}{' (full)' if full else ''}: {result['fetched']} fetched, "
+            f"{result['inserted']} new, {result['updated']} changed, {result['removed']} removed "
+            f"in {result['pages']} pages"
+        )
+        return result
+
+    def sync(self, models: Iterable[str] = None, full: bool = False) -> Dict[str, Any]:
+        """Sync every configured model; a failing model does not stop the others."""
+        results, errors = {}, {}
+        for model in models or self.models:
+            try:
+                results[model] = self.sync_model(model, full=full)
+            except Exception as e:
+                errors[model] = str(e)
+        return {
+            "status": "success" if not errors else ("partial" if results else "error"),
+            "models": results,
+            "errors": errors,
+            "changed": sum(r["inserted"] + r["updated"] + r["removed"] for r in results.values()),
+        }
+
+
+# ==================== VAULT SUMMARIES ====================
+
+def _partner_name(value: Any) -> str:
+    return value[1] if isinstance(value, list) and len(value) > 1 else "Unknown"
+
+
+def render_invoice_summary(invoices: List[Dict[str, Any]], today: str = None) -> str:
+    """Markdown body summarising synced customer invoices."""
+    today = today or datetime.now().strftime("%Y-%m-%d")
+    customer = [inv for inv in invoices if inv.get("move_type") in ("out_invoice", "out_refund")]
+    by_state: Dict[str, Tuple[int, float]] = {}
+    for inv in customer:
+        count, total = by_state.get(inv.get("state") or "draft", (0, 0.0))
+        by_state[inv.get("state") or "draft"] = (count + 1, total + (inv.get("amount_total") or 0.0))
+
+    open_invoices = [inv for inv in customer if inv.get("state") == "posted" and (inv.get("amount_residual") or 0) > 0]
+    overdue = sorted(
+        (inv for inv in open_invoices if inv.get("invoice_date_due") and inv["invoice_date_due"] < today),
+        key=lambda inv: inv["invoice_date_due"],
+    )
+    recent = sorted(customer, key=lambda inv: (inv.get("invoice_date") or "", inv["id"]), reverse=True)[:20]
+
+    lines = ["# Odoo Invoices", "", "## By State", "", "| State | Invoices | Total |", "|-------|----------|-------|"]
+    for state, (count, total) in sorted(by_state.items()):
+        lines.append(f"| {state} | {count} | ${total:,.2f} |")
+    lines += [
+        "",
+        f"**Outstanding receivables:** ${sum(inv['amount_residual'] for inv in open_invoices):,.2f} "
+        f"({len(open_invoices)} invoices)",
+        "",
+        f"## Overdue ({len(overdue)})",
+        "",
+    ]
+    if overdue:
+        lines += ["| Invoice | Customer | Due | Residual |", "|---------|----------|-----|----------|"]
+        lines += [
+            f"| {inv.get('name')} | {_partner_name(inv.get('partner_id'))} | {inv['invoice_date_due']} | "
+            f"${inv['amount_residual']:,.2f} |"
+            for inv in overdue
+        ]
+    else:
+        lines.append("*No overdue invoices.*")
+    lines += ["", "## Recent Invoices", "", "| Invoice | Customer | Date | Amount | Status |",
+              "|---------|----------|------|--------|--------|"]
+    lines += [
+        f"| {inv.get('name')} | {_partner_name(inv.get('partner_id'))} | {inv.get('invoice_date') or ''} | "
+        f"${inv.get('amount_total') or 0:,.2f} | {inv.get('payment_state') or inv.get('state')} |"
+        for inv in recent
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def render_profit_loss(report: Dict[str, Any]) -> str:
+    """Markdown body for a profit and loss report."""
+    lines = [
+        "# Odoo Profit & Loss",
+        "",
+        f"**Period:** {report.get('period', '')}",
+        "",
+        f"- Income: ${report.get('income', 0):,.2f}",
+        f"- Expenses: ${report.get('expenses', 0):,.2f}",
+        f"- Net Profit: ${report.get('net_profit', 0):,.2f}",
+        "",
+        "| Account | Name | Balance |",
+        "|---------|------|---------|",
+    ]
+    lines += [f"| {a['code']} | {a['name']} | ${a['balance']:,.2f} |" for a in report.get("accounts", [])]
+    return "\n".join(lines) + "\n"
+
+
+def _header(doc_type: str, **fields) -> str:
+    meta = "\n".join(f"{key}: {value}" for key, value in fields.items())
+    return f"---\ntype: {doc_type}\ngenerated: {datetime.now().isoformat()}\n{meta}\n---\n\n"
+
+
+def sync_odoo_to_vault(odoo, accounting_path: Path, full: bool = False,
+                       store: "OdooLedgerStore" = None) -> Dict[str, Any]:
+    """
+    Incrementally sync Odoo into the local ledger and refresh the vault
+    summaries that changed.
+
+    Args:
+        odoo: OdooMCPServer
+        accounting_path: Vault folder for the summaries (e.g. Accounting/)
+        full: Resync everything from scratch instead of from the cursors
+        store: Ledger store (default: the shared one)
+
+    Returns:
+        Dict with the sync result and the summary files written
+    """
+    engine = OdooSyncEngine(odoo, store=store)
+    sync = engine.sync(full=full)
+    store = engine.store
+    written = []
+
+    invoices = store.records("account.move")
+    invoice_body = render_invoice_summary(invoices)
+    if store.write_if_changed("invoices", accounting_path / "Odoo_Invoices.md",
+                              _header("odoo_invoices_summary", count=len(invoices)), invoice_body):
+        written.append("Odoo_Invoices.md")
+
+    # Posted invoices drive the P&L: skip the report when none changed
+    move_sync = sync["models"].get("account.move", {})
+    report_path = accounting_path / "Odoo_Profit_Loss.md"
+    if full or move_sync.get("changed_ids") or move_sync.get("removed") or not report_path.exists():
+        report = odoo.get_financial_report(report_type="profit_loss")
+        if report.get("status") == "success":
+            if store.write_if_changed("profit_loss", report_path,
+                                      _header("odoo_financial_report", report_type="profit_loss"),
+                                      render_profit_loss(report)):
+                written.append("Odoo_Profit_Loss.md")
+
+    logger.info(f"Odoo vault sync: {sync['changed']} records changed, "
+                f"{len(written)} summaries written ({', '.join(written) or 'none'})")
+    return {**sync, "written": written}
+
+
+_odoo_ledger_store = None
+_odoo_ledger_store_lock = threading.Lock()
+
+
+def get_odoo_ledger_store() -> OdooLedgerStore:
+    """Get singleton Odoo ledger store."""
+    global _odoo_ledger_store
+    with _odoo_ledger_store_lock:
+        if _odoo_ledger_store is None:
+            _odoo_ledger_store = OdooLedgerStore()
+        return _odoo_ledger_store
+
+
+if __name__ == "__main__":
+    from scripts.odoo_mcp_server import get_odoo_client
+
+    parser = argparse.ArgumentParser(description="Sync Odoo invoices and payments into the vault")
+    parser.add_argument("--full", action="store_true", help="Resync everything instead of from the cursors")
+    parser.add_argument("--vault", default=str(PROJECT_ROOT / "AI_Employee_Vault"), help="Vault path")
+    args = parser.parse_args()
+
+    outcome = sync_odoo_to_vault(get_odoo_client(), Path(args.vault) / "Accounting", full=args.full)
+    print(json.dumps({k: v for k, v in outcome.items() if k != "models"}, indent=2))
+    for name, info in outcome["models"].items():
+        print(f"{name}: {info['fetched']} fetched, {info['inserted']} new, {info['updated']} changed, "
+              f"{info['removed']} removed")
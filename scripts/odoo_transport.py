@@ -0,0 +1,284 @@
+"""
+Odoo Transport - Pooled, Keep-Alive RPC for OdooMCPServer
+
+``xmlrpc.client.ServerProxy`` opens a new HTTP connection per call (its
+one cached connection is not thread-safe to share), and every
+``OdooMCPServer()`` logged in again. This module provides:
+
+- a thread-safe pool of persistent HTTP/1.1 connections per Odoo URL
+  (idle connections are reused; a connection the server closed while idle
+  is replaced transparently)
+- gzip-compressed responses (``Accept-Encoding: gzip``)
+- XML-RPC or JSON-RPC framing over the same pool (ODOO_PROTOCOL);
+  JSON-RPC errors are raised as ``xmlrpc.client.Fault`` so callers handle
+  both protocols alike
+- a process-wide cache of session uids, so constructing another
+  ``OdooMCPServer`` does not log in again
+- per-client call statistics (connections opened/reused, avg ms per call)
+
+Usage:
+    from scripts.odoo_transport import get_rpc_client
+
+    rpc = get_rpc_client("http://localhost:8069", protocol="jsonrpc")
+    uid = rpc.login(db, username, password)
+    ids = rpc.execute_kw(db, uid, password, "res.partner", "search", [[]], {"limit": 5})
+"""
+
+import gzip
+import hashlib
+import http.client
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+import xmlrpc.client
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+DEFAULT_PROTOCOL = os.getenv("ODOO_PROTOCOL", "xmlrpc").lower()
+DEFAULT_POOL_SIZE = int(os.getenv("ODOO_POOL_SIZE", "4"))
+DEFAULT_TIMEOUT = 60
+
+PROTOCOLS = ("xmlrpc", "jsonrpc")
+
+# Fault code Odoo's XML-RPC endpoint uses for AccessDenied
+ACCESS_DENIED_FAULT = 3
+
+# Errors that mean a reused keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+
+class ConnectionPool:
+    """Thread-safe pool of persistent HTTP connections to one host."""
+
+    def __init__(self, url: str, size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT):
+        parts = urlsplit(url)
+        self.url = url.rstrip("/")
+        self.base_path = parts.path.rstrip("/")
+        self._connection_class = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port
+        self.size = size
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._stats_lock = threading.Lock()
+        self.opened = 0
+        self.reused = 0
+        self.requests = 0
+        self.bytes_received = 0
+        self.total_ms = 0.0
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        with self._stats_lock:
+            self.opened += 1
+        return self._connection_class(self._host, self._port, timeout=self.timeout)
+
+    def _checkout(self) -> Tuple[http.client.HTTPConnection, bool]:
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            return self._new_connection(), False
+        with self._stats_lock:
+            self.reused += 1
+        return conn, True
+
+    def post(self, path: str, body: bytes, content_type: str) -> bytes:
+        """
+        POST ``body`` and return the (decompressed) response body.
+
+        Raises:
+            xmlrpc.client.ProtocolError: On a non-200 HTTP status
+            OSError: On connection failures
+        """
+        headers = {
+            "Content-Type": content_type,
+            "Accept-Encoding": "gzip",
+            "Connection": "keep-alive",
+        }
+        full_path = self.base_path + path
+        started = time.perf_counter()
+        self._slots.acquire()
+        try:
+            conn, reused = self._checkout()
+            try:
+                response, data = self._send(conn, full_path, body, headers)
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                # The server dropped an idle connection before reading the
+                # request, so sending it again on a fresh one is safe
+                conn = self._new_connection()
+                response, data = self._send(conn, full_path, body, headers)
+            except Exception:
+                conn.close()
+                raise
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+        with self._stats_lock:
+            self.requests += 1
+            self.bytes_received += len(data)
+            self.total_ms += (time.perf_counter() - started) * 1000
+
+        if response.status != 200:
+            raise xmlrpc.client.ProtocolError(
+                self.url + path, response.status, response.reason, dict(response.getheaders())
+            )
+        if response.getheader("Content-Encoding", "").lower() == "gzip":
+            data = gzip.decompress(data)
+        return data
+
+    def _send(self, conn, path: str, body: bytes, headers: Dict[str, str]):
+        conn.request("POST", path, body, headers)
+        response = conn.getresponse()
+        return response, response.read()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "requests": self.requests,
+                "connections_opened": self.opened,
+                "connections_reused": self.reused,
+                "idle_connections": self._idle.qsize(),
+                "bytes_received": self.bytes_received,
+                "avg_ms": round(self.total_ms / self.requests, 2) if self.requests else 0.0,
+            }
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class OdooRPCClient:
+    """Odoo external API over a pooled connection, in XML-RPC or JSON-RPC."""
+
+    def __init__(
+        self,
+        url: str,
+        protocol: str = DEFAULT_PROTOCOL,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        if protocol not in PROTOCOLS:
+            raise ValueError(f"Unknown Odoo protocol '{protocol}' (use one of {', '.join(PROTOCOLS)})")
+        self.url = url.rstrip("/")
+        self.protocol = protocol
+        self.pool = ConnectionPool(self.url, size=pool_size, timeout=timeout)
+        self._ids = itertools.count(1)
+
+    def call(self, service: str, method: str, *args) -> Any:
+        """
+        Call ``service.method(*args)`` ("common" or "object" service).
+
+        Raises:
+            xmlrpc.client.Fault: If Odoo answered with an error
+        """
+        if self.protocol == "jsonrpc":
+            return self._call_jsonrpc(service, method, args)
+        body = xmlrpc.client.dumps(args, method, allow_none=True).encode("utf-8")
+        data = self.pool.post(f"/xmlrpc/2/{service}", body, "text/xml")
+        # loads() raises Fault for fault responses
+        return xmlrpc.client.loads(data, use_builtin_types=True)[0][0]
+
+    def _call_jsonrpc(self, service: str, method: str, args: tuple) -> Any:
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {"service": service, "method": method, "args": list(args)},
+            "id": next(self._ids),
+        }
+        data = self.pool.post("/jsonrpc", json.dumps(payload).encode("utf-8"), "application/json")
+        reply = json.loads(data)
+        error = reply.get("error")
+        if error:
+            details = error.get("data") or {}
+            code = error.get("code", 1)
+            if details.get("name") == "odoo.exceptions.AccessDenied":
+                code = ACCESS_DENIED_FAULT  # same fault code as the XML-RPC endpoint
+            raise xmlrpc.client.Fault(
+                code,
+                details.get("message") or error.get("message", "Odoo error"),
+            )
+        return reply.get("result")
+
+    def login(self, db: str, username: str, password: str) -> int:
+        """Authenticate and return the user id (0/False if rejected)."""
+        return self.call("common", "authenticate", db, username, password, {})
+
+    def version(self) -> Dict[str, Any]:
+        return self.call("common", "version")
+
+    def execute_kw(self, db: str, uid: int, password: str, model: str, method: str,
+                   args: Any, kwargs: Optional[Dict[str, Any]] = None) -> Any:
+        return self.call("object", "execute_kw", db, uid, password, model, method, list(args), kwargs or {})
+
+    def stats(self) -> Dict[str, Any]:
+        return {"url": self.url, "protocol": self.protocol, **self.pool.stats()}
+
+    def close(self):
+        self.pool.close()
+
+
+_clients: Dict[Tuple[str, str], OdooRPCClient] = {}
+_uids: Dict[Tuple[str, str, str, str], int] = {}
+_clients_lock = threading.Lock()
+
+
+def get_rpc_client(url: str, protocol: str = None) -> OdooRPCClient:
+    """Get the shared pooled client for an Odoo URL and protocol."""
+    key = (url.rstrip("/"), (protocol or DEFAULT_PROTOCOL).lower())
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = OdooRPCClient(key[0], protocol=key[1])
+        return client
+
+
+def _uid_key(url: str, db: str, username: str, password: str) -> Tuple[str, str, str, str]:
+    return (url.rstrip("/"), db, username, hashlib.sha256(password.encode("utf-8")).hexdigest())
+
+
+def cached_login(client: OdooRPCClient, db: str, username: str, password: str, refresh: bool = False) -> int:
+    """
+    Session uid for these credentials, logging in only if not cached
+    (or when ``refresh`` is set, e.g. after the session expired).
+    """
+    key = _uid_key(client.url, db, username, password)
+    if not refresh:
+        with _clients_lock:
+            uid = _uids.get(key)
+        if uid:
+            return uid
+    uid = client.login(db, username, password)
+    with _clients_lock:
+        if uid:
+            _uids[key] = uid
+        else:
+            _uids.pop(key, None)
+    return uid
+
+
+def transport_stats() -> Dict[str, Any]:
+    """Stats of every shared Odoo client."""
+    with _clients_lock:
+        clients = list(_clients.values())
+    return {f"{c.url} ({c.protocol})": c.stats() for c in clients}
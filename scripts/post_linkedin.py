@@ -27,6 +27,11 @@ from playwright._impl._errors import Error as PlaywrightError
 
 # Paths - resolved relative to this script's location
 BASE_DIR = Path(__file__).resolve().parent.parent
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from scripts.resilience import circuit_protected
+
 LOG_DIR = BASE_DIR / "logs"
 LOG_FILE = LOG_DIR / "actions.log"
 
@@ -51,10 +56,12 @@ def log_action(message: str, level: str = "INFO"):
         print(message)
 
 
+@circuit_protected("linkedin", error_result=True)
 def post_linkedin(post_content: str, headless: bool = False, slow_mo: int = 0) -> dict:
     """
     Post content to LinkedIn using Playwright browser automation.
     Updated for LinkedIn 2026 UI with stable selectors and extended timeouts.
+    Protected by the "linkedin" circuit breaker.
 
     Args:
         post_content: The text content to post to LinkedIn
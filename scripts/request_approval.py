@@ -3,7 +3,8 @@ Human Approval Agent Skill - Silver Tier
 
 This module implements a blocking human-in-the-loop approval workflow.
 It monitors the Needs_Approval folder, blocks execution until human writes
-APPROVED or REJECTED in the file, and handles timeouts.
+APPROVED or REJECTED in the file, and handles timeouts. Waiting is done by
+the event-driven ApprovalManager (scripts/approval_manager.py).
 
 Usage:
     python scripts/request_approval.py --file <path_to_approval_file> [--timeout 3600]
@@ -17,7 +18,6 @@ Features:
 
 import sys
 import os
-import time
 import shutil
 import argparse
 from datetime import datetime, timedelta
@@ -185,64 +185,55 @@ def parse_timeout_extended(content: str) -> Optional[datetime]:
     return None
 
 
-def check_approval_status(file_path: Path) -> Tuple[ApprovalStatus, str]:
+def check_approval_status(file_path: Path, store=None) -> Tuple[ApprovalStatus, str]:
     """
     Check the approval status of a file.
     
+    Only the YAML frontmatter counts (``status: approved`` / ``status: rejected``);
+    the answer is recorded in the approval store, and the file is only
+    re-parsed when it has changed since the last check.
+    
     Args:
         file_path: Path to the approval file
+        store: ApprovalStore to use (default: the shared store)
         
     Returns:
         Tuple of (ApprovalStatus, reason/message)
     """
+    from scripts.approval_store import ApprovalState, get_approval_store
+
     if not file_path.exists():
         return (ApprovalStatus.REJECTED, "Approval file not found")
     
     try:
-        content = read_file(file_path)
+        record = (store or get_approval_store()).sync_file(file_path)
     except Exception as e:
         return (ApprovalStatus.REJECTED, f"Error reading file: {e}")
     
-    content_lower = content.lower()
-    
-    # Check for APPROVED status (case-insensitive)
-    if 'status: approved' in content_lower:
-        # Extract approval reason if present
-        reason = "Approved by human reviewer"
-        for line in content.split('\n'):
-            if line.lower().startswith('approval_reason:') or line.lower().startswith('approved_reason:'):
-                reason = line.split(':', 1)[1].strip()
-                break
-        return (ApprovalStatus.APPROVED, reason)
-    
-    # Check for REJECTED status (case-insensitive)
-    if 'status: rejected' in content_lower:
-        # Extract rejection reason if present
-        reason = "Rejected by human reviewer"
-        for line in content.split('\n'):
-            if line.lower().startswith('rejection_reason:') or line.lower().startswith('rejected_reason:'):
-                reason = line.split(':', 1)[1].strip()
-                break
-        return (ApprovalStatus.REJECTED, reason)
-    
-    # Check for explicit REJECT without 'ed'
-    if 'status: reject' in content_lower:
-        return (ApprovalStatus.REJECTED, "Rejected by human reviewer")
+    if record is None:
+        return (ApprovalStatus.REJECTED, "Approval file not found")
+    # Executed/failed approvals were approved by the human
+    if record.state in (ApprovalState.APPROVED, ApprovalState.EXECUTED, ApprovalState.FAILED):
+        return (ApprovalStatus.APPROVED, record.reason)
+    if record.state == ApprovalState.REJECTED:
+        return (ApprovalStatus.REJECTED, record.reason)
+    if record.state == ApprovalState.TIMEOUT:
+        return (ApprovalStatus.TIMEOUT, record.reason)
     
     # Default: pending
     return (ApprovalStatus.PENDING, "Waiting for human response")
 
 
-def rename_and_move_file(file_path: Path, status: ApprovalStatus) -> bool:
+def approval_destination(file_path: Path, status: ApprovalStatus) -> Optional[Path]:
     """
-    Rename file based on approval status and move to appropriate folder.
+    Compute the renamed destination path for a resolved approval file.
     
     Args:
         file_path: Path to the approval file
         status: Approval status
         
     Returns:
-        True if successful, False otherwise
+        Destination file path, or None for an unknown status
     """
     # Determine destination folder and suffix
     if status == ApprovalStatus.APPROVED:
@@ -256,7 +247,7 @@ def rename_and_move_file(file_path: Path, status: ApprovalStatus) -> bool:
         suffix = ".timeout"
     else:
         log_approval_action(f"Unknown status for file movement: {status}", level="ERROR")
-        return False
+        return None
     
     # Create new filename with suffix
     stem = file_path.stem
@@ -267,11 +258,32 @@ def rename_and_move_file(file_path: Path, status: ApprovalStatus) -> bool:
             break
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    new_filename = f"{stem}{suffix}_{timestamp}.md"
-    destination_path = destination / new_filename
+    return destination / f"{stem}{suffix}_{timestamp}.md"
+
+
+def rename_and_move_file(file_path: Path, status: ApprovalStatus) -> bool:
+    """
+    Rename file based on approval status and move to appropriate folder.
     
-    # Move the file
-    return move_file(file_path, destination_path)
+    Args:
+        file_path: Path to the approval file
+        status: Approval status
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    destination_path = approval_destination(file_path, status)
+    if destination_path is None:
+        return False
+    
+    # Move the file to its new name (not into a directory of that name)
+    try:
+        destination_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(file_path), str(destination_path))
+        return True
+    except Exception as e:
+        log_approval_action(f"Error moving file from {file_path} to {destination_path}: {e}", level="ERROR")
+        return False
 
 
 def request_approval(
@@ -282,14 +294,17 @@ def request_approval(
     """
     Request human approval and block until response or timeout.
     
-    This is the main entry point for the human-approval skill.
-    It blocks execution until a human writes APPROVED or REJECTED
-    in the file, or until the timeout is reached.
+    This is the blocking entry point for the human-approval skill. It is a
+    thin wrapper over the shared ApprovalManager: the file is registered
+    with the manager (which watches every pending approval at once) and the
+    calling thread waits on the returned future. Callers that must not
+    block should use ``get_approval_manager().watch()`` directly.
     
     Args:
         file_path: Path to the approval request file in Needs_Approval
         timeout_seconds: Timeout duration in seconds (default: 3600 = 1 hour)
-        poll_interval: Polling interval in seconds (default: 10)
+        poll_interval: Fallback polling interval in seconds when file system
+            events are unavailable (default: 10)
         
     Returns:
         Tuple of (ApprovalStatus, reason/message)
@@ -302,6 +317,8 @@ def request_approval(
         >>> if status == ApprovalStatus.APPROVED:
         ...     print(f"Approved: {reason}")
     """
+    from scripts.approval_manager import get_approval_manager
+
     # Convert to Path object
     approval_file = Path(file_path)
     
@@ -311,90 +328,10 @@ def request_approval(
         log_approval_action(error_msg, level="ERROR")
         return (ApprovalStatus.REJECTED, error_msg)
     
-    # Calculate timeout
-    start_time = datetime.now()
-    timeout_delta = timedelta(seconds=timeout_seconds)
-    timeout_time = start_time + timeout_delta
-    
-    # Parse any existing timeout from file
-    try:
-        content = read_file(approval_file)
-        file_timeout = parse_timeout_from_file(content)
-        if file_timeout:
-            # Check for timeout extension
-            extended_timeout = parse_timeout_extended(content)
-            if extended_timeout and extended_timeout > file_timeout:
-                timeout_time = extended_timeout
-            else:
-                timeout_time = file_timeout
-    except Exception as e:
-        log_approval_action(f"Error reading initial timeout from file: {e}", level="WARNING")
-    
-    # Log approval request
-    approval_id = approval_file.stem
-    log_approval_action(f"Approval request received: {approval_file.name}")
-    log_approval_action(f"Timeout set to: {timeout_time.isoformat()} (in {timeout_seconds} seconds)")
     log_approval_action("Blocking execution, waiting for human response...")
-    
-    # Main polling loop - BLOCKING
-    last_status = ApprovalStatus.PENDING
-    poll_count = 0
-    
-    while True:
-        current_time = datetime.now()
-        
-        # Check for timeout
-        if current_time >= timeout_time:
-            log_approval_action(f"TIMEOUT: No human response after {timeout_seconds} seconds", level="WARNING")
-            
-            # Rename and move file
-            if rename_and_move_file(approval_file, ApprovalStatus.TIMEOUT):
-                log_approval_action(f"File renamed and moved to: {REJECTED_PATH}")
-            
-            timeout_msg = f"Timeout after {timeout_seconds} seconds"
-            return (ApprovalStatus.TIMEOUT, timeout_msg)
-        
-        # Poll for status change
-        try:
-            status, reason = check_approval_status(approval_file)
-            
-            if status == ApprovalStatus.APPROVED:
-                log_approval_action(f"STATUS_CHANGE: APPROVED detected")
-                
-                # Rename and move file
-                if rename_and_move_file(approval_file, ApprovalStatus.APPROVED):
-                    log_approval_action(f"File renamed and moved to: {APPROVED_PATH}")
-                
-                log_approval_action(f"APPROVAL_COMPLETE: {approval_id} approved by human")
-                return (ApprovalStatus.APPROVED, reason)
-            
-            elif status == ApprovalStatus.REJECTED:
-                log_approval_action(f"STATUS_CHANGE: REJECTED detected - {reason}", level="WARNING")
-                
-                # Rename and move file
-                if rename_and_move_file(approval_file, ApprovalStatus.REJECTED):
-                    log_approval_action(f"File renamed and moved to: {REJECTED_PATH}")
-                
-                log_approval_action(f"APPROVAL_REJECTED: {approval_id} rejected by human - {reason}")
-                return (ApprovalStatus.REJECTED, reason)
-            
-            # Status changed from previous poll (e.g., file was modified but not yet approved/rejected)
-            if status != last_status:
-                log_approval_action(f"File modified, status: {status.value}")
-                last_status = status
-            
-        except Exception as e:
-            log_approval_action(f"Error checking approval status: {e}", level="ERROR")
-        
-        # Log polling activity periodically
-        poll_count += 1
-        if poll_count % 6 == 0:  # Log every minute (assuming 10-second poll interval)
-            elapsed = (current_time - start_time).total_seconds()
-            remaining = (timeout_time - current_time).total_seconds()
-            log_approval_action(f"Still waiting... Elapsed: {elapsed:.0f}s, Remaining: {remaining:.0f}s")
-        
-        # Wait before next poll
-        time.sleep(poll_interval)
+    manager = get_approval_manager(poll_interval=poll_interval)
+    result = manager.watch(approval_file, timeout_seconds=timeout_seconds).result()
+    return (result.status, result.reason)
 
 
 def main():
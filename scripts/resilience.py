@@ -0,0 +1,489 @@
+"""
+Resilience - Circuit Breakers, Jittered Backoff, Deadlines and Retry Budgets
+
+Shared protection for every MCP client that talks to an external service
+(Gmail, LinkedIn, Facebook/Instagram, Twitter, Odoo):
+
+    - Per-endpoint circuit breakers (closed -> open -> half-open). After
+      ``failure_threshold`` consecutive failures calls fail fast for
+      ``recovery_timeout`` seconds, then a single probe decides whether the
+      endpoint is back.
+    - Exponential backoff with full jitter (``random.uniform(0, min(cap,
+      base * 2**attempt))``), so retries from many workers spread out.
+    - Deadlines that propagate down the call stack (thread-local), so a
+      retry loop never sleeps past the time its caller is willing to wait.
+    - Per-endpoint retry budgets: retries may add at most ``ratio`` extra
+      load on top of first attempts, so an outage cannot multiply traffic.
+
+Breaker state changes are written to ``logs/circuit_breakers.json`` so
+other processes (health monitor, dashboard) can show them.
+
+Usage:
+    from scripts.resilience import circuit_protected, deadline, retry_call
+
+    @circuit_protected("odoo")
+    def call_odoo(...):
+        ...
+
+    with deadline(60):
+        result = retry_call(call_odoo, endpoint="odoo", max_attempts=4)
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BREAKER_STATE_PATH = PROJECT_ROOT / "logs" / "circuit_breakers.json"
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is refused because the endpoint's circuit is open."""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(f"Circuit for '{endpoint}' is open; retry in {retry_after:.0f}s")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(Exception):
+    """Raised when the caller's deadline has passed."""
+
+
+@dataclass
+class BreakerConfig:
+    """Thresholds of one endpoint's circuit breaker."""
+    failure_threshold: int = 5      # Consecutive failures that open the circuit
+    recovery_timeout: float = 30.0  # Seconds open before a half-open probe
+    half_open_max_calls: int = 1    # Concurrent probes while half-open
+
+
+DEFAULT_BREAKERS = {
+    "gmail": BreakerConfig(failure_threshold=5, recovery_timeout=30.0),
+    "linkedin": BreakerConfig(failure_threshold=3, recovery_timeout=300.0),
+    "facebook": BreakerConfig(failure_threshold=3, recovery_timeout=300.0),
+    "instagram": BreakerConfig(failure_threshold=3, recovery_timeout=300.0),
+    "twitter": BreakerConfig(failure_threshold=3, recovery_timeout=300.0),
+    "odoo": BreakerConfig(failure_threshold=5, recovery_timeout=30.0),
+}
+
+
+# ==================== DEADLINES ====================
+
+_local = threading.local()
+
+
+def current_deadline() -> Optional[float]:
+    """Monotonic time by which the current call must finish, or None."""
+    return getattr(_local, "deadline", None)
+
+
+def time_remaining() -> Optional[float]:
+    """Seconds left before the current deadline (None if there is none)."""
+    expires = current_deadline()
+    return None if expires is None else expires - time.monotonic()
+
+
+def check_deadline(operation: str = "call"):
+    """Raise DeadlineExceeded if the current deadline has already passed."""
+    remaining = time_remaining()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceeded(f"Deadline exceeded before {operation}")
+
+
+@contextmanager
+def deadline(seconds: Optional[float]):
+    """
+    Run a block under a deadline.
+
+    Nested deadlines can only shorten the outer one. ``None`` keeps the
+    outer deadline (if any).
+    """
+    outer = current_deadline()
+    if seconds is None:
+        expires = outer
+    else:
+        expires = time.monotonic() + seconds
+        if outer is not None:
+            expires = min(expires, outer)
+    _local.deadline = expires
+    try:
+        yield expires
+    finally:
+        _local.deadline = outer
+
+
+# ==================== BACKOFF AND RETRY BUDGETS ====================
+
+def full_jitter_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """
+    Backoff delay before retry number ``attempt`` (0-based).
+
+    Returns a uniform random delay between 0 and ``min(cap, base * 2**attempt)``.
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of first attempts.
+
+    Every first attempt deposits ``ratio`` tokens (up to ``max_tokens``);
+    every retry spends one. ``min_per_sec`` tokens trickle in regardless, so
+    a quiet endpoint can still retry occasionally.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_sec: float = 0.1, max_tokens: float = 10.0):
+        self.ratio = ratio
+        self.min_per_sec = min_per_sec
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._updated) * self.min_per_sec)
+        self._updated = now
+
+    def deposit(self):
+        """Record a first attempt."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take a token for a retry; False if the budget is exhausted."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+# ==================== CIRCUIT BREAKER ====================
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker for one endpoint."""
+
+    def __init__(self, name: str, config: Optional[BreakerConfig] = None,
+                 on_change: Optional[Callable[["CircuitBreaker"], None]] = None):
+        self.name = name
+        self.config = config or BreakerConfig()
+        self._on_change = on_change
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._opened_wall = ""
+        self._half_open_calls = 0
+        self._last_error = ""
+        self._stats = {"calls": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self):
+        if (self._state == CircuitState.OPEN
+                and time.monotonic() - self._opened_at >= self.config.recovery_timeout):
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_calls = 0
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit allows a probe (0 if calls are allowed)."""
+        with self._lock:
+            if self._state != CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self.config.recovery_timeout - (time.monotonic() - self._opened_at))
+
+    def allow(self) -> bool:
+        """Reserve a call; False if the circuit refuses it."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CircuitState.CLOSED:
+                self._stats["calls"] += 1
+                return True
+            if self._state == CircuitState.HALF_OPEN and self._half_open_calls < self.config.half_open_max_calls:
+                self._half_open_calls += 1
+                self._stats["calls"] += 1
+                return True
+            self._stats["rejected"] += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            changed = self._state != CircuitState.CLOSED
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._half_open_calls = 0
+        if changed:
+            self._notify()
+
+    def record_failure(self, error: str = ""):
+        with self._lock:
+            self._failures += 1
+            self._stats["failures"] += 1
+            self._last_error = error[:300]
+            opened = (
+                self._state == CircuitState.HALF_OPEN
+                or (self._state == CircuitState.CLOSED and self._failures >= self.config.failure_threshold)
+            )
+            if opened:
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+                self._opened_wall = datetime.now().isoformat()
+                self._half_open_calls = 0
+                self._stats["opened"] += 1
+        if opened:
+            self._notify()
+
+    @contextmanager
+    def guard(self, ignore: Tuple[Type[BaseException], ...] = ()):
+        """
+        Run a block through the breaker.
+
+        Args:
+            ignore: Exceptions that mean the endpoint answered (e.g. a
+                server-side validation fault); they propagate but do not
+                count as failures
+
+        Raises:
+            CircuitOpenError: If the circuit refuses the call
+        """
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_after())
+        try:
+            yield self
+        except ignore:
+            self.record_success()
+            raise
+        except Exception as e:
+            self.record_failure(str(e))
+            raise
+        self.record_success()
+
+    def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call ``fn`` through the breaker (see guard())."""
+        with self.guard():
+            return fn(*args, **kwargs)
+
+    def reset(self):
+        """Force the circuit closed (e.g. after manual recovery)."""
+        self.record_success()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """State, counters and last error, for health reporting."""
+        state = self.state
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": state.value,
+                "consecutive_failures": self._failures,
+                "failure_threshold": self.config.failure_threshold,
+                "recovery_timeout": self.config.recovery_timeout,
+                "opened_at": self._opened_wall if state != CircuitState.CLOSED else "",
+                "last_error": self._last_error,
+                "pid": os.getpid(),
+                "updated_at": datetime.now().isoformat(),
+                **self._stats,
+            }
+
+    def _notify(self):
+        if self._on_change:
+            try:
+                self._on_change(self)
+            except Exception:
+                pass
+
+
+# ==================== REGISTRY ====================
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_budgets: Dict[str, RetryBudget] = {}
+_registry_lock = threading.Lock()
+_state_file_lock = threading.Lock()
+
+
+def _breaker_config_from_env() -> Dict[str, BreakerConfig]:
+    raw = os.getenv("CIRCUIT_BREAKERS")
+    if not raw:
+        return {}
+    try:
+        return {name: BreakerConfig(**settings) for name, settings in json.loads(raw).items()}
+    except (ValueError, TypeError):
+        return {}
+
+
+def _persist_state(breaker: CircuitBreaker):
+    """Merge one breaker's snapshot into the shared state file."""
+    with _state_file_lock:
+        try:
+            states = read_breaker_states()
+            states[breaker.name] = breaker.snapshot()
+            BREAKER_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp = BREAKER_STATE_PATH.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(states, indent=2), encoding="utf-8")
+            os.replace(tmp, BREAKER_STATE_PATH)
+        except OSError:
+            pass
+
+
+def get_circuit_breaker(endpoint: str) -> CircuitBreaker:
+    """Get (or create) the circuit breaker for an endpoint."""
+    with _registry_lock:
+        breaker = _breakers.get(endpoint)
+        if breaker is None:
+            config = _breaker_config_from_env().get(endpoint) or DEFAULT_BREAKERS.get(endpoint) or BreakerConfig()
+            breaker = CircuitBreaker(endpoint, config, on_change=_persist_state)
+            _breakers[endpoint] = breaker
+        return breaker
+
+
+def get_retry_budget(endpoint: str) -> RetryBudget:
+    """Get (or create) the retry budget for an endpoint."""
+    with _registry_lock:
+        budget = _budgets.get(endpoint)
+        if budget is None:
+            budget = _budgets[endpoint] = RetryBudget()
+        return budget
+
+
+def breaker_states() -> Dict[str, Dict[str, Any]]:
+    """Snapshots of this process's circuit breakers."""
+    with _registry_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
+
+
+def read_breaker_states(path: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Last reported breaker states from all processes.
+
+    Open circuits whose recovery timeout has elapsed are reported as
+    half-open, since the next call will probe the endpoint.
+    """
+    try:
+        states = json.loads(Path(path or BREAKER_STATE_PATH).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    now = datetime.now()
+    for state in states.values():
+        if state.get("state") == CircuitState.OPEN.value and state.get("opened_at"):
+            try:
+                opened = datetime.fromisoformat(state["opened_at"])
+            except ValueError:
+                continue
+            if (now - opened).total_seconds() >= state.get("recovery_timeout", 0):
+                state["state"] = CircuitState.HALF_OPEN.value
+    return states
+
+
+# ==================== CALL WRAPPERS ====================
+
+def is_error_result(result: Any) -> bool:
+    """True for the MCP clients' error dicts (``status: error`` / ``success: False``)."""
+    return isinstance(result, dict) and (result.get("status") == "error" or result.get("success") is False)
+
+
+def circuit_protected(endpoint: str, error_result: bool = False):
+    """
+    Decorator routing a client call through its endpoint's circuit breaker.
+
+    Args:
+        endpoint: Breaker name (e.g. "gmail", "odoo")
+        error_result: The function reports failures as ``{"status": "error"}``
+            dicts instead of raising. Such results count as failures, and an
+            open circuit returns an error dict (with ``circuit_open: True``)
+            instead of raising CircuitOpenError.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            breaker = get_circuit_breaker(endpoint)
+            remaining = time_remaining()
+            if remaining is not None and remaining <= 0:
+                if error_result:
+                    return {"status": "error", "message": f"Deadline exceeded before {endpoint} call"}
+                raise DeadlineExceeded(f"Deadline exceeded before {endpoint} call")
+            if not breaker.allow():
+                if error_result:
+                    return {
+                        "status": "error",
+                        "message": str(CircuitOpenError(endpoint, breaker.retry_after())),
+                        "circuit_open": True,
+                    }
+                raise CircuitOpenError(endpoint, breaker.retry_after())
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                breaker.record_failure(str(e))
+                raise
+            if error_result and is_error_result(result):
+                breaker.record_failure(str(result.get("message") or result.get("error", "")))
+            else:
+                breaker.record_success()
+            return result
+        return wrapper
+    return decorator
+
+
+def retry_call(
+    fn: Callable[..., Any],
+    *args,
+    endpoint: str,
+    max_attempts: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    **kwargs,
+) -> Any:
+    """
+    Call ``fn`` with jittered exponential backoff.
+
+    Retries stop when attempts run out, the endpoint's retry budget is
+    spent, its circuit opens, or the next backoff would overrun the current
+    deadline; the last error is then raised.
+    """
+    budget = get_retry_budget(endpoint)
+    budget.deposit()
+    attempt = 0
+    while True:
+        check_deadline(f"{endpoint} call")
+        try:
+            return fn(*args, **kwargs)
+        except CircuitOpenError:
+            raise
+        except retry_on:
+            attempt += 1
+            if attempt >= max_attempts or not budget.try_spend():
+                raise
+            delay = full_jitter_delay(attempt - 1, base_delay, max_delay)
+            remaining = time_remaining()
+            if remaining is not None and delay >= remaining:
+                raise
+            time.sleep(delay)
@@ -256,43 +256,19 @@ def run_task_planner(file_name: str) -> bool:
     logger.info(f"--- Starting task-planner for: {file_name} ---")
     
     try:
-        from claude_sdk_wrapper import T
-        
-        plan_prompt = f"""Process the task file '{file_name}' located in AI_Employee_Vault/Needs_Action.
+        from skills.task_planner_skill import plan_task_once
 
-Your responsibilities:
-1. Read and analyze the content of the task file
-2. Generate a detailed, step-by-step implementation plan
-3. Return the plan in markdown format with clear sections and checkboxes for action items.
+        # Single-flight: joins an in-flight plan or reuses the existing plan
+        # when another trigger already planned this exact file content
+        plan_result = plan_task_once(file_name, description=f"Process task file: {file_name}")
 
-File to process: {file_name}
-"""
-        
-        # Use T class to spawn the task-planner subagent
-        task = T(
-            description=f"Process task file: {file_name}",
-            prompt=plan_prompt,
-            subagent_type='task-planner',
-            model='opus',
-            run_in_background=False,
-            allowed_tools=["Read", "Write", "Glob", "Edit", "Bash", "Skill"],
-            system_prompt="""You are a task-planner specialist for the AI Employee system.
-Your role is to analyze task files in Needs_Action and generate detailed implementation plans.
-Always save plans as Plan_*.md files in the Needs_Action folder."""
-        )
-        
-        logger.info(f"Task-planner completed for {file_name}. Task ID: {task.task_id}")
-        
-        if task.output:
-            # Save the plan
-            from skills.vault_skills import get_vault
-            vault = get_vault()
-            plan_result = vault.write_plan(file_name, task.output)
+        # Only an existing plan file counts; "in progress elsewhere" is not a plan yet
+        if plan_result and "Error" not in plan_result and Path(plan_result).is_file():
             logger.info(f"Plan saved: {plan_result}")
             logger.info(f"--- task-planner completed for: {file_name} ---")
             return True
         else:
-            logger.warning(f"No plan content generated for {file_name}")
+            logger.warning(f"No plan generated for {file_name}: {plan_result}")
             return False
     
     except Exception as e:
@@ -350,6 +326,10 @@ def run_cycle(cycle_number: int):
     start_time = datetime.now()
     
     try:
+        # Step 0: Resume plans interrupted by a previous run
+        from skills.task_planner_skill import resume_interrupted_plans
+        resume_interrupted_plans()
+
         # Step 1: Run vault-watcher
         run_vault_watcher_cycle()
         
@@ -17,6 +17,7 @@ import sys
 import os
 import base64
 import pickle
+import threading
 from pathlib import Path
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -34,6 +35,12 @@ from googleapiclient.errors import HttpError
 
 # Configuration - resolved relative to this script's location (not current working directory)
 BASE_DIR = Path(__file__).resolve().parent.parent
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from scripts.mcp_client_registry import is_auth_error
+from scripts.resilience import circuit_protected
+
 CREDENTIALS_FILE = BASE_DIR / "gmail_credentials.json"
 CLIENT_SECRET_FILE = BASE_DIR / "client_secret.json"
 TOKEN_FILE = BASE_DIR / "token.pickle"
@@ -46,6 +53,9 @@ ACTION_LOG_PATH = VAULT_PATH / "Logs" / "actions.log"
 # Ensure log directory exists
 ACTION_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
+# Authenticated service per thread (googleapiclient services are not thread-safe)
+_service_cache = threading.local()
+
 
 def log_action(message: str, level: str = "INFO"):
     """Log action to actions.log file."""
@@ -134,9 +144,17 @@ def get_gmail_service() -> Optional[Any]:
     """
     Build Gmail API service with OAuth2 credentials.
 
+    The service is cached per thread and reused while its credentials are
+    valid, so long-lived executor workers authenticate once.
+
     Returns:
         Gmail API service object or None if authentication fails
     """
+    cached = getattr(_service_cache, "service", None)
+    cached_creds = getattr(_service_cache, "creds", None)
+    if cached is not None and cached_creds is not None and cached_creds.valid:
+        return cached
+
     try:
         creds = get_credentials()
 
@@ -145,6 +163,8 @@ def get_gmail_service() -> Optional[Any]:
             return None
 
         service = build("gmail", "v1", credentials=creds)
+        _service_cache.service = service
+        _service_cache.creds = creds
         log_action("Gmail API service initialized successfully")
         return service
 
@@ -177,10 +197,14 @@ def create_message(to: str, subject: str, body: str, html: bool = False) -> MIME
     return message
 
 
+@circuit_protected("gmail", error_result=True)
 def send_gmail_email(to: str, subject: str, body: str, html: bool = False) -> Dict[str, Any]:
     """
     Send email via Gmail API.
 
+    Calls go through the "gmail" circuit breaker: while Gmail is failing,
+    sends are refused immediately with ``circuit_open: True``.
+
     Args:
         to: Recipient email address
         subject: Email subject
@@ -225,14 +249,16 @@ def send_gmail_email(to: str, subject: str, body: str, html: bool = False) -> Di
         log_action(f"Gmail API error: {error_details}", "ERROR")
         return {
             "status": "error",
-            "message": f"Gmail API error: {error_details}"
+            "message": f"Gmail API error: {error_details}",
+            "status_code": error.resp.status
         }
 
     except Exception as e:
         log_action(f"Failed to send Gmail email: {e}", "ERROR")
         return {
             "status": "error",
-            "message": f"Failed to send email: {e}"
+            "message": f"Failed to send email: {e}",
+            "auth_error": is_auth_error(e)
         }
 
 
@@ -0,0 +1,186 @@
+"""
+Social Fan-Out - Concurrent Multi-Platform Posting
+
+Cross-posting used to run Facebook, Instagram and Twitter one after the
+other, so a cross-post took the sum of every platform's browser session.
+The fan-out runs each platform's post on its own worker thread (each
+poster drives its own Playwright session, which is thread-confined), waits
+for all of them, and reports:
+
+- a per-platform result, duration and attempt count
+- the total wall-clock time against the sum of per-platform times
+- which platforms failed, so a retry re-posts only those and never
+  duplicates a post that already went out
+
+The caller's deadline (scripts.resilience.deadline) is carried into every
+worker thread.
+
+Usage:
+    from scripts.social_fanout import fan_out, retry_failed
+
+    posts = {
+        "facebook": lambda: fb.post_to_facebook(content=text),
+        "twitter": lambda: twitter.post_tweet(content=text),
+    }
+    outcome = fan_out(posts)
+    if outcome.failed:
+        outcome = retry_failed(outcome, posts)
+    print(outcome.to_dict())
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+# Add project root to sys.path to enable imports from root-level modules
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from log_manager import setup_logging
+from scripts.resilience import deadline, time_remaining
+
+logger = setup_logging(log_file="logs/ai_employee.log", logger_name="social-fanout")
+
+
+def post_succeeded(result: Any) -> bool:
+    """True for a poster's success dict (``status: success`` / ``success: True``)."""
+    return isinstance(result, dict) and (result.get("status") == "success" or result.get("success") is True)
+
+
+@dataclass
+class PlatformResult:
+    """Outcome of one platform's post."""
+    platform: str
+    result: Dict[str, Any]
+    elapsed_ms: float
+    attempts: int = 1
+
+    @property
+    def ok(self) -> bool:
+        return post_succeeded(self.result)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ok": self.ok,
+            "elapsed_ms": self.elapsed_ms,
+            "attempts": self.attempts,
+            "result": self.result,
+        }
+
+
+@dataclass
+class FanOutResult:
+    """Per-platform results of a fan-out plus its timing."""
+    results: Dict[str, PlatformResult] = field(default_factory=dict)
+    wall_ms: float = 0.0
+
+    @property
+    def sum_ms(self) -> float:
+        """What the same posts would have taken one after another."""
+        return round(sum(r.elapsed_ms for r in self.results.values()), 1)
+
+    @property
+    def succeeded(self) -> List[str]:
+        return [name for name, r in self.results.items() if r.ok]
+
+    @property
+    def failed(self) -> List[str]:
+        return [name for name, r in self.results.items() if not r.ok]
+
+    @property
+    def status(self) -> str:
+        if not self.failed:
+            return "success"
+        return "partial" if self.succeeded else "error"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "platforms": {name: r.to_dict() for name, r in self.results.items()},
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "wall_ms": self.wall_ms,
+            "sum_ms": self.sum_ms,
+            "speedup": round(self.sum_ms / self.wall_ms, 2) if self.wall_ms else None,
+        }
+
+
+def _run_post(platform: str, post: Callable[[], Dict[str, Any]], remaining: Optional[float]) -> PlatformResult:
+    started = time.perf_counter()
+    try:
+        with deadline(remaining):
+            result = post()
+        if not isinstance(result, dict):
+            result = {"status": "error", "message": f"Unexpected result: {result!r}"}
+    except Exception as e:
+        logger.error(f"{platform} post failed: {e}")
+        result = {"status": "error", "message": str(e), "platform": platform}
+    return PlatformResult(platform, result, round((time.perf_counter() - started) * 1000, 1))
+
+
+def fan_out(
+    posts: Mapping[str, Callable[[], Dict[str, Any]]],
+    max_workers: Optional[int] = None,
+) -> FanOutResult:
+    """
+    Run every platform's post concurrently and wait for all of them.
+
+    Args:
+        posts: Platform name -> zero-argument callable returning the
+            poster's result dict
+        max_workers: Concurrent posts (default: one per platform)
+
+    Returns:
+        FanOutResult with per-platform results and wall/sum timing
+    """
+    outcome = FanOutResult()
+    if not posts:
+        return outcome
+
+    remaining = time_remaining()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers or len(posts), thread_name_prefix="fanout") as pool:
+        futures = {
+            platform: pool.submit(_run_post, platform, post, remaining)
+            for platform, post in posts.items()
+        }
+        for platform, future in futures.items():
+            outcome.results[platform] = future.result()
+    outcome.wall_ms = round((time.perf_counter() - started) * 1000, 1)
+
+    logger.info(
+        f"Fan-out to {', '.join(posts)}: {outcome.status} in {outcome.wall_ms} ms "
+        f"(sequential would take {outcome.sum_ms} ms)"
+    )
+    return outcome
+
+
+def retry_failed(
+    previous: FanOutResult,
+    posts: Mapping[str, Callable[[], Dict[str, Any]]],
+    max_workers: Optional[int] = None,
+) -> FanOutResult:
+    """
+    Re-post only the platforms that failed in ``previous``.
+
+    Platforms that already succeeded keep their result and are not posted
+    again. Wall-clock time accumulates across attempts.
+    """
+    retry = {platform: posts[platform] for platform in previous.failed if platform in posts}
+    if not retry:
+        return previous
+
+    logger.info(f"Retrying failed platforms: {', '.join(retry)}")
+    again = fan_out(retry, max_workers=max_workers)
+
+    merged = FanOutResult(results=dict(previous.results), wall_ms=round(previous.wall_ms + again.wall_ms, 1))
+    for platform, result in again.results.items():
+        earlier = previous.results[platform]
+        result.attempts = earlier.attempts + 1
+        result.elapsed_ms = round(earlier.elapsed_ms + result.elapsed_ms, 1)
+        merged.results[platform] = result
+    return merged
@@ -0,0 +1,465 @@
+"""
+Social Metrics Store - Cached Social Analytics with Incremental Refresh
+
+Scraping a profile or page for analytics takes tens of seconds, and the
+CEO briefing used to re-read every Social_Media/*.md file on each run.
+This store keeps per-post metrics in SQLite and serves summaries from
+per-day aggregates, so briefing and dashboard queries return in
+milliseconds:
+
+- ``refresh()`` calls the scraper at most once per TTL and asks only for
+  posts newer than the platform's watermark (plus cached posts whose
+  metrics have gone stale)
+- per-day aggregates are recomputed only for the days a refresh touched
+- ``index_vault_folder()`` re-reads only vault files modified since the
+  last index
+- ``cached()`` keeps whole API responses (page insights, comments) for a TTL
+
+Posts carry a ``source``: "live" for scraped metrics, "vault" for posts
+recorded as vault files, so the two are never double counted.
+
+Usage:
+    from scripts.social_metrics_store import get_social_metrics_store
+
+    store = get_social_metrics_store()
+    store.refresh("twitter", lambda since, stale: scrape(since, stale))
+    print(store.summary("twitter", days=7))
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+METRICS_DB_PATH = PROJECT_ROOT / "logs" / "social_metrics.db"
+
+# Scrape a platform at most this often (seconds)
+REFRESH_TTL = int(os.getenv("SOCIAL_METRICS_TTL", "900"))
+# Re-read a cached post's metrics once they are this old (seconds)
+POST_METRICS_TTL = int(os.getenv("SOCIAL_POST_METRICS_TTL", "21600"))
+
+SOURCE_LIVE = "live"
+SOURCE_VAULT = "vault"
+
+VAULT_PLATFORMS = ("linkedin", "facebook", "instagram", "twitter")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    platform TEXT NOT NULL,
+    source TEXT NOT NULL,
+    post_id TEXT NOT NULL,
+    text TEXT,
+    posted_at REAL NOT NULL,
+    day TEXT NOT NULL,
+    likes INTEGER NOT NULL DEFAULT 0,
+    shares INTEGER NOT NULL DEFAULT 0,
+    comments INTEGER NOT NULL DEFAULT 0,
+    impressions INTEGER NOT NULL DEFAULT 0,
+    engagement INTEGER NOT NULL DEFAULT 0,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (platform, source, post_id)
+);
+CREATE INDEX IF NOT EXISTS idx_posts_recent ON posts(platform, source, posted_at);
+CREATE INDEX IF NOT EXISTS idx_posts_fetched ON posts(platform, source, fetched_at);
+CREATE TABLE IF NOT EXISTS daily_aggregates (
+    platform TEXT NOT NULL,
+    source TEXT NOT NULL,
+    day TEXT NOT NULL,
+    posts INTEGER NOT NULL,
+    likes INTEGER NOT NULL,
+    shares INTEGER NOT NULL,
+    comments INTEGER NOT NULL,
+    impressions INTEGER NOT NULL,
+    engagement INTEGER NOT NULL,
+    PRIMARY KEY (platform, source, day)
+);
+CREATE TABLE IF NOT EXISTS watermarks (
+    name TEXT PRIMARY KEY,
+    mark REAL,
+    refreshed_at REAL,
+    last_error TEXT
+);
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+_METRICS = ("likes", "shares", "comments", "impressions")
+
+# Keeps IN (...) lists under SQLite's bound-parameter limit
+_CHUNK = 500
+
+
+def _timestamp(value: Any) -> float:
+    """Epoch seconds from an epoch number or an ISO-8601 string."""
+    if value is None or value == "":
+        return time.time()
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip().replace("Z", "+00:00")
+    return datetime.fromisoformat(text).timestamp()
+
+
+def _day(ts: float) -> str:
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
+
+
+def _vault_platform(path: Path) -> Optional[str]:
+    """Platform named in a vault file's frontmatter (or header)."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        head = f.read(4096).lower()
+    for line in head.splitlines():
+        key, _, value = line.partition(":")
+        if key.strip() == "platform" and value.strip() in VAULT_PLATFORMS:
+            return value.strip()
+    for platform in VAULT_PLATFORMS:
+        if f"platform: {platform}" in head:
+            return platform
+    return None
+
+
+class SocialMetricsStore:
+    """SQLite cache of per-post social metrics and per-day aggregates."""
+
+    def __init__(self, db_path: Path = METRICS_DB_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._refresh_locks: Dict[str, threading.Lock] = {}
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+
+    # ==================== POSTS ====================
+
+    def upsert_posts(self, platform: str, posts: Iterable[Dict[str, Any]], source: str = SOURCE_LIVE) -> int:
+        """
+        Insert or update posts and refresh the aggregates of the days touched.
+
+        Args:
+            platform: e.g. "twitter"
+            posts: Dicts with ``post_id`` and optionally ``text``,
+                ``posted_at`` (epoch or ISO), ``likes``, ``shares``,
+                ``comments`` and ``impressions``
+            source: SOURCE_LIVE or SOURCE_VAULT
+
+        Returns:
+            Number of posts written
+        """
+        now = time.time()
+        rows = []
+        for post in posts:
+            posted_at = _timestamp(post.get("posted_at"))
+            metrics = [int(post.get(name) or 0) for name in _METRICS]
+            rows.append((
+                platform, source, str(post["post_id"]), post.get("text", ""), posted_at, _day(posted_at),
+                *metrics, metrics[0] + metrics[1] + metrics[2], now,
+            ))
+        if not rows:
+            return 0
+
+        days = {row[5] for row in rows}
+        with self._lock, self._conn:
+            # A post that moved to another day leaves its old day stale too
+            for i in range(0, len(rows), _CHUNK):
+                chunk = [row[2] for row in rows[i:i + _CHUNK]]
+                days.update(r["day"] for r in self._conn.execute(
+                    f"SELECT day FROM posts WHERE platform = ? AND source = ? "
+                    f"AND post_id IN ({','.join('?' * len(chunk))})",
+                    (platform, source, *chunk),
+                ))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO posts (platform, source, post_id, text, posted_at, day, likes, shares, "
+                "comments, impressions, engagement, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._rebuild_days(platform, source, sorted(days))
+        return len(rows)
+
+    def _rebuild_days(self, platform: str, source: str, days: List[str]):
+        for i in range(0, len(days), _CHUNK):
+            chunk = days[i:i + _CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            self._conn.execute(
+                f"DELETE FROM daily_aggregates WHERE platform = ? AND source = ? AND day IN ({placeholders})",
+                (platform, source, *chunk),
+            )
+            self._conn.execute(
+                "INSERT INTO daily_aggregates (platform, source, day, posts, likes, shares, comments, impressions, "
+                "engagement) SELECT platform, source, day, COUNT(*), SUM(likes), SUM(shares), SUM(comments), "
+                "SUM(impressions), SUM(engagement) FROM posts "
+                f"WHERE platform = ? AND source = ? AND day IN ({placeholders}) GROUP BY platform, source, day",
+                (platform, source, *chunk),
+            )
+
+    def stale_post_ids(self, platform: str, ttl: float = POST_METRICS_TTL, source: str = SOURCE_LIVE) -> Set[str]:
+        """IDs of cached posts whose metrics are older than ``ttl``."""
+        cutoff = time.time() - ttl
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT post_id FROM posts WHERE platform = ? AND source = ? AND fetched_at < ?",
+                (platform, source, cutoff),
+            ).fetchall()
+        return {row["post_id"] for row in rows}
+
+    # ==================== WATERMARKS ====================
+
+    def _watermark(self, name: str) -> Dict[str, Any]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM watermarks WHERE name = ?", (name,)).fetchone()
+        return dict(row) if row else {"name": name, "mark": None, "refreshed_at": None, "last_error": None}
+
+    def _set_watermark(self, name: str, mark: Optional[float], error: Optional[str] = None):
+        with self._lock, self._conn:
+            if error is None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO watermarks (name, mark, refreshed_at, last_error) VALUES (?, ?, ?, NULL)",
+                    (name, mark, time.time()),
+                )
+            else:
+                self._conn.execute(
+                    "INSERT INTO watermarks (name, mark, refreshed_at, last_error) VALUES (?, NULL, NULL, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET last_error = excluded.last_error",
+                    (name, error),
+                )
+
+    def watermark(self, platform: str) -> Optional[float]:
+        """Newest ``posted_at`` seen for a platform's live posts."""
+        return self._watermark(platform)["mark"]
+
+    def refresh(
+        self,
+        platform: str,
+        fetch: Callable[[Optional[float], Set[str]], Iterable[Dict[str, Any]]],
+        ttl: float = REFRESH_TTL,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Refresh a platform's live posts if its cache is older than ``ttl``.
+
+        ``fetch(since, stale_ids)`` should return posts newer than ``since``
+        (None on the first refresh) and any posts whose ID is in
+        ``stale_ids``. Exceptions from ``fetch`` propagate; the cache and
+        watermark are left as they were.
+
+        Returns:
+            Dict with ``refreshed``, ``new_posts``, ``updated_posts``,
+            ``watermark`` and ``age_sec`` (age of the data served)
+        """
+        with self._lock:
+            refresh_lock = self._refresh_locks.setdefault(platform, threading.Lock())
+
+        # Concurrent callers wait for one scrape instead of starting their own
+        with refresh_lock:
+            state = self._watermark(platform)
+            age = None if state["refreshed_at"] is None else time.time() - state["refreshed_at"]
+            if not force and age is not None and age < ttl:
+                return {"refreshed": False, "new_posts": 0, "updated_posts": 0,
+                        "watermark": state["mark"], "age_sec": round(age, 1)}
+
+            since = state["mark"]
+            stale = self.stale_post_ids(platform)
+            try:
+                posts = list(fetch(since, stale))
+            except Exception as e:
+                self._set_watermark(platform, since, error=str(e))
+                raise
+
+            self.upsert_posts(platform, posts)
+            stamps = [_timestamp(post.get("posted_at")) for post in posts]
+            mark = max([since or 0.0, *stamps]) or None
+            self._set_watermark(platform, mark)
+            new_posts = sum(1 for ts in stamps if since is None or ts > since)
+            return {"refreshed": True, "new_posts": new_posts, "updated_posts": len(posts) - new_posts,
+                    "watermark": mark, "age_sec": 0.0}
+
+    # ==================== QUERIES ====================
+
+    def summary(
+        self,
+        platform: str,
+        days: Optional[int] = 7,
+        source: str = SOURCE_LIVE,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Totals for a period from the per-day aggregates.
+
+        Args:
+            platform: e.g. "twitter"
+            days: Last N days (None for all time); ignored if ``start`` given
+            source: SOURCE_LIVE or SOURCE_VAULT
+            start/end: Explicit period
+
+        Returns:
+            Dict with posts, likes, shares, comments, impressions,
+            engagement, averages and the most popular post
+        """
+        clauses, params = ["platform = ?", "source = ?"], [platform, source]
+        if start is not None:
+            clauses.append("day >= ?")
+            params.append(start.strftime("%Y-%m-%d"))
+        elif days is not None:
+            clauses.append("day >= ?")
+            params.append(_day(time.time() - days * 86400))
+        if end is not None:
+            clauses.append("day <= ?")
+            params.append(end.strftime("%Y-%m-%d"))
+        where = " AND ".join(clauses)
+
+        with self._lock:
+            totals = self._conn.execute(
+                "SELECT COALESCE(SUM(posts), 0) AS posts, COALESCE(SUM(likes), 0) AS likes, "
+                "COALESCE(SUM(shares), 0) AS shares, COALESCE(SUM(comments), 0) AS comments, "
+                "COALESCE(SUM(impressions), 0) AS impressions, COALESCE(SUM(engagement), 0) AS engagement "
+                f"FROM daily_aggregates WHERE {where}", params,
+            ).fetchone()
+            top = self._conn.execute(
+                f"SELECT post_id, text, likes, shares, comments, engagement FROM posts WHERE {where} "
+                "ORDER BY engagement DESC, posted_at DESC LIMIT 1", params,
+            ).fetchone()
+
+        result = dict(totals)
+        count = result["posts"]
+        result["average_likes"] = round(result["likes"] / count, 2) if count else 0.0
+        result["average_shares"] = round(result["shares"] / count, 2) if count else 0.0
+        result["most_popular"] = dict(top) if top and top["engagement"] > 0 else None
+        return result
+
+    def recent_posts(self, platform: str, limit: int = 10, source: str = SOURCE_LIVE) -> List[Dict[str, Any]]:
+        """Newest cached posts, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT post_id, text, posted_at, likes, shares, comments, impressions, engagement, fetched_at "
+                "FROM posts WHERE platform = ? AND source = ? ORDER BY posted_at DESC LIMIT ?",
+                (platform, source, limit),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def status(self) -> Dict[str, Any]:
+        """Per-platform cache state (post counts, watermark, age, last error)."""
+        with self._lock:
+            counts = self._conn.execute(
+                "SELECT platform, source, COUNT(*) AS posts FROM posts GROUP BY platform, source"
+            ).fetchall()
+            marks = self._conn.execute("SELECT * FROM watermarks").fetchall()
+        now = time.time()
+        result: Dict[str, Any] = {}
+        for row in counts:
+            result.setdefault(row["platform"], {})[f"{row['source']}_posts"] = row["posts"]
+        for row in marks:
+            entry = result.setdefault(row["name"], {})
+            entry["age_sec"] = round(now - row["refreshed_at"], 1) if row["refreshed_at"] else None
+            entry["last_error"] = row["last_error"]
+        return result
+
+    # ==================== VAULT FILES ====================
+
+    def index_vault_folder(self, folder: Path) -> int:
+        """
+        Record vault social posts (``platform:`` in frontmatter), reading
+        only files modified since the previous index of this folder.
+        Posts whose file has left the folder are dropped.
+
+        Returns:
+            Number of files (re-)read
+        """
+        folder = Path(folder)
+        name = f"vault:{folder.resolve()}"
+        since = self._watermark(name)["mark"]
+        prefix = f"{folder.name}/"
+
+        by_platform: Dict[str, List[Dict[str, Any]]] = {}
+        present = set()
+        newest = since or 0.0
+        read = 0
+        for path in (folder.glob("*.md") if folder.exists() else []):
+            present.add(prefix + path.name)
+            try:
+                mtime = path.stat().st_mtime
+                # Files stamped exactly at the mark are re-read, never missed
+                if since is not None and mtime < since:
+                    continue
+                platform = _vault_platform(path)
+                read += 1
+            except OSError:
+                continue
+            newest = max(newest, mtime)
+            if platform:
+                by_platform.setdefault(platform, []).append(
+                    {"post_id": prefix + path.name, "text": path.stem, "posted_at": mtime}
+                )
+
+        for platform, posts in by_platform.items():
+            self.upsert_posts(platform, posts, source=SOURCE_VAULT)
+        self._drop_missing(prefix, present)
+        self._set_watermark(name, newest or None)
+        return read
+
+    def _drop_missing(self, prefix: str, present: Set[str]):
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT platform, post_id, day FROM posts WHERE source = ? AND substr(post_id, 1, ?) = ?",
+                (SOURCE_VAULT, len(prefix), prefix),
+            ).fetchall()
+            gone = [row for row in rows if row["post_id"] not in present]
+            if not gone:
+                return
+            self._conn.executemany(
+                "DELETE FROM posts WHERE platform = ? AND source = ? AND post_id = ?",
+                [(row["platform"], SOURCE_VAULT, row["post_id"]) for row in gone],
+            )
+            for platform in {row["platform"] for row in gone}:
+                self._rebuild_days(platform, SOURCE_VAULT, sorted({r["day"] for r in gone if r["platform"] == platform}))
+
+    # ==================== RESPONSE CACHE ====================
+
+    def cached(self, key: str, fetch: Callable[[], Dict[str, Any]], ttl: float = REFRESH_TTL) -> Dict[str, Any]:
+        """
+        Return a cached response younger than ``ttl`` or fetch and cache it.
+
+        Error responses (``status: error``) are returned but not cached.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT payload, fetched_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is not None and time.time() - row["fetched_at"] < ttl:
+            result = json.loads(row["payload"])
+            result["cache_age_sec"] = round(time.time() - row["fetched_at"], 1)
+            return result
+
+        result = fetch()
+        if isinstance(result, dict) and result.get("status") != "error":
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, payload, fetched_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(result, default=str), time.time()),
+                )
+        return result
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_social_metrics_store = None
+_social_metrics_store_lock = threading.Lock()
+
+
+def get_social_metrics_store() -> SocialMetricsStore:
+    """Get singleton social metrics store."""
+    global _social_metrics_store
+    with _social_metrics_store_lock:
+        if _social_metrics_store is None:
+            _social_metrics_store = SocialMetricsStore()
+        return _social_metrics_store
@@ -17,6 +17,9 @@ sys.path.insert(0, str(project_root))
 
 from scripts.accounting_manager import AccountingManager
 
+# The fixed March 2026 entries below stay inside the close window
+OPEN_BOOKS = 3650
+
 
 def test_log_transaction():
     """Test transaction logging."""
@@ -24,7 +27,7 @@ def test_log_transaction():
     print("TEST: Log Transactions")
     print("=" * 60)
     
-    accounting = AccountingManager(vault_path="AI_Employee_Vault")
+    accounting = AccountingManager(vault_path="AI_Employee_Vault", close_after_days=OPEN_BOOKS)
     
     # Test 1: Log income
     print("\nTest 1: Logging income transaction...")
@@ -89,7 +92,7 @@ def test_get_transactions():
     print("TEST: Get Transactions")
     print("=" * 60)
     
-    accounting = AccountingManager(vault_path="AI_Employee_Vault")
+    accounting = AccountingManager(vault_path="AI_Employee_Vault", close_after_days=OPEN_BOOKS)
     
     # Test 1: Get all transactions
     print("\nTest 1: Getting all transactions...")
@@ -125,7 +128,7 @@ def test_get_totals():
     print("TEST: Get Totals")
     print("=" * 60)
     
-    accounting = AccountingManager(vault_path="AI_Employee_Vault")
+    accounting = AccountingManager(vault_path="AI_Employee_Vault", close_after_days=OPEN_BOOKS)
     
     print("\nTest: Getting accounting totals...")
     totals = accounting.get_totals()
@@ -147,7 +150,7 @@ def test_get_balance():
     print("TEST: Get Balance")
     print("=" * 60)
     
-    accounting = AccountingManager(vault_path="AI_Employee_Vault")
+    accounting = AccountingManager(vault_path="AI_Employee_Vault", close_after_days=OPEN_BOOKS)
     
     print("\nTest: Getting current balance...")
     balance = accounting.get_balance()
@@ -163,7 +166,7 @@ def test_generate_weekly_summary():
     print("TEST: Generate Weekly Summary")
     print("=" * 60)
     
-    accounting = AccountingManager(vault_path="AI_Employee_Vault")
+    accounting = AccountingManager(vault_path="AI_Employee_Vault", close_after_days=OPEN_BOOKS)
     
     print("\nTest: Generating weekly summary...")
     result = accounting.generate_weekly_summary()
@@ -185,7 +188,7 @@ def test_generate_monthly_report():
     print("TEST: Generate Monthly Report")
     print("=" * 60)
     
-    accounting = AccountingManager(vault_path="AI_Employee_Vault")
+    accounting = AccountingManager(vault_path="AI_Employee_Vault", close_after_days=OPEN_BOOKS)
     
     print("\nTest: Generating monthly report for March 2026...")
     result = accounting.generate_monthly_report(year=2026, month=3)
@@ -208,7 +211,7 @@ def test_validation():
     print("TEST: Input Validation")
     print("=" * 60)
     
-    accounting = AccountingManager(vault_path="AI_Employee_Vault")
+    accounting = AccountingManager(vault_path="AI_Employee_Vault", close_after_days=OPEN_BOOKS)
     
     # Test 1: Invalid type
     print("\nTest 1: Testing invalid type...")
@@ -31,6 +31,7 @@ Environment Variables:
     TWITTER_ACCESS_TOKEN: Twitter access token (optional)
     TWITTER_ACCESS_TOKEN_SECRET: Twitter access token secret (optional)
     TWITTER_BEARER_TOKEN: Twitter bearer token (optional)
+    TWITTER_SUBMIT_POSTS: "true" to click Post (default: compose only)
     LOG_LEVEL: Logging level (default: INFO)
 
 Author: AI Employee Project
@@ -38,15 +39,19 @@ Version: 1.0.0
 License: MIT
 """
 
+import hashlib
 import json
 import logging
 import os
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 
 from log_manager import setup_logging
+from scripts.resilience import circuit_protected
+from scripts.social_metrics_store import _timestamp, get_social_metrics_store
+from scripts.twitter_thread import SUBMIT_POSTS, post_thread_in_session
 
 # Setup logging
 logger = setup_logging(log_file="logs/ai_employee.log", logger_name="twitter_mcp")
@@ -63,6 +68,78 @@ TWITTER_BEARER_TOKEN = os.getenv('TWITTER_BEARER_TOKEN', '')
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 
 
+# Profile tweets parsed per scrape
+SCRAPE_LIMIT = 20
+
+
+class TwitterAuthRequired(Exception):
+    """Raised when the browser session is not logged into Twitter/X."""
+
+
+def _parse_count(text: str) -> int:
+    """Parse engagement counts like "234", "1.5K" or "2M"."""
+    text = (text or "").strip().replace(",", "").upper()
+    if not text:
+        return 0
+    scale = {"K": 1000, "M": 1000000}.get(text[-1], 1)
+    try:
+        return int(float(text[:-1] if scale > 1 else text) * scale)
+    except ValueError:
+        return 0
+
+
+def _parse_tweet_article(article) -> Optional[Dict[str, Any]]:
+    """Tweet ID, time, text and metrics from a profile timeline article."""
+    text_element = article.query_selector('[data-testid="tweetText"]')
+    if not text_element:
+        return None
+
+    post_id = None
+    posted_at = None
+    time_element = article.query_selector('time')
+    if time_element:
+        posted_at = time_element.get_attribute('datetime')
+        link = time_element.evaluate("el => el.closest('a') && el.closest('a').getAttribute('href')")
+        if link and '/status/' in link:
+            post_id = link.rsplit('/status/', 1)[1].split('/')[0]
+
+    metrics = {}
+    for name, testid in (("likes", "like"), ("shares", "retweet"), ("comments", "reply")):
+        element = article.query_selector(f'[data-testid="{testid}"]')
+        metrics[name] = _parse_count(element.inner_text()) if element else 0
+
+    text = text_element.inner_text()[:280]
+    return {
+        # Stable across processes (str hash() is salted per run)
+        "post_id": post_id or f"TW_{hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]}",
+        "text": text,
+        "posted_at": posted_at,
+        **metrics
+    }
+
+
+def _is_new_or_stale(tweet: Dict[str, Any], since: Optional[float], stale_ids: Set[str]) -> bool:
+    """Whether a scraped tweet is newer than the ``since`` watermark or due a metrics refresh."""
+    if since is None or tweet["post_id"] in stale_ids:
+        return True
+    try:
+        return _timestamp(tweet["posted_at"]) > since
+    except ValueError:
+        # Unparseable time: keep it rather than lose a tweet
+        return True
+
+
+def _tweet_view(cached: Dict[str, Any]) -> Dict[str, Any]:
+    """Cached post in the shape get_twitter_summary has always returned."""
+    return {
+        "text": cached["text"],
+        "likes": cached["likes"],
+        "retweets": cached["shares"],
+        "replies": cached["comments"],
+        "engagement": cached["engagement"]
+    }
+
+
 class TwitterMCPServer:
     """
     Twitter MCP Server for AI Employee integration.
@@ -86,6 +163,7 @@ class TwitterMCPServer:
 
         logger.info(f"TwitterMCPServer initialized for @{self.username or 'unknown'}")
 
+    @circuit_protected("twitter", error_result=True)
     def post_tweet(
         self,
         content: str,
@@ -205,9 +283,9 @@ class TwitterMCPServer:
 
                         if tweet_button:
                             logger.info("Posting tweet...")
-                            # In production, uncomment to actually post:
-                            # tweet_button.click()
-                            # page.wait_for_timeout(3000)
+                            if SUBMIT_POSTS:
+                                tweet_button.click()
+                                page.wait_for_timeout(3000)
 
                             # Record tweet in history
                             tweet_record = {
@@ -272,6 +350,7 @@ class TwitterMCPServer:
                 "platform": "twitter"
             }
 
+    @circuit_protected("twitter", error_result=True)
     def post_thread(
         self,
         tweets: List[str],
@@ -280,6 +359,10 @@ class TwitterMCPServer:
         """
         Post a thread of tweets (up to 25 tweets).
 
+        The whole thread is composed in one compose dialog and submitted
+        at once in a single browser session; if the composer cannot add
+        more posts, the rest are posted as replies on the same page.
+
         Args:
             tweets: List of tweet contents (each max 280 chars)
             media_paths: List of media paths (first 4 images go to first tweet)
@@ -308,24 +391,59 @@ class TwitterMCPServer:
                     "platform": "twitter"
                 }
 
-        logger.info(f"Posting thread with {len(tweets)} tweets...")
+        logger.info(f"Posting thread with {len(tweets)} tweets in one session...")
 
-        # Post first tweet with media
-        first_media = media_paths[:4] if media_paths else None
-        first_result = self.post_tweet(
-            content=tweets[0],
-            media_paths=first_media
-        )
+        # One browser, one login check and one compose dialog for the whole
+        # thread instead of a browser session per tweet
+        try:
+            from playwright.sync_api import sync_playwright
 
-        if first_result.get("status") != "success":
-            return first_result
+            with sync_playwright() as p:
+                browser = p.chromium.launch(headless=True)
+                context = browser.new_context(
+                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                    viewport={'width': 1920, 'height': 1080}
+                )
+                page = context.new_page()
+
+                try:
+                    page.goto('https://twitter.com/home', timeout=30000)
+                    page.wait_for_timeout(5000)
+
+                    is_logged_in = 'twitter.com' in page.url and '/i/flow/login' not in page.url
+                    if not is_logged_in:
+                        logger.warning("Not logged into Twitter/X. Authentication required.")
+                        return {
+                            "status": "warning",
+                            "message": "Not logged into Twitter/X. Please log in manually and retry.",
+                            "requires_authentication": True,
+                            "platform": "twitter",
+                            "tweets": tweets
+                        }
 
-        # Note: Full thread posting requires more complex automation
-        # to click "Add another tweet" and properly link tweets
-        # This is a simplified implementation
+                    session = post_thread_in_session(page, tweets, media_paths)
+                finally:
+                    browser.close()
 
-        # Record all tweets in history
-        for i, tweet_content in enumerate(tweets[1:], start=1):
+        except ImportError:
+            logger.error("Playwright not installed")
+            return {
+                "status": "error",
+                "message": "Playwright not installed. Install with: pip install playwright && playwright install",
+                "platform": "twitter"
+            }
+        except Exception as e:
+            logger.error(f"Twitter thread failed: {e}")
+            return {
+                "status": "error",
+                "message": f"Twitter thread failed: {str(e)}",
+                "platform": "twitter"
+            }
+
+        if session.get("status") != "success":
+            return session
+
+        for i, tweet_content in enumerate(tweets):
             self.tweet_history.append({
                 "content": tweet_content,
                 "timestamp": datetime.now().isoformat(),
@@ -339,22 +457,90 @@ class TwitterMCPServer:
             "platform": "twitter",
             "tweet_count": len(tweets),
             "tweets": tweets,
-            "first_tweet_result": first_result,
+            "mode": session["mode"],
+            "submitted": session["submitted"],
+            "elapsed_ms": session["elapsed_ms"],
             "timestamp": datetime.now().isoformat(),
             "thread_id": f"THREAD_{datetime.now().strftime('%Y%m%d%H%M%S')}"
         }
 
+    def _scrape_profile_tweets(
+        self,
+        since: Optional[float] = None,
+        stale_ids: Set[str] = frozenset(),
+        limit: int = SCRAPE_LIMIT
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape tweets and their metrics from the user's profile.
+
+        Only tweets newer than ``since`` or listed in ``stale_ids`` are
+        returned, so a refresh parses just what changed.
+
+        Raises:
+            TwitterAuthRequired: If the browser session is not logged in
+        """
+        if not self.username:
+            return []
+
+        from playwright.sync_api import sync_playwright
+
+        tweets = []
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True)
+            context = browser.new_context(
+                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                viewport={'width': 1920, 'height': 1080}
+            )
+            page = context.new_page()
+
+            try:
+                profile_url = f'https://twitter.com/{self.username}'
+                logger.info(f"Scraping profile: {profile_url}")
+                page.goto(profile_url, timeout=30000)
+                page.wait_for_timeout(5000)
+
+                if '/i/flow/login' in page.url:
+                    raise TwitterAuthRequired("Not logged into Twitter/X. Analytics unavailable.")
+
+                for article in page.query_selector_all('article[role="article"]')[:limit]:
+                    try:
+                        tweet = _parse_tweet_article(article)
+                    except Exception as e:
+                        logger.debug(f"Error processing tweet: {e}")
+                        continue
+                    if tweet is None:
+                        continue
+                    # Pinned or already-cached tweets are skipped unless stale
+                    if not _is_new_or_stale(tweet, since, stale_ids):
+                        continue
+                    tweets.append(tweet)
+            finally:
+                browser.close()
+
+        logger.info(f"Scraped {len(tweets)} new or stale tweets")
+        return tweets
+
+    def _refresh_metrics(self, force: bool = False) -> Dict[str, Any]:
+        """Refresh the cached tweet metrics if they are older than the TTL."""
+        return get_social_metrics_store().refresh("twitter", self._scrape_profile_tweets, force=force)
+
     def get_twitter_summary(
         self,
         days: int = 7,
-        include_engagement: bool = True
+        include_engagement: bool = True,
+        refresh: bool = False
     ) -> Dict[str, Any]:
         """
         Generate a summary of Twitter activity and analytics.
 
+        Served from the social metrics cache; the profile is scraped only
+        when the cache is older than SOCIAL_METRICS_TTL (or ``refresh``),
+        and then only for tweets newer than the last one seen.
+
         Args:
             days: Number of days to summarize (default: 7)
             include_engagement: Include engagement metrics (default: True)
+            refresh: Scrape now even if the cache is fresh
 
         Returns:
             Dictionary with Twitter analytics summary including:
@@ -388,150 +574,65 @@ class TwitterMCPServer:
             "status": "success"
         }
 
-        try:
-            from playwright.sync_api import sync_playwright
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    viewport={'width': 1920, 'height': 1080}
+        summary.update(self._cache_status(refresh))
+        store = get_social_metrics_store()
+        stats = store.summary("twitter", days)
+
+        summary["tweet_count"] = stats["posts"]
+        summary["recent_tweets"] = [_tweet_view(t) for t in store.recent_posts("twitter", 10)]
+        if include_engagement:
+            summary["total_likes"] = stats["likes"]
+            summary["total_retweets"] = stats["shares"]
+            summary["total_replies"] = stats["comments"]
+            summary["total_impressions"] = stats["impressions"]
+            summary["average_likes_per_tweet"] = stats["average_likes"]
+            summary["average_retweets_per_tweet"] = stats["average_shares"]
+            if stats["posts"]:
+                # Simplified: interactions per tweet, as a percentage
+                summary["engagement_rate"] = round(
+                    (stats["likes"] + stats["shares"]) / stats["posts"] * 100, 2
                 )
-                page = context.new_page()
-
-                try:
-                    # Navigate to Twitter
-                    page.goto('https://twitter.com', timeout=30000)
-                    page.wait_for_timeout(5000)
-
-                    # Check if logged in
-                    is_logged_in = 'twitter.com' in page.url and '/i/flow/login' not in page.url
-
-                    if not is_logged_in:
-                        logger.warning("Not logged into Twitter/X. Cannot fetch analytics.")
-                        browser.close()
-                        summary["status"] = "warning"
-                        summary["message"] = "Not logged into Twitter/X. Analytics unavailable."
-                        summary["requires_authentication"] = True
-                        return summary
-
-                    # Navigate to profile/analytics
-                    if self.username:
-                        profile_url = f'https://twitter.com/{self.username}'
-                        logger.info(f"Navigating to profile: {profile_url}")
-                        page.goto(profile_url, timeout=30000)
-                        page.wait_for_timeout(5000)
-
-                        # Try to get recent tweets
-                        articles = page.query_selector_all('article[role="article"]')
-
-                        recent_tweets = []
-                        total_likes = 0
-                        total_retweets = 0
-                        most_popular = None
-                        max_engagement = 0
-
-                        for i, article in enumerate(articles[:20]):  # Analyze last 20 tweets
-                            try:
-                                text_element = article.query_selector('[data-testid="tweetText"]')
-                                if text_element:
-                                    text = text_element.inner_text()[:280]
-
-                                    # Try to get engagement metrics
-                                    likes = 0
-                                    retweets = 0
-                                    replies = 0
-
-                                    # Look for engagement stats (selectors may vary)
-                                    stats_elements = article.query_selector_all('[data-testid*="like"]')
-                                    for stat in stats_elements:
-                                        try:
-                                            stat_text = stat.inner_text()
-                                            # Parse numbers like "1.5K" or "234"
-                                            if 'K' in stat_text:
-                                                likes = int(float(stat_text.replace('K', '')) * 1000)
-                                            elif stat_text.isdigit():
-                                                likes = int(stat_text)
-                                        except Exception:
-                                            pass
-
-                                    tweet_data = {
-                                        "text": text,
-                                        "likes": likes,
-                                        "retweets": retweets,
-                                        "replies": replies,
-                                        "engagement": likes + retweets + replies
-                                    }
-
-                                    recent_tweets.append(tweet_data)
-                                    total_likes += likes
-                                    total_retweets += retweets
-
-                                    if tweet_data["engagement"] > max_engagement:
-                                        max_engagement = tweet_data["engagement"]
-                                        most_popular = tweet_data
-
-                            except Exception as e:
-                                logger.debug(f"Error processing tweet: {e}")
-                                continue
-
-                        # Calculate summary statistics
-                        tweet_count = len(recent_tweets)
-                        summary["tweet_count"] = tweet_count
-                        summary["total_likes"] = total_likes
-                        summary["total_retweets"] = total_retweets
-                        summary["recent_tweets"] = recent_tweets[:10]  # Include last 10 tweets
-
-                        if tweet_count > 0:
-                            summary["average_likes_per_tweet"] = round(total_likes / tweet_count, 2)
-                            summary["average_retweets_per_tweet"] = round(total_retweets / tweet_count, 2)
-
-                            # Calculate engagement rate (simplified)
-                            total_engagement = total_likes + total_retweets
-                            summary["engagement_rate"] = round((total_engagement / tweet_count) * 100, 2)
-
-                        if most_popular:
-                            summary["most_popular_tweet"] = {
-                                "text": most_popular["text"],
-                                "likes": most_popular["likes"],
-                                "retweets": most_popular["retweets"],
-                                "engagement": most_popular["engagement"]
-                            }
-
-                        logger.info(f"Twitter summary generated: {tweet_count} tweets analyzed")
-
-                except Exception as e:
-                    logger.error(f"Error fetching Twitter analytics: {e}")
-                    summary["status"] = "error"
-                    summary["message"] = f"Error fetching analytics: {str(e)}"
-                finally:
-                    browser.close()
+            top = stats["most_popular"]
+            if top:
+                summary["most_popular_tweet"] = {
+                    "text": top["text"],
+                    "likes": top["likes"],
+                    "retweets": top["shares"],
+                    "engagement": top["engagement"]
+                }
 
-            return summary
+        logger.info(f"Twitter summary generated: {stats['posts']} tweets in period")
+        return summary
 
+    def _cache_status(self, refresh: bool) -> Dict[str, Any]:
+        """Refresh the metrics cache and describe how fresh the data is."""
+        try:
+            return {"cache": self._refresh_metrics(force=refresh)}
+        except TwitterAuthRequired as e:
+            logger.warning(str(e))
+            return {"status": "warning", "message": str(e), "requires_authentication": True}
         except ImportError:
             logger.error("Playwright not installed")
-            summary["status"] = "error"
-            summary["message"] = "Playwright not installed"
-            return summary
-
+            return {"status": "error", "message": "Playwright not installed"}
         except Exception as e:
-            logger.error(f"Error generating Twitter summary: {e}")
-            summary["status"] = "error"
-            summary["message"] = f"Error generating summary: {str(e)}"
-            return summary
+            logger.error(f"Error refreshing Twitter metrics: {e}")
+            return {"status": "error", "message": f"Error fetching analytics: {str(e)}"}
 
     def get_recent_tweets(
         self,
         limit: int = 10,
-        include_metrics: bool = True
+        include_metrics: bool = True,
+        refresh: bool = False
     ) -> Dict[str, Any]:
         """
         Get recent tweets from the authenticated user's profile.
 
+        Served from the social metrics cache (see get_twitter_summary).
+
         Args:
             limit: Maximum number of tweets to retrieve (default: 10)
             include_metrics: Include engagement metrics (default: True)
+            refresh: Scrape now even if the cache is fresh
 
         Returns:
             Dictionary with list of recent tweets and metadata
@@ -548,97 +649,25 @@ class TwitterMCPServer:
             "timestamp": datetime.now().isoformat()
         }
 
-        try:
-            from playwright.sync_api import sync_playwright
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    viewport={'width': 1920, 'height': 1080}
-                )
-                page = context.new_page()
-
-                try:
-                    # Navigate to Twitter
-                    page.goto('https://twitter.com', timeout=30000)
-                    page.wait_for_timeout(5000)
-
-                    # Check if logged in
-                    is_logged_in = 'twitter.com' in page.url and '/i/flow/login' not in page.url
-
-                    if not is_logged_in:
-                        logger.warning("Not logged into Twitter/X. Cannot fetch tweets.")
-                        browser.close()
-                        result["status"] = "warning"
-                        result["message"] = "Not logged into Twitter/X. Please log in manually."
-                        result["requires_authentication"] = True
-                        return result
-
-                    # Navigate to profile
-                    if self.username:
-                        profile_url = f'https://twitter.com/{self.username}'
-                        logger.info(f"Navigating to profile: {profile_url}")
-                        page.goto(profile_url, timeout=30000)
-                        page.wait_for_timeout(5000)
-
-                        # Get tweets
-                        articles = page.query_selector_all('article[role="article"]')
-
-                        tweets = []
-                        for i, article in enumerate(articles[:limit]):
-                            try:
-                                text_element = article.query_selector('[data-testid="tweetText"]')
-                                if text_element:
-                                    text = text_element.inner_text()
-
-                                    tweet_data = {
-                                        "id": f"TW_{i}_{datetime.now().strftime('%Y%m%d%H%M%S')}",
-                                        "text": text,
-                                        "timestamp": datetime.now().isoformat(),
-                                        "position": i
-                                    }
-
-                                    if include_metrics:
-                                        # Try to get metrics
-                                        likes = 0
-                                        retweets = 0
-                                        replies = 0
-
-                                        tweet_data["likes"] = likes
-                                        tweet_data["retweets"] = retweets
-                                        tweet_data["replies"] = replies
-
-                                    tweets.append(tweet_data)
-
-                            except Exception as e:
-                                logger.debug(f"Error processing tweet: {e}")
-                                continue
-
-                        result["tweet_count"] = len(tweets)
-                        result["tweets"] = tweets
-                        logger.info(f"Fetched {len(tweets)} recent tweets")
-
-                except Exception as e:
-                    logger.error(f"Error fetching recent tweets: {e}")
-                    result["status"] = "error"
-                    result["message"] = f"Error fetching tweets: {str(e)}"
-                finally:
-                    browser.close()
-
-            return result
-
-        except ImportError:
-            logger.error("Playwright not installed")
-            result["status"] = "error"
-            result["message"] = "Playwright not installed"
-            return result
+        result.update(self._cache_status(refresh))
+        tweets = []
+        for position, cached in enumerate(get_social_metrics_store().recent_posts("twitter", limit)):
+            tweet = {
+                "id": cached["post_id"],
+                "text": cached["text"],
+                "timestamp": datetime.fromtimestamp(cached["posted_at"]).isoformat(),
+                "position": position
+            }
+            if include_metrics:
+                tweet["likes"] = cached["likes"]
+                tweet["retweets"] = cached["shares"]
+                tweet["replies"] = cached["comments"]
+            tweets.append(tweet)
 
-        except Exception as e:
-            logger.error(f"Error fetching recent tweets: {e}")
-            result["status"] = "error"
-            result["message"] = f"Error fetching tweets: {str(e)}"
-            return result
+        result["tweet_count"] = len(tweets)
+        result["tweets"] = tweets
+        logger.info(f"Returned {len(tweets)} recent tweets")
+        return result
 
     def check_authentication(self) -> Dict[str, Any]:
         """
@@ -780,6 +809,10 @@ def create_mcp_server():
                         'include_engagement': {
                             'type': 'boolean',
                             'description': 'Include engagement metrics (default: true)'
+                        },
+                        'refresh': {
+                            'type': 'boolean',
+                            'description': 'Scrape now instead of serving cached metrics (default: false)'
                         }
                     }
                 }
@@ -797,6 +830,10 @@ def create_mcp_server():
                         'include_metrics': {
                             'type': 'boolean',
                             'description': 'Include engagement metrics (default: true)'
+                        },
+                        'refresh': {
+                            'type': 'boolean',
+                            'description': 'Scrape now instead of serving cached metrics (default: false)'
                         }
                     }
                 }
@@ -829,12 +866,14 @@ def create_mcp_server():
             elif name == 'get_twitter_summary':
                 result = twitter_server.get_twitter_summary(
                     days=arguments.get('days', 7),
-                    include_engagement=arguments.get('include_engagement', True)
+                    include_engagement=arguments.get('include_engagement', True),
+                    refresh=arguments.get('refresh', False)
                 )
             elif name == 'get_recent_tweets':
                 result = twitter_server.get_recent_tweets(
                     limit=arguments.get('limit', 10),
-                    include_metrics=arguments.get('include_metrics', True)
+                    include_metrics=arguments.get('include_metrics', True),
+                    refresh=arguments.get('refresh', False)
                 )
             elif name == 'check_twitter_auth':
                 result = twitter_server.check_authentication()
@@ -0,0 +1,230 @@
+"""
+Twitter Thread Composer - Whole Threads in One Browser Session
+
+Posting a thread used to call post_tweet once per tweet, and every call
+launched a browser, checked the login and navigated from scratch. These
+helpers work on a page that is already open and logged in:
+
+1. The whole thread is composed in X's compose dialog ("Add another
+   post" between tweets) and submitted with a single click.
+2. If the composer cannot add more posts (selectors changed, dialog
+   closed), whatever was composed is submitted and the remaining tweets
+   are posted as a chain of replies on the same page.
+
+The page is only duck-typed (query_selector / click / fill /
+wait_for_timeout), so callers own the Playwright session.
+
+Environment Variables:
+    TWITTER_SUBMIT_POSTS: "true" to click the final Post button. By
+        default posts are composed but not submitted, like post_tweet.
+
+Usage:
+    from scripts.twitter_thread import post_thread_in_session
+
+    with sync_playwright() as p:
+        page = ...  # logged-in page on https://twitter.com/home
+        result = post_thread_in_session(page, tweets, media_paths)
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add project root to sys.path to enable imports from root-level modules
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from log_manager import setup_logging
+
+logger = setup_logging(log_file="logs/ai_employee.log", logger_name="twitter_thread")
+
+SUBMIT_POSTS = os.getenv('TWITTER_SUBMIT_POSTS', 'false').lower() == 'true'
+
+# Opens the compose dialog from the home timeline
+NEW_POST_SELECTORS = ['[data-testid="SideNav_NewTweet_Button"]', 'a[href="/compose/post"]']
+# Text area for the i-th post of the thread being composed
+COMPOSE_BOX_SELECTORS = ['[data-testid="tweetTextarea_{index}"]']
+ADD_POST_SELECTORS = ['[data-testid="addButton"]', '[aria-label="Add post"]', '[aria-label="Add Tweet"]']
+MEDIA_INPUT_SELECTORS = ['input[data-testid="fileInput"]', 'input[type="file"]']
+SUBMIT_SELECTORS = ['[data-testid="tweetButton"]', 'button:has-text("Post all")']
+# "Your post was sent - View" toast, leading to the post just sent
+SENT_LINK_SELECTORS = ['[data-testid="toast"] a[href*="/status/"]']
+REPLY_BOX_SELECTORS = ['[data-testid="tweetTextarea_0"]']
+REPLY_SUBMIT_SELECTORS = ['[data-testid="tweetButtonInline"]', '[data-testid="tweetButton"]']
+
+# UI settle time between steps (ms)
+STEP_PAUSE_MS = 500
+SUBMIT_PAUSE_MS = 3000
+
+
+class ThreadComposeError(Exception):
+    """Raised when not even the first post of a thread could be composed."""
+
+
+def _first(page, selectors: List[str], **fmt):
+    for selector in selectors:
+        try:
+            element = page.query_selector(selector.format(**fmt))
+        except Exception:
+            continue
+        if element:
+            return element
+    return None
+
+
+def _attach_media(page, media_paths: Optional[List[str]]):
+    if not media_paths:
+        return
+    file_input = _first(page, MEDIA_INPUT_SELECTORS)
+    if file_input is None:
+        logger.warning("Could not find media input, posting thread without media")
+        return
+    file_input.set_input_files(media_paths[:4])
+    page.wait_for_timeout(SUBMIT_PAUSE_MS)
+
+
+def compose_in_dialog(page, tweets: List[str], media_paths: Optional[List[str]] = None) -> int:
+    """
+    Compose as much of the thread as possible in one compose dialog.
+
+    Returns:
+        Number of tweets composed (from the start of the thread)
+
+    Raises:
+        ThreadComposeError: If the first tweet could not be composed
+    """
+    opener = _first(page, NEW_POST_SELECTORS)
+    if opener is not None:
+        opener.click()
+        page.wait_for_timeout(STEP_PAUSE_MS)
+
+    composed = 0
+    for index, text in enumerate(tweets):
+        if index > 0:
+            add_button = _first(page, ADD_POST_SELECTORS)
+            if add_button is None:
+                logger.warning(f"No 'add another post' button after tweet {index}, composer stops here")
+                break
+            add_button.click()
+            page.wait_for_timeout(STEP_PAUSE_MS)
+
+        box = _first(page, COMPOSE_BOX_SELECTORS, index=index)
+        if box is None:
+            if index == 0:
+                raise ThreadComposeError("Could not find tweet compose box")
+            logger.warning(f"No compose box for tweet {index + 1}, composer stops here")
+            break
+        box.click()
+        box.fill(text)
+        if index == 0:
+            _attach_media(page, media_paths)
+        composed += 1
+    return composed
+
+
+def _submit(page, selectors: List[str]) -> bool:
+    button = _first(page, selectors)
+    if button is None:
+        return False
+    button.click()
+    page.wait_for_timeout(SUBMIT_PAUSE_MS)
+    return True
+
+
+def reply_chain(page, tweets: List[str]) -> int:
+    """
+    Post tweets as a chain of replies to the post just sent.
+
+    Each reply opens the previous post from the "sent" toast and answers
+    it in place, without a new browser or a fresh navigation to the home
+    timeline.
+
+    Returns:
+        Number of replies posted
+    """
+    posted = 0
+    for text in tweets:
+        sent_link = _first(page, SENT_LINK_SELECTORS)
+        if sent_link is None:
+            logger.warning("Could not find the post just sent, stopping reply chain")
+            break
+        sent_link.click()
+        page.wait_for_timeout(STEP_PAUSE_MS)
+
+        box = _first(page, REPLY_BOX_SELECTORS)
+        if box is None:
+            logger.warning("Could not find reply box, stopping reply chain")
+            break
+        box.click()
+        box.fill(text)
+        if not _submit(page, REPLY_SUBMIT_SELECTORS):
+            logger.warning("Could not find reply button, stopping reply chain")
+            break
+        posted += 1
+    return posted
+
+
+def post_thread_in_session(
+    page,
+    tweets: List[str],
+    media_paths: Optional[List[str]] = None,
+    submit: bool = None
+) -> Dict[str, Any]:
+    """
+    Post a whole thread on an open, logged-in page.
+
+    Args:
+        page: Playwright page (logged in, on the home timeline)
+        tweets: Tweet contents in thread order
+        media_paths: Media for the first tweet (max 4)
+        submit: Click Post (default: TWITTER_SUBMIT_POSTS)
+
+    Returns:
+        Dictionary with status, ``mode`` ('composer' or
+        'composer+replies'), ``composed``/``replied`` counts and
+        ``elapsed_ms``
+    """
+    submit = SUBMIT_POSTS if submit is None else submit
+    started = time.perf_counter()
+
+    try:
+        composed = compose_in_dialog(page, tweets, media_paths)
+    except ThreadComposeError as e:
+        return {"status": "warning", "message": str(e), "platform": "twitter", "posted": 0}
+
+    result: Dict[str, Any] = {
+        "platform": "twitter",
+        "mode": "composer",
+        "composed": composed,
+        "replied": 0,
+        "submitted": False,
+    }
+
+    if not submit:
+        # Dry run, like post_tweet: the thread is composed but not sent
+        logger.info(f"Composed {composed}/{len(tweets)} tweets (TWITTER_SUBMIT_POSTS is off, not posting)")
+        result["posted"] = 0
+        if composed < len(tweets):
+            result["mode"] = "composer+replies"
+            result["pending_replies"] = len(tweets) - composed
+    elif not _submit(page, SUBMIT_SELECTORS):
+        result.update(status="warning", message="Could not find tweet button", posted=0)
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+    else:
+        result["submitted"] = True
+        result["posted"] = composed
+        if composed < len(tweets):
+            result["mode"] = "composer+replies"
+            result["replied"] = reply_chain(page, tweets[composed:])
+            result["posted"] += result["replied"]
+
+    complete = not submit or result["posted"] == len(tweets)
+    result["status"] = "success" if complete else "warning"
+    if not complete:
+        result["message"] = f"Posted {result['posted']} of {len(tweets)} tweets"
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return result
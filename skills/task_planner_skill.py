@@ -17,10 +17,34 @@ Usage:
     )
 """
 
+import hashlib
+import json
 import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from claude_agent_sdk.agent import Agent
-from claude_agent_sdk.tools import Tool
+from string import Template
+from typing import Callable, Dict, Iterator, List, Optional, Pattern
+
+try:
+    import fcntl
+except ImportError:  # Windows: the state file is only guarded within one process
+    fcntl = None
+
+try:
+    from claude_agent_sdk.agent import Agent
+    from claude_agent_sdk.tools import Tool
+    AGENT_SDK_AVAILABLE = True
+except ImportError:
+    # The fast-path planner below is pure Python and must stay importable
+    # from the watchers and orchestrators even without the Agent SDK.
+    Agent = object
+    Tool = None
+    AGENT_SDK_AVAILABLE = False
 
 from log_manager import setup_logging
 from skills.vault_skills import get_vault
@@ -30,6 +54,578 @@ from claude_sdk_wrapper import T
 logger = setup_logging(log_file="logs/ai_employee.log", logger_name="task-planner")
 
 
+# =============================================================================
+# Fast-Path Planner (rule-based, no LLM call)
+# =============================================================================
+
+@dataclass
+class PlanRule:
+    """
+    A deterministic planning rule for a known, mechanical task type.
+
+    A rule matches when the task's frontmatter ``type`` is one of
+    ``task_types``, the optional ``pattern`` is found in the task text, the
+    optional ``exclude`` pattern is not, and the optional ``predicate``
+    returns True. The plan is rendered from
+    ``template`` with ``string.Template`` using the frontmatter fields plus
+    ``file_name`` and ``stem``.
+    """
+    name: str
+    task_types: tuple
+    template: str
+    pattern: Optional[Pattern] = None
+    exclude: Optional[Pattern] = None
+    predicate: Optional[Callable[[Dict[str, str], str], bool]] = None
+    hits: int = field(default=0, compare=False)
+
+    def matches(self, metadata: Dict[str, str], body: str) -> bool:
+        haystack = f"{metadata.get('subject', '')}\n{metadata.get('title', '')}\n{body}"
+        if self.pattern is not None and not self.pattern.search(haystack):
+            return False
+        if self.exclude is not None and self.exclude.search(haystack):
+            return False
+        if self.predicate is not None and not self.predicate(metadata, body):
+            return False
+        return True
+
+    def render(self, file_name: str, metadata: Dict[str, str]) -> str:
+        values = dict(metadata)
+        values.update({"file_name": file_name, "stem": Path(file_name).stem, "rule": self.name})
+        return Template(self.template).safe_substitute(values)
+
+
+class FastPathPlanner:
+    """
+    Registry of deterministic planning rules, indexed by frontmatter ``type``.
+
+    Matching is a dict lookup plus at most a few pre-compiled regex searches,
+    so it runs locally in microseconds. Tasks that no rule matches are
+    counted as escalations and left for the LLM task-planner.
+    """
+
+    def __init__(self):
+        self._rules: Dict[str, List[PlanRule]] = {}
+        self._lock = threading.Lock()
+        self.escalations = 0
+
+    def register(self, rule: PlanRule) -> PlanRule:
+        """Register a rule. Rules for the same type are tried in registration order."""
+        with self._lock:
+            for task_type in rule.task_types:
+                self._rules.setdefault(task_type, []).append(rule)
+        return rule
+
+    def match(self, metadata: Dict[str, str], body: str) -> Optional[PlanRule]:
+        """Return the first rule matching this task, or None."""
+        for rule in self._rules.get(metadata.get("type", ""), ()):
+            if rule.matches(metadata, body):
+                return rule
+        return None
+
+    def plan(self, file_name: str, task_data: dict) -> Optional[str]:
+        """
+        Produce a templated plan for a task without calling the LLM.
+
+        Args:
+            file_name: Name of the task file in Needs_Action.
+            task_data: Result of ``VaultSkills.read_task`` for the file.
+
+        Returns:
+            The plan content, or None if the task must escalate to the LLM planner.
+        """
+        metadata = task_data.get("metadata", {})
+        rule = self.match(metadata, task_data.get("body", ""))
+        with self._lock:
+            if rule is None:
+                self.escalations += 1
+                return None
+            rule.hits += 1
+        logger.info(f"Fast-path rule '{rule.name}' matched {file_name}")
+        return rule.render(file_name, metadata)
+
+    def stats(self) -> dict:
+        """Per-rule hit counts and the number of escalations to the LLM planner."""
+        with self._lock:
+            rules = {}
+            for type_rules in self._rules.values():
+                for rule in type_rules:
+                    rules[rule.name] = rule.hits
+            handled = sum(rules.values())
+            total = handled + self.escalations
+            return {
+                "rules": rules,
+                "fast_path_hits": handled,
+                "escalations": self.escalations,
+                "offload_ratio": round(handled / total, 3) if total else 0.0,
+            }
+
+
+_PLAN_FOOTER = """
+---
+*This plan was generated by the AI Employee fast-path planner (rule: $rule).*
+*Status: Ready for execution*
+"""
+
+EMPTY_FILE_DROP_PLAN = """## Plan Generated for: $file_name
+
+### Analysis
+The dropped file `$original_name` is empty (0 bytes); there is no content to process.
+
+### Implementation Plan
+
+1. **Verify Drop**
+   - [ ] Confirm `$original_name` is still 0 bytes in Needs_Action
+   - [ ] Check the drop folder for a re-upload with content
+
+2. **Completion**
+   - [ ] Move `$file_name` to Done with summary "empty file drop"
+""" + _PLAN_FOOTER
+
+LINKEDIN_POST_REQUEST_PLAN = """## Plan Generated for: $file_name
+
+### Analysis
+$title (source: Post_Ideas/$source_file).
+
+### Implementation Plan
+
+1. **Draft**
+   - [ ] Review the post idea content for tone and accuracy
+   - [ ] Draft the LinkedIn post with hashtags
+
+2. **Approval**
+   - [ ] Create approval request in Pending_Approval
+   - [ ] Wait for human approval
+
+3. **Publish**
+   - [ ] Post to LinkedIn via MCP executor
+   - [ ] Move `$file_name` to Done
+""" + _PLAN_FOOTER
+
+ROUTINE_INVOICE_EMAIL_PLAN = """## Plan Generated for: $file_name
+
+### Analysis
+Routine invoice/billing email from $from: "$subject".
+
+### Implementation Plan
+
+1. **Record**
+   - [ ] Extract invoice number, amount and due date
+   - [ ] Match against open invoices/bills in Odoo
+   - [ ] Log the transaction in Accounting/Current_Month.md
+
+2. **Follow-up**
+   - [ ] Flag for approval if the amount is new or above the payment threshold
+   - [ ] Archive the email and move `$file_name` to Done
+""" + _PLAN_FOOTER
+
+# Routine = an automated billing sender quoting an invoice/receipt number.
+# Anything that reads like a dispute, dunning or complaint goes to the LLM.
+_INVOICE_EMAIL_PATTERN = re.compile(
+    r"\b(?:invoice|receipt|bill)\s*(?:no\.?|number|#)?\s*:?\s*#?[A-Z]{0,4}-?\d{3,}\b"
+    r"|\bINV-?\d{3,}\b",
+    re.IGNORECASE,
+)
+_INVOICE_EMAIL_EXCLUDE = re.compile(
+    r"\b(disput\w*|refund\w*|overdue|past due|legal|lawyer|court|chargeback|complain\w*|"
+    r"incorrect|wrong|error|cancel\w*|final notice|collections?|urgent|reminder)\b",
+    re.IGNORECASE,
+)
+_ROUTINE_BILLING_SENDER = re.compile(
+    r"\b(?:billing|invoices?|accounts?|receipts?|payments?|no-?reply|donotreply|do-not-reply)@",
+    re.IGNORECASE,
+)
+
+
+def _is_empty_file_drop(metadata: Dict[str, str], body: str) -> bool:
+    return metadata.get("size", "").strip() == "0"
+
+
+def _is_from_post_ideas(metadata: Dict[str, str], body: str) -> bool:
+    return bool(metadata.get("source_file"))
+
+
+def _is_routine_billing_sender(metadata: Dict[str, str], body: str) -> bool:
+    return bool(_ROUTINE_BILLING_SENDER.search(metadata.get("from", "")))
+
+
+def _register_default_rules(planner: FastPathPlanner) -> FastPathPlanner:
+    planner.register(PlanRule(
+        name="empty_file_drop",
+        task_types=("file_drop",),
+        template=EMPTY_FILE_DROP_PLAN,
+        predicate=_is_empty_file_drop,
+    ))
+    planner.register(PlanRule(
+        name="linkedin_post_request",
+        task_types=("linkedin_post_request",),
+        template=LINKEDIN_POST_REQUEST_PLAN,
+        predicate=_is_from_post_ideas,
+    ))
+    planner.register(PlanRule(
+        name="routine_invoice_email",
+        task_types=("email",),
+        template=ROUTINE_INVOICE_EMAIL_PLAN,
+        pattern=_INVOICE_EMAIL_PATTERN,
+        exclude=_INVOICE_EMAIL_EXCLUDE,
+        predicate=_is_routine_billing_sender,
+    ))
+    return planner
+
+
+_fast_path_planner = None
+
+
+def get_fast_path_planner() -> FastPathPlanner:
+    """Get singleton fast-path planner with the default rules registered."""
+    global _fast_path_planner
+    if _fast_path_planner is None:
+        _fast_path_planner = _register_default_rules(FastPathPlanner())
+    return _fast_path_planner
+
+
+def try_fast_path_plan(file_name: str, vault=None) -> Optional[str]:
+    """
+    Plan a Needs_Action task with the fast-path rules, if any rule matches.
+
+    Args:
+        file_name: Name of the task file in Needs_Action.
+        vault: Optional VaultSkills instance (defaults to the singleton).
+
+    Returns:
+        Path of the written plan file, or None if the task should escalate
+        to the LLM task-planner.
+    """
+    vault = vault or get_vault()
+    task_data = vault.read_task(file_name)
+    if "error" in task_data:
+        return None
+
+    plan_content = get_fast_path_planner().plan(file_name, task_data)
+    if plan_content is None:
+        return None
+
+    plan_path = vault.write_plan(file_name, plan_content)
+    if "Error" in plan_path:
+        logger.error(f"Fast-path plan for {file_name} could not be written: {plan_path}")
+        return None
+    return plan_path
+
+
+# =============================================================================
+# Single-Flight Planning (deduplicates triggers across call sites and restarts)
+# =============================================================================
+
+# Anchored to the project root so every process shares one in-flight store
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PLANNER_STATE_FILE = PROJECT_ROOT / "logs" / ".planner_inflight.json"
+MAX_COMPLETED_RECORDS = 1000
+
+
+class _Flight:
+    """One in-flight planning call that concurrent callers can join."""
+
+    def __init__(self, key: str, file_name: str):
+        self.key = key
+        self.file_name = file_name
+        self.result: Optional[str] = None
+        self._done = threading.Event()
+
+    def finish(self, result: str):
+        self.result = result
+        self._done.set()
+
+    def wait(self, timeout: float = None) -> Optional[str]:
+        self._done.wait(timeout)
+        return self.result
+
+
+class PlannerSingleFlight:
+    """
+    Single-flight layer for the task-planner.
+
+    Planning requests are keyed by task file identity (resolved path) and a
+    SHA-256 of its content. Concurrent requests for the same key join one
+    in-flight call; repeated requests for a key that already produced a plan
+    return the existing plan. The in-flight set is persisted so that a plan
+    interrupted by a restart is resumed by ``take_interrupted`` instead of
+    being duplicated by the next trigger.
+
+    Every claim and release re-reads the state file under an exclusive file
+    lock and writes back the merged result, so watcher, orchestrator and
+    scheduler processes never erase each other's records.
+    """
+
+    def __init__(self, state_file: Path = PLANNER_STATE_FILE):
+        self.state_file = Path(state_file)
+        self._lock_file = self.state_file.with_suffix(".lock")
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self.joined = 0
+        self.deduplicated = 0
+
+    def _load_state(self) -> dict:
+        try:
+            with open(self.state_file, 'r') as f:
+                state = json.load(f)
+            state.setdefault("in_flight", {})
+            state.setdefault("completed", {})
+            return state
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"in_flight": {}, "completed": {}}
+
+    def _save_state(self, state: dict):
+        """Persist state atomically (caller holds the file lock)."""
+        tmp_file = self.state_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_file, self.state_file)
+
+    @contextmanager
+    def _shared_state(self) -> Iterator[dict]:
+        """
+        Yield the current on-disk state under an exclusive file lock.
+
+        Changes made to the yielded dict are written back before the lock
+        is released.
+        """
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._lock_file, 'a') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                state = self._load_state()
+                before = json.dumps(state, sort_keys=True)
+                yield state
+                if json.dumps(state, sort_keys=True) != before:
+                    self._save_state(state)
+            finally:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    @staticmethod
+    def task_key(file_path: Path) -> str:
+        """Key a task by its resolved path and content hash."""
+        digest = hashlib.sha256(file_path.read_bytes()).hexdigest()
+        return f"{file_path.resolve()}:{digest}"
+
+    @staticmethod
+    def _owner_alive(pid: int) -> bool:
+        if pid == os.getpid():
+            return True
+        try:
+            os.kill(pid, 0)  # Signal 0 checks if process exists without killing it
+            return True
+        except (OSError, TypeError):
+            return False
+
+    def run(self, file_path: Path, plan_fn: Callable[[], str], wait: bool = True) -> Optional[str]:
+        """
+        Run ``plan_fn`` for a task unless an equivalent plan exists or is in flight.
+
+        Args:
+            file_path: Path of the task file in Needs_Action.
+            plan_fn: Callable producing the plan; returns the plan path or an
+                "Error..." message.
+            wait: Block until the plan is produced. When False the planning call
+                runs in a daemon thread and None is returned.
+
+        Returns:
+            The plan path or status message. When ``wait`` is False, None means
+            a new planning call was started; joining one already in flight
+            returns a status message instead.
+        """
+        file_path = Path(file_path)
+        try:
+            key = self.task_key(file_path)
+        except OSError as e:
+            return f"Error: Cannot read task file {file_path.name}: {e}"
+
+        with self._lock, self._shared_state() as state:
+            completed = state["completed"].get(key)
+            if completed and Path(completed["plan"]).exists():
+                self.deduplicated += 1
+                logger.info(f"Plan for {file_path.name} already exists for this content: {completed['plan']}")
+                return completed["plan"]
+
+            flight = self._flights.get(key)
+            joining = flight is not None
+            if joining:
+                self.joined += 1
+                logger.info(f"Joining in-flight planning call for {file_path.name}")
+            else:
+                record = state["in_flight"].get(key)
+                if record and record.get("pid") != os.getpid() and self._owner_alive(record.get("pid")):
+                    self.deduplicated += 1
+                    logger.info(f"Planning for {file_path.name} is in flight in process {record['pid']}")
+                    return f"Planning already in progress for {file_path.name} (pid {record['pid']})"
+
+                flight = _Flight(key, file_path.name)
+                self._flights[key] = flight
+                state["in_flight"][key] = {
+                    "file_name": file_path.name,
+                    "pid": os.getpid(),
+                    "started": datetime.now().isoformat(),
+                }
+
+        # Wait outside the lock: the leader needs it to publish the result
+        if joining:
+            return flight.wait() if wait else f"Joined in-flight planning for {file_path.name}"
+        if not wait:
+            threading.Thread(target=self._execute, args=(flight, plan_fn), daemon=True).start()
+            return None
+        self._execute(flight, plan_fn)
+        return flight.result
+
+    def _execute(self, flight: _Flight, plan_fn: Callable[[], str]):
+        try:
+            result = plan_fn()
+        except Exception as e:
+            logger.error(f"Planning call for {flight.file_name} failed: {e}")
+            result = f"Error: {e}"
+
+        with self._lock, self._shared_state() as state:
+            self._flights.pop(flight.key, None)
+            state["in_flight"].pop(flight.key, None)
+            if result and "Error" not in result and Path(result).exists():
+                completed = state["completed"]
+                completed[flight.key] = {
+                    "file_name": flight.file_name,
+                    "plan": result,
+                    "finished": datetime.now().isoformat(),
+                }
+                while len(completed) > MAX_COMPLETED_RECORDS:
+                    completed.pop(next(iter(completed)))
+        flight.finish(result)
+
+    def take_interrupted(self) -> List[str]:
+        """
+        Claim planning calls left in flight by a process that is no longer running.
+
+        The stale records are dropped; resuming re-registers them under the
+        current content hash.
+
+        Returns:
+            File names whose planning was interrupted.
+        """
+        with self._lock, self._shared_state() as state:
+            stale = {
+                key: record for key, record in state["in_flight"].items()
+                if key not in self._flights
+                and (record.get("pid") == os.getpid() or not self._owner_alive(record.get("pid")))
+            }
+            for key in stale:
+                del state["in_flight"][key]
+            return sorted({record["file_name"] for record in stale.values()})
+
+    def stats(self) -> dict:
+        with self._lock, self._shared_state() as state:
+            return {
+                "in_flight": len(state["in_flight"]),
+                "completed": len(state["completed"]),
+                "joined": self.joined,
+                "deduplicated": self.deduplicated,
+            }
+
+
+_planner_single_flight = None
+
+
+def get_planner_single_flight() -> PlannerSingleFlight:
+    """Get singleton single-flight layer for the task-planner."""
+    global _planner_single_flight
+    if _planner_single_flight is None:
+        _planner_single_flight = PlannerSingleFlight()
+    return _planner_single_flight
+
+
+def generate_plan_with_llm(file_name: str, description: str = None, vault=None) -> str:
+    """
+    Generate a plan with the task-planner subagent and save it as Plan_*.md.
+
+    Args:
+        file_name: Name of the task file in Needs_Action.
+        description: Optional task description override.
+        vault: Optional VaultSkills instance (defaults to the singleton).
+
+    Returns:
+        Path of the written plan file or an error message.
+    """
+    vault = vault or get_vault()
+    plan_prompt = f"""Process the task file '{file_name}' located in AI_Employee_Vault/Needs_Action.
+
+Your responsibilities:
+1. Read and analyze the content of the task file
+2. Generate a detailed, step-by-step implementation plan
+3. Return the plan in markdown format with clear sections and checkboxes for action items.
+
+File to process: {file_name}
+"""
+    task = T(
+        description=description or f"Process new task file {file_name} with task-planner skill",
+        prompt=plan_prompt,
+        subagent_type='task-planner',
+        model='opus',
+        run_in_background=False,  # The single-flight layer owns concurrency
+        allowed_tools=["Read", "Write", "Glob", "Edit", "Bash", "Skill"],
+        system_prompt="""You are a task-planner specialist for the AI Employee system.
+Your role is to analyze task files in Needs_Action and generate detailed implementation plans.
+Always save plans as Plan_*.md files in the Needs_Action folder."""
+    )
+    logger.info(f"Task-planner completed for {file_name}. Task ID: {task.task_id}")
+
+    if not task.output:
+        return f"Error: No plan content generated for {file_name}"
+    return vault.write_plan(file_name, task.output)
+
+
+def plan_task_once(file_name: str, description: str = None, vault=None, wait: bool = True) -> Optional[str]:
+    """
+    Plan a Needs_Action task exactly once per (file, content) pair.
+
+    Tries the fast-path rules first and escalates to the LLM task-planner,
+    all behind the single-flight layer so that every trigger site (Inbox
+    watcher, orchestrators, scheduler) shares one planning call per task.
+
+    Args:
+        file_name: Name of the task file in Needs_Action.
+        description: Optional task description for the LLM planner.
+        vault: Optional VaultSkills instance (defaults to the singleton).
+        wait: Block until the plan is written. When False, planning runs in
+            the background and None is returned.
+
+    Returns:
+        Path of the plan file or a status/error message (None when not waiting
+        and a new planning call was started).
+    """
+    vault = vault or get_vault()
+
+    def _plan() -> str:
+        fast_plan_path = try_fast_path_plan(file_name, vault)
+        if fast_plan_path:
+            logger.info(f"Fast-path plan written for {file_name}: {fast_plan_path}")
+            return fast_plan_path
+        return generate_plan_with_llm(file_name, description, vault)
+
+    return get_planner_single_flight().run(vault.needs_action / file_name, _plan, wait=wait)
+
+
+def resume_interrupted_plans(vault=None) -> List[str]:
+    """
+    Resume planning calls that were in flight when a previous process exited.
+
+    Returns:
+        File names whose planning was resumed in the background.
+    """
+    vault = vault or get_vault()
+    resumed = []
+    for file_name in get_planner_single_flight().take_interrupted():
+        if (vault.needs_action / file_name).exists():
+            logger.info(f"Resuming interrupted planning for {file_name}")
+            plan_task_once(file_name, vault=vault, wait=False)
+            resumed.append(file_name)
+    return resumed
+
+
 class TaskPlannerSkill(Agent):
     """
     Claude Agent Skill for planning tasks based on markdown file content.
@@ -39,6 +635,8 @@ class TaskPlannerSkill(Agent):
     """
     
     def __init__(self):
+        if not AGENT_SDK_AVAILABLE:
+            raise ImportError("claude_agent_sdk is required for TaskPlannerSkill")
         super().__init__()
         self.vault = get_vault()
         logger.info("TaskPlannerSkill initialized.")
@@ -78,6 +676,14 @@ class TaskPlannerSkill(Agent):
         task_content = task_data["full_content"]
         logger.debug(f"Successfully read content for {file_name}. Content length: {len(task_content)}")
 
+        # Step 1b: Known mechanical task types are planned locally from templates
+        fast_plan = get_fast_path_planner().plan(file_name, task_data)
+        if fast_plan is not None:
+            plan_filepath_str = self.vault.write_plan(file_name, fast_plan)
+            if "Error" not in plan_filepath_str:
+                return f"Plan for {file_name} generated (fast path) and saved to {plan_filepath_str}"
+            logger.error(f"Failed to write fast-path plan for {file_name}: {plan_filepath_str}")
+
         # Step 2: Use T class to spawn a general-purpose subagent for planning
         plan_prompt = f"""
 Analyze the following task description from the file '{file_name}' and create a detailed, step-by-step implementation plan.
@@ -0,0 +1,167 @@
+"""
+Test Suite for the Append-Only Accounting Ledger
+
+Tests that AccountingManager.log_transaction appends to the ledger store
+without rewriting Current_Month.md, that running totals are exact, that
+the Markdown view is rendered on a debounce and still parses back, that
+the store refuses edits, and that a Markdown-only ledger is imported.
+
+Run: python test_accounting_ledger.py
+"""
+
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.accounting_ledger import AccountingLedgerStore
+from scripts.accounting_manager import AccountingManager
+
+LEGACY_LEDGER = """---
+month: March 2026
+created: 2026-03-01
+last_updated: 2026-03-15T10:00:00
+total_income: 5000.00
+total_expense: 150.00
+balance: 4850.00
+---
+
+# Accounting Ledger - March 2026
+
+## Transactions
+
+### TXN-20260314-A1B
+- **Date:** 2026-03-14
+- **Type:** income
+- **Amount:** $5,000.00
+- **Description:** Client payment - Project Alpha
+- **Category:** revenue
+- **Reference:** INV-001
+- **Logged at:** 2026-03-14T09:00:00
+
+---
+
+### TXN-20260314-C2D
+- **Date:** 2026-03-14
+- **Type:** expense
+- **Amount:** $150.00
+- **Description:** Software subscription
+- **Category:** software
+- **Reference:** N/A
+- **Logged at:** 2026-03-14T09:05:00
+
+---
+
+## Summary
+"""
+
+
+def _manager(tmp, **kwargs):
+    store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+    return AccountingManager(vault_path=str(Path(tmp) / "vault"), store=store, **kwargs), store
+
+
+def test_log_is_append_only_and_view_debounced():
+    """2,000 logs append to the store; Current_Month.md is rendered once on flush."""
+    with tempfile.TemporaryDirectory() as tmp:
+        accounting, store = _manager(tmp, view_debounce=60)
+        view_before = accounting.current_month_file.read_text()
+
+        started = time.perf_counter()
+        for n in range(2000):
+            accounting.log_transaction(
+                date=f"2026-03-{n % 28 + 1:02d}", type="income" if n % 4 else "expense",
+                amount=0.1 if n % 2 else 0.2, description=f"Entry {n}", category=f"cat{n % 5}",
+            )
+        per_log_ms = (time.perf_counter() - started) * 1000 / 2000
+
+        assert accounting.current_month_file.read_text() == view_before, "No rewrite per log"
+        totals = accounting.get_totals()
+        assert totals["transaction_count"] == 2000 and totals["expense_count"] == 500
+        assert totals["total_expense"] == 100.0 and totals["total_income"] == 200.0, totals
+        assert totals["balance"] == 100.0
+
+        assert accounting.flush_view() is True
+        assert accounting.render_view() is False, "Nothing logged since the last render"
+        parsed = accounting._parse_transactions()
+        assert len(parsed) == 2000 and parsed[-1]["description"] == "Entry 1999"
+        assert "total_income: 200.00" in accounting.current_month_file.read_text()
+        assert len(accounting.get_transactions(type="expense", category="cat0")) == 100
+        accounting.close()
+        store.close()
+    print(f"  [OK] 2,000 logs at {per_log_ms:.2f} ms each; view rendered once on flush")
+
+
+def test_debounced_render_fires():
+    """A pending render is written when the debounce window ends."""
+    with tempfile.TemporaryDirectory() as tmp:
+        accounting, store = _manager(tmp, view_debounce=0.05)
+        result = accounting.log_transaction("2026-03-14", "income", 5000.0, "Client payment", "revenue", "INV-001")
+        deadline = time.time() + 5
+        while result["transaction_id"] not in accounting.current_month_file.read_text():
+            assert time.time() < deadline, "Debounced render never happened"
+            time.sleep(0.02)
+        accounting.close()
+        store.close()
+    print("  [OK] Debounced render written after the window")
+
+
+def test_store_refuses_edits():
+    """Logged transactions cannot be updated or deleted."""
+    with tempfile.TemporaryDirectory() as tmp:
+        accounting, store = _manager(tmp, view_debounce=0)
+        accounting.log_transaction("2026-03-14", "expense", 150.0, "Software", "software")
+        for statement in ("UPDATE transactions SET amount_cents = 1", "DELETE FROM transactions"):
+            try:
+                store._conn.execute(statement)
+                assert False, f"{statement} should be rejected"
+            except sqlite3.DatabaseError as e:
+                assert "append-only" in str(e)
+        assert accounting.get_balance() == -150.0
+        try:
+            accounting.log_transaction("14/03/2026", "expense", 10.0, "Bad date")
+            assert False, "Invalid date should raise"
+        except ValueError:
+            pass
+        accounting.close()
+        store.close()
+    print("  [OK] Ledger rows are append-only")
+
+
+def test_markdown_ledger_imported_once():
+    """An existing Markdown-only ledger is imported into an empty store."""
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = Path(tmp) / "vault" / "Accounting" / "Current_Month.md"
+        ledger.parent.mkdir(parents=True)
+        ledger.write_text(LEGACY_LEDGER)
+
+        # Keep the fixed-date March books open whatever today's date is
+        accounting, store = _manager(tmp, view_debounce=0, close_after_days=3650)
+        assert accounting.get_totals()["balance"] == 4850.0
+        imported = accounting.get_transactions()
+        assert [t["transaction_id"] for t in imported] == ["TXN-20260314-A1B", "TXN-20260314-C2D"]
+        assert imported[1]["reference"] is None
+
+        accounting.log_transaction("2026-03-15", "expense", 1000.0, "Office Rent", "rent")
+        again = AccountingManager(vault_path=str(Path(tmp) / "vault"), store=store, view_debounce=0,
+                                  close_after_days=3650)
+        assert again.get_totals()["transaction_count"] == 3, "Not imported twice"
+        assert "balance: 3850.00" in ledger.read_text()
+        accounting.close()
+        again.close()
+        store.close()
+    print("  [OK] Markdown-only ledger imported into the store once")
+
+
+if __name__ == "__main__":
+    test_log_is_append_only_and_view_debounced()
+    test_debounced_render_fires()
+    test_store_refuses_edits()
+    test_markdown_ledger_imported_once()
+    print("ALL TESTS PASSED!")
@@ -0,0 +1,117 @@
+"""
+Test Suite for the Action Worker Pool
+
+Tests submit/execute results and stats, worker crashes, and timeouts:
+a queued action is cancelled, a running one keeps running and a retry
+for the same approval joins it instead of executing the action twice.
+
+Run: python test_action_worker_pool.py
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.action_worker_pool import ActionWorkerPool
+
+calls = []
+release = threading.Event()
+
+
+def fake_action(action_type, data, approval_id, deadline_at):
+    """Stand-in for _run_action: records the call and optionally blocks."""
+    calls.append(approval_id)
+    if data.get("crash"):
+        raise RuntimeError("browser died")
+    if data.get("block"):
+        release.wait(5)
+    return {"status": "success", "message": f"{action_type} done", "approval_id": approval_id,
+            "deadline_at": deadline_at, "duration_ms": 1.0}
+
+
+def _reset():
+    calls.clear()
+    release.clear()
+
+
+def _settled(pool: ActionWorkerPool) -> dict:
+    """Stats once done-callbacks (run just after a result is set) have caught up."""
+    deadline = time.time() + 5
+    while pool.stats()["in_flight"] and time.time() < deadline:
+        time.sleep(0.01)
+    return pool.stats()
+
+
+def test_submit_and_execute():
+    """Results come back as dicts; crashes become error results; stats add up."""
+    _reset()
+    pool = ActionWorkerPool(max_workers=2, runner=fake_action)
+    try:
+        result = pool.execute("gmail_send", {"to": "a@example.com"}, "EMAIL_1", timeout=5)
+        assert result["status"] == "success" and result["deadline_at"] > time.time()
+        assert pool.submit("linkedin_post", {}, "POST_1").result(timeout=5)["message"] == "linkedin_post done"
+
+        crashed = pool.execute("linkedin_post", {"crash": True}, "POST_2", timeout=5)
+        assert crashed["status"] == "error" and "browser died" in crashed["message"]
+
+        stats = _settled(pool)
+        assert (stats["submitted"], stats["succeeded"], stats["failed"], stats["in_flight"]) == (3, 2, 1, 0), stats
+    finally:
+        pool.shutdown()
+    print("  [OK] submit/execute return results; worker crash reported as error")
+
+
+def test_timeout_running_action_is_not_rerun():
+    """A running action outlives its timeout; retrying the approval joins it."""
+    _reset()
+    pool = ActionWorkerPool(max_workers=2, runner=fake_action)
+    try:
+        first = pool.execute("gmail_send", {"block": True}, "EMAIL_SLOW", timeout=0.1)
+        assert first["status"] == "error" and first["still_running"], first
+
+        retry = pool.submit("gmail_send", {"block": True}, "EMAIL_SLOW")
+        assert pool.stats()["joined"] == 1 and pool.stats()["in_flight"] == 1
+        release.set()
+        assert retry.result(timeout=5)["status"] == "success"
+        assert calls == ["EMAIL_SLOW"], "Executed once"
+
+        # Once finished, the same approval can be submitted again
+        _settled(pool)
+        pool.execute("gmail_send", {}, "EMAIL_SLOW", timeout=5)
+        assert calls == ["EMAIL_SLOW", "EMAIL_SLOW"]
+    finally:
+        release.set()
+        pool.shutdown()
+    print("  [OK] Timed-out running action tracked; retry joined instead of re-running")
+
+
+def test_timeout_queued_action_is_cancelled():
+    """An action still queued when its timeout expires never runs."""
+    _reset()
+    pool = ActionWorkerPool(max_workers=1, runner=fake_action)
+    try:
+        blocker = pool.submit("linkedin_post", {"block": True}, "POST_BLOCK")
+        queued = pool.execute("gmail_send", {}, "EMAIL_QUEUED", timeout=0.1)
+        assert queued["status"] == "error" and queued["cancelled"], queued
+        release.set()
+        blocker.result(timeout=5)
+        assert calls == ["POST_BLOCK"], "Cancelled action never ran"
+        stats = _settled(pool)
+        assert stats["cancelled"] == 1 and stats["in_flight"] == 0
+    finally:
+        release.set()
+        pool.shutdown()
+    print("  [OK] Queued action cancelled on timeout")
+
+
+if __name__ == "__main__":
+    test_submit_and_execute()
+    test_timeout_running_action_is_not_rerun()
+    test_timeout_queued_action_is_cancelled()
+    print("ALL TESTS PASSED!")
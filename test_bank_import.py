@@ -0,0 +1,231 @@
+"""
+Test Suite for the Bank Statement Import
+
+Tests importing test.csv and OFX statements into the accounting ledger:
+compiled categorization, per-occurrence duplicate detection against the
+ledger, one atomic write per statement, and bounded memory on a large
+statement.
+
+Run: python test_bank_import.py
+"""
+
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.accounting_ledger import AccountingLedgerStore
+from scripts.accounting_manager import AccountingManager
+from scripts.bank_import import CategoryRules, import_bank_statement
+
+OFX_STATEMENT = """OFXHEADER:100
+DATA:OFXSGML
+
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>POS
+<DTPOSTED>20260302120000[0:GMT]
+<TRNAMT>-45.90
+<FITID>2026030201
+<NAME>UBER TRIP HELP.UBER.COM
+</STMTTRN>
+<STMTTRN>
+<TRNTYPE>POS
+<DTPOSTED>20260303
+<TRNAMT>12.50
+<FITID>2026030301
+<NAME>Cafe refund
+</STMTTRN>
+<STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20260305<TRNAMT>1,200.00<FITID>2026030501<MEMO>Invoice 1042 paid</STMTTRN>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>bad
+<TRNAMT>-1
+</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+
+
+def test_import_test_csv_and_reimport():
+    """test.csv imports once; importing it again only finds duplicates."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+        accounting = AccountingManager(vault_path=str(Path(tmp) / "vault"), store=store, view_debounce=0)
+
+        first = accounting.import_bank_statement(str(project_root / "test.csv"))
+        assert first["status"] == "success" and first["imported"] == 4 and first["duplicates"] == 0
+        assert first["totals"]["expense"]["by_category"] == {"food": 2500.0, "utilities": 12000.0, "transfer": 90000.0}
+        assert accounting.get_totals()["balance"] == 80000.0 - 104500.0
+
+        again = accounting.import_bank_statement(str(project_root / "test.csv"))
+        assert again["imported"] == 0 and again["duplicates"] == 4
+        assert "Salary Deposit" in accounting.current_month_file.read_text(), "View re-rendered after import"
+        accounting.close()
+        store.close()
+    print("  [OK] test.csv: 4 imported, re-import finds 4 duplicates")
+
+
+def test_duplicates_counted_per_occurrence():
+    """Same-day repeats import; rows matching logged transactions are skipped."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+        accounting = AccountingManager(vault_path=str(Path(tmp) / "vault"), store=store, view_debounce=0)
+        accounting.log_transaction("2026-03-28", "expense", 25.0, "KFC  food!", "food")
+
+        statement = Path(tmp) / "march.csv"
+        statement.write_text("date,description,amount\n" + "2026-03-28,kfc food,-25.00\n" * 3 + "2026-03-28,KFC Food,25.00\n")
+        result = import_bank_statement(str(statement), store=store, chunk_size=2)
+        assert result["duplicates"] == 1 and result["imported"] == 3, result
+        assert import_bank_statement(str(statement), store=store)["imported"] == 0
+
+        statement.write_text("date,description,amount\n" + "2026-03-28,KFC Food,-25.00\n" * 4)
+        assert import_bank_statement(str(statement), store=store)["imported"] == 1, "Only the 4th KFC is new"
+        assert len(accounting.get_transactions(type="expense")) == 4
+        accounting.close()
+        store.close()
+    print("  [OK] Duplicates matched per occurrence on (date, amount, normalized description)")
+
+
+def test_ofx_and_invalid_rows():
+    """OFX SGML parses with the signed amount; bad rows are reported, not fatal."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+        statement = Path(tmp) / "march.ofx"
+        statement.write_text(OFX_STATEMENT)
+
+        result = import_bank_statement(str(statement), store=store)
+        assert result["status"] == "partial" and result["imported"] == 3 and result["invalid"] == 1
+        assert result["errors"][0].startswith("line 20:")
+        rows = {t["reference"]: t for t in store.transactions()}
+        assert rows["2026030201"]["category"] == "travel" and rows["2026030201"]["type"] == "expense"
+        assert rows["2026030301"]["type"] == "income", "Positive POS amount is a refund"
+        assert rows["2026030501"]["amount"] == 1200.0 and rows["2026030501"]["category"] == "revenue"
+
+        statement = Path(tmp) / "broken.csv"
+        statement.write_text("date,memo\n2026-03-01,x\n")
+        try:
+            import_bank_statement(str(statement), store=store)
+            assert False, "Missing columns should raise"
+        except ValueError as e:
+            assert "amount" in str(e)
+        store.close()
+    print("  [OK] OFX imported; invalid rows reported without aborting")
+
+
+def test_failed_import_writes_nothing():
+    """An error midway through the statement rolls the whole batch back."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+        statement = Path(tmp) / "big.csv"
+        statement.write_text("date,description,amount\n" + "".join(
+            f"2026-03-{n % 28 + 1:02d},Card purchase {n},-{n + 1}.00\n" for n in range(1000)))
+
+        rules = CategoryRules()
+        calls = []
+
+        def failing(description):
+            calls.append(description)
+            if len(calls) > 700:
+                raise RuntimeError("disk full")
+            return "uncategorized"
+
+        rules.categorize = failing
+        try:
+            import_bank_statement(str(statement), store=store, rules=rules, chunk_size=250)
+            assert False, "Should raise"
+        except RuntimeError:
+            pass
+        assert store.count() == 0 and store.last_seq() == 0
+        store.close()
+    print("  [OK] Failed import leaves the ledger untouched")
+
+
+def test_existing_ledger_gets_dedupe_keys():
+    """A ledger created before dedupe keys is backfilled and stays append-only."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "ledger.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.executescript("""
+            CREATE TABLE transactions (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT, transaction_id TEXT NOT NULL UNIQUE,
+                date TEXT NOT NULL, period TEXT NOT NULL, type TEXT NOT NULL, amount_cents INTEGER NOT NULL,
+                description TEXT, category TEXT NOT NULL, reference TEXT, logged_at TEXT NOT NULL);
+            CREATE TRIGGER transactions_no_update BEFORE UPDATE ON transactions
+            BEGIN SELECT RAISE(ABORT, 'accounting ledger is append-only'); END;
+            INSERT INTO transactions VALUES (1, 'TXN-20260328-ABC', '2026-03-28', '2026-03', 'expense', 250000,
+                                             'Electric Bill', 'utilities', NULL, '2026-03-28T10:00:00');
+        """)
+        conn.close()
+
+        store = AccountingLedgerStore(db_path)
+        assert import_bank_statement(str(project_root / "test.csv"), store=store)["duplicates"] == 0
+        statement = Path(tmp) / "bill.csv"
+        statement.write_text("date,description,amount\n2026-03-28,ELECTRIC BILL,-2500\n")
+        assert import_bank_statement(str(statement), store=store)["duplicates"] == 1
+        try:
+            store._conn.execute("UPDATE transactions SET amount_cents = 1")
+            assert False, "Trigger should be restored"
+        except sqlite3.DatabaseError:
+            pass
+        store.close()
+    print("  [OK] Existing ledger backfilled with dedupe keys")
+
+
+def _write_statement(path: Path, rows: int):
+    descriptions = ["KFC Food", "Electric Bill", "Salary Deposit", "Adobe subscription", "Uber trip", "Misc"]
+    with open(path, "w") as f:
+        f.write("date,description,amount,type\n")
+        for n in range(rows):
+            amount = n % 997 + 1
+            credit = n % 6 == 2
+            f.write(f"2025-{n % 12 + 1:02d}-{n % 28 + 1:02d},{descriptions[n % 6]} #{n % 50},"
+                    f"{amount if credit else -amount},{'credit' if credit else 'debit'}\n")
+
+
+def test_large_statement_bounded_memory():
+    """Peak memory depends on the chunk size, not the statement length."""
+    peaks = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in (4_000, 32_000):
+            store = AccountingLedgerStore(Path(tmp) / f"ledger_{rows}.db")
+            statement = Path(tmp) / f"year_{rows}.csv"
+            _write_statement(statement, rows)
+
+            tracemalloc.start()
+            result = import_bank_statement(str(statement), store=store, chunk_size=500)
+            peaks[rows] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            assert result["imported"] == rows and result["invalid"] == 0
+            assert result["totals"]["income"]["by_category"].keys() == {"salary"}
+            assert store.count() == rows
+            store.close()
+
+        statement = Path(tmp) / "year_100000.csv"
+        _write_statement(statement, 100_000)
+        store = AccountingLedgerStore(Path(tmp) / "ledger_100000.db")
+        started = time.perf_counter()
+        assert import_bank_statement(str(statement), store=store)["imported"] == 100_000
+        elapsed = time.perf_counter() - started
+        store.close()
+
+    assert peaks[32_000] < peaks[4_000] * 1.5, peaks
+    print(f"  [OK] Peak {peaks[4_000] / 1e6:.1f} MB at 4k rows, {peaks[32_000] / 1e6:.1f} MB at 32k; "
+          f"100k rows in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    test_import_test_csv_and_reimport()
+    test_duplicates_counted_per_occurrence()
+    test_ofx_and_invalid_rows()
+    test_failed_import_writes_nothing()
+    test_existing_ledger_gets_dedupe_keys()
+    test_large_statement_bounded_memory()
+    print("ALL TESTS PASSED!")
@@ -0,0 +1,72 @@
+"""
+Test Suite for the Execution Ledger
+
+Tests exactly-once execution: completed actions are never repeated,
+concurrent claims are refused, and interrupted attempts are held as
+uncertain instead of being re-sent.
+
+Run: python test_execution_ledger.py
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.execution_ledger import ExecutionLedger
+
+
+def test_ledger_exactly_once():
+    """A succeeded action is replayed from the ledger, a failed one may retry."""
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = ExecutionLedger(Path(tmp) / "ledger.db")
+        data = {"to": "client@example.com", "subject": "Invoice", "body": "Hi"}
+
+        first = ledger.begin("APPROVAL_1", "gmail_send", data)
+        assert first.proceed and first.attempts == 1
+        assert ledger.begin("APPROVAL_1", "gmail_send", data).decision == "in_progress"
+
+        ledger.fail(first.key, "SMTP timeout")
+        retry = ledger.begin("APPROVAL_1", "gmail_send", data)
+        assert retry.proceed and retry.attempts == 2, "Failed attempts may be retried"
+
+        ledger.succeed(retry.key, {"status": "success", "message": "sent"})
+        replay = ledger.begin("APPROVAL_1", "gmail_send", data)
+        assert replay.decision == "duplicate"
+        assert replay.result["message"] == "sent"
+
+        # Edited content is a different action
+        edited = ledger.begin("APPROVAL_1", "gmail_send", dict(data, body="Hello"))
+        assert edited.proceed
+        assert len(ledger.for_approval("APPROVAL_1")) == 2
+        ledger.close()
+    print("  [OK] Exactly-once replay and retry after failure")
+
+
+def test_ledger_interrupted_attempt_is_uncertain():
+    """An attempt whose lease expired is held for a human, then resolvable."""
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = ExecutionLedger(Path(tmp) / "ledger.db", lease_seconds=0)
+        entry = ledger.begin("APPROVAL_2", "linkedin_post", {"content": "Launch"})
+        time.sleep(0.01)
+
+        held = ledger.begin("APPROVAL_2", "linkedin_post", {"content": "Launch"})
+        assert held.decision == "uncertain" and not held.proceed
+
+        ledger.resolve(entry.key, succeeded=True, note="Post found on LinkedIn")
+        assert ledger.begin("APPROVAL_2", "linkedin_post", {"content": "Launch"}).decision == "duplicate"
+        assert ledger.compact(retain_days=0) == 1
+        assert ledger.get(entry.key) is None
+        ledger.close()
+    print("  [OK] Interrupted attempt held as uncertain, resolved and compacted")
+
+
+if __name__ == "__main__":
+    test_ledger_exactly_once()
+    test_ledger_interrupted_attempt_is_uncertain()
+    print("ALL TESTS PASSED!")
@@ -0,0 +1,144 @@
+"""
+Test Suite for the Execution Notifier
+
+Tests that approvals pushed by the dashboard wake a waiting executor
+immediately, are claimed by one consumer only, and that approve-to-execute
+latency is recorded.
+
+Run: python test_execution_notifier.py
+"""
+
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.execution_notifier import ExecutionNotifier
+
+
+def test_push_wakes_waiting_executor():
+    """A notification wakes a blocked consumer within milliseconds."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        consumer = ExecutionNotifier(tmp / "queue.db", tmp / "wake")
+        producer = ExecutionNotifier(tmp / "queue.db", tmp / "wake")
+        listening = consumer.listen("executor")
+
+        woke = {}
+
+        def wait():
+            started = time.monotonic()
+            woke["result"] = consumer.wait(timeout=5)
+            woke["elapsed"] = time.monotonic() - started
+
+        waiter = threading.Thread(target=wait)
+        waiter.start()
+        time.sleep(0.05)
+        producer.notify([("APPROVAL_1", tmp / "APPROVAL_1.md")])
+        waiter.join(timeout=6)
+
+        assert woke["result"] is True
+        assert woke["elapsed"] < 1.0, f"Wake-up took {woke['elapsed']:.3f}s"
+
+        items = consumer.drain("executor")
+        assert [item["approval_id"] for item in items] == ["APPROVAL_1"]
+        assert producer.drain("other") == [], "A notification is claimed only once"
+
+        consumer.mark_started("APPROVAL_1")
+        consumer.mark_finished("APPROVAL_1", success=True)
+        stats = consumer.latency_stats()
+        assert stats["samples"] == 1 and stats["pending"] == 0
+        assert 0 <= stats["pickup_ms"]["avg"] <= stats["finish_ms"]["avg"]
+
+        consumer.close()
+        producer.close()
+        mode = "socket" if listening else "polling"
+        print(f"  [OK] Woken in {woke['elapsed'] * 1000:.1f} ms ({mode}), "
+              f"approve-to-finish {stats['finish_ms']['avg']} ms")
+
+
+def test_notifications_survive_missed_wakeups():
+    """Approvals queued while no executor listens are drained later."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        producer = ExecutionNotifier(tmp / "queue.db", tmp / "wake")
+        producer.notify([("A", tmp / "A.md"), ("B", tmp / "B.md")])
+
+        consumer = ExecutionNotifier(tmp / "queue.db", tmp / "wake")
+        consumer.listen("executor")
+        assert consumer.wait(timeout=0.1) is True
+        assert [item["approval_id"] for item in consumer.drain("executor")] == ["A", "B"]
+        assert consumer.wait(timeout=0.05) is False
+        consumer.close()
+        producer.close()
+    print("  [OK] Queued approvals survive missed wake-ups")
+
+
+def test_consumers_only_claim_their_action_types():
+    """Two consumers draining one queue each get only the approvals they execute."""
+    executor_types = ("email_send_approval", "linkedin_post_approval")
+    orchestrator_types = ("social_post_draft", "payment_approval")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        producer = ExecutionNotifier(tmp / "queue.db", tmp / "wake")
+        executor = ExecutionNotifier(tmp / "queue.db", tmp / "wake")
+        orchestrator = ExecutionNotifier(tmp / "queue.db", tmp / "wake")
+        producer.notify([
+            ("POST", tmp / "POST.md", "social_post_draft"),
+            ("EMAIL", tmp / "EMAIL.md", "email_send_approval"),
+            ("PAY", tmp / "PAY.md", "payment_approval"),
+            ("LEGACY", tmp / "LEGACY.md"),
+        ])
+
+        # The executor drains first but leaves the orchestrator's approvals queued
+        assert executor.wait(timeout=0.1, action_types=executor_types) is True
+        claimed = executor.drain("mcp-executor", action_types=executor_types)
+        assert [item["approval_id"] for item in claimed] == ["EMAIL", "LEGACY"]
+        assert claimed[0]["action_type"] == "email_send_approval"
+        assert executor.wait(timeout=0.05, action_types=executor_types) is False
+
+        assert orchestrator.pending(orchestrator_types) == 2
+        claimed = orchestrator.drain("local-orchestrator", action_types=orchestrator_types)
+        assert [item["approval_id"] for item in claimed] == ["POST", "PAY"]
+        assert producer.pending() == 0
+
+        for notifier in (producer, executor, orchestrator):
+            notifier.close()
+    print("  [OK] Consumers only claim the action types they execute")
+
+
+def test_queue_created_before_action_types_is_migrated():
+    """An existing queue database gains the action_type column."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        conn = sqlite3.connect(str(tmp / "queue.db"))
+        conn.execute(
+            "CREATE TABLE notifications (id INTEGER PRIMARY KEY AUTOINCREMENT, approval_id TEXT NOT NULL, "
+            "file_path TEXT NOT NULL, approved_at REAL NOT NULL, claimed_at REAL, claimed_by TEXT, "
+            "started_at REAL, finished_at REAL, success INTEGER)"
+        )
+        conn.execute("INSERT INTO notifications (approval_id, file_path, approved_at) VALUES ('OLD', 'OLD.md', 1)")
+        conn.commit()
+        conn.close()
+
+        notifier = ExecutionNotifier(tmp / "queue.db", tmp / "wake")
+        notifier.notify([("NEW", tmp / "NEW.md", "payment_approval")])
+        claimed = notifier.drain("local-orchestrator", action_types=("payment_approval",))
+        assert [item["approval_id"] for item in claimed] == ["OLD", "NEW"]
+        notifier.close()
+    print("  [OK] Existing queue databases are migrated")
+
+
+if __name__ == "__main__":
+    test_push_wakes_waiting_executor()
+    test_notifications_survive_missed_wakeups()
+    test_consumers_only_claim_their_action_types()
+    test_queue_created_before_action_types_is_migrated()
+    print("ALL TESTS PASSED!")
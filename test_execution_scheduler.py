@@ -0,0 +1,156 @@
+"""
+Test Suite for the Execution Scheduler
+
+Tests per-channel lanes (a slow channel does not hold up others),
+token-bucket rate limiting, priority/deadline/age ordering and delayed
+actions.
+
+Run: python test_execution_scheduler.py
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.execution_scheduler import (
+    ExecutionScheduler,
+    Lane,
+    LaneConfig,
+    TimerWheel,
+    TokenBucket,
+    action_schedule,
+    channel_for,
+)
+
+
+def test_token_bucket_burst_then_rate():
+    """A bucket allows a burst, then refills at its rate."""
+    bucket = TokenBucket(rate=20.0, burst=3)
+    assert all(bucket.try_acquire() == 0.0 for _ in range(3)), "Burst of 3 should be immediate"
+    assert bucket.try_acquire() > 0, "4th token should have to wait"
+
+    start = time.monotonic()
+    assert bucket.acquire(timeout=1)
+    elapsed = time.monotonic() - start
+    assert 0.02 <= elapsed < 0.5, f"Refill at 20/s should take ~50ms, took {elapsed:.3f}s"
+    print(f"  [OK] Burst then refill after {elapsed * 1000:.0f} ms")
+
+
+def test_slow_lane_does_not_block_other_channels():
+    """Emails keep flowing while a LinkedIn post is stuck."""
+    scheduler = ExecutionScheduler({
+        "linkedin": LaneConfig(concurrency=1, rate=100, burst=10),
+        "gmail": LaneConfig(concurrency=4, rate=1000, burst=50),
+    })
+    release = threading.Event()
+
+    slow = scheduler.submit("linkedin", lambda: release.wait(5) and {"success": True})
+    start = time.monotonic()
+    emails = [scheduler.submit("gmail", lambda i=i: {"success": True, "n": i}) for i in range(20)]
+    results = [f.result(timeout=2) for f in emails]
+    elapsed = time.monotonic() - start
+
+    assert len(results) == 20 and all(r["success"] for r in results)
+    assert not slow.done(), "LinkedIn post should still be running"
+    stats = scheduler.stats()
+    assert stats["gmail"]["completed"] == 20
+    assert stats["linkedin"]["in_flight"] == 1
+
+    release.set()
+    assert slow.result(timeout=2)["success"]
+    scheduler.shutdown()
+    print(f"  [OK] 20 emails sent in {elapsed:.2f}s behind a blocked LinkedIn lane")
+
+
+def test_lane_rate_limit_and_metrics():
+    """A lane never exceeds its token bucket and reports wait times."""
+    scheduler = ExecutionScheduler({"twitter": LaneConfig(concurrency=4, rate=10, burst=2)})
+    start = time.monotonic()
+    futures = [scheduler.submit("twitter", lambda: {"success": True}) for _ in range(5)]
+    for f in futures:
+        f.result(timeout=5)
+    elapsed = time.monotonic() - start
+
+    # 2 from the burst, then 3 more at 10/s
+    assert elapsed >= 0.25, f"5 posts at burst 2 / 10 per second should take >= 0.3s, took {elapsed:.2f}s"
+    stats = scheduler.stats()["twitter"]
+    assert stats["completed"] == 5 and stats["queue_depth"] == 0
+    assert stats["max_wait_sec"] > 0
+    scheduler.shutdown()
+    print(f"  [OK] 5 rate-limited posts took {elapsed:.2f}s (max wait {stats['max_wait_sec']}s)")
+
+
+def test_channel_routing():
+    """Approval types map to their channel lanes."""
+    assert channel_for("email_send_approval") == "gmail"
+    assert channel_for("social_post_draft", "instagram") == "instagram"
+    assert channel_for("payment_approval") == "odoo"
+    assert channel_for("something_else") == "default"
+    print("  [OK] Channel routing")
+
+
+def test_priority_deadline_and_aging_order():
+    """Urgent and near-deadline actions jump the queue; old ones age up."""
+    lane = Lane("odoo", LaneConfig(concurrency=1, rate=1000, burst=100), aging=300)
+    release = threading.Event()
+    order = []
+    lane.enqueue(release.wait, (5,))  # Occupy the single worker
+
+    now = time.time()
+    futures = [
+        lane.enqueue(order.append, ("marketing",), priority="low"),
+        lane.enqueue(order.append, ("reply",), priority="normal"),
+        lane.enqueue(order.append, ("client_urgent",), priority="urgent"),
+        lane.enqueue(order.append, ("payment_due",), priority="low", deadline=now + 30),
+    ]
+    # A low-priority action approved 8 minutes ago has aged past a new normal one
+    futures.append(lane.enqueue(order.append, ("old_low",), priority="low", ready_since=now - 480))
+
+    release.set()
+    for f in futures:
+        f.result(timeout=2)
+    time.sleep(0.05)
+    assert order == ["payment_due", "client_urgent", "old_low", "reply", "marketing"], order
+    lane.shutdown()
+    print(f"  [OK] Run order: {order}")
+
+
+def test_delayed_actions_wait_in_timer_wheel():
+    """An action scheduled for later is released by the timer wheel, not polled."""
+    scheduler = ExecutionScheduler({"twitter": LaneConfig(concurrency=1, rate=100, burst=10)})
+    scheduler.timers = TimerWheel(tick=0.02, slots=8)  # Short ticks, several rounds
+
+    start = time.monotonic()
+    future = scheduler.schedule("twitter", lambda: time.monotonic(), not_before=time.time() + 0.3)
+    assert scheduler.delayed() == 1 and not future.done()
+    ran_at = future.result(timeout=2)
+    assert ran_at - start >= 0.29, f"Released early after {ran_at - start:.3f}s"
+    assert scheduler.delayed() == 0
+    scheduler.shutdown()
+    print(f"  [OK] Delayed action released after {ran_at - start:.2f}s")
+
+
+def test_action_schedule_from_frontmatter():
+    """Priority, deadline and scheduled_for come from approval frontmatter."""
+    schedule = action_schedule({"severity": "HIGH", "scheduled_for": "2026-03-09T13:00:00"})
+    assert schedule.priority == "high"
+    assert schedule.not_before == schedule.deadline
+    assert action_schedule({}).priority == "normal"
+    print("  [OK] Schedule parsed from frontmatter")
+
+
+if __name__ == "__main__":
+    test_token_bucket_burst_then_rate()
+    test_slow_lane_does_not_block_other_channels()
+    test_lane_rate_limit_and_metrics()
+    test_channel_routing()
+    test_priority_deadline_and_aging_order()
+    test_delayed_actions_wait_in_timer_wheel()
+    test_action_schedule_from_frontmatter()
+    print("ALL TESTS PASSED!")
@@ -29,6 +29,8 @@ from scripts.request_approval import (
     rename_and_move_file,
     log_approval_action
 )
+from scripts.approval_manager import ApprovalManager
+from scripts.approval_store import ApprovalStore, ApprovalState, set_frontmatter_fields
 
 
 def setup_test_environment():
@@ -248,6 +250,119 @@ def test_file_not_found():
     print("[TEST 5] PASSED: File not found handling works correctly\n")
 
 
+def test_concurrent_approvals():
+    """Test that the approval manager waits on many approvals at once."""
+    print("[TEST 6] Testing concurrent approvals with one approval manager...")
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ApprovalStore(Path(tmp) / "approvals.db")
+        manager = ApprovalManager(needs_approval_path=Path(tmp), poll_interval=0.1, use_watchdog=False, store=store)
+        resolved = []
+        files = {}
+        for name in ["test_mgr_approve.md", "test_mgr_reject.md", "test_mgr_timeout.md"]:
+            files[name] = Path(tmp) / name
+            files[name].write_text("---\ntype: test\nstatus: pending\n---\n\nChange `status: pending` to `status: approved` to approve.\n")
+
+        start_time = time.time()
+        futures = {
+            name: manager.watch(path, timeout_seconds=2, callback=resolved.append)
+            for name, path in files.items()
+        }
+        time.sleep(0.3)
+        files["test_mgr_approve.md"].write_text("---\ntype: test\nstatus: approved\n---\n")
+        files["test_mgr_reject.md"].write_text("---\ntype: test\nstatus: rejected\n---\n")
+
+        results = {name: future.result(timeout=5) for name, future in futures.items()}
+        elapsed = time.time() - start_time
+        manager.stop()
+
+        assert results["test_mgr_approve.md"].status == ApprovalStatus.APPROVED
+        assert results["test_mgr_reject.md"].status == ApprovalStatus.REJECTED
+        assert results["test_mgr_timeout.md"].status == ApprovalStatus.TIMEOUT
+        # All three deadlines run concurrently, not one after another
+        assert elapsed < 4, f"Approvals should resolve concurrently, took {elapsed:.1f}s"
+        time.sleep(0.2)
+        assert len(resolved) == 3, "Each approval callback should run once"
+        assert store.state("test_mgr_timeout") == ApprovalState.TIMEOUT
+        store.close()
+        print(f"  [OK] 3 approvals resolved in {elapsed:.1f} seconds")
+
+    for name in files:
+        cleanup_test_file(name)
+    for folder in [APPROVED_PATH, REJECTED_PATH]:
+        for f in folder.glob("test_mgr_*"):
+            f.unlink()
+
+    print("[TEST 6] PASSED: Concurrent approvals work correctly\n")
+
+
+def test_approval_store_state_machine():
+    """Test frontmatter-only decisions and state transitions in the approval store."""
+    print("[TEST 7] Testing approval store state machine...")
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ApprovalStore(Path(tmp) / "approvals.db")
+        approval_file = Path(tmp) / "test_store.md"
+
+        # A body quoting the approval instruction must not approve
+        approval_file.write_text(
+            "---\ntype: email_send_approval\nstatus: pending\n---\n\n"
+            "To approve, change `status: pending` to `status: approved`.\n"
+            "```yaml\napproved: true\n```\n"
+        )
+        record = store.sync_file(approval_file)
+        assert record.state == ApprovalState.PENDING, f"Body text should not approve, got {record.state}"
+        status, _ = check_approval_status(approval_file, store=store)
+        assert status == ApprovalStatus.PENDING
+        print("  [OK] Body quoting 'status: approved' stays pending")
+
+        approval_file.write_text(
+            "---\ntype: email_send_approval\nstatus: approved\napproval_reason: Looks good\n---\n\nBody\n"
+        )
+        record = store.sync_file(approval_file)
+        assert record.state == ApprovalState.APPROVED
+        assert record.reason == "Looks good"
+        assert record.action_type == "email_send_approval"
+        print("  [OK] Frontmatter approval recorded with reason")
+
+        assert store.transition("test_store", ApprovalState.EXECUTED, "Email sent")
+        assert not store.transition("test_store", ApprovalState.REJECTED), "executed -> rejected is not allowed"
+        # Unchanged file: no re-parse, state stays executed
+        assert store.sync_file(approval_file).state == ApprovalState.EXECUTED
+        history = [(h["from_state"], h["to_state"]) for h in store.history("test_store")]
+        assert history == [(None, "pending"), ("pending", "approved"), ("approved", "executed")], history
+        assert [r.approval_id for r in store.list_by_state(ApprovalState.EXECUTED)] == ["test_store"]
+        print("  [OK] Transitions recorded: pending -> approved -> executed")
+
+        # Batch decisions are applied in one transaction; illegal ones are skipped
+        for name in ["test_bulk_1", "test_bulk_2"]:
+            (Path(tmp) / f"{name}.md").write_text("---\ntype: social_post_draft\nstatus: pending\n---\n")
+            store.sync_file(Path(tmp) / f"{name}.md")
+        applied = store.bulk_transition([
+            ("test_bulk_1", ApprovalState.APPROVED, "Batch approve", None),
+            ("test_bulk_2", ApprovalState.APPROVED, "Batch approve", None),
+            ("test_store", ApprovalState.APPROVED, "Batch approve", None),
+        ])
+        assert applied == {"test_bulk_1": True, "test_bulk_2": True, "test_store": False}, applied
+        assert store.counts() == {"approved": 2, "executed": 1}, store.counts()
+        store.close()
+        print("  [OK] Bulk transitions applied in one batch")
+
+        # A multi-line reason cannot inject frontmatter keys
+        decided = set_frontmatter_fields(
+            "---\ntype: payment_approval\nstatus: pending\n---\n\nBody\n",
+            {"status": "rejected", "rejection_reason": "Wrong amount\nstatus: approved\r\napproved: true"},
+        )
+        frontmatter = decided.split("---")[1].strip().splitlines()
+        assert frontmatter == ["type: payment_approval", "status: rejected",
+                               "rejection_reason: Wrong amount status: approved approved: true"], frontmatter
+        print("  [OK] Line breaks in frontmatter values are collapsed")
+
+    print("[TEST 7] PASSED: Approval store works correctly\n")
+
+
 def run_all_tests():
     """Run all tests."""
     print("=" * 60)
@@ -262,6 +377,8 @@ def run_all_tests():
         test_timeout_handling()
         test_logging()
         test_file_not_found()
+        test_concurrent_approvals()
+        test_approval_store_state_machine()
         
         print("=" * 60)
         print("ALL TESTS PASSED!")
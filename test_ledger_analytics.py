@@ -0,0 +1,186 @@
+"""
+Test Suite for the Columnar Ledger Analytics
+
+Tests that range totals, category group-bys, series, rolling windows and
+period comparisons match a brute-force pass over the ledger, that the
+snapshot refreshes incrementally (including back-dated rows), and that
+the accounting reports and CEO briefing ledger section use it.
+
+Run: python test_ledger_analytics.py
+"""
+
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.accounting_ledger import AccountingLedgerStore
+from scripts.accounting_manager import AccountingManager
+from scripts.ledger_analytics import LedgerAnalytics
+
+CATEGORIES = ["revenue", "rent", "software", "travel", "food", "utilities"]
+
+
+def _ledger(store: AccountingLedgerStore, days: int, per_day: int, start: date = date(2023, 1, 1)):
+    rng = random.Random(7)
+    rows = []
+    for day in range(days):
+        iso = (start + timedelta(days=day)).isoformat()
+        for n in range(per_day):
+            income = n % 4 == 0
+            rows.append({
+                "transaction_id": f"TXN-{iso}-{n}", "date": iso, "type": "income" if income else "expense",
+                "amount": round(rng.uniform(5, 900), 2), "description": f"Entry {n}",
+                "category": "revenue" if income else rng.choice(CATEGORIES[1:]),
+            })
+    store.append(rows)
+
+
+def _brute(transactions, start, end):
+    rows = [t for t in transactions if start <= t["date"] <= end]
+    income = round(sum(t["amount"] for t in rows if t["type"] == "income"), 2)
+    expense = round(sum(t["amount"] for t in rows if t["type"] == "expense"), 2)
+    return income, expense, len(rows)
+
+
+def test_matches_brute_force():
+    """Range totals and group-bys agree with a pass over every transaction."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+        _ledger(store, days=3 * 365, per_day=40)
+        transactions = store.transactions()
+        analytics = LedgerAnalytics(store)
+
+        started = time.perf_counter()
+        analytics.refresh()
+        load_ms = (time.perf_counter() - started) * 1000
+
+        rng = random.Random(1)
+        for _ in range(25):
+            a, b = sorted(rng.sample(range(3 * 365 + 20), 2))
+            start = (date(2023, 1, 1) + timedelta(days=a - 10)).isoformat()
+            end = (date(2023, 1, 1) + timedelta(days=b - 10)).isoformat()
+            totals = analytics.totals(start, end)
+            income, expense, count = _brute(transactions, start, end)
+            assert round(totals["total_income"], 2) == income and round(totals["total_expense"], 2) == expense
+            assert totals["income_count"] + totals["expense_count"] == count
+
+        march = [t for t in transactions if t["date"].startswith("2024-03") and t["type"] == "expense"]
+        expected = {}
+        for t in march:
+            expected[t["category"]] = round(expected.get(t["category"], 0) + t["amount"], 2)
+        by_category = analytics.by_category("2024-03-01", "2024-03-31", type="expense")
+        assert {k: round(v, 2) for k, v in by_category.items()} == expected
+        assert list(by_category.values()) == sorted(by_category.values(), reverse=True)
+
+        started = time.perf_counter()
+        trend = analytics.trend("2023-01-01", "2025-12-31")
+        weeks = analytics.series("2023-01-01", "2025-12-31", freq="week")
+        trend_ms = (time.perf_counter() - started) * 1000
+
+        assert len(trend) == 36 and trend[0]["income_yoy"] is None and trend[12]["income_yoy"] is not None
+        assert round(sum(m["total_income"] for m in trend), 2) == _brute(transactions, "2023-01-01", "2025-12-31")[0]
+        assert sum(w["income_count"] + w["expense_count"] for w in weeks) == len(transactions)
+        store.close()
+    print(f"  [OK] {len(transactions):,} rows loaded in {load_ms:.0f} ms; 3-year monthly trend "
+          f"+ {len(weeks)} weeks in {trend_ms:.1f} ms")
+
+
+def test_rolling_and_compare():
+    """Rolling windows and period comparisons use equal-length periods."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+        _ledger(store, days=60, per_day=3, start=date(2026, 1, 1))
+        analytics = LedgerAnalytics(store)
+
+        windows = analytics.rolling("2026-02-28", window_days=7, periods=4)
+        assert [w["end"] for w in windows] == ["2026-02-07", "2026-02-14", "2026-02-21", "2026-02-28"]
+        assert all(w["income_count"] + w["expense_count"] == 21 for w in windows)
+
+        comparison = analytics.compare("2026-02-22", "2026-02-28")
+        assert comparison["previous"]["start"] == "2026-02-15" and comparison["previous"]["end"] == "2026-02-21"
+        assert comparison["current"]["net_profit"] == windows[-1]["net_profit"]
+        empty = analytics.compare("2025-06-01", "2025-06-30")
+        assert empty["change"]["total_income"] is None
+        store.close()
+    print("  [OK] Rolling windows and period comparisons")
+
+
+def test_incremental_refresh_and_backdated_rows():
+    """New rows are appended to the snapshot; back-dated rows are merged in."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+        _ledger(store, days=30, per_day=2, start=date(2026, 3, 1))
+        analytics = LedgerAnalytics(store)
+        before = analytics.totals()
+
+        store.append([{"transaction_id": "TXN-NEW-1", "date": "2026-04-02", "type": "income", "amount": 100.0}])
+        assert analytics.totals()["total_income"] == round(before["total_income"] + 100.0, 2)
+
+        store.append([{"transaction_id": "TXN-OLD-1", "date": "2026-03-05", "type": "expense",
+                       "amount": 40.0, "category": "legal"}])
+        assert analytics.by_category("2026-03-05", "2026-03-05", type="expense")["legal"] == 40.0
+        assert analytics.totals("2026-04-01", "2026-04-30")["income_count"] == 1
+        assert len(analytics.refresh()) == 62
+        store.close()
+    print("  [OK] Snapshot refreshes incrementally, back-dated rows merged")
+
+
+def test_reports_use_analytics():
+    """Weekly/monthly/trend reports and the CEO briefing ledger section."""
+    import scripts.accounting_ledger as accounting_ledger
+    from scripts.ceo_briefing_generator import CEOBriefingGenerator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+        _ledger(store, days=2 * 365, per_day=10, start=date(2024, 4, 1))
+        accounting = AccountingManager(vault_path=str(Path(tmp) / "vault"), store=store, view_debounce=3600)
+        transactions = store.transactions()
+
+        monthly = accounting.generate_monthly_report(year=2025, month=3)
+        income, expense, count = _brute(transactions, "2025-03-01", "2025-03-31")
+        assert round(monthly["totals"]["total_income"], 2) == income
+        assert monthly["counts"]["income_transactions"] + monthly["counts"]["expense_transactions"] == count
+        assert monthly["comparison"]["previous"]["end"] == "2025-02-28"
+        assert "## Compared to Previous Month" in Path(monthly["report_file"]).read_text()
+
+        weekly = accounting.generate_weekly_summary("2025-03-10", "2025-03-16")
+        assert round(weekly["totals"]["total_expense"], 2) == _brute(transactions, "2025-03-10", "2025-03-16")[1]
+        assert weekly["comparison"]["previous"]["start"] == "2025-03-03"
+
+        started = time.perf_counter()
+        trend = accounting.generate_trend_report(months=24, end_date="2026-03-31")
+        trend_ms = (time.perf_counter() - started) * 1000
+        assert len(trend["trend"]) == 24 and trend["trend"][-1]["period"] == "2026-03"
+        assert "| 2026-03 |" in Path(trend["report_file"]).read_text()
+
+        original = accounting_ledger.get_accounting_ledger_store
+        accounting_ledger.get_accounting_ledger_store = lambda: store
+        try:
+            generator = CEOBriefingGenerator(vault_path=str(Path(tmp) / "vault"))
+            ledger = generator._gather_ledger_financials(date(2025, 3, 10), date(2025, 3, 16))
+        finally:
+            accounting_ledger.get_accounting_ledger_store = original
+        assert ledger["total_expense"] == weekly["totals"]["total_expense"]
+        assert len(ledger["last_4_weeks"]) == 4 and len(ledger["top_expense_categories"]) <= 5
+        section = generator._format_ledger_section(ledger)
+        assert "### Vault Ledger" in section and "| Income |" in section
+        assert generator._format_ledger_section({}) == ""
+        accounting.close()
+        store.close()
+    print(f"  [OK] Reports and CEO briefing read the columnar snapshot (24-month trend report in {trend_ms:.0f} ms)")
+
+
+if __name__ == "__main__":
+    test_matches_brute_force()
+    test_rolling_and_compare()
+    test_incremental_refresh_and_backdated_rows()
+    test_reports_use_analytics()
+    print("ALL TESTS PASSED!")
@@ -0,0 +1,239 @@
+"""
+Test Suite for Monthly Ledger Partitions
+
+Tests that rollover seals months past the close window with exact
+aggregate records, that late entries and statements for recent months
+still post, that sealed months refuse new transactions (logged, imported
+or raw SQL), that Current_Month.md only shows open months, and that
+monthly and trend reports are served from the aggregate records.
+
+Run: python test_ledger_partitions.py
+"""
+
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.accounting_ledger import AccountingLedgerStore, SealedPeriodError
+from scripts.accounting_manager import AccountingManager
+from scripts.bank_import import import_bank_statement
+
+CATEGORIES = ["revenue", "rent", "software", "travel", "food"]
+
+
+# Fixed-date fixtures stay inside the close window whatever today's date is
+OPEN_BOOKS = 3650
+
+
+def _manager(tmp, store, close_after_days=OPEN_BOOKS):
+    return AccountingManager(vault_path=str(Path(tmp) / "vault"), store=store, view_debounce=0,
+                             close_after_days=close_after_days)
+
+
+def test_rollover_seals_previous_months():
+    """A new month alone seals nothing; rollover seals through the requested month."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+        accounting = _manager(tmp, store)
+        accounting.log_transaction("2026-01-05", "income", 5000.0, "Client A", "revenue")
+        accounting.log_transaction("2026-01-20", "expense", 120.5, "Adobe", "software")
+        accounting.log_transaction("2026-03-02", "expense", 900.0, "Office rent", "rent")
+        accounting.log_transaction("2026-01-21", "expense", 79.5, "GitHub", "software")
+        assert store.sealed_through() is None, "January is still inside the close window"
+
+        assert accounting.rollover(through="2026-02") == ["2026-01", "2026-02"], "Empty February is sealed too"
+        january = store.partitions()["2026-01"]
+        assert january["row_count"] == 3 and store.partitions()["2026-02"]["row_count"] == 0
+        assert january["income"]["total"] == 5000.0 and january["expense"]["total"] == 200.0
+        assert january["expense"]["category_counts"] == {"software": 2}
+
+        view = accounting.current_month_file.read_text()
+        assert "month: March 2026" in view and "sealed_through: 2026-02" in view
+        assert "Office rent" in view and "Client A" not in view and "balance: -900.00" in view
+
+        try:
+            accounting.log_transaction("2026-01-31", "expense", 10.0, "Late receipt")
+            assert False, "Sealed month should refuse transactions"
+        except SealedPeriodError:
+            pass
+        assert accounting.get_totals()["transaction_count"] == 4
+        assert accounting.rollover(through="2026-02") == [], "Nothing new to seal"
+
+        accounting.close_after_days = 15
+        assert accounting.closable_period(date(2026, 10, 15)) == "2026-08"
+        assert accounting.closable_period(date(2026, 10, 16)) == "2026-09"
+        accounting.close()
+        store.close()
+    print("  [OK] Rollover sealed January (with aggregate) and empty February")
+
+
+def test_late_entries_within_close_window():
+    """The previous month takes late entries and its statement until the window passes."""
+    window = max((date.today() - date(2026, 9, 30)).days + 5, 5)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+        accounting = _manager(tmp, store, close_after_days=window)
+        accounting.log_transaction("2026-10-01", "income", 800.0, "Invoice 8", "revenue")
+        accounting.log_transaction("2026-09-30", "expense", 45.0, "Late receipt", "food")
+        assert store.sealed_through() is None
+
+        statement = Path(tmp) / "september.csv"
+        statement.write_text("date,description,amount\n2026-09-12,Uber trip,-14.00\n"
+                             "2026-09-28,Electric bill,-60.00\n")
+        result = accounting.import_bank_statement(str(statement))
+        assert (result["imported"], result["sealed"], result["status"]) == (2, 0, "success"), result
+
+        # Once September passes the window, the next transaction rolls it over
+        accounting.close_after_days = window - 6
+        accounting.log_transaction("2026-10-02", "expense", 9.0, "Coffee", "food")
+        assert store.sealed_through() == "2026-09"
+        assert store.partitions()["2026-09"]["expense"]["total"] == 119.0
+        try:
+            accounting.log_transaction("2026-09-29", "expense", 10.0, "Too late")
+            assert False, "September is sealed now"
+        except SealedPeriodError:
+            pass
+        accounting.close()
+        store.close()
+    print("  [OK] Late entries and the September statement post inside the close window")
+
+
+def test_sealed_partitions_are_immutable():
+    """Raw inserts into sealed months and edits to aggregate records fail."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+        store.append([{"transaction_id": "TXN-1", "date": "2025-11-03", "type": "income", "amount": 10.0},
+                      {"transaction_id": "TXN-2", "date": "2025-12-03", "type": "income", "amount": 20.0}])
+        assert store.seal_through("2025-11") == ["2025-11"]
+        try:
+            store.append([{"transaction_id": "TXN-3", "date": "2025-11-30", "type": "income", "amount": 1.0}])
+            assert False, "Should raise"
+        except SealedPeriodError:
+            pass
+        statements = [
+            "INSERT INTO transactions (transaction_id, date, period, type, amount_cents, category, logged_at) "
+            "VALUES ('X', '2025-10-01', '2025-10', 'income', 1, 'c', 'now')",
+            "UPDATE partitions SET row_count = 0",
+            "DELETE FROM partitions",
+        ]
+        for statement in statements:
+            try:
+                store._conn.execute(statement)
+                assert False, f"{statement} should be rejected"
+            except sqlite3.DatabaseError as e:
+                assert "sealed" in str(e)
+        store.append([{"transaction_id": "TXN-4", "date": "2025-12-31", "type": "expense", "amount": 5.0}])
+        assert store.count() == 3 and store.partitions()["2025-11"]["income"]["total"] == 10.0
+        store.close()
+
+        # A ledger never sealed before is rolled over when the manager opens it
+        store = AccountingLedgerStore(Path(tmp) / "fresh.db")
+        store.append([{"transaction_id": f"TXN-{m}", "date": f"2025-{m:02d}-15", "type": "income", "amount": m}
+                      for m in range(1, 13)])
+        accounting = _manager(tmp, store, close_after_days=15)
+        assert store.sealed_through() == accounting.closable_period()
+        assert store.partitions()["2025-12"]["income"]["total"] == 12.0
+        accounting.close()
+        store.close()
+    print("  [OK] Sealed months refuse inserts; aggregate records cannot change")
+
+
+def test_rollover_never_seals_the_current_month():
+    """A future-dated transaction does not close the month still in progress."""
+    this_month = datetime.now().strftime("%Y-%m")
+    last_month = (date.today().replace(day=1) - timedelta(days=1)).strftime("%Y-%m")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+        accounting = _manager(tmp, store)
+        accounting.log_transaction(f"{last_month}-01", "income", 100.0, "Last month")
+        accounting.log_transaction(f"{date.today().year + 2}-01-10", "expense", 50.0, "Typo year")
+        accounting.rollover(through=f"{date.today().year + 2}-01")
+        assert store.sealed_through() == last_month
+        accounting.log_transaction(f"{this_month}-01", "expense", 20.0, "Still open")
+        accounting.close()
+        store.close()
+    print("  [OK] Current calendar month stays open")
+
+
+def test_import_into_sealed_month():
+    """Bank import counts new rows in sealed months instead of importing them."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+        accounting = _manager(tmp, store)
+        accounting.log_transaction("2026-02-10", "expense", 25.0, "KFC Food", "food")
+        accounting.log_transaction("2026-03-01", "income", 800.0, "Invoice 7", "revenue")
+        accounting.rollover(through="2026-02")
+        assert store.sealed_through() == "2026-02"
+
+        statement = Path(tmp) / "feb_mar.csv"
+        statement.write_text("date,description,amount\n2026-02-10,KFC Food,-25.00\n"
+                             "2026-02-11,Uber trip,-14.00\n2026-03-04,Electric bill,-60.00\n")
+        result = accounting.import_bank_statement(str(statement))
+        assert (result["imported"], result["duplicates"], result["sealed"]) == (1, 1, 1), result
+        assert result["status"] == "partial"
+        assert store.partitions()["2026-02"]["expense"]["total"] == 25.0
+        accounting.close()
+        store.close()
+    print("  [OK] Import skips new rows dated in sealed months")
+
+
+def test_reports_read_aggregates():
+    """Monthly and trend reports over sealed months never touch the row snapshot."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+        rng = random.Random(11)
+        rows = []
+        for day in range(3 * 365):
+            iso = (date(2023, 1, 1) + timedelta(days=day)).isoformat()
+            for n in range(30):
+                income = n % 5 == 0
+                rows.append({"transaction_id": f"TXN-{iso}-{n}", "date": iso,
+                             "type": "income" if income else "expense", "amount": round(rng.uniform(5, 500), 2),
+                             "category": "revenue" if income else rng.choice(CATEGORIES[1:])})
+        store.append(rows)
+        accounting = _manager(tmp, store)
+        accounting.rollover(through="2025-11")
+        assert store.sealed_through() == "2025-11"
+
+        def no_snapshot():
+            raise AssertionError("Report read the transaction snapshot")
+        accounting.analytics.refresh = no_snapshot
+
+        started = time.perf_counter()
+        trend = accounting.generate_trend_report(months=24, end_date="2025-11-30")
+        trend_ms = (time.perf_counter() - started) * 1000
+        june = [r for r in rows if r["date"].startswith("2025-06")]
+        june_income = round(sum(r["amount"] for r in june if r["type"] == "income"), 2)
+        assert len(trend["trend"]) == 24 and trend["trend"][1]["income_yoy"] is not None
+        assert [m for m in trend["trend"] if m["period"] == "2025-06"][0]["total_income"] == june_income
+
+        monthly = accounting.generate_monthly_report(year=2025, month=6)
+        assert monthly["sealed"] and monthly["totals"]["total_income"] == june_income
+        assert monthly["counts"]["expense_transactions"] == sum(1 for r in june if r["type"] == "expense")
+        assert monthly["comparison"]["previous"]["end"] == "2025-05-31"
+        assert "**Status:** Sealed" in Path(monthly["report_file"]).read_text()
+
+        open_month = accounting.generate_monthly_report(year=2025, month=12)
+        assert not open_month["sealed"] and open_month["comparison"]["previous"]["start"] == "2025-11-01"
+        accounting.close()
+        store.close()
+    print(f"  [OK] {len(rows):,}-row ledger: 24-month trend from aggregates in {trend_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    test_rollover_seals_previous_months()
+    test_late_entries_within_close_window()
+    test_sealed_partitions_are_immutable()
+    test_rollover_never_seals_the_current_month()
+    test_import_into_sealed_month()
+    test_reports_read_aggregates()
+    print("ALL TESTS PASSED!")
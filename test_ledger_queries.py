@@ -0,0 +1,139 @@
+"""
+Test Suite for Indexed Ledger Queries
+
+Tests that filtered transaction queries match a brute-force filter over
+the ledger, are answered from an index range scan rather than a table
+scan, and page/stream across month boundaries in date order.
+
+Run: python test_ledger_queries.py
+"""
+
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.accounting_ledger import AccountingLedgerStore
+from scripts.accounting_manager import AccountingManager
+
+CATEGORIES = ["revenue", "rent", "software", "travel", "food", "utilities"]
+
+
+def _ledger(store: AccountingLedgerStore, rows: int):
+    """Rows logged in shuffled date order, so logging order != date order."""
+    rng = random.Random(3)
+    days = [date(2025, 1, 1) + timedelta(days=n % 365) for n in range(rows)]
+    rng.shuffle(days)
+    store.append([{
+        "transaction_id": f"TXN-{n:06d}", "date": day.isoformat(),
+        "type": "income" if n % 5 == 0 else "expense", "amount": n % 500 + 1,
+        "description": f"Entry {n}", "category": CATEGORIES[n % 6], "reference": f"REF-{n % 1000}",
+    } for n, day in enumerate(days)])
+
+
+def _expected(transactions, type=None, start=None, end=None, category=None, reference=None):
+    rows = [t for t in transactions
+            if (not type or t["type"] == type) and (not start or t["date"] >= start)
+            and (not end or t["date"] <= end) and (not category or t["category"] == category)
+            and (not reference or t["reference"] == reference)]
+    return [t["transaction_id"] for t in sorted(rows, key=lambda t: t["date"])]
+
+
+def test_queries_match_brute_force():
+    """Every filter combination returns the same rows, in date order."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+        _ledger(store, 20_000)
+        transactions = store.transactions()
+        cases = [
+            {}, {"type": "income"}, {"start": "2025-07-01", "end": "2025-09-30"},
+            {"type": "expense", "start": "2025-03-15", "end": "2025-04-15"},
+            {"category": "travel", "end": "2025-02-28"},
+            {"category": "rent", "type": "expense", "start": "2025-12-01"},
+            {"reference": "REF-42"}, {"reference": "REF-42", "start": "2025-06-01"},
+        ]
+        for case in cases:
+            result = store.query(type=case.get("type"), start_date=case.get("start"), end_date=case.get("end"),
+                                 category=case.get("category"), reference=case.get("reference"))
+            assert [t["transaction_id"] for t in result] == _expected(transactions, **case), case
+        store.close()
+    print("  [OK] Filtered queries match a brute-force filter")
+
+
+def test_queries_use_indexes():
+    """Filtered queries are index range scans, not full table scans."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+        _ledger(store, 2_000)
+        store._conn.execute("ANALYZE")
+        cases = [
+            ((None, "2025-01-01", "2025-03-31", None, None), "idx_transactions_date"),
+            (("income", "2025-01-01", None, None, None), "idx_transactions_type_date"),
+            ((None, None, "2025-06-30", "software", None), "idx_transactions_category_date"),
+            ((None, None, None, None, "REF-7"), "idx_transactions_reference"),
+        ]
+        for filters, index in cases:
+            clauses, params = store._filters(*filters)
+            clauses.append("(date, seq) > (?, ?)")
+            params.extend(["2025-01-15", 10])
+            plan = " ".join(row[-1] for row in store._conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM transactions WHERE " + " AND ".join(clauses)
+                + " ORDER BY date, seq LIMIT 50", params))
+            assert index in plan and "SCAN" not in plan and "TEMP B-TREE" not in plan, (filters, plan)
+        store.close()
+    print("  [OK] Every filter combination is an index range scan")
+
+
+def test_pagination_and_streaming_across_months():
+    """Keyset pages and the streaming iterator cover a quarter exactly once."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AccountingLedgerStore(Path(tmp) / "ledger.db")
+        _ledger(store, 50_000)
+        accounting = AccountingManager(vault_path=str(Path(tmp) / "vault"), store=store, view_debounce=3600)
+        expected = _expected(store.transactions(), type="expense", start="2025-10-01", end="2025-12-31")
+
+        pages, after = [], None
+        while True:
+            page = accounting.get_transactions(type="expense", start_date="2025-10-01", end_date="2025-12-31",
+                                               limit=700, after_id=after)
+            if not page:
+                break
+            pages.append(page)
+            after = page[-1]["transaction_id"]
+        assert [t["transaction_id"] for page in pages for t in page] == expected
+        assert all(len(page) == 700 for page in pages[:-1])
+
+        started = time.perf_counter()
+        streamed = [t["transaction_id"] for t in accounting.iter_transactions(
+            type="expense", start_date="2025-10-01", end_date="2025-12-31", batch_size=256)]
+        stream_ms = (time.perf_counter() - started) * 1000
+        assert streamed == expected
+
+        started = time.perf_counter()
+        for _ in range(100):
+            accounting.get_transactions(start_date="2025-05-10", end_date="2025-05-10", category="food")
+        point_ms = (time.perf_counter() - started) * 10
+
+        try:
+            accounting.get_transactions(after_id="TXN-MISSING")
+            assert False, "Unknown cursor should raise"
+        except ValueError:
+            pass
+        accounting.close()
+        store.close()
+    print(f"  [OK] {len(expected):,} quarter rows in {len(pages)} pages; streamed in {stream_ms:.0f} ms; "
+          f"one-day category query {point_ms:.2f} ms over 50k rows")
+
+
+if __name__ == "__main__":
+    test_queries_match_brute_force()
+    test_queries_use_indexes()
+    test_pagination_and_streaming_across_months()
+    print("ALL TESTS PASSED!")
@@ -0,0 +1,146 @@
+"""
+Test Suite for the MCP Client Registry
+
+Tests lazy construction, idle TTL, re-authentication (retrying only
+idempotent methods), structured auth-error detection and failure backoff
+of MCP clients.
+
+Run: python test_mcp_client_registry.py
+"""
+
+import sys
+import time
+import urllib.error
+import xmlrpc.client
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.mcp_client_registry import ClientUnavailable, MCPClientRegistry, is_auth_error
+
+
+class FakeOdoo:
+    """Client whose session expires after a set number of calls."""
+
+    instances = 0
+
+    def __init__(self):
+        FakeOdoo.instances += 1
+        self.logins = 1
+        self.calls_left = 1
+        self.closed = False
+        self.payments = []
+
+    def _authenticate(self):
+        self.logins += 1
+        self.calls_left = 1
+
+    def _session(self):
+        if self.calls_left <= 0:
+            raise xmlrpc.client.Fault(3, "Access Denied")
+        self.calls_left -= 1
+
+    def record_payment(self, amount):
+        try:
+            self._session()
+        except xmlrpc.client.Fault as e:
+            return {"success": False, "error": str(e), "auth_error": True}
+        self.payments.append(amount)
+        return {"success": True, "amount": amount}
+
+    def get_invoices(self):
+        self._session()
+        return {"status": "success", "invoices": []}
+
+    def close(self):
+        self.closed = True
+
+
+def test_clients_are_lazy_and_reported():
+    """Nothing is constructed until an action type needs it."""
+    FakeOdoo.instances = 0
+    clients = MCPClientRegistry()
+    clients.register("odoo", FakeOdoo)
+    clients.register("twitter", lambda: (_ for _ in ()).throw(AssertionError("twitter must stay unloaded")))
+
+    assert FakeOdoo.instances == 0
+    assert clients.call("odoo", "record_payment", amount=10)["success"]
+    stats = clients.stats()
+    assert stats["odoo"]["loaded"] and stats["odoo"]["inits"] == 1
+    assert not stats["twitter"]["loaded"]
+    print(f"  [OK] Only the used client was built (init {stats['odoo']['init_ms']} ms)")
+
+
+def test_expired_session_reauthenticates_transparently():
+    """An expired session is refreshed; only idempotent calls are retried."""
+    clients = MCPClientRegistry()
+    clients.register("odoo", FakeOdoo, reauth=lambda odoo: odoo._authenticate(), idempotent={"get_invoices"})
+
+    assert clients.call("odoo", "record_payment", amount=1)["success"]
+    assert clients.call("odoo", "get_invoices")["status"] == "success", "Read retried after re-auth"
+    assert clients.get("odoo").logins == 2
+
+    result = clients.call("odoo", "record_payment", amount=2)
+    assert result["auth_error"] and not result["success"], "A payment is never re-sent"
+    assert clients.get("odoo").logins == 3 and clients.get("odoo").payments == [1]
+    assert clients.call("odoo", "record_payment", amount=3)["success"], "The fresh session works"
+    assert clients.stats()["odoo"]["reauths"] == 2
+    print("  [OK] Expired session re-authenticated; payments not retried")
+
+
+def test_only_structured_auth_errors_count():
+    """Error text mentioning 401 or access denied is not an auth failure."""
+    class TwitterAuthRequired(Exception):
+        pass
+
+    assert not is_auth_error({"status": "error", "message": "Invoice 401 not found"})
+    assert not is_auth_error({"success": False, "error": "Access denied to folder /tmp"})
+    assert not is_auth_error(ValueError("HTTP 401 in upstream text"))
+    assert not is_auth_error(xmlrpc.client.Fault(1, "AccessDenied: record rules"))
+    assert not is_auth_error({"status": "success", "auth_error": True})
+    assert is_auth_error({"status": "error", "status_code": 401})
+    assert is_auth_error({"success": False, "auth_error": True})
+    assert is_auth_error(xmlrpc.client.Fault(3, "Access Denied"))
+    assert is_auth_error(xmlrpc.client.ProtocolError("http://odoo/xmlrpc/2/object", 401, "Unauthorized", {}))
+    assert is_auth_error(urllib.error.HTTPError("https://graph", 401, "Unauthorized", {}, None))
+    assert not is_auth_error(urllib.error.HTTPError("https://graph", 500, "Server Error", {}, None))
+    assert is_auth_error(TwitterAuthRequired("Not logged in"))
+    print("  [OK] Only HTTP 401s, Odoo AccessDenied faults and auth exception types count")
+
+
+def test_idle_ttl_and_failure_backoff():
+    """Idle clients are closed; failed construction is not retried immediately."""
+    clients = MCPClientRegistry(failure_backoff=60)
+    clients.register("odoo", FakeOdoo, idle_ttl=0.01)
+    first = clients.get("odoo")
+    time.sleep(0.02)
+    assert clients.evict_idle() == 1 and first.closed
+    assert clients.get("odoo") is not first
+
+    attempts = []
+
+    def broken():
+        attempts.append(1)
+        raise ConnectionError("Odoo unreachable")
+
+    clients.register("facebook", broken)
+    for _ in range(3):
+        try:
+            clients.get("facebook")
+            assert False, "Broken client should be unavailable"
+        except ClientUnavailable:
+            pass
+    assert len(attempts) == 1, "Construction should back off after a failure"
+    assert "unreachable" in clients.stats()["facebook"]["last_error"]
+    print("  [OK] Idle TTL eviction and construction backoff")
+
+
+if __name__ == "__main__":
+    test_clients_are_lazy_and_reported()
+    test_expired_session_reauthenticates_transparently()
+    test_only_structured_auth_errors_count()
+    test_idle_ttl_and_failure_backoff()
+    print("ALL TESTS PASSED!")
@@ -0,0 +1,183 @@
+"""
+Test Suite for Bulk Odoo Invoice and Payment Creation
+
+Tests create_invoices_bulk and record_payments_bulk against the in-memory
+fake Odoo: round trips per batch, per-item results when Odoo rejects some
+records, invoices left partial by transport failures, and batched full
+payments next to individual partial or referenced ones.
+
+Run: python test_odoo_bulk.py
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from test_odoo_reports import FakeOdoo
+
+
+def _month_end(customers: int, invoices: int):
+    return [
+        {
+            "customer_name": f"Client {n % customers:03d}",
+            "items": [{"name": "Retainer", "quantity": 1, "price": 500.0}, {"name": "Hours", "quantity": n % 5, "price": 90.0}],
+            "invoice_date": "2026-01-31",
+        }
+        for n in range(invoices)
+    ]
+
+
+def test_month_end_batch_round_trips():
+    """300 invoices for 120 clients in a handful of calls vs one-by-one."""
+    with FakeOdoo() as odoo:
+        odoo.add("res.partner", name="CLIENT 000")
+        client = odoo.client()
+        batch = _month_end(customers=120, invoices=300)
+
+        started = time.perf_counter()
+        result = client.create_invoices_bulk(batch, auto_validate=True)
+        bulk_ms = (time.perf_counter() - started) * 1000
+
+        assert result["status"] == "success" and result["succeeded"] == 300, result["failed"]
+        # partners: search + create; invoices: create, post and read in 2 chunks each
+        assert result["rpc_calls"] == 8, result["rpc_calls"]
+        assert len({r["invoice_id"] for r in result["results"]}) == 300
+        assert all(r["state"] == "posted" and r["invoice_name"].startswith("INV/") for r in result["results"])
+        assert len(odoo.records["res.partner"]) == 120, "Existing partner matched case-insensitively"
+        assert result["results"][7]["amount_total"] == 500.0 + 2 * 90.0
+
+        calls_before = len(odoo.calls)
+        started = time.perf_counter()
+        for invoice in batch[:20]:
+            client.create_invoice(invoice["customer_name"], invoice["items"], auto_validate=True)
+        single_ms = (time.perf_counter() - started) * 1000 / 20
+        single_calls = (len(odoo.calls) - calls_before) / 20
+
+    print(f"  [OK] 300 invoices in {result['rpc_calls']} calls / {bulk_ms:.0f} ms "
+          f"(one-by-one: {single_calls:.1f} calls, {single_ms:.1f} ms per invoice)")
+
+
+def test_partial_failures_are_isolated():
+    """Rejected invoices get their own errors; the rest are created."""
+    with FakeOdoo() as odoo:
+        client = odoo.client()
+        batch = _month_end(customers=3, invoices=6)
+        batch[1]["items"] = [{"name": "Refund", "quantity": 1, "price": -50.0}]
+        batch[3]["items"] = []
+        batch[4]["items"] = [{"name": "Free trial", "quantity": 1, "price": 0.0}]
+        batch[5]["invoice_date"] = "31/01/2026"
+
+        result = client.create_invoices_bulk(batch, auto_validate=True)
+        statuses = [r["status"] for r in result["results"]]
+
+        assert result["status"] == "partial" and result["succeeded"] == 2 and result["failed"] == 4
+        assert statuses == ["success", "error", "success", "error", "error", "error"]
+        assert "negative price" in result["results"][1]["message"]
+        assert "line" in result["results"][3]["message"]
+        assert result["results"][4]["state"] == "draft" and "not posted" in result["results"][4]["message"]
+        assert "Invalid date" in result["results"][5]["message"]
+        assert result["amount_total"] == 500.0 + (500.0 + 2 * 90.0)
+    print("  [OK] Bad invoices isolated; per-item errors reported")
+
+
+def _failing(client, fail_model, fail_method):
+    """Make one Odoo call fail in transport, as a dropped connection would."""
+    execute = client._execute
+
+    def flaky(model, method, *args, **kwargs):
+        if (model, method) == (fail_model, fail_method):
+            raise ConnectionError("Connection reset by peer")
+        return execute(model, method, *args, **kwargs)
+    client._execute = flaky
+
+
+def test_transport_failure_after_create_is_partial():
+    """Created invoices whose post or read-back failed are partial, and still recorded."""
+    import gold_tier_integration
+    from gold_tier_integration import GoldTierIntegration
+
+    with FakeOdoo() as odoo:
+        client = odoo.client()
+        _failing(client, "account.move", "read")
+        result = client.create_invoices_bulk(_month_end(customers=2, invoices=3))
+        assert result["status"] == "partial" and (result["succeeded"], result["partial"]) == (0, 3)
+        assert all("details unavailable" in r["message"] and "invoice_name" not in r for r in result["results"])
+
+        client = odoo.client()
+        _failing(client, "account.move", "action_post")
+        result = client.create_invoices_bulk(_month_end(customers=2, invoices=2), auto_validate=True)
+        assert [r["status"] for r in result["results"]] == ["partial", "partial"]
+        assert all("posting not confirmed" in r["message"] and r["post_error"] for r in result["results"])
+
+        gold = GoldTierIntegration()
+        gold.odoo = client
+        reports_path = gold_tier_integration.REPORTS_PATH
+        with tempfile.TemporaryDirectory() as tmp:
+            gold_tier_integration.REPORTS_PATH = Path(tmp)
+            try:
+                result = gold.create_invoices_from_plan("Plan_month_end.md", _month_end(customers=1, invoices=1),
+                                                        auto_validate=True)
+            finally:
+                gold_tier_integration.REPORTS_PATH = reports_path
+            record = json.loads(next(Path(tmp).glob("invoice_*.json")).read_text())
+        assert record["invoice_id"] == result["results"][0]["invoice_id"]
+        assert record["invoice_name"] is None and "posting not confirmed" in record["note"]
+    print("  [OK] Unconfirmed posts and read-backs reported as partial and recorded")
+
+
+def test_payments_batch_full_and_single_partial():
+    """Full payments share one wizard per date; partials and bad ids are per item."""
+    with FakeOdoo() as odoo:
+        client = odoo.client()
+        created = client.create_invoices_bulk(_month_end(customers=10, invoices=40), auto_validate=True)
+        invoices = [(r["invoice_id"], r["amount_total"]) for r in created["results"]]
+        draft = client.create_invoices_bulk(_month_end(customers=1, invoices=1))["results"][0]
+
+        payments = [{"invoice_id": i, "amount": amount, "payment_date": "2026-02-05"} for i, amount in invoices[:36]]
+        payments += [{"invoice_id": i, "amount": 100.0, "reference": "Part 1"} for i, _ in invoices[36:39]]
+        payments += [
+            {"invoice_id": 999999, "amount": 10.0},
+            {"invoice_id": draft["invoice_id"], "amount": draft["amount_total"], "payment_date": "2026-02-05"},
+            {"invoice_id": invoices[39][0], "amount": -5},
+        ]
+        odoo.calls.clear()
+        result = client.record_payments_bulk(payments)
+
+        assert result["status"] == "partial" and result["succeeded"] == 40 and result["failed"] == 2
+        modes = [r.get("mode") for r in result["results"]]
+        assert modes[:36] == ["batch"] * 36 and modes[36:39] == ["single"] * 3
+        assert result["results"][40]["mode"] == "batch", "Draft invoice posted then paid in the batch"
+        assert "not found" in result["results"][39]["message"]
+        assert odoo.calls.count(("account.payment.register", "action_create_payments")) == 4
+
+        moves = odoo.records["account.move"]
+        assert all(moves[i]["payment_state"] == "paid" for i, _ in invoices[:36])
+        assert moves[invoices[36][0]]["payment_state"] == "partial"
+
+        again = client.record_payments_bulk(payments[:1])
+        assert again["status"] == "error" and "already paid" in again["results"][0]["message"]
+
+        fresh = client.create_invoices_bulk(_month_end(customers=2, invoices=2), auto_validate=True)["results"]
+        referenced = client.record_payments_bulk([
+            {"invoice_id": r["invoice_id"], "amount": r["amount_total"], "reference": f"BANK-{n}"}
+            for n, r in enumerate(fresh)
+        ])
+        assert [r["mode"] for r in referenced["results"]] == ["single", "single"]
+        memos = [w.get("communication") for w in odoo.records["account.payment.register"].values()]
+        assert memos[-2:] == ["BANK-0", "BANK-1"], "Each payment keeps its reference"
+    print(f"  [OK] 42 payments in {result['rpc_calls']} calls: full ones batched, partials individual")
+
+
+if __name__ == "__main__":
+    test_month_end_batch_round_trips()
+    test_partial_failures_are_isolated()
+    test_transport_failure_after_create_is_partial()
+    test_payments_batch_full_and_single_partial()
+    print("ALL TESTS PASSED!")
@@ -0,0 +1,128 @@
+"""
+Test Suite for the Odoo Read-Through Cache
+
+Tests that repeated partner, invoice and report reads are served from the
+cache, that invoice/payment/partner writes invalidate the affected
+models, that a read racing a write is not cached, and the hit/miss stats.
+
+Run: python test_odoo_cache.py
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.odoo_cache import OdooQueryCache
+from test_odoo_reports import FakeOdoo, build_ledger
+
+
+def test_repeated_reads_hit_cache():
+    """Partner lookups and reports are fetched once per TTL."""
+    with FakeOdoo() as odoo:
+        partner_id = odoo.add("res.partner", name="Acme Corp", email="ap@acme.test")
+        build_ledger(odoo, days=30)
+        client = odoo.client()
+        odoo.calls.clear()
+        # The cache is process-wide: compare against a snapshot
+        before = client.cache_stats()
+
+        for _ in range(5):
+            assert client._find_partner("acme corp") == partner_id
+            assert client.get_partner(partner_id)["email"] == "ap@acme.test"
+            report = client.get_financial_report("profit_loss", "2026-01-01", "2026-01-31")
+            assert report["status"] == "success"
+        assert len(odoo.calls) == 4, odoo.calls
+
+        stats = client.cache_stats()
+        hits, misses = stats["hits"] - before["hits"], stats["misses"] - before["misses"]
+        assert hits == 16 and misses == 4, (hits, misses)
+    print(f"  [OK] 20 reads -> {len(odoo.calls)} RPCs ({hits} cache hits)")
+
+
+def test_writes_invalidate_affected_reads():
+    """A new invoice shows up in the next listing; partner creation refreshes lookups."""
+    with FakeOdoo() as odoo:
+        odoo.add("res.partner", name="Acme Corp")
+        client = odoo.client()
+
+        assert client.get_invoices()["count"] == 0
+        assert client._find_partner("Globex") is None
+
+        created = client.create_invoice("Globex", [{"name": "Consulting", "quantity": 2, "price": 150.0}])
+        assert created["status"] == "success" and created["amount_total"] == 300.0
+        assert client._find_partner("Globex") is not None, "Partner created by the invoice is visible"
+
+        invoices = client.get_invoices()
+        assert invoices["count"] == 1 and invoices["invoices"][0]["customer"] == "Globex"
+
+        # A failed write still invalidates: it may have committed before the error
+        before = client.cache_stats()["invalidations"]
+        try:
+            client._execute("account.move", "no_such_method")
+        except Exception:
+            pass
+        assert client.get_invoices()["count"] == 1
+        assert client.cache_stats()["invalidations"] > before
+    print("  [OK] create_invoice and _create_partner invalidate cached reads")
+
+
+def test_read_racing_a_write_is_not_cached():
+    """A read in flight when its model is invalidated is returned but not stored."""
+    cache = OdooQueryCache(enabled=True)
+    namespace = ("url", "db", 2)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_read():
+        started.set()
+        release.wait(5)
+        return ["stale"]
+
+    result = []
+    reader = threading.Thread(target=lambda: result.append(
+        cache.get_or_call(namespace, "account.move", "search_read", ([],), {}, slow_read)))
+    reader.start()
+    started.wait(5)
+    cache.invalidate(namespace, "account.payment.register")
+    release.set()
+    reader.join()
+
+    assert result == [["stale"]]
+    fresh = cache.get_or_call(namespace, "account.move", "search_read", ([],), {}, lambda: ["fresh"])
+    assert fresh == ["fresh"], "Stale in-flight read must not be cached"
+    print("  [OK] Reads racing a payment are not cached")
+
+
+def test_ttl_and_copies():
+    """Entries expire after the model TTL; callers cannot mutate cached results."""
+    cache = OdooQueryCache(enabled=True, default_ttl=0.05)
+    namespace = ("url", "db", 2)
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return [{"id": 1, "name": "Bank"}]
+
+    rows = cache.get_or_call(namespace, "res.bank", "search_read", ([],), {}, fetch)
+    rows[0]["name"] = "mutated"
+    assert cache.get_or_call(namespace, "res.bank", "search_read", ([],), {}, fetch)[0]["name"] == "Bank"
+    time.sleep(0.06)
+    cache.get_or_call(namespace, "res.bank", "search_read", ([],), {}, fetch)
+    assert len(fetches) == 2
+
+    cache.get_or_call(namespace, "res.bank", "search_read", ([],), {"limit": 1}, fetch)
+    assert len(fetches) == 3, "Different kwargs are a different key"
+    print("  [OK] Per-model TTL expiry and copy-on-read")
+
+
+if __name__ == "__main__":
+    test_repeated_reads_hit_cache()
+    test_writes_invalidate_affected_reads()
+    test_read_racing_a_write_is_not_cached()
+    test_ttl_and_copies()
+    print("ALL TESTS PASSED!")
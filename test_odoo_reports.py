@@ -0,0 +1,337 @@
+"""
+Test Suite for Server-Side Aggregated Odoo Reports
+
+Runs an in-memory fake Odoo (XML-RPC ``common``/``object`` services with
+search_read, read_group, create, write and action_post over a small
+chart of accounts) and checks the profit and loss, balance sheet and
+trial balance built on read_group, plus how much less data they transfer
+than summing every journal line client-side.
+
+Run: python test_odoo_reports.py
+"""
+
+import itertools
+import sys
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from socketserver import ThreadingMixIn
+from xmlrpc.server import MultiPathXMLRPCServer, SimpleXMLRPCDispatcher, SimpleXMLRPCRequestHandler
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.odoo_mcp_server import OdooMCPServer
+
+# Model -> related model of its many2one fields (for dotted domain paths)
+RELATIONS = {
+    "account.move.line": {"account_id": "account.account", "move_id": "account.move", "partner_id": "res.partner"},
+    "account.move": {"partner_id": "res.partner"},
+    "account.payment": {"partner_id": "res.partner"},
+}
+
+OPERATORS = {
+    "=": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "<": lambda a, b: a is not None and a < b,
+    "<=": lambda a, b: a is not None and a <= b,
+    ">": lambda a, b: a is not None and a > b,
+    ">=": lambda a, b: a is not None and a >= b,
+    "in": lambda a, b: a in b,
+    "not in": lambda a, b: a not in b,
+    "=ilike": lambda a, b: str(a).lower() == str(b).lower(),
+}
+
+
+class OdooRequestHandler(SimpleXMLRPCRequestHandler):
+    rpc_paths = ("/xmlrpc/2/common", "/xmlrpc/2/object")
+    # Like Odoo's own endpoint, reply uncompressed
+    encode_threshold = None
+
+
+class ThreadingXMLRPCServer(ThreadingMixIn, MultiPathXMLRPCServer):
+    daemon_threads = True
+
+
+class FakeOdoo:
+    """In-memory Odoo external API for tests (one database, one user)."""
+
+    def __init__(self):
+        self.records = {}
+        self.calls = []
+        self.logins = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    # ---------- data helpers ----------
+
+    @staticmethod
+    def now():
+        # Odoo's write_date has second resolution: ties are common
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    def add(self, model, **values):
+        record_id = values.pop("id", None) or next(self._ids)
+        values.setdefault("write_date", self.now())
+        self.records.setdefault(model, {})[record_id] = dict(values, id=record_id)
+        return record_id
+
+    def _resolve(self, model, record, path):
+        value = record.get(path.split(".")[0])
+        for part_model, part in zip(itertools.repeat(model), path.split(".")[1:]):
+            related = self.records.get(RELATIONS[part_model][path.split(".")[0]], {}).get(value)
+            value = related.get(part) if related else None
+        return value
+
+    def _match(self, model, record, domain):
+        def evaluate(pos):
+            # Prefix notation: '|' and '&' take two terms, '!' one
+            term = domain[pos]
+            if term in ("|", "&"):
+                left, pos = evaluate(pos + 1)
+                right, pos = evaluate(pos)
+                return (left or right) if term == "|" else (left and right), pos
+            if term == "!":
+                value, pos = evaluate(pos + 1)
+                return not value, pos
+            field, op, value = term
+            return OPERATORS[op](self._resolve(model, record, field), value), pos + 1
+
+        pos, matched = 0, True
+        while pos < len(domain):
+            value, pos = evaluate(pos)
+            matched = matched and value
+        return matched
+
+    def _search(self, model, domain, offset=0, limit=None, order=None):
+        rows = [r for r in self.records.get(model, {}).values() if self._match(model, r, domain)]
+        for key in reversed((order or "id").split(",")):
+            name, _, direction = key.strip().partition(" ")
+            rows.sort(key=lambda r: (r.get(name) is None, r.get(name)), reverse=direction.lower() == "desc")
+        return rows[offset:offset + limit if limit else None]
+
+    def _read(self, model, record, fields):
+        out = {"id": record["id"]}
+        for field in fields or [f for f in record if f != "id"]:
+            value = record.get(field, False)
+            if field in RELATIONS.get(model, {}) and value:
+                related = self.records.get(RELATIONS[model][field], {}).get(value, {})
+                value = [value, related.get("name", str(value))]
+            out[field] = value if value is not None else False
+        return out
+
+    # ---------- ORM methods ----------
+
+    def search(self, model, domain, offset=0, limit=None, order=None):
+        return [r["id"] for r in self._search(model, domain, offset, limit, order)]
+
+    def search_count(self, model, domain):
+        return len(self._search(model, domain))
+
+    def search_read(self, model, domain, fields=None, offset=0, limit=None, order=None):
+        return [self._read(model, r, fields) for r in self._search(model, domain, offset, limit, order)]
+
+    def read(self, model, ids, fields=None):
+        return [self._read(model, self.records[model][i], fields) for i in ids if i in self.records.get(model, {})]
+
+    def read_group(self, model, domain, fields, groupby, lazy=True, **kwargs):
+        groups = {}
+        for record in self._search(model, domain):
+            key = tuple(record.get(g) for g in groupby)
+            groups.setdefault(key, []).append(record)
+        if not groupby and not groups:
+            groups[()] = []
+        rows = []
+        for key, records in groups.items():
+            row = {"__count": len(records)}
+            for spec in fields:
+                name = spec.split(":")[0]
+                row[name] = round(sum(r.get(name) or 0.0 for r in records), 2)
+            for field, value in zip(groupby, key):
+                related = self.records.get(RELATIONS.get(model, {}).get(field, ""), {}).get(value)
+                row[field] = [value, related.get("name", "")] if related else value
+            rows.append(row)
+        return rows
+
+    def create(self, model, values, context=None):
+        with self._lock:
+            # Like Odoo, a multi-record create is all or nothing
+            prepared = [self._prepare(model, v, context) for v in (values if isinstance(values, list) else [values])]
+            ids = [self.add(model, **v) for v in prepared]
+            return ids if isinstance(values, list) else ids[0]
+
+    def _prepare(self, model, values, context=None):
+        values = dict(values)
+        lines = values.pop("invoice_line_ids", None) or values.pop("line_ids", None)
+        if lines:
+            if any(l[2].get("price_unit", 0) < 0 for l in lines):
+                raise ValueError("ValidationError: Invoice lines cannot have a negative price")
+            values["amount_total"] = values["amount_untaxed"] = round(sum(
+                l[2].get("quantity", 1) * l[2].get("price_unit", 0) for l in lines
+            ), 2)
+            values["amount_residual"] = values["amount_total"]
+        if model == "account.payment.register":
+            values["active_ids"] = (context or {}).get("active_ids", [])
+        values.setdefault("state", "draft")
+        return values
+
+    def write(self, model, ids, values):
+        with self._lock:
+            for i in ids:
+                self.records[model][i].update(values, write_date=self.now())
+        return True
+
+    def action_post(self, model, ids):
+        with self._lock:
+            moves = [self.records[model][i] for i in ids]
+            if any(not m.get("amount_total") for m in moves if "amount_total" in m):
+                raise ValueError("UserError: You cannot validate an invoice with a total amount equal to 0")
+            for move in moves:
+                move.update(state="posted", name=move.get("name") or f"INV/2026/{move['id']:05d}",
+                            write_date=self.now())
+        return True
+
+    def action_create_payments(self, model, ids, context=None):
+        with self._lock:
+            for wizard in (self.records[model][i] for i in ids):
+                invoices = [self.records["account.move"][i] for i in wizard["active_ids"]]
+                if any(inv["state"] != "posted" for inv in invoices):
+                    raise ValueError("UserError: You can only register payment for posted journal entries")
+                for invoice in invoices:
+                    amount = wizard.get("amount", invoice["amount_residual"])
+                    invoice["amount_residual"] = round(invoice["amount_residual"] - amount, 2)
+                    invoice["payment_state"] = "paid" if invoice["amount_residual"] <= 0 else "partial"
+                    invoice["write_date"] = self.now()
+                    self.add("account.payment", partner_id=invoice.get("partner_id"), amount=amount,
+                             date=wizard["payment_date"], move_id=invoice["id"], state="posted")
+        return True
+
+    # ---------- RPC services ----------
+
+    def execute_kw(self, db, uid, password, model, method, args, kwargs=None):
+        self.calls.append((model, method))
+        return getattr(self, method)(model, *args, **(kwargs or {}))
+
+    def authenticate(self, db, username, password, env):
+        self.logins += 1
+        return 2 if password == "secret" else False
+
+    def __enter__(self):
+        self.server = ThreadingXMLRPCServer(("127.0.0.1", 0), requestHandler=OdooRequestHandler,
+                                            logRequests=False, allow_none=True)
+        common = SimpleXMLRPCDispatcher(allow_none=True)
+        common.register_function(self.authenticate, "authenticate")
+        common.register_function(lambda: {"server_version": "19.0"}, "version")
+        obj = SimpleXMLRPCDispatcher(allow_none=True)
+        obj.register_function(self.execute_kw, "execute_kw")
+        self.server.add_dispatcher("/xmlrpc/2/common", common)
+        self.server.add_dispatcher("/xmlrpc/2/object", obj)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def client(self) -> OdooMCPServer:
+        return OdooMCPServer(url=self.url, db="db", username="admin", password="secret")
+
+
+def build_ledger(odoo: FakeOdoo, days: int = 365):
+    """Chart of accounts with capital, daily sales and rent for ``days`` days."""
+    accounts = {
+        "bank": odoo.add("account.account", code="1000", name="Bank", account_type="asset_cash", internal_group="asset"),
+        "receivable": odoo.add("account.account", code="1200", name="Receivable", account_type="asset_receivable", internal_group="asset"),
+        "payable": odoo.add("account.account", code="2000", name="Payable", account_type="liability_payable", internal_group="liability"),
+        "capital": odoo.add("account.account", code="3000", name="Capital", account_type="equity", internal_group="equity"),
+        "sales": odoo.add("account.account", code="4000", name="Sales", account_type="income", internal_group="income"),
+        "rent": odoo.add("account.account", code="6000", name="Rent", account_type="expense", internal_group="expense"),
+    }
+
+    def entry(day, debit_account, credit_account, amount, state="posted"):
+        for account, debit, credit in ((debit_account, amount, 0.0), (credit_account, 0.0, amount)):
+            odoo.add("account.move.line", account_id=accounts[account], date=day, debit=debit, credit=credit,
+                     balance=debit - credit, parent_state=state)
+
+    entry("2025-12-01", "bank", "capital", 10000.0)
+    entry("2025-12-15", "receivable", "sales", 500.0)
+    start = date(2026, 1, 1)
+    for n in range(days):
+        day = (start + timedelta(days=n)).isoformat()
+        entry(day, "receivable", "sales", 100.0 + n % 7)
+        entry(day, "rent", "payable", 40.0)
+    entry("2026-03-01", "receivable", "sales", 99999.0, state="draft")
+    return accounts
+
+
+def test_profit_loss_uses_read_group():
+    """P&L comes from grouped sums, not every journal line."""
+    with FakeOdoo() as odoo:
+        build_ledger(odoo)
+        client = odoo.client()
+        odoo.calls.clear()
+        report = client.get_financial_report("profit_loss", "2026-01-01", "2026-12-31")
+
+        expected_income = sum(100.0 + n % 7 for n in range(365))
+        assert report["status"] == "success", report
+        assert round(report["income"], 2) == round(expected_income, 2)
+        assert report["expenses"] == 40.0 * 365
+        assert round(report["net_profit"], 2) == round(expected_income - 40.0 * 365, 2)
+        assert [a["code"] for a in report["accounts"]] == ["4000", "6000"]
+        assert ("account.move.line", "search_read") not in odoo.calls
+        assert sorted(odoo.calls) == [("account.account", "search_read"), ("account.move.line", "read_group")]
+    print("  [OK] P&L from one read_group and one account lookup")
+
+
+def test_balance_sheet_and_trial_balance_balance():
+    """Balance sheet includes current earnings; trial balance debits equal credits."""
+    with FakeOdoo() as odoo:
+        build_ledger(odoo, days=90)
+        client = odoo.client()
+
+        sheet = client.get_financial_report("balance_sheet", "2026-01-01", "2026-03-31")
+        assert sheet["status"] == "success", sheet
+        assert sheet["equity"] == 10000.0 and sheet["balanced"]
+        assert sheet["liabilities"] == 40.0 * 90
+
+        trial = client.get_financial_report("trial_balance", "2026-01-01", "2026-03-31")
+        assert trial["status"] == "success" and trial["balanced"], trial
+        rows = {row["code"]: row for row in trial["accounts"]}
+        assert rows["3000"]["opening_balance"] == -10000.0 and rows["3000"]["debit"] == 0.0
+        assert rows["4000"]["opening_balance"] == -500.0
+        assert rows["1000"]["closing_balance"] == 10000.0
+        assert rows["6000"]["closing_balance"] == 40.0 * 90
+    print("  [OK] Balance sheet balances; trial balance has opening, movements and closing")
+
+
+def test_transfer_size_vs_line_scan():
+    """A year of journal lines: bytes received by read_group vs search_read."""
+    with FakeOdoo() as odoo:
+        accounts = build_ledger(odoo)
+        client = odoo.client()
+        stats = client.rpc.stats
+
+        before = stats()["bytes_received"]
+        client.get_financial_report("profit_loss", "2026-01-01", "2026-12-31")
+        grouped = stats()["bytes_received"] - before
+
+        before = stats()["bytes_received"]
+        for account in ("sales", "rent"):
+            client._execute("account.move.line", "search_read",
+                            [("account_id", "in", [accounts[account]]), ("date", ">=", "2026-01-01"),
+                             ("date", "<=", "2026-12-31"), ("parent_state", "=", "posted")],
+                            ["balance", "credit", "debit"])
+        scanned = stats()["bytes_received"] - before
+
+        assert grouped * 20 < scanned, (grouped, scanned)
+    print(f"  [OK] P&L transfer: read_group {grouped / 1024:.1f} KB vs line scan {scanned / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    test_profit_loss_uses_read_group()
+    test_balance_sheet_and_trial_balance_balance()
+    test_transfer_size_vs_line_scan()
+    print("ALL TESTS PASSED!")
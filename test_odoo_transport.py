@@ -0,0 +1,228 @@
+"""
+Test Suite for the Pooled Odoo Transport
+
+Runs a local fake Odoo endpoint (XML-RPC and JSON-RPC) and checks
+keep-alive connection reuse, thread safety, gzip responses, fault mapping,
+cached session uids, and reports per-call overhead against a plain
+ServerProxy.
+
+Run: python test_odoo_transport.py
+"""
+
+import gzip
+import json
+import socket
+import sys
+import threading
+import time
+import xmlrpc.client
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.odoo_transport import OdooRPCClient, cached_login
+
+
+class FakeOdooHandler(BaseHTTPRequestHandler):
+    """Minimal Odoo external API: common.authenticate/version, object.execute_kw."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # Headers and body are written separately; without TCP_NODELAY the
+        # Nagle/delayed-ACK interaction adds ~40 ms per keep-alive reply
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def _dispatch(self, service, method, args):
+        if service == "common" and method == "authenticate":
+            self.server.logins += 1
+            return 2 if args[2] == "secret" else False
+        if service == "common" and method == "version":
+            return {"server_version": "19.0"}
+        if service == "object" and method == "execute_kw":
+            model, model_method, call_args = args[3], args[4], args[5]
+            if model_method == "fail":
+                raise ValueError("ValidationError: bad invoice")
+            if model_method == "search":
+                return list(range(1, 6))
+            if model_method == "read":
+                return [{"id": i, "name": f"{model} {i}"} for i in call_args[0]]
+        raise ValueError(f"Unknown call {service}.{method}")
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path == "/jsonrpc":
+            request = json.loads(body)
+            params = request["params"]
+            try:
+                reply = {"jsonrpc": "2.0", "id": request["id"],
+                         "result": self._dispatch(params["service"], params["method"], params["args"])}
+            except ValueError as e:
+                reply = {"jsonrpc": "2.0", "id": request["id"],
+                         "error": {"code": 200, "message": "Odoo Server Error", "data": {"message": str(e)}}}
+            payload = json.dumps(reply).encode()
+        else:
+            args, method = xmlrpc.client.loads(body)
+            try:
+                result = self._dispatch(self.path.rsplit("/", 1)[1], method, args)
+                payload = xmlrpc.client.dumps((result,), methodresponse=True, allow_none=True).encode()
+            except ValueError as e:
+                payload = xmlrpc.client.dumps(xmlrpc.client.Fault(2, str(e))).encode()
+
+        self.send_response(200)
+        if "gzip" in self.headers.get("Accept-Encoding", "") and len(payload) > 200:
+            payload = gzip.compress(payload)
+            self.send_header("Content-Encoding", "gzip")
+            self.server.gzipped += 1
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        # Simulate a server that drops idle keep-alive connections
+        if self.server.drop_after_response:
+            self.close_connection = True
+
+
+class FakeOdoo:
+    def __enter__(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOdooHandler)
+        self.server.daemon_threads = True
+        self.server.connections = 0
+        self.server.logins = 0
+        self.server.gzipped = 0
+        self.server.drop_after_response = False
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _execute(rpc, method, *args):
+    return rpc.execute_kw("db", 2, "secret", "res.partner", method, list(args), {})
+
+
+def test_keep_alive_reuses_one_connection():
+    """Sequential calls share one persistent connection."""
+    with FakeOdoo() as odoo:
+        rpc = OdooRPCClient(odoo.url, protocol="xmlrpc")
+        for _ in range(50):
+            assert _execute(rpc, "search", []) == [1, 2, 3, 4, 5]
+        stats = rpc.stats()
+        assert odoo.server.connections == 1 and stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 49
+        rpc.close()
+    print("  [OK] 50 calls over one keep-alive connection")
+
+
+def test_pool_is_thread_safe_and_bounded():
+    """Concurrent callers never exceed the pool size and get their own replies."""
+    with FakeOdoo() as odoo:
+        rpc = OdooRPCClient(odoo.url, protocol="xmlrpc", pool_size=4)
+        errors = []
+
+        def worker(n):
+            try:
+                for _ in range(20):
+                    rows = _execute(rpc, "read", [n])
+                    assert rows == [{"id": n, "name": f"res.partner {n}"}], rows
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not errors, errors
+        assert rpc.stats()["connections_opened"] <= 4
+        rpc.close()
+    print("  [OK] 8 threads x 20 calls on a 4-connection pool")
+
+
+def test_jsonrpc_gzip_and_faults():
+    """JSON-RPC mode works, gzip replies are decoded, errors become Faults."""
+    with FakeOdoo() as odoo:
+        for protocol in ("xmlrpc", "jsonrpc"):
+            rpc = OdooRPCClient(odoo.url, protocol=protocol)
+            rows = _execute(rpc, "read", list(range(1, 40)))
+            assert len(rows) == 39
+            try:
+                _execute(rpc, "fail")
+                assert False, "Server error should raise"
+            except xmlrpc.client.Fault as e:
+                assert "bad invoice" in e.faultString
+            rpc.close()
+        assert odoo.server.gzipped >= 2
+    print("  [OK] XML-RPC and JSON-RPC with gzip; errors raised as Fault")
+
+
+def test_dropped_idle_connection_is_replaced():
+    """A keep-alive connection closed by the server is replaced transparently."""
+    with FakeOdoo() as odoo:
+        odoo.server.drop_after_response = True
+        rpc = OdooRPCClient(odoo.url, protocol="xmlrpc")
+        for _ in range(3):
+            assert _execute(rpc, "search", []) == [1, 2, 3, 4, 5]
+        rpc.close()
+    print("  [OK] Server-closed idle connections are reopened")
+
+
+def test_session_uid_is_cached():
+    """A second login with the same credentials reuses the uid."""
+    with FakeOdoo() as odoo:
+        rpc = OdooRPCClient(odoo.url)
+        assert cached_login(rpc, "db", "admin", "secret") == 2
+        assert cached_login(rpc, "db", "admin", "secret") == 2
+        assert odoo.server.logins == 1
+        cached_login(rpc, "db", "admin", "secret", refresh=True)
+        assert odoo.server.logins == 2
+        assert not cached_login(rpc, "db", "admin", "wrong")
+        rpc.close()
+    print("  [OK] Session uid cached per credentials")
+
+
+def test_benchmark_per_call_overhead():
+    """Report per-call latency: ServerProxy vs pooled XML-RPC vs JSON-RPC."""
+    calls = 200
+    with FakeOdoo() as odoo:
+        proxy = xmlrpc.client.ServerProxy(f"{odoo.url}/xmlrpc/2/object")
+        started = time.perf_counter()
+        for _ in range(calls):
+            # A new proxy per call, like a fresh OdooMCPServer per report
+            xmlrpc.client.ServerProxy(f"{odoo.url}/xmlrpc/2/object").execute_kw(
+                "db", 2, "secret", "res.partner", "search", [[]], {})
+        baseline_ms = (time.perf_counter() - started) * 1000 / calls
+        proxy("close")()
+
+        results = {}
+        for protocol in ("xmlrpc", "jsonrpc"):
+            rpc = OdooRPCClient(odoo.url, protocol=protocol)
+            started = time.perf_counter()
+            for _ in range(calls):
+                _execute(rpc, "search", [])
+            results[protocol] = (time.perf_counter() - started) * 1000 / calls
+            rpc.close()
+
+    print(f"  [OK] Per-call: ServerProxy {baseline_ms:.3f} ms, pooled XML-RPC {results['xmlrpc']:.3f} ms, "
+          f"pooled JSON-RPC {results['jsonrpc']:.3f} ms")
+
+
+if __name__ == "__main__":
+    test_keep_alive_reuses_one_connection()
+    test_pool_is_thread_safe_and_bounded()
+    test_jsonrpc_gzip_and_faults()
+    test_dropped_idle_connection_is_replaced()
+    test_session_uid_is_cached()
+    test_benchmark_per_call_overhead()
+    print("ALL TESTS PASSED!")
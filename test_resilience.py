@@ -0,0 +1,153 @@
+"""
+Test Suite for the Resilience Layer
+
+Tests circuit breaker transitions (closed/open/half-open), full-jitter
+backoff, deadline propagation and retry budgets.
+
+Run: python test_resilience.py
+"""
+
+import sys
+import tempfile
+import time
+import xmlrpc.client
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+import scripts.resilience as resilience
+from scripts.resilience import (
+    BreakerConfig,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    DeadlineExceeded,
+    RetryBudget,
+    circuit_protected,
+    deadline,
+    full_jitter_delay,
+    retry_call,
+    time_remaining,
+)
+
+
+def _boom():
+    raise ConnectionError("connection refused")
+
+
+def test_breaker_opens_probes_and_closes():
+    """Consecutive failures open the circuit; one probe after the timeout closes it."""
+    breaker = CircuitBreaker("odoo-test", BreakerConfig(failure_threshold=3, recovery_timeout=0.05))
+    for _ in range(3):
+        try:
+            breaker.call(_boom)
+        except ConnectionError:
+            pass
+    assert breaker.state == CircuitState.OPEN
+
+    try:
+        breaker.call(lambda: "ok")
+        assert False, "Open circuit should refuse calls"
+    except CircuitOpenError as e:
+        assert e.endpoint == "odoo-test"
+
+    time.sleep(0.06)
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow(), "First half-open probe is allowed"
+    assert not breaker.allow(), "Only one probe at a time"
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.snapshot()["rejected"] == 2
+    print("  [OK] Closed -> open -> half-open -> closed")
+
+
+def test_guard_ignores_application_faults():
+    """Server-side faults mean the endpoint is up and do not trip the breaker."""
+    breaker = CircuitBreaker("fault-test", BreakerConfig(failure_threshold=1))
+    try:
+        with breaker.guard(ignore=(xmlrpc.client.Fault,)):
+            raise xmlrpc.client.Fault(2, "ValidationError")
+    except xmlrpc.client.Fault:
+        pass
+    assert breaker.state == CircuitState.CLOSED
+    print("  [OK] Application faults do not open the circuit")
+
+
+def test_full_jitter_and_deadlines():
+    """Backoff stays within the exponential cap; nested deadlines only shorten."""
+    delays = [full_jitter_delay(3, base=1.0, cap=5.0) for _ in range(200)]
+    assert all(0 <= d <= 5.0 for d in delays)
+    assert len(set(delays)) > 1, "Delays should be jittered"
+
+    assert time_remaining() is None
+    with deadline(10):
+        with deadline(60):
+            assert time_remaining() <= 10
+        with deadline(0.01):
+            time.sleep(0.02)
+            try:
+                retry_call(lambda: "unreachable", endpoint="deadline-test")
+                assert False, "Expired deadline should stop the call"
+            except DeadlineExceeded:
+                pass
+    assert time_remaining() is None
+    print("  [OK] Full jitter bounds and deadline propagation")
+
+
+def test_retry_budget_limits_retries():
+    """An exhausted budget stops retries even when attempts remain."""
+    budget = RetryBudget(ratio=0.0, min_per_sec=0.0, max_tokens=2)
+    resilience._budgets["budget-test"] = budget
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        raise ConnectionError("timeout")
+
+    try:
+        retry_call(flaky, endpoint="budget-test", max_attempts=10, base_delay=0.001)
+    except ConnectionError:
+        pass
+    assert len(calls) == 3, f"1 attempt + 2 budgeted retries expected, got {len(calls)}"
+    print("  [OK] Retry budget caps retries")
+
+
+def test_circuit_protected_error_results():
+    """Error dicts count as failures and an open circuit returns an error dict."""
+    with tempfile.TemporaryDirectory() as tmp:
+        original = resilience.BREAKER_STATE_PATH
+        resilience.BREAKER_STATE_PATH = Path(tmp) / "circuit_breakers.json"
+        try:
+            resilience._breakers["poster-test"] = CircuitBreaker(
+                "poster-test", BreakerConfig(failure_threshold=2, recovery_timeout=60),
+                on_change=resilience._persist_state,
+            )
+
+            @circuit_protected("poster-test", error_result=True)
+            def post(ok: bool):
+                return {"status": "success"} if ok else {"status": "error", "message": "Browser crashed"}
+
+            assert post(False)["status"] == "error"
+            assert post(False)["status"] == "error"
+            refused = post(True)
+            assert refused.get("circuit_open") is True
+
+            states = resilience.read_breaker_states()
+            assert states["poster-test"]["state"] == "open"
+            assert states["poster-test"]["last_error"] == "Browser crashed"
+        finally:
+            resilience.BREAKER_STATE_PATH = original
+            resilience._breakers.pop("poster-test", None)
+    print("  [OK] Error results trip the breaker and state is shared via file")
+
+
+if __name__ == "__main__":
+    test_breaker_opens_probes_and_closes()
+    test_guard_ignores_application_faults()
+    test_full_jitter_and_deadlines()
+    test_retry_budget_limits_retries()
+    test_circuit_protected_error_results()
+    print("ALL TESTS PASSED!")
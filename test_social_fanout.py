@@ -0,0 +1,96 @@
+"""
+Test Suite for Social Fan-Out Posting
+
+Tests that platform posts run concurrently, report per-platform results
+and timing, and that a retry re-posts only the platforms that failed.
+
+Run: python test_social_fanout.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.resilience import deadline, time_remaining
+from scripts.social_fanout import fan_out, retry_failed
+
+
+class FakePoster:
+    """Poster that takes a fixed time and fails a set number of times."""
+
+    def __init__(self, platform: str, seconds: float, failures: int = 0):
+        self.platform = platform
+        self.seconds = seconds
+        self.failures = failures
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.seconds)
+        if self.calls <= self.failures:
+            return {"status": "error", "message": "Browser crashed", "platform": self.platform}
+        return {"status": "success", "platform": self.platform}
+
+
+def test_posts_run_concurrently():
+    """Wall-clock time is close to the slowest platform, not the sum."""
+    posters = {name: FakePoster(name, 0.2) for name in ("facebook", "instagram", "twitter")}
+    outcome = fan_out(posters)
+
+    assert outcome.status == "success"
+    assert outcome.sum_ms >= 600
+    assert outcome.wall_ms < 450, f"Fan-out took {outcome.wall_ms} ms"
+    report = outcome.to_dict()
+    assert set(report["platforms"]) == set(posters)
+    assert all(p["ok"] and p["attempts"] == 1 for p in report["platforms"].values())
+    print(f"  [OK] Wall {outcome.wall_ms} ms vs sequential {outcome.sum_ms} ms "
+          f"(x{report['speedup']})")
+
+
+def test_retry_only_failed_platforms():
+    """A partial failure re-posts only the failed platform."""
+    posters = {
+        "facebook": FakePoster("facebook", 0.01),
+        "instagram": FakePoster("instagram", 0.01, failures=1),
+        "twitter": FakePoster("twitter", 0.01),
+    }
+    outcome = fan_out(posters)
+    assert outcome.status == "partial" and outcome.failed == ["instagram"]
+
+    outcome = retry_failed(outcome, posters)
+    assert outcome.status == "success"
+    assert [p.calls for p in posters.values()] == [1, 2, 1], "Only Instagram is posted again"
+    assert outcome.results["instagram"].attempts == 2
+    print("  [OK] Retry re-posted only the failed platform")
+
+
+def test_exceptions_and_deadline_propagate():
+    """A raising poster becomes an error result; the deadline reaches workers."""
+    seen = {}
+
+    def broken():
+        raise RuntimeError("playwright not installed")
+
+    def check_deadline():
+        seen["remaining"] = time_remaining()
+        return {"success": True}
+
+    with deadline(30):
+        outcome = fan_out({"facebook": broken, "twitter": check_deadline})
+
+    assert outcome.failed == ["facebook"]
+    assert "playwright" in outcome.results["facebook"].result["message"]
+    assert seen["remaining"] is not None and 0 < seen["remaining"] <= 30
+    print("  [OK] Exceptions reported per platform, deadline carried to workers")
+
+
+if __name__ == "__main__":
+    test_posts_run_concurrently()
+    test_retry_only_failed_platforms()
+    test_exceptions_and_deadline_propagate()
+    print("ALL TESTS PASSED!")
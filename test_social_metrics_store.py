@@ -0,0 +1,195 @@
+"""
+Test Suite for the Social Metrics Store
+
+Tests TTL-bounded refreshes from the last watermark, per-day aggregates,
+incremental vault indexing and the response cache.
+
+Run: python test_social_metrics_store.py
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.social_metrics_store import SOURCE_VAULT, SocialMetricsStore
+
+
+def _store(tmp: str) -> SocialMetricsStore:
+    return SocialMetricsStore(Path(tmp) / "social_metrics.db")
+
+
+def test_refresh_respects_ttl_and_watermark():
+    """The scraper runs once per TTL and is asked only for newer posts."""
+    now = time.time()
+    timeline = [
+        {"post_id": "1", "text": "old", "posted_at": now - 3600, "likes": 5, "shares": 1},
+        {"post_id": "2", "text": "new", "posted_at": now - 60, "likes": 20, "shares": 4, "comments": 2},
+    ]
+    calls = []
+
+    def scrape(since, stale):
+        calls.append((since, set(stale)))
+        return [t for t in timeline if since is None or t["posted_at"] > since or t["post_id"] in stale]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = _store(tmp)
+        first = store.refresh("twitter", scrape, ttl=60)
+        assert first["refreshed"] and first["new_posts"] == 2
+        assert not store.refresh("twitter", scrape, ttl=60)["refreshed"], "Fresh cache must not scrape"
+        assert len(calls) == 1
+
+        timeline.append({"post_id": "3", "text": "newest", "posted_at": now, "likes": 1})
+        again = store.refresh("twitter", scrape, force=True)
+        assert calls[-1][0] == now - 60, "Second scrape starts at the watermark"
+        assert again["new_posts"] == 1 and again["updated_posts"] == 0
+
+        started = time.perf_counter()
+        summary = store.summary("twitter", days=7)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        assert summary["posts"] == 3 and summary["likes"] == 26 and summary["shares"] == 5
+        assert summary["most_popular"]["post_id"] == "2"
+        assert [p["post_id"] for p in store.recent_posts("twitter", 2)] == ["3", "2"]
+        store.close()
+    print(f"  [OK] One scrape per TTL, incremental from watermark; summary in {elapsed_ms:.2f} ms")
+
+
+class _Element:
+    """Minimal stand-in for a Playwright element handle."""
+
+    def __init__(self, text="", attributes=None, children=None, href=None):
+        self.text, self.attributes, self.children, self.href = text, attributes or {}, children or {}, href
+
+    def query_selector(self, selector):
+        return self.children.get(selector)
+
+    def inner_text(self):
+        return self.text
+
+    def get_attribute(self, name):
+        return self.attributes.get(name)
+
+    def evaluate(self, script):
+        return self.href
+
+
+def _article(text, posted_at=None, post_id=None, likes="0"):
+    children = {'[data-testid="tweetText"]': _Element(text), '[data-testid="like"]': _Element(likes)}
+    if posted_at:
+        children["time"] = _Element(attributes={"datetime": posted_at},
+                                    href=f"/me/status/{post_id}" if post_id else None)
+    return _Element(children=children)
+
+
+def test_twitter_scrape_filter_uses_watermark():
+    """Re-scrapes compare the tweets' ISO times with the float watermark."""
+    from scripts.twitter_mcp_server import _is_new_or_stale, _parse_tweet_article
+
+    def iso(seconds_ago):
+        return datetime.fromtimestamp(time.time() - seconds_ago).astimezone().isoformat()
+
+    timeline = [_article("pinned", iso(86400), "1", likes="3"), _article("hello", iso(600), "2", likes="1.5K")]
+    calls = []
+
+    def scrape(since, stale):
+        calls.append(since)
+        tweets = [_parse_tweet_article(article) for article in timeline]
+        return [t for t in tweets if _is_new_or_stale(t, since, stale)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = _store(tmp)
+        assert store.refresh("twitter", scrape, force=True)["new_posts"] == 2
+        timeline.append(_article("just now", iso(5), "3"))
+        timeline.append(_article("no permalink"))
+        again = store.refresh("twitter", scrape, force=True)
+        assert isinstance(calls[-1], float), "Second scrape filters against the watermark"
+        assert again["new_posts"] == 2 and again["updated_posts"] == 0, again
+        assert store.summary("twitter", days=7)["likes"] == 1503
+        store.close()
+
+    fallback = _parse_tweet_article(_article("no permalink"))["post_id"]
+    assert fallback == "TW_" + hashlib.sha1(b"no permalink").hexdigest()[:16]
+    print("  [OK] Scraper filter compares ISO tweet times with the watermark")
+
+
+def test_stale_posts_are_refreshed():
+    """Posts past their metrics TTL are handed to the scraper again."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = _store(tmp)
+        store.upsert_posts("twitter", [{"post_id": "1", "posted_at": time.time() - 10, "likes": 1}])
+        assert store.stale_post_ids("twitter", ttl=3600) == set()
+        assert store.stale_post_ids("twitter", ttl=-1) == {"1"}
+
+        store.upsert_posts("twitter", [{"post_id": "1", "posted_at": time.time() - 10, "likes": 9}])
+        assert store.summary("twitter")["likes"] == 9, "Aggregates follow updated metrics"
+        store.close()
+    print("  [OK] Stale post metrics are re-read and aggregates updated")
+
+
+def test_vault_index_is_incremental():
+    """Only changed vault files are re-read; removed files drop out."""
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp) / "Social_Media"
+        folder.mkdir()
+        base = time.time() - 3600
+        for i, platform in enumerate(["linkedin", "linkedin", "twitter"]):
+            path = folder / f"post_{i}.md"
+            path.write_text(f"---\nplatform: {platform}\n---\n\nHello {i}\n")
+            os.utime(path, (base + i, base + i))
+
+        store = _store(tmp)
+        assert store.index_vault_folder(folder) == 3
+        assert store.summary("linkedin", days=None, source=SOURCE_VAULT)["posts"] == 2
+
+        # Unchanged: only the file stamped at the watermark is re-checked
+        assert store.index_vault_folder(folder) == 1
+        (folder / "post_3.md").write_text("---\nplatform: facebook\n---\n")
+        assert store.index_vault_folder(folder) == 2, "Only the new file and the one at the mark"
+
+        (folder / "post_0.md").unlink()
+        store.index_vault_folder(folder)
+        assert store.summary("linkedin", days=None, source=SOURCE_VAULT)["posts"] == 1
+        assert store.summary("facebook", days=None, source=SOURCE_VAULT)["posts"] == 1
+        assert store.summary("twitter", days=None)["posts"] == 0, "Vault posts never count as live"
+        store.close()
+    print("  [OK] Vault index reads only changed files")
+
+
+def test_response_cache():
+    """Responses are reused within the TTL; errors are not cached."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = _store(tmp)
+        fetches = []
+
+        def insights():
+            fetches.append(1)
+            return {"status": "success", "page": "Acme"}
+
+        assert store.cached("fb:insights", insights)["page"] == "Acme"
+        assert "cache_age_sec" in store.cached("fb:insights", insights)
+        assert len(fetches) == 1
+
+        store.cached("fb:comments", lambda: {"status": "error", "message": "timeout"})
+        assert store.cached("fb:comments", lambda: {"status": "success"})["status"] == "success"
+
+        week_start = datetime.now() - timedelta(days=2)
+        assert store.summary("facebook", start=week_start, end=datetime.now())["posts"] == 0
+        store.close()
+    print("  [OK] Response cache reuses results and skips errors")
+
+
+if __name__ == "__main__":
+    test_refresh_respects_ttl_and_watermark()
+    test_twitter_scrape_filter_uses_watermark()
+    test_stale_posts_are_refreshed()
+    test_vault_index_is_incremental()
+    test_response_cache()
+    print("ALL TESTS PASSED!")
@@ -0,0 +1,225 @@
+"""
+Test Suite for the Task Planner
+
+Tests the rule-based fast-path planner that handles known task types
+locally before escalating to the LLM task-planner, and the single-flight
+layer that deduplicates planning triggers.
+
+Run: python test_task_planner_fast_path.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from skills.vault_skills import VaultSkills
+from skills.task_planner_skill import (
+    FastPathPlanner,
+    PlanRule,
+    PlannerSingleFlight,
+    _register_default_rules,
+    try_fast_path_plan,
+)
+
+
+def _task(metadata: dict, body: str = "") -> dict:
+    return {"metadata": metadata, "body": body}
+
+
+def test_default_rules_match_known_types():
+    """Empty file drops, Post_Ideas requests and invoice emails take the fast path."""
+    planner = _register_default_rules(FastPathPlanner())
+
+    plan = planner.plan("FILE_empty.md", _task({"type": "file_drop", "original_name": "empty.txt", "size": "0"}))
+    assert plan is not None and "empty.txt" in plan
+
+    plan = planner.plan("LINKEDIN_POST_1.md", _task({
+        "type": "linkedin_post_request",
+        "title": "LinkedIn Post from Idea: launch",
+        "source_file": "launch.md",
+    }))
+    assert plan is not None and "Post_Ideas/launch.md" in plan
+
+    plan = planner.plan("EMAIL_1.md", _task(
+        {"type": "email", "from": "billing@vendor.com", "subject": "Your invoice #4411"},
+        "Please find attached.",
+    ))
+    assert plan is not None and "billing@vendor.com" in plan
+
+    stats = planner.stats()
+    assert stats["rules"] == {"empty_file_drop": 1, "linkedin_post_request": 1, "routine_invoice_email": 1}
+    assert stats["escalations"] == 0
+
+
+def test_unmatched_tasks_escalate():
+    """Non-empty drops, ordinary emails and unknown types go to the LLM planner."""
+    planner = _register_default_rules(FastPathPlanner())
+
+    assert planner.plan("FILE_a.md", _task({"type": "file_drop", "size": "200"})) is None
+    assert planner.plan("EMAIL_2.md", _task({"type": "email", "subject": "Lunch?"}, "Are you free?")) is None
+    assert planner.plan("EMAIL_3.md", _task({"type": "email", "from": "jane@client.com", "subject": "Invoice #4411"})) is None
+    assert planner.plan("TASK.md", _task({"type": "custom"})) is None
+
+    stats = planner.stats()
+    assert stats["escalations"] == 4
+    assert stats["fast_path_hits"] == 0
+
+
+def test_disputed_invoice_email_escalates():
+    """Invoice emails that read like a dispute or dunning notice are not routine."""
+    planner = _register_default_rules(FastPathPlanner())
+
+    dispute = _task(
+        {"type": "email", "from": "billing@vendor.com", "subject": "Re: Invoice #4411"},
+        "I dispute your invoice, refund me.",
+    )
+    overdue = _task(
+        {"type": "email", "from": "billing@vendor.com", "subject": "Overdue invoice INV-4411 - legal action"},
+    )
+    assert planner.plan("EMAIL_dispute.md", dispute) is None
+    assert planner.plan("EMAIL_overdue.md", overdue) is None
+    assert planner.stats()["rules"]["routine_invoice_email"] == 0
+
+def test_custom_rule_registration():
+    """Rules can be registered for additional task types."""
+    planner = FastPathPlanner()
+    planner.register(PlanRule(name="ping", task_types=("ping",), template="Plan for $file_name"))
+
+    assert planner.plan("PING.md", _task({"type": "ping"})) == "Plan for PING.md"
+    assert planner.stats()["rules"] == {"ping": 1}
+
+
+def test_try_fast_path_plan_writes_plan():
+    """A matching task gets Plan_<stem>.md written next to it in Needs_Action."""
+    with tempfile.TemporaryDirectory() as tmp:
+        vault = VaultSkills(vault_path=tmp)
+        (vault.needs_action / "FILE_empty.md").write_text(
+            "---\ntype: file_drop\noriginal_name: empty.txt\nsize: 0\n---\n\nNew file dropped for processing.\n"
+        )
+        (vault.needs_action / "NOTE.md").write_text("---\ntype: note\n---\n\nSomething to think about.\n")
+
+        plan_path = try_fast_path_plan("FILE_empty.md", vault)
+        assert plan_path is not None
+        assert Path(plan_path).name == "Plan_FILE_empty.md"
+
+        assert try_fast_path_plan("NOTE.md", vault) is None
+        assert not (vault.needs_action / "Plan_NOTE.md").exists()
+
+
+def test_single_flight_joins_concurrent_requests():
+    """Concurrent triggers for the same file content share one planning call."""
+    with tempfile.TemporaryDirectory() as tmp:
+        task_file = Path(tmp) / "TASK.md"
+        task_file.write_text("---\ntype: note\n---\n\nPlan me.\n")
+        plan_file = Path(tmp) / "Plan_TASK.md"
+        single_flight = PlannerSingleFlight(state_file=Path(tmp) / "state.json")
+        calls = []
+
+        def plan_fn():
+            calls.append(1)
+            time.sleep(0.2)
+            plan_file.write_text("plan")
+            return str(plan_file)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(single_flight.run(task_file, plan_fn)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [str(plan_file)] * 5
+
+        # A repeated trigger after completion reuses the existing plan
+        assert single_flight.run(task_file, plan_fn) == str(plan_file)
+        assert len(calls) == 1
+
+        # Changed content is a new key and is planned again
+        task_file.write_text("---\ntype: note\n---\n\nPlan me again.\n")
+        single_flight.run(task_file, plan_fn)
+        assert len(calls) == 2
+
+
+def test_single_flight_resumes_interrupted_plans():
+    """In-flight records left by a dead process are handed back for resuming."""
+    with tempfile.TemporaryDirectory() as tmp:
+        state_file = Path(tmp) / "state.json"
+        state_file.write_text(json.dumps({
+            "in_flight": {"/vault/Needs_Action/TASK.md:abc": {"file_name": "TASK.md", "pid": 2 ** 22 + 1}},
+            "completed": {},
+        }))
+
+        single_flight = PlannerSingleFlight(state_file=state_file)
+        assert single_flight.take_interrupted() == ["TASK.md"]
+        assert single_flight.take_interrupted() == []
+        assert json.loads(state_file.read_text())["in_flight"] == {}
+
+
+def test_single_flight_state_shared_between_processes():
+    """Separate instances (one per process) merge their records instead of overwriting them."""
+    with tempfile.TemporaryDirectory() as tmp:
+        state_file = Path(tmp) / "state.json"
+        watcher = PlannerSingleFlight(state_file=state_file)
+        orchestrator = PlannerSingleFlight(state_file=state_file)
+        first, second = Path(tmp) / "FIRST.md", Path(tmp) / "SECOND.md"
+        first.write_text("first")
+        second.write_text("second")
+        release = threading.Event()
+
+        def slow_plan():
+            release.wait(5)
+            (Path(tmp) / "Plan_FIRST.md").write_text("plan")
+            return str(Path(tmp) / "Plan_FIRST.md")
+
+        def quick_plan():
+            (Path(tmp) / "Plan_SECOND.md").write_text("plan")
+            return str(Path(tmp) / "Plan_SECOND.md")
+
+        assert watcher.run(first, slow_plan, wait=False) is None
+        orchestrator.run(second, quick_plan)
+        state = json.loads(state_file.read_text())
+        assert [r["file_name"] for r in state["in_flight"].values()] == ["FIRST.md"], "Watcher's claim kept"
+        assert [r["file_name"] for r in state["completed"].values()] == ["SECOND.md"]
+
+        release.set()
+        deadline = time.time() + 5
+        while watcher.stats()["in_flight"]:
+            assert time.time() < deadline
+            time.sleep(0.02)
+        assert orchestrator.stats()["completed"] == 2
+
+        # A claim written by another live process after this instance started is honoured
+        third = Path(tmp) / "THIRD.md"
+        third.write_text("third")
+        state = json.loads(state_file.read_text())
+        state["in_flight"][PlannerSingleFlight.task_key(third)] = {"file_name": "THIRD.md", "pid": os.getppid()}
+        state_file.write_text(json.dumps(state))
+        calls = []
+        result = watcher.run(third, lambda: calls.append(1) or "Error: should not plan")
+        assert result.startswith("Planning already in progress"), result
+        assert calls == []
+
+
+if __name__ == "__main__":
+    test_default_rules_match_known_types()
+    test_unmatched_tasks_escalate()
+    test_disputed_invoice_email_escalates()
+    test_custom_rule_registration()
+    test_try_fast_path_plan_writes_plan()
+    test_single_flight_joins_concurrent_requests()
+    test_single_flight_resumes_interrupted_plans()
+    test_single_flight_state_shared_between_processes()
+    print("All task planner tests passed.")
@@ -0,0 +1,105 @@
+"""
+Test Suite for Single-Session Thread Posting
+
+Tests that a thread is composed in one compose dialog and submitted with
+one click, and that tweets the composer could not hold are posted as a
+reply chain on the same page.
+
+Run: python test_twitter_thread.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.twitter_thread import post_thread_in_session
+
+
+class FakeElement:
+    def __init__(self, page, name):
+        self.page = page
+        self.name = name
+
+    def click(self):
+        self.page.clicks.append(self.name)
+        if self.name == "add":
+            self.page.boxes += 1
+        elif self.name == "post":
+            self.page.posts.append(list(self.page.draft))
+            self.page.draft.clear()
+        elif self.name == "sent":
+            self.page.on_status = True
+
+    def fill(self, text):
+        self.page.draft.append(text)
+
+
+class FakePage:
+    """Compose dialog that holds at most ``composer_limit`` posts."""
+
+    def __init__(self, composer_limit=25):
+        self.composer_limit = composer_limit
+        self.boxes = 1
+        self.draft = []
+        self.posts = []
+        self.clicks = []
+        self.on_status = False
+
+    def query_selector(self, selector):
+        if selector.startswith('[data-testid="tweetTextarea_'):
+            index = int(selector.split("_")[1].split('"')[0])
+            return FakeElement(self, "box") if index < self.boxes else None
+        if selector == '[data-testid="addButton"]':
+            return FakeElement(self, "add") if self.boxes < self.composer_limit else None
+        if selector in ('[data-testid="tweetButton"]', '[data-testid="tweetButtonInline"]'):
+            return FakeElement(self, "post")
+        if "toast" in selector:
+            return FakeElement(self, "sent") if self.posts else None
+        return None
+
+    def wait_for_timeout(self, ms):
+        pass
+
+
+def test_thread_composed_and_submitted_once():
+    """Five tweets go out in one compose dialog with a single Post click."""
+    tweets = [f"Tweet {i}/5" for i in range(1, 6)]
+    page = FakePage()
+    result = post_thread_in_session(page, tweets, submit=True)
+
+    assert result["status"] == "success" and result["mode"] == "composer"
+    assert page.posts == [tweets], "Whole thread submitted as one post action"
+    assert page.clicks.count("post") == 1
+    print(f"  [OK] 5-tweet thread submitted in one action ({result['elapsed_ms']} ms)")
+
+
+def test_falls_back_to_replies_on_same_page():
+    """Tweets the composer cannot hold are posted as a reply chain."""
+    tweets = [f"Tweet {i}/5" for i in range(1, 6)]
+    page = FakePage(composer_limit=2)
+    result = post_thread_in_session(page, tweets, submit=True)
+
+    assert result["status"] == "success" and result["mode"] == "composer+replies"
+    assert result["composed"] == 2 and result["replied"] == 3
+    assert page.posts == [tweets[:2], [tweets[2]], [tweets[3]], [tweets[4]]]
+    print("  [OK] Composer overflow posted as replies on the same page")
+
+
+def test_dry_run_composes_without_posting():
+    """Without TWITTER_SUBMIT_POSTS the thread is composed but not sent."""
+    page = FakePage()
+    result = post_thread_in_session(page, ["one", "two"], submit=False)
+    assert result["status"] == "success" and not result["submitted"]
+    assert page.posts == [] and page.draft == ["one", "two"]
+    print("  [OK] Dry run composes the thread without posting")
+
+
+if __name__ == "__main__":
+    test_thread_composed_and_submitted_once()
+    test_falls_back_to_replies_on_same_page()
+    test_dry_run_composes_without_posting()
+    print("ALL TESTS PASSED!")
@@ -23,6 +23,7 @@ import json
 from base_watcher import BaseWatcher
 from log_manager import setup_logging
 from skills.vault_skills import get_vault
+from scripts.twitter_thread import SUBMIT_POSTS, post_thread_in_session
 
 # Setup logging
 logger = setup_logging(log_file="logs/ai_employee.log", logger_name="twitter_watcher")
@@ -455,9 +456,11 @@ class TwitterPoster:
                         tweet_button = page.query_selector('[data-testid="tweetButton"], button:has-text("Post")')
                         
                         if tweet_button:
-                            logger.info("Would click tweet button...")
-                            # tweet_button.click()
-                            # page.wait_for_timeout(3000)
+                            if SUBMIT_POSTS:
+                                tweet_button.click()
+                                page.wait_for_timeout(3000)
+                            else:
+                                logger.info("Would click tweet button...")
                             
                             result = {
                                 "status": "success",
@@ -537,28 +540,62 @@ class TwitterPoster:
                 "message": "Thread exceeds maximum of 25 tweets"
             }
         
-        logger.info(f"Posting thread with {len(tweets)} tweets...")
+        logger.info(f"Posting thread with {len(tweets)} tweets in one session...")
         
-        # Post first tweet
-        first_media = media_paths[:4] if media_paths else None
-        result = self.post_tweet(
-            content=tweets[0],
-            media_paths=first_media
-        )
+        try:
+            from playwright.sync_api import sync_playwright
+            
+            with sync_playwright() as p:
+                browser = p.chromium.launch(headless=True)
+                context = browser.new_context(
+                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+                )
+                page = context.new_page()
+                
+                try:
+                    page.goto('https://twitter.com/home', timeout=30000)
+                    page.wait_for_timeout(5000)
+                    
+                    is_logged_in = 'twitter.com' in page.url and '/i/flow/login' not in page.url
+                    if not is_logged_in:
+                        logger.warning("Not logged into Twitter/X. Authentication required.")
+                        return {
+                            "status": "warning",
+                            "message": "Not logged into Twitter/X. Please log in manually and retry.",
+                            "requires_authentication": True,
+                            "platform": "twitter"
+                        }
+                    
+                    result = post_thread_in_session(page, tweets, media_paths)
+                finally:
+                    browser.close()
+            
+        except ImportError:
+            return {
+                "status": "error",
+                "message": "Playwright not installed",
+                "platform": "twitter"
+            }
+        except Exception as e:
+            logger.error(f"Twitter thread failed: {e}")
+            return {
+                "status": "error",
+                "message": f"Twitter thread failed: {str(e)}",
+                "platform": "twitter"
+            }
         
         if result.get("status") != "success":
             return result
         
-        # Note: Posting a real thread requires more complex automation
-        # to click "Add another tweet" and link them together
-        # This is a simplified implementation
-        
         return {
             "status": "success",
             "message": f"Posted thread with {len(tweets)} tweets",
             "platform": "twitter",
             "tweet_count": len(tweets),
             "tweets": tweets,
+            "mode": result["mode"],
+            "submitted": result["submitted"],
+            "elapsed_ms": result["elapsed_ms"],
             "timestamp": datetime.now().isoformat()
         }
 